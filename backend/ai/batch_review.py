@@ -0,0 +1,160 @@
+"""오프라인 일괄 재리뷰 작업 (Message Batches 실행 모드).
+
+야간 재리뷰처럼 응답을 기다릴 필요가 없는 리뷰 작업을 JSONL 파일로 받아, 실시간
+경로와 같은 ReviewService를 배치 체인(get_batch_review_chain /
+get_batch_review_section_chain)으로 구성해 실행합니다. 작업을 동시에 시작하므로
+평가 단계 호출이 한 배치로 모이고, 모두 끝나면 이어지는 개선 단계가 다시 한 배치로
+모입니다. 결과는 작업 순서대로 JSONL 파일에 기록하며, 실패한 작업은 error 필드로
+남기고 나머지 작업은 계속 진행합니다.
+
+작업 파일 한 줄 형식 (요청 본문은 REST API 요청 본문과 같음):
+    {"resumeId": "...", "target": "block", "sectionType": "project", "request": {...}}
+
+실행:
+    python -m backend.ai.batch_review jobs.jsonl results.jsonl --concurrency 500
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+from pathlib import Path
+from typing import Any, Literal
+from uuid import UUID
+
+from pydantic import BaseModel, Field, ValidationError
+
+from backend.ai.chains import get_batch_review_chain, get_batch_review_section_chain
+from backend.api.rest.v1.schemas.resumes import (
+    ResumeBlockReviewRequest,
+    ResumeReviewRequest,
+    ResumeSectionReviewRequest,
+    ResumeSkillReviewRequest,
+)
+from backend.domain.resume.enums import SectionType
+from backend.services.review import ReviewService
+from backend.services.review.assembler import get_review_context_assembler
+from backend.services.review.mapper import get_review_response_mapper
+from backend.utils.schema_base import CamelModel
+
+logger = logging.getLogger(__name__)
+
+
+class BatchReviewJob(CamelModel):
+    """재리뷰 작업 하나 (REST 리뷰 엔드포인트 호출 하나에 대응)."""
+
+    resume_id: UUID = Field(..., description="이력서 ID")
+    target: Literal["summary", "introduction", "skill", "section", "block"] = Field(
+        ..., description="리뷰 대상"
+    )
+    section_type: SectionType | None = Field(None, description="섹션 타입 (section/block 대상)")
+    request: dict[str, Any] = Field(..., description="REST API와 같은 리뷰 요청 본문")
+    cache_bypass: bool = Field(False, description="결과 캐시 우회 여부")
+
+
+def build_batch_review_service() -> ReviewService:
+    """배치 체인으로 구성한 ReviewService 생성."""
+    return ReviewService(
+        assembler=get_review_context_assembler(),
+        chain=get_batch_review_chain(),
+        section_chain=get_batch_review_section_chain(),
+        mapper=get_review_response_mapper(),
+    )
+
+
+async def run_job(service: ReviewService, job: BatchReviewJob) -> BaseModel:
+    """작업 대상에 맞는 리뷰 실행."""
+    if job.target in ("section", "block") and job.section_type is None:
+        raise ValueError(f"{job.target} 리뷰에는 sectionType이 필요합니다.")
+
+    if job.target == "summary":
+        return await service.review_summary(
+            job.resume_id,
+            ResumeReviewRequest.model_validate(job.request),
+            cache_bypass=job.cache_bypass,
+        )
+    if job.target == "introduction":
+        return await service.review_introduction(
+            job.resume_id,
+            ResumeReviewRequest.model_validate(job.request),
+            cache_bypass=job.cache_bypass,
+        )
+    if job.target == "skill":
+        return await service.review_skill(
+            job.resume_id,
+            ResumeSkillReviewRequest.model_validate(job.request),
+            cache_bypass=job.cache_bypass,
+        )
+    assert job.section_type is not None
+    if job.target == "section":
+        return await service.review_section(
+            job.resume_id,
+            job.section_type,
+            ResumeSectionReviewRequest.model_validate(job.request),
+            cache_bypass=job.cache_bypass,
+        )
+    block_request = ResumeBlockReviewRequest.model_validate(job.request)
+    return await service.review_block(
+        job.resume_id,
+        job.section_type,
+        block_request.section_id,
+        block_request.id,
+        block_request,
+        cache_bypass=job.cache_bypass,
+    )
+
+
+async def run_jobs(
+    service: ReviewService, lines: list[str], concurrency: int = 500
+) -> list[dict[str, Any]]:
+    """JSONL 작업들을 동시에 실행하고 작업 순서대로 결과 반환.
+
+    동시에 진행하는 작업 수는 concurrency로 제한합니다. 배치 하나에 모이는 단계
+    호출 수가 이 값을 따르므로 제공자 배치 최대 크기에 맞춰 정합니다.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(line_number: int, line: str) -> dict[str, Any]:
+        result: dict[str, Any] = {"line": line_number}
+        try:
+            job = BatchReviewJob.model_validate_json(line)
+        except ValidationError as e:
+            return {**result, "error": f"잘못된 작업: {e.error_count()}개 필드 오류"}
+
+        result.update(resumeId=str(job.resume_id), target=job.target)
+        async with semaphore:
+            try:
+                response = await run_job(service, job)
+            except Exception as e:
+                logger.error(
+                    f"재리뷰 작업 실패: {e}",
+                    extra={"line": line_number, "resume_id": str(job.resume_id)},
+                )
+                return {**result, "error": f"{type(e).__name__}: {e}"}
+        return {**result, "response": response.model_dump(mode="json", by_alias=True)}
+
+    return await asyncio.gather(
+        *[run(line_number, line) for line_number, line in enumerate(lines, start=1) if line.strip()]
+    )
+
+
+def main() -> None:
+    """CLI 진입점."""
+    parser = argparse.ArgumentParser(description="오프라인 일괄 재리뷰 (Message Batches)")
+    parser.add_argument("jobs", type=Path, help="리뷰 작업 JSONL 파일")
+    parser.add_argument("output", type=Path, help="결과 JSONL 파일")
+    parser.add_argument("--concurrency", type=int, default=500)
+    args = parser.parse_args()
+
+    lines = args.jobs.read_text(encoding="utf-8").splitlines()
+    results = asyncio.run(run_jobs(build_batch_review_service(), lines, args.concurrency))
+    with args.output.open("w", encoding="utf-8") as f:
+        for result in results:
+            f.write(json.dumps(result, ensure_ascii=False) + "\n")
+
+    failed = sum(1 for result in results if "error" in result)
+    print(f"jobs: {len(results)}  succeeded: {len(results) - failed}  failed: {failed}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 from functools import lru_cache
 
+from backend.ai.chains.llm import get_message_batcher
 from backend.ai.chains.review_chain import ReviewChain, SectionReviewChain
 
 
@@ -15,4 +16,24 @@ def get_review_section_chain() -> SectionReviewChain:
     return SectionReviewChain()
 
 
-__all__ = ["get_review_chain", "get_review_section_chain"]
+@lru_cache
+def get_batch_review_chain() -> ReviewChain:
+    """Message Batches 모드 ReviewChain 싱글톤 인스턴스 반환.
+
+    동시에 실행한 리뷰들의 단계 호출이 배치로 모여 제출됩니다 (야간 재리뷰 등).
+    """
+    return ReviewChain(llm=get_message_batcher().as_runnable())
+
+
+@lru_cache
+def get_batch_review_section_chain() -> SectionReviewChain:
+    """Message Batches 모드 SectionReviewChain 싱글톤 인스턴스 반환."""
+    return SectionReviewChain(get_batch_review_chain())
+
+
+__all__ = [
+    "get_batch_review_chain",
+    "get_batch_review_section_chain",
+    "get_review_chain",
+    "get_review_section_chain",
+]
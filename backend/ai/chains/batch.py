@@ -0,0 +1,324 @@
+"""Message Batches 실행 모드 (지연에 둔감한 대량 리뷰용).
+
+야간 재리뷰처럼 응답을 기다릴 필요가 없는 작업은 단계 호출을 하나씩 보내는 대신
+일정 시간 동안 모아 제공자 배치 하나로 제출하고, 완료될 때까지 폴링한 뒤 결과를
+호출자별로 돌려줍니다. ReviewChain은 LLM만 바꿔 끼우면 되므로 전략과 프롬프트는
+실시간 경로와 같습니다. 평가 단계가 한 배치로 모이고, 모두 끝나면 이어지는 개선
+단계가 다시 한 배치로 모입니다.
+
+배치 클라이언트는 BatchClient 인터페이스 뒤에 두며, 테스트와 가짜 제공자에서는
+채팅 모델로 요청을 처리하는 LocalBatchClient를 사용합니다.
+
+배치 결과는 max_tokens에서 잘려도 이어쓰기를 하지 않으므로 라우팅 테이블의
+max_tokens를 넉넉히 잡아야 합니다.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Protocol, cast
+from uuid import uuid4
+
+import anthropic
+from anthropic.types.message_create_params import MessageCreateParamsNonStreaming
+from langchain_anthropic import ChatAnthropic
+from langchain_core.language_models import LanguageModelInput
+from langchain_core.messages import AIMessage, BaseMessage, ToolCall
+from langchain_core.runnables import Runnable, RunnableConfig, RunnableLambda
+
+from backend.ai.chains.gateway import ChatModel
+from backend.ai.chains.key_pool import APIKeyPool, APIKeySlot
+from backend.ai.chains.routing import ModelRouter
+from backend.ai.chains.token_budget import to_messages
+
+logger = logging.getLogger(__name__)
+
+
+class BatchRequestError(RuntimeError):
+    """배치 안의 개별 요청이 실패(오류/취소/만료)한 경우."""
+
+
+class BatchRequest:
+    """배치에 담을 단계 호출 하나."""
+
+    def __init__(self, custom_id: str, messages: list[BaseMessage], params: dict[str, Any]):
+        self.custom_id = custom_id
+        self.messages = messages
+        self.params = params
+
+
+# 배치에 담긴 요청과 그 결과를 기다리는 호출자의 Future
+PendingCall = tuple[BatchRequest, asyncio.Future[BaseMessage]]
+
+
+class BatchClient(Protocol):
+    """제공자 배치 API 인터페이스."""
+
+    async def submit(self, requests: list[BatchRequest]) -> str:
+        """요청들을 배치 하나로 제출하고 배치 ID 반환."""
+        ...
+
+    async def is_done(self, batch_id: str) -> bool:
+        """배치 처리가 끝났는지 여부."""
+        ...
+
+    async def results(self, batch_id: str) -> dict[str, BaseMessage | Exception]:
+        """custom_id별 응답 메시지 또는 실패 예외 반환."""
+        ...
+
+
+class AnthropicBatchClient:
+    """Anthropic Message Batches API 클라이언트.
+
+    배치는 실시간 경로와 같은 API 키 풀에서 고른 키로 제출하고(429/인증 오류 시 다른
+    키로 넘김), 배치가 그 키에 묶이므로 상태 조회와 결과 수집도 제출한 키로 수행합니다.
+    요청 본문은 해당 키의 ChatAnthropic 변환(시스템 프롬프트 캐시 표시 포함)으로
+    만들고, 결과는 실시간 응답과 같은 response_metadata / usage_metadata를 가진
+    AIMessage로 변환합니다.
+    """
+
+    def __init__(self, key_pool: APIKeyPool):
+        self._key_pool = key_pool
+        self._batch_models: dict[str, ChatAnthropic] = {}
+
+    async def submit(self, requests: list[BatchRequest]) -> str:
+        async def create(slot: APIKeySlot) -> str:
+            model = _anthropic_model(slot)
+            batch = await model._async_client.messages.batches.create(
+                requests=[
+                    {"custom_id": request.custom_id, "params": _build_params(model, request)}
+                    for request in requests
+                ]
+            )
+            self._batch_models[batch.id] = model
+            return batch.id
+
+        return await self._key_pool.call(create)
+
+    async def is_done(self, batch_id: str) -> bool:
+        client = self._batch_models[batch_id]._async_client
+        batch = await client.messages.batches.retrieve(batch_id)
+        return batch.processing_status == "ended"
+
+    async def results(self, batch_id: str) -> dict[str, BaseMessage | Exception]:
+        client = self._batch_models.pop(batch_id)._async_client
+        results: dict[str, BaseMessage | Exception] = {}
+        async for entry in await client.messages.batches.results(batch_id):
+            result = entry.result
+            if result.type == "succeeded":
+                results[entry.custom_id] = _to_ai_message(result.message)
+            else:
+                error = getattr(result, "error", None)
+                detail = getattr(getattr(error, "error", None), "message", None)
+                results[entry.custom_id] = BatchRequestError(
+                    f"배치 요청 실패: {result.type}" + (f" ({detail})" if detail else "")
+                )
+        return results
+
+
+def _anthropic_model(slot: APIKeySlot) -> ChatAnthropic:
+    """키 슬롯의 ChatAnthropic 반환 (배치 API는 Anthropic 클라이언트가 필요)."""
+    if not isinstance(slot.client, ChatAnthropic):
+        raise TypeError(f"배치 제출에는 ChatAnthropic 키 슬롯이 필요합니다: key={slot.name}")
+    return slot.client
+
+
+def _build_params(model: ChatAnthropic, request: BatchRequest) -> MessageCreateParamsNonStreaming:
+    """배치 요청 하나의 Messages API 본문 생성."""
+    payload = model._get_request_payload(request.messages, **request.params)
+    payload.pop("stream", None)
+    # ChatAnthropic은 일부 생성 파라미터를 extra_body로 넘기므로 본문으로 펼침
+    payload.update(payload.pop("extra_body", None) or {})
+    return cast(MessageCreateParamsNonStreaming, payload)
+
+
+def _to_ai_message(message: anthropic.types.Message) -> AIMessage:
+    """배치 결과의 Message를 실시간 응답과 같은 형태의 AIMessage로 변환."""
+    usage = message.usage
+    input_tokens = (
+        usage.input_tokens
+        + (usage.cache_read_input_tokens or 0)
+        + (usage.cache_creation_input_tokens or 0)
+    )
+    return AIMessage(
+        content="".join(block.text for block in message.content if block.type == "text"),
+        tool_calls=[
+            ToolCall(name=block.name, args=block.input, id=block.id)
+            for block in message.content
+            if block.type == "tool_use"
+        ],
+        response_metadata={
+            "id": message.id,
+            "model": message.model,
+            "model_name": message.model,
+            "stop_reason": message.stop_reason,
+            "usage": usage.model_dump(),
+        },
+        usage_metadata={
+            "input_tokens": input_tokens,
+            "output_tokens": usage.output_tokens,
+            "total_tokens": input_tokens + usage.output_tokens,
+            "input_token_details": {
+                "cache_read": usage.cache_read_input_tokens or 0,
+                "cache_creation": usage.cache_creation_input_tokens or 0,
+            },
+        },
+    )
+
+
+class LocalBatchClient:
+    """채팅 모델로 배치를 처리하는 로컬 대역 (테스트/가짜 제공자용).
+
+    제출 즉시 백그라운드에서 요청을 동시에 처리하고, 개별 실패는 해당 요청의 결과로만
+    남깁니다.
+    """
+
+    def __init__(self, model: ChatModel, concurrency: int = 8):
+        self._model = model
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._batches: dict[str, asyncio.Task[dict[str, BaseMessage | Exception]]] = {}
+        self.submitted: list[list[str]] = []
+
+    async def submit(self, requests: list[BatchRequest]) -> str:
+        batch_id = f"local_batch_{uuid4().hex}"
+        self._batches[batch_id] = asyncio.create_task(self._process(requests))
+        self.submitted.append([request.custom_id for request in requests])
+        return batch_id
+
+    async def is_done(self, batch_id: str) -> bool:
+        return self._batches[batch_id].done()
+
+    async def results(self, batch_id: str) -> dict[str, BaseMessage | Exception]:
+        return await self._batches.pop(batch_id)
+
+    async def _process(self, requests: list[BatchRequest]) -> dict[str, BaseMessage | Exception]:
+        async def call(request: BatchRequest) -> BaseMessage:
+            async with self._semaphore:
+                return await self._model.ainvoke(request.messages, **request.params)
+
+        responses = await asyncio.gather(
+            *[call(request) for request in requests], return_exceptions=True
+        )
+        results: dict[str, BaseMessage | Exception] = {}
+        for request, response in zip(requests, responses, strict=True):
+            if isinstance(response, BaseException) and not isinstance(response, Exception):
+                # 취소 등 Exception이 아닌 BaseException은 요청 실패로 삼키지 않음
+                raise response
+            results[request.custom_id] = response
+        return results
+
+
+class MessageBatcher:
+    """단계 호출을 모아 배치로 제출하고 결과를 호출자별로 돌려주는 ChatModel.
+
+    첫 호출 후 flush_seconds 동안(또는 max_batch_size개가 찰 때까지) 들어온 호출을 한
+    배치로 제출하고, poll_seconds 간격으로 완료를 확인합니다. 모델과 생성 파라미터는
+    실시간 경로와 같은 라우팅 테이블을 따릅니다.
+    """
+
+    def __init__(
+        self,
+        client: BatchClient,
+        router: ModelRouter | None = None,
+        max_batch_size: int = 1000,
+        flush_seconds: float = 5.0,
+        poll_seconds: float = 30.0,
+    ):
+        self._client = client
+        self._router = router
+        self._max_batch_size = max_batch_size
+        self._flush_seconds = flush_seconds
+        self._poll_seconds = poll_seconds
+        self._pending: list[PendingCall] = []
+        self._flush_timer: asyncio.TimerHandle | None = None
+        self._running: set[asyncio.Task[None]] = set()
+        self._batches = 0
+        self._requests = 0
+        self._failed_requests = 0
+        self._last_batch_seconds: float | None = None
+
+    async def ainvoke(
+        self,
+        messages: LanguageModelInput,
+        config: RunnableConfig | None = None,
+        **kwargs: Any,
+    ) -> BaseMessage:
+        """호출을 다음 배치에 담고 해당 결과가 나올 때까지 대기."""
+        route = self._router.resolve_config(config) if self._router else None
+        params = {**(route.call_kwargs() if route else {}), **kwargs}
+        request = BatchRequest(uuid4().hex, to_messages(messages), params)
+        future: asyncio.Future[BaseMessage] = asyncio.get_running_loop().create_future()
+        self._pending.append((request, future))
+
+        if len(self._pending) >= self._max_batch_size:
+            self._flush()
+        elif self._flush_timer is None:
+            self._flush_timer = asyncio.get_running_loop().call_later(
+                self._flush_seconds, self._flush
+            )
+        return await future
+
+    def as_runnable(self) -> Runnable[LanguageModelInput, BaseMessage]:
+        """LCEL 체인에서 사용할 수 있는 Runnable로 변환."""
+        return RunnableLambda(self.ainvoke, name="MessageBatcher")
+
+    def snapshot(self) -> dict[str, Any]:
+        """제출한 배치/요청 수와 대기 중인 요청 수 반환."""
+        return {
+            "batches": self._batches,
+            "requests": self._requests,
+            "failed_requests": self._failed_requests,
+            "pending": len(self._pending),
+            "running_batches": len(self._running),
+            "last_batch_seconds": (
+                None if self._last_batch_seconds is None else round(self._last_batch_seconds, 1)
+            ),
+        }
+
+    def _flush(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        items, self._pending = self._pending, []
+        if not items:
+            return
+        task = asyncio.create_task(self._run_batch(items))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _run_batch(
+        self, items: list[tuple[BatchRequest, asyncio.Future[BaseMessage]]]
+    ) -> None:
+        started = time.monotonic()
+        self._batches += 1
+        self._requests += len(items)
+        try:
+            batch_id = await self._client.submit([request for request, _ in items])
+            logger.info(f"LLM 배치 제출: {len(items)}건", extra={"batch_id": batch_id})
+            while not await self._client.is_done(batch_id):
+                await asyncio.sleep(self._poll_seconds)
+            results = await self._client.results(batch_id)
+        except Exception as e:
+            logger.error(f"LLM 배치 처리 실패: {e}", extra={"requests": len(items)}, exc_info=True)
+            self._failed_requests += len(items)
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        self._last_batch_seconds = time.monotonic() - started
+        for request, future in items:
+            if future.done():
+                continue
+            result = results.get(request.custom_id)
+            if result is None:
+                result = BatchRequestError(f"배치 결과 누락: custom_id={request.custom_id}")
+            if isinstance(result, Exception):
+                self._failed_requests += 1
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+        logger.info(
+            f"LLM 배치 완료: {len(items)}건",
+            extra={"batch_id": batch_id, "elapsed_seconds": round(self._last_batch_seconds, 1)},
+        )
@@ -0,0 +1,149 @@
+"""LLM 호출 관측용 콜백 핸들러."""
+
+import asyncio
+import logging
+import time
+from typing import Any
+from uuid import UUID
+
+from langchain_core.callbacks import AsyncCallbackHandler
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import LLMResult
+
+from backend.ai.chains.telemetry import LLMTelemetry, StageTelemetry, get_llm_telemetry
+
+logger = logging.getLogger(__name__)
+
+
+class PromptCacheUsageHandler(AsyncCallbackHandler):
+    """호출별 입력/출력 토큰과 프롬프트 캐시 읽기·쓰기 토큰 수를 기록하는 콜백."""
+
+    def __init__(self, stage: str, target_type: str):
+        self.stage = stage
+        self.target_type = target_type
+
+    async def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        """LLM 응답의 usage_metadata에서 캐시 토큰 수를 읽어 로깅."""
+        for generations in response.generations:
+            for generation in generations:
+                message = getattr(generation, "message", None)
+                if not isinstance(message, AIMessage) or not message.usage_metadata:
+                    continue
+
+                usage = message.usage_metadata
+                details = usage.get("input_token_details", {})
+                logger.info(
+                    f"LLM 토큰 사용량: stage={self.stage}, target_type={self.target_type}",
+                    extra={
+                        "stage": self.stage,
+                        "target_type": self.target_type,
+                        "input_tokens": usage.get("input_tokens", 0),
+                        "output_tokens": usage.get("output_tokens", 0),
+                        "cache_read_tokens": details.get("cache_read", 0),
+                        "cache_creation_tokens": details.get("cache_creation", 0),
+                    },
+                )
+
+
+class LLMTelemetryHandler(PromptCacheUsageHandler):
+    """단계 하나(prompt | llm | parser)의 텔레메트리를 모으는 콜백.
+
+    모델 호출마다 TTFT(스트리밍 첫 토큰)와 생성 시간을, 실패한 시도는 재시도로,
+    run_name이 PARSER_RUN_NAME인 실행은 파싱 시간(실패하면 파싱 실패)으로 기록합니다. 단계가 끝나면
+    finish()로 집계기에 넘깁니다.
+    """
+
+    PARSER_RUN_NAME = "output_parser"
+
+    def __init__(self, stage: str, target_type: str, telemetry: LLMTelemetry | None = None):
+        super().__init__(stage, target_type)
+        self._telemetry = telemetry or get_llm_telemetry()
+        self.record = StageTelemetry(stage, target_type)
+        self._started: dict[UUID, float] = {}
+        self._first_token: dict[UUID, float] = {}
+        self._completions = 0
+
+    async def on_chat_model_start(
+        self,
+        serialized: dict[str, Any],
+        messages: list[list[BaseMessage]],
+        *,
+        run_id: UUID,
+        **kwargs: Any,
+    ) -> None:
+        """모델 호출 시작 시각 기록."""
+        self._started[run_id] = time.monotonic()
+
+    async def on_llm_new_token(
+        self, token: str | list[str | dict[str, Any]], *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        """스트리밍 첫 토큰 수신 시각 기록."""
+        self._first_token.setdefault(run_id, time.monotonic())
+
+    async def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        """성공한 호출의 토큰 사용량, 모델, 시간 지표 누적."""
+        await super().on_llm_end(response, **kwargs)
+
+        now = time.monotonic()
+        run_id = kwargs.get("run_id")
+        started = self._started.pop(run_id, None) if run_id is not None else None
+        first_token = self._first_token.pop(run_id, None) if run_id is not None else None
+        if started is not None:
+            elapsed_ms = (now - started) * 1000
+            self.record.generation_ms = (self.record.generation_ms or 0.0) + elapsed_ms
+            # 이어쓰기 호출이 있으면 첫 호출의 TTFT만 사용
+            if first_token is not None and self.record.ttft_ms is None:
+                self.record.ttft_ms = (first_token - started) * 1000
+
+        self._completions += 1
+        self.record.continuations = self._completions - 1
+        for generations in response.generations:
+            for generation in generations:
+                message = getattr(generation, "message", None)
+                if not isinstance(message, AIMessage):
+                    continue
+                self.record.model = message.response_metadata.get("model_name", self.record.model)
+                usage = message.usage_metadata
+                if not usage:
+                    continue
+                details = usage.get("input_token_details", {})
+                self.record.input_tokens += usage.get("input_tokens", 0)
+                self.record.output_tokens += usage.get("output_tokens", 0)
+                self.record.cache_read_tokens += details.get("cache_read", 0)
+                self.record.cache_creation_tokens += details.get("cache_creation", 0)
+
+    async def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        """실패한 시도를 재시도로 기록 (헤징에서 취소된 호출은 제외)."""
+        self._started.pop(run_id, None)
+        self._first_token.pop(run_id, None)
+        if not isinstance(error, asyncio.CancelledError):
+            self.record.retries += 1
+
+    async def on_chain_start(
+        self, serialized: dict[str, Any], inputs: dict[str, Any], *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        """파서 실행 시작 시각 기록."""
+        if kwargs.get("name") == self.PARSER_RUN_NAME:
+            self._started[run_id] = time.monotonic()
+
+    async def on_chain_end(self, outputs: dict[str, Any], *, run_id: UUID, **kwargs: Any) -> None:
+        """파서 실행 시간 기록."""
+        self._record_parse_time(run_id)
+
+    async def on_chain_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        """파싱 실패 수와 실패까지 걸린 시간 기록."""
+        if self._record_parse_time(run_id):
+            self.record.parse_failures += 1
+
+    def finish(self) -> StageTelemetry:
+        """단계 기록을 집계기(및 요청 수집기)에 넘기고 반환."""
+        self._telemetry.record(self.record)
+        return self.record
+
+    def _record_parse_time(self, run_id: UUID) -> bool:
+        """파서 실행이면 걸린 시간을 기록하고 True 반환."""
+        started = self._started.pop(run_id, None)
+        if started is None:
+            return False
+        self.record.parse_ms = (time.monotonic() - started) * 1000
+        return True
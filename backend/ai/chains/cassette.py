@@ -0,0 +1,258 @@
+"""LLM 호출 녹화/재생 카세트.
+
+녹화 모드에서는 LLMGateway가 보내는 렌더링된 메시지와 모델 파라미터, 원본 응답,
+소요 시간을 gzip JSONL 파일에 한 줄씩 추가합니다. 재생 모드에서는 같은 메시지와
+파라미터의 해시로 녹화된 응답을 찾아 원래 소요 시간(배율 조정 가능)만큼 기다린 뒤
+돌려주므로, 네트워크 없이 결정적인 성능 회귀 테스트와 파싱 실패 재현이 가능합니다.
+
+max_tokens는 출력 토큰 예산이 실행마다 조정하므로 키에서 제외합니다. 도구 호출을
+강제한 요청은 같은 메시지라도 응답 형식이 다르므로 tool_choice를 키에 포함합니다.
+"""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import logging
+import threading
+import time
+from datetime import UTC, datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.language_models import BaseChatModel, LanguageModelInput
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.runnables import RunnableConfig
+from pydantic import PrivateAttr
+
+from backend.ai.chains.gateway import ChatModel
+from backend.ai.chains.token_budget import to_messages
+from backend.ai.config import get_ai_config
+
+logger = logging.getLogger(__name__)
+
+# 카세트 키에 포함하는 모델 파라미터
+KEY_PARAMS = ("model", "temperature")
+
+
+class CassetteMissError(LookupError):
+    """재생 모드에서 녹화되지 않은 요청을 받은 경우."""
+
+
+def cassette_key(messages: LanguageModelInput, params: dict[str, Any]) -> str:
+    """메시지와 모델 파라미터의 SHA-256 해시."""
+    key_params = {name: params.get(name) for name in KEY_PARAMS}
+    if params.get("tool_choice") is not None:
+        key_params["tool_choice"] = params["tool_choice"]
+    payload = {
+        "messages": [
+            {"type": message.type, "content": message.content} for message in to_messages(messages)
+        ],
+        "params": key_params,
+    }
+    canonical = json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class LLMCassette:
+    """gzip JSONL 파일에 저장하는 카세트 저장소.
+
+    녹화는 레코드마다 gzip 멤버를 이어 붙이고(추가 쓰기), 같은 키는 처음 것만 남깁니다.
+    이벤트 루프 안에서는 arecord로 파일 쓰기를 스레드에서 수행합니다.
+    """
+
+    def __init__(self, path: Path):
+        self._path = path
+        self._records: dict[str, dict[str, Any]] = {}
+        self._write_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._recorded = 0
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def lookup(self, key: str) -> dict[str, Any] | None:
+        """키로 녹화 레코드 조회."""
+        record = self._records.get(key)
+        if record is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+        return record
+
+    def record(
+        self,
+        key: str,
+        messages: LanguageModelInput,
+        params: dict[str, Any],
+        response: BaseMessage,
+        elapsed: float,
+    ) -> None:
+        """호출 하나를 녹화 (이미 있는 키는 무시)."""
+        record = self._add(key, messages, params, response, elapsed)
+        if record is not None:
+            self._append(record)
+
+    async def arecord(
+        self,
+        key: str,
+        messages: LanguageModelInput,
+        params: dict[str, Any],
+        response: BaseMessage,
+        elapsed: float,
+    ) -> None:
+        """record와 같지만 gzip 파일 쓰기를 스레드에서 수행."""
+        record = self._add(key, messages, params, response, elapsed)
+        if record is not None:
+            await asyncio.to_thread(self._append, record)
+
+    def snapshot(self) -> dict[str, Any]:
+        """녹화 수와 재생 적중/실패 수 반환."""
+        return {
+            "path": str(self._path),
+            "records": len(self._records),
+            "recorded": self._recorded,
+            "hits": self._hits,
+            "misses": self._misses,
+        }
+
+    def _add(
+        self,
+        key: str,
+        messages: LanguageModelInput,
+        params: dict[str, Any],
+        response: BaseMessage,
+        elapsed: float,
+    ) -> dict[str, Any] | None:
+        """레코드를 메모리에 추가하고 반환 (이미 있는 키면 None)."""
+        if key in self._records:
+            return None
+
+        record = {
+            "key": key,
+            "recorded_at": datetime.now(UTC).isoformat(),
+            "params": {name: value for name, value in params.items() if value is not None},
+            "messages": [
+                {"type": message.type, "content": message.content}
+                for message in to_messages(messages)
+            ],
+            "response": {
+                "content": response.content,
+                "tool_calls": getattr(response, "tool_calls", []),
+                "response_metadata": response.response_metadata,
+                "usage_metadata": getattr(response, "usage_metadata", None),
+            },
+            "elapsed_ms": round(elapsed * 1000, 1),
+        }
+        self._records[key] = record
+        self._recorded += 1
+        return record
+
+    def _append(self, record: dict[str, Any]) -> None:
+        """레코드 한 줄을 gzip 멤버로 파일 끝에 추가."""
+        line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+        with self._write_lock:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            with gzip.open(self._path, "at", encoding="utf-8") as f:
+                f.write(line)
+
+    def _load(self) -> None:
+        if not self._path.exists():
+            return
+        with gzip.open(self._path, "rt", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    self._records.setdefault(record["key"], record)
+        logger.info(f"LLM 카세트 로드: {len(self._records)}건", extra={"path": str(self._path)})
+
+
+class CassetteRecorder:
+    """실제 호출 결과를 카세트에 녹화하는 ChatModel 래퍼."""
+
+    def __init__(self, model: ChatModel, cassette: LLMCassette):
+        self._model = model
+        self._cassette = cassette
+
+    async def ainvoke(
+        self,
+        input: LanguageModelInput,
+        config: RunnableConfig | None = None,
+        **kwargs: Any,
+    ) -> BaseMessage:
+        """호출 후 성공한 응답과 소요 시간을 녹화."""
+        started = time.monotonic()
+        result = await self._model.ainvoke(input, config, **kwargs)
+        await self._cassette.arecord(
+            cassette_key(input, kwargs), input, kwargs, result, time.monotonic() - started
+        )
+        return result
+
+
+class CassetteReplayChatModel(BaseChatModel):
+    """카세트에 녹화된 응답을 원래 소요 시간 × time_scale 뒤에 돌려주는 채팅 모델.
+
+    채팅 모델로 호출되므로 텔레메트리 콜백도 실제 호출처럼 동작합니다.
+    """
+
+    time_scale: float = 1.0
+
+    _cassette: LLMCassette = PrivateAttr()
+
+    def __init__(self, cassette: LLMCassette, **kwargs: Any):
+        super().__init__(**kwargs)
+        self._cassette = cassette
+
+    @property
+    def _llm_type(self) -> str:
+        return "cassette-replay"
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        delay, result = self._replay(messages, **kwargs)
+        time.sleep(delay)
+        return result
+
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        delay, result = self._replay(messages, **kwargs)
+        await asyncio.sleep(delay)
+        return result
+
+    def _replay(self, messages: list[BaseMessage], **kwargs: Any) -> tuple[float, ChatResult]:
+        """녹화된 응답과 돌려주기 전 기다릴 시간(초) 반환."""
+        key = cassette_key(messages, kwargs)
+        record = self._cassette.lookup(key)
+        if record is None:
+            raise CassetteMissError(f"카세트에 녹화되지 않은 요청입니다: key={key[:12]}")
+
+        response = record["response"]
+        message = AIMessage(
+            content=response["content"],
+            tool_calls=response.get("tool_calls", []),
+            response_metadata=response["response_metadata"],
+            usage_metadata=response["usage_metadata"],
+        )
+        delay = record["elapsed_ms"] / 1000 * self.time_scale
+        return delay, ChatResult(generations=[ChatGeneration(message=message)])
+
+
+@lru_cache
+def get_llm_cassette() -> LLMCassette:
+    """설정한 경로의 카세트 싱글톤 반환."""
+    return LLMCassette(Path(get_ai_config().llm_cassette_path))
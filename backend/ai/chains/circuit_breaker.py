@@ -0,0 +1,206 @@
+"""LLM 호출 서킷 브레이커."""
+
+import logging
+import math
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from enum import StrEnum
+from functools import lru_cache
+from typing import Any
+
+from anthropic import APIConnectionError, InternalServerError, OverloadedError
+
+from backend.ai.config import get_ai_config
+
+logger = logging.getLogger(__name__)
+
+# 공급자 장애로 기록하는 오류 (429는 할당량 신호이므로 동시성 제한기만 반응).
+# 전송 타임아웃은 APITimeoutError(APIConnectionError 하위)로 기록되며, 요청 데드라인
+# 만료로 인한 TimeoutError는 공급자 장애가 아니므로 제외합니다.
+CIRCUIT_FAILURE_ERRORS = (APIConnectionError, OverloadedError, InternalServerError)
+
+
+class CircuitState(StrEnum):
+    """서킷 브레이커 상태."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """서킷이 열려 있어 호출을 즉시 거부함."""
+
+    def __init__(self, retry_after: float):
+        self.retry_after = retry_after
+        super().__init__(f"LLM circuit is open (retry after {retry_after:.1f}s)")
+
+    @property
+    def retry_after_ms(self) -> int:
+        """재시도 가능 시점까지 남은 시간 (밀리초)."""
+        return math.ceil(self.retry_after * 1000)
+
+
+class CircuitBreaker:
+    """최근 호출의 오류율과 지연을 기준으로 동작하는 서킷 브레이커.
+
+    - CLOSED: 최근 window_size개 호출 중 오류율 또는 느린 호출 비율이 임계값을 넘으면 OPEN
+    - OPEN: open_duration 동안 모든 호출을 CircuitOpenError로 즉시 거부
+    - HALF_OPEN: half_open_calls개의 탐색 호출만 허용, 모두 성공하면 CLOSED, 하나라도
+      실패하면 다시 OPEN
+
+    지연은 guard 블록 안의 시간만 잽니다. 게이트웨이는 동시성 슬롯을 얻은 뒤 guard에
+    들어가므로 제한기 대기 시간은 포함되지 않습니다.
+    """
+
+    def __init__(
+        self,
+        failure_exceptions: tuple[type[BaseException], ...],
+        window_size: int = 20,
+        min_calls: int = 10,
+        failure_rate_threshold: float = 0.5,
+        slow_call_seconds: float = 30.0,
+        slow_call_rate_threshold: float = 0.8,
+        open_duration: float = 30.0,
+        half_open_calls: int = 2,
+    ):
+        self._failure_exceptions = failure_exceptions
+        self._min_calls = min_calls
+        self._failure_rate_threshold = failure_rate_threshold
+        self._slow_call_seconds = slow_call_seconds
+        self._slow_call_rate_threshold = slow_call_rate_threshold
+        self._open_duration = open_duration
+        self._half_open_calls = half_open_calls
+
+        self._state = CircuitState.CLOSED
+        # (실패 여부, 느린 호출 여부)
+        self._window: deque[tuple[bool, bool]] = deque(maxlen=window_size)
+        self._opened_at = 0.0
+        self._half_open_in_flight = 0
+        self._half_open_successes = 0
+        self._rejected_total = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """현재 상태 (OPEN 유지 시간이 지났으면 HALF_OPEN으로 간주)."""
+        if self._state == CircuitState.OPEN and self._open_remaining() <= 0:
+            return CircuitState.HALF_OPEN
+        return self._state
+
+    @asynccontextmanager
+    async def guard(self) -> AsyncIterator[None]:
+        """호출 허용 여부를 확인하고 블록 실행 결과를 기록."""
+        self._acquire_permission()
+        probe = self._state == CircuitState.HALF_OPEN
+        started = time.monotonic()
+        try:
+            yield
+        except self._failure_exceptions:
+            self._on_result(failed=True, elapsed=time.monotonic() - started, probe=probe)
+            raise
+        except BaseException:
+            # 클라이언트 오류나 취소는 공급자 상태와 무관하므로 기록하지 않음
+            if probe:
+                self._half_open_in_flight -= 1
+            raise
+        else:
+            self._on_result(failed=False, elapsed=time.monotonic() - started, probe=probe)
+
+    def snapshot(self) -> dict[str, Any]:
+        """현재 상태 및 최근 호출 통계 반환."""
+        failures = sum(1 for failed, _ in self._window if failed)
+        slow = sum(1 for _, is_slow in self._window if is_slow)
+        calls = len(self._window)
+        return {
+            "state": self.state.value,
+            "window_calls": calls,
+            "failure_rate": round(failures / calls, 4) if calls else 0.0,
+            "slow_call_rate": round(slow / calls, 4) if calls else 0.0,
+            "retry_after_ms": math.ceil(max(0.0, self._open_remaining()) * 1000),
+            "rejected_total": self._rejected_total,
+        }
+
+    def _acquire_permission(self) -> None:
+        if self._state == CircuitState.OPEN:
+            remaining = self._open_remaining()
+            if remaining > 0:
+                self._reject(remaining)
+            self._transition(CircuitState.HALF_OPEN)
+
+        if self._state == CircuitState.HALF_OPEN:
+            if self._half_open_in_flight >= self._half_open_calls:
+                # 탐색 호출 결과를 기다리는 중
+                self._reject(self._open_duration)
+            self._half_open_in_flight += 1
+
+    def _reject(self, retry_after: float) -> None:
+        self._rejected_total += 1
+        raise CircuitOpenError(retry_after)
+
+    def _on_result(self, failed: bool, elapsed: float, probe: bool) -> None:
+        slow = elapsed >= self._slow_call_seconds
+
+        if probe:
+            self._half_open_in_flight -= 1
+            if self._state != CircuitState.HALF_OPEN:
+                return
+            if failed:
+                self._transition(CircuitState.OPEN)
+                return
+            self._half_open_successes += 1
+            if self._half_open_successes >= self._half_open_calls:
+                self._transition(CircuitState.CLOSED)
+            return
+
+        self._window.append((failed, slow))
+        if self._state == CircuitState.CLOSED and self._should_open():
+            self._transition(CircuitState.OPEN)
+
+    def _should_open(self) -> bool:
+        calls = len(self._window)
+        if calls < self._min_calls:
+            return False
+        failure_rate = sum(1 for failed, _ in self._window if failed) / calls
+        slow_rate = sum(1 for _, slow in self._window if slow) / calls
+        return (
+            failure_rate >= self._failure_rate_threshold
+            or slow_rate >= self._slow_call_rate_threshold
+        )
+
+    def _transition(self, state: CircuitState) -> None:
+        previous = self._state
+        self._state = state
+        if state == CircuitState.OPEN:
+            self._opened_at = time.monotonic()
+        if state == CircuitState.HALF_OPEN:
+            self._half_open_in_flight = 0
+            self._half_open_successes = 0
+        if state == CircuitState.CLOSED:
+            self._window.clear()
+
+        log = logger.warning if state == CircuitState.OPEN else logger.info
+        log(
+            f"LLM 서킷 브레이커 상태 변경: {previous} -> {state}",
+            extra={"previous_state": previous.value, "state": state.value},
+        )
+
+    def _open_remaining(self) -> float:
+        return self._opened_at + self._open_duration - time.monotonic()
+
+
+@lru_cache
+def get_circuit_breaker() -> CircuitBreaker:
+    """프로세스 전역 LLM 서킷 브레이커 싱글톤 반환."""
+    config = get_ai_config()
+    return CircuitBreaker(
+        failure_exceptions=CIRCUIT_FAILURE_ERRORS,
+        window_size=config.llm_circuit_window_size,
+        min_calls=config.llm_circuit_min_calls,
+        failure_rate_threshold=config.llm_circuit_failure_rate,
+        slow_call_seconds=config.llm_circuit_slow_call_seconds,
+        slow_call_rate_threshold=config.llm_circuit_slow_call_rate,
+        open_duration=config.llm_circuit_open_seconds,
+        half_open_calls=config.llm_circuit_half_open_calls,
+    )
@@ -0,0 +1,369 @@
+"""부하 테스트/오프라인 벤치마크용 가짜 LLM 제공자.
+
+실제 Anthropic API 대신 단계(평가/개선)에 맞는 스키마 유효 JSON을 반환합니다. 도구
+정의(tools)와 함께 호출하면 같은 JSON을 도구 호출 입력으로 돌려줍니다. 첫 토큰
+지연은 로그정규 분포에서, 생성 시간은 출력 토큰 수 / 토큰 생성 속도로 정하고, 설정한
+확률로 429/529/타임아웃/5xx 오류를 주입합니다. LangChain 채팅 모델로 구현되어 있어
+LLMGateway, 키 풀, 폴백, 텔레메트리 콜백이 실제와 같은 경로로 동작합니다.
+"""
+
+import asyncio
+import importlib
+import json
+import random
+import time
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+
+import anthropic
+from anthropic import APITimeoutError, InternalServerError, OverloadedError, RateLimitError
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage, ToolCall
+from langchain_core.messages.tool import tool_call_chunk
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from pydantic import Field, PrivateAttr
+
+from backend.ai.chains.rate_shaper import TokenEstimator
+from backend.ai.config import get_ai_config
+
+FAKE_MODEL_NAME = "fake-review-model"
+
+_FAKE_API_URL = "https://fake-llm.local/v1/messages"
+# 출력 길이를 맞추기 위해 반복해서 덧붙이는 문장
+_FILLER_SENTENCE = (
+    "담당 업무와 기술적 의사결정을 구체적인 수치와 함께 서술하면 설득력이 높아집니다. "
+)
+# 스트리밍 청크 하나의 문자 수
+_STREAM_CHUNK_CHARS = 24
+# 구조화 출력 도구 이름(결과 스키마 이름)별 단계
+_FAKE_TOOL_CALL_ID = "toolu_fake"
+_TOOL_STAGES = {
+    "ImprovementOutput": "improvement",
+    "FusedReviewOutput": "fused",
+    "EvaluationBatchResult": "evaluation_batch",
+}
+
+# SDK가 쓰는 httpx 구현 (SDK 버전에 따라 httpx 또는 httpx2). 오류 객체의 요청/응답을
+# SDK와 같은 타입으로 만들기 위해 SDK 기본 HTTP 클라이언트의 상위 클래스에서 찾음
+_sdk_httpx: Any = importlib.import_module(
+    anthropic.DefaultAsyncHttpxClient.__mro__[1].__module__.split(".")[0]
+)
+
+
+def _error_response(status_code: int, headers: dict[str, str] | None = None) -> Any:
+    return _sdk_httpx.Response(
+        status_code, request=_sdk_httpx.Request("POST", _FAKE_API_URL), headers=headers or {}
+    )
+
+
+def build_fake_error(kind: str) -> Exception:
+    """오류 종류 이름에 해당하는 Anthropic SDK 예외 생성."""
+    if kind == "rate_limit":
+        return RateLimitError(
+            "fake rate limit", response=_error_response(429, {"retry-after": "1"}), body=None
+        )
+    if kind == "overloaded":
+        return OverloadedError("fake overloaded", response=_error_response(529), body=None)
+    if kind == "timeout":
+        return APITimeoutError(request=_sdk_httpx.Request("POST", _FAKE_API_URL))
+    if kind == "server_error":
+        return InternalServerError("fake server error", response=_error_response(500), body=None)
+    raise ValueError(f"지원하지 않는 가짜 LLM 오류 종류: {kind}")
+
+
+def build_fake_payload(stage: str, item_count: int = 1) -> dict[str, Any]:
+    """단계에 맞는 최소 응답 JSON 생성 (EvaluationOutput / ImprovementOutput /
+    FusedReviewOutput 스키마).
+
+    다중 항목 평가(evaluation_batch)는 item_count개 항목의 EvaluationBatchResult를 만듭니다.
+    """
+    if stage == "evaluation_batch":
+        return {
+            "items": [
+                {
+                    "index": index,
+                    "summary": "전반적으로 구성이 좋으나 성과 표현을 보완하면 좋습니다.",
+                    "strengths": ["핵심 기술 스택이 명확히 드러납니다"],
+                    "weaknesses": ["정량적 성과가 부족합니다"],
+                    "needs_improvement": True,
+                }
+                for index in range(item_count)
+            ]
+        }
+
+    if stage == "improvement":
+        return {
+            "improvement_suggestion": "성과를 수치로 표현하고 역할을 구체화하세요.",
+            "improved_content": "",
+        }
+    if stage == "fused":
+        return {
+            "evaluation_summary": "전반적으로 구성이 좋으나 성과 표현을 보완하면 좋습니다.",
+            "strengths": ["핵심 기술 스택이 명확히 드러납니다"],
+            "weaknesses": ["정량적 성과가 부족합니다"],
+            "improvement_suggestion": "성과를 수치로 표현하고 역할을 구체화하세요.",
+            "improved_content": "",
+        }
+    return {
+        "summary": "전반적으로 구성이 좋으나 성과 표현을 보완하면 좋습니다.",
+        "strengths": ["핵심 기술 스택이 명확히 드러납니다"],
+        "weaknesses": ["정량적 성과가 부족합니다"],
+        "needs_improvement": True,
+    }
+
+
+def infer_stage(prompt_text: str, tools: list[dict[str, Any]] | None = None) -> str:
+    """도구 정의 또는 프롬프트의 출력 형식 지침으로 단계 추정.
+
+    도구 호출 방식이면 강제한 도구(결과 스키마) 이름으로, JSON 방식이면 단계 스키마에만
+    있는 필드(단일 호출의 평가 요약, 개선 단계의 개선 제안)로 구분합니다.
+    """
+    if tools:
+        return _TOOL_STAGES.get(tools[0].get("name", ""), "evaluation")
+    if '"evaluation_summary"' in prompt_text:
+        return "fused"
+    if '"improvement_suggestion"' in prompt_text:
+        return "improvement"
+    if '"EvaluationBatchItem"' in prompt_text:
+        return "evaluation_batch"
+    return "evaluation"
+
+
+def count_batch_items(prompt_text: str) -> int:
+    """다중 항목 평가 프롬프트에 담긴 항목 수."""
+    return max(1, prompt_text.count("<item index="))
+
+
+def render_fake_payload(payload: dict[str, Any], target_tokens: int) -> str:
+    """출력 토큰 수가 목표에 가까워지도록 본문 필드에 문장을 덧붙인 JSON 반환."""
+    estimator = TokenEstimator(use_tiktoken=False)
+    field = "improved_content" if "improved_content" in payload else "summary"
+    text = json.dumps(payload, ensure_ascii=False)
+    if field not in payload:
+        return text
+    filler_tokens = estimator.raw_estimate(_FILLER_SENTENCE)
+    repeats = max(0, (target_tokens - estimator.raw_estimate(text)) // filler_tokens)
+    payload[field] = (payload[field] + " " + _FILLER_SENTENCE * repeats).strip()
+    return json.dumps(payload, ensure_ascii=False)
+
+
+class FakeReviewChatModel(BaseChatModel):
+    """리뷰 단계별 스키마 유효 JSON을 지연/오류 분포에 따라 반환하는 가짜 채팅 모델.
+
+    단계는 호출 메타데이터(stage)에서 읽고, 메타데이터가 전달되지 않는 스트리밍
+    경로에서는 도구 정의나 프롬프트로 단계를 추정합니다.
+    """
+
+    model_name: str = FAKE_MODEL_NAME
+    ttft_ms: float = 600.0
+    latency_sigma: float = 0.4
+    output_tokens_per_second: float = 80.0
+    output_tokens: int = 300
+    error_rate: float = 0.0
+    error_types: list[str] = Field(default_factory=lambda: ["rate_limit", "overloaded", "timeout"])
+    seed: int | None = None
+    streaming: bool = False
+
+    _rng: random.Random = PrivateAttr()
+    _estimator: TokenEstimator = PrivateAttr()
+
+    def model_post_init(self, context: Any) -> None:
+        self._rng = random.Random(self.seed)
+        self._estimator = TokenEstimator(use_tiktoken=False)
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-review"
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        ttft, error, text, generation = self._plan(messages, run_manager, **kwargs)
+        if error is not None:
+            time.sleep(_error_delay(error, ttft))
+            raise build_fake_error(error)
+        time.sleep(ttft + generation)
+        return ChatResult(
+            generations=[ChatGeneration(message=self._message(messages, text, **kwargs))]
+        )
+
+    def _stream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        ttft, error, text, generation = self._plan(messages, run_manager, **kwargs)
+        if error is not None:
+            time.sleep(_error_delay(error, ttft))
+            raise build_fake_error(error)
+        time.sleep(ttft)
+
+        chunks = self._chunks(text, **kwargs)
+        per_chunk = generation / max(1, len(chunks))
+        for index, chunk in enumerate(chunks):
+            if index:
+                time.sleep(per_chunk)
+            yield chunk
+        yield self._final_chunk(messages, text, **kwargs)
+
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        ttft, error, text, generation = self._plan(messages, run_manager, **kwargs)
+        if error is not None:
+            await asyncio.sleep(_error_delay(error, ttft))
+            raise build_fake_error(error)
+        await asyncio.sleep(ttft + generation)
+        return ChatResult(
+            generations=[ChatGeneration(message=self._message(messages, text, **kwargs))]
+        )
+
+    async def _astream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        ttft, error, text, generation = self._plan(messages, run_manager, **kwargs)
+        if error is not None:
+            await asyncio.sleep(_error_delay(error, ttft))
+            raise build_fake_error(error)
+        await asyncio.sleep(ttft)
+
+        chunks = self._chunks(text, **kwargs)
+        per_chunk = generation / max(1, len(chunks))
+        for index, chunk in enumerate(chunks):
+            if index:
+                await asyncio.sleep(per_chunk)
+            yield chunk
+        yield self._final_chunk(messages, text, **kwargs)
+
+    def _plan(
+        self,
+        messages: list[BaseMessage],
+        run_manager: CallbackManagerForLLMRun | AsyncCallbackManagerForLLMRun | None,
+        **kwargs: Any,
+    ) -> tuple[float, str | None, str, float]:
+        """첫 토큰 지연, 주입할 오류 종류(없으면 None), 응답 텍스트, 생성 시간을 정함."""
+        ttft = self._sample_latency(self.ttft_ms) / 1000
+        if self.error_types and self._rng.random() < self.error_rate:
+            return ttft, self._rng.choice(self.error_types), "", 0.0
+
+        metadata = run_manager.metadata if run_manager is not None else {}
+        prompt_text = "\n".join(message.text for message in messages)
+        payload = build_fake_payload(
+            metadata.get("stage") or infer_stage(prompt_text, kwargs.get("tools")),
+            count_batch_items(prompt_text),
+        )
+        target_tokens = round(self._sample_latency(self.output_tokens))
+        max_tokens = kwargs.get("max_tokens")
+        if max_tokens:
+            target_tokens = min(target_tokens, int(max_tokens * 0.9))
+        text = render_fake_payload(payload, target_tokens)
+        generation = self._estimator.raw_estimate(text) / self.output_tokens_per_second
+        return ttft, None, text, generation
+
+    def _message(self, messages: list[BaseMessage], text: str, **kwargs: Any) -> AIMessage:
+        """응답 텍스트(도구 호출 방식이면 도구 입력)를 담은 전체 응답 메시지."""
+        tool_name = forced_tool_name(kwargs)
+        return AIMessage(
+            content="" if tool_name else text,
+            tool_calls=(
+                [ToolCall(name=tool_name, args=json.loads(text), id=_FAKE_TOOL_CALL_ID)]
+                if tool_name
+                else []
+            ),
+            response_metadata=self._response_metadata(**kwargs),
+            usage_metadata=self._usage(messages, text),
+        )
+
+    def _chunks(self, text: str, **kwargs: Any) -> list[ChatGenerationChunk]:
+        """응답 텍스트를 스트리밍 청크로 나눔 (도구 호출 방식이면 도구 입력 JSON 조각)."""
+        tool_name = forced_tool_name(kwargs)
+        chunks = []
+        for index, start in enumerate(range(0, len(text), _STREAM_CHUNK_CHARS)):
+            content = text[start : start + _STREAM_CHUNK_CHARS]
+            if tool_name:
+                # 도구 입력 JSON 조각 (이름/ID는 첫 조각에만)
+                chunk = tool_call_chunk(
+                    name=None if index else tool_name,
+                    args=content,
+                    id=None if index else _FAKE_TOOL_CALL_ID,
+                    index=0,
+                )
+                message = AIMessageChunk(content="", tool_call_chunks=[chunk])
+            else:
+                message = AIMessageChunk(content=content)
+            chunks.append(ChatGenerationChunk(message=message))
+        return chunks
+
+    def _final_chunk(
+        self, messages: list[BaseMessage], text: str, **kwargs: Any
+    ) -> ChatGenerationChunk:
+        """응답 메타데이터와 사용량을 담은 마지막 스트리밍 청크."""
+        return ChatGenerationChunk(
+            message=AIMessageChunk(
+                content="",
+                response_metadata=self._response_metadata(**kwargs),
+                usage_metadata=self._usage(messages, text),
+            )
+        )
+
+    def _sample_latency(self, median: float) -> float:
+        """중앙값이 median인 로그정규 분포 표본."""
+        if median <= 0:
+            return 0.0
+        return median * self._rng.lognormvariate(0.0, self.latency_sigma)
+
+    def _response_metadata(self, **kwargs: Any) -> dict[str, Any]:
+        stop_reason = "tool_use" if forced_tool_name(kwargs) else "end_turn"
+        return {"model_name": kwargs.get("model") or self.model_name, "stop_reason": stop_reason}
+
+    def _usage(self, messages: list[BaseMessage], text: str) -> dict[str, Any]:
+        input_tokens = self._estimator.raw_estimate(messages)
+        output_tokens = self._estimator.raw_estimate(text)
+        return {
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+        }
+
+
+def _error_delay(kind: str, ttft: float) -> float:
+    """오류 응답까지의 지연 (타임아웃은 첫 토큰 지연만큼, 나머지 오류는 즉시 응답)."""
+    return ttft if kind == "timeout" else ttft * 0.1
+
+
+def forced_tool_name(kwargs: dict[str, Any]) -> str | None:
+    """tool_choice로 호출을 강제한 도구 이름 (도구 호출 방식이 아니면 None)."""
+    tool_choice = kwargs.get("tool_choice")
+    if isinstance(tool_choice, dict) and tool_choice.get("type") == "tool":
+        return tool_choice.get("name")
+    return None
+
+
+def build_fake_chat_model() -> FakeReviewChatModel:
+    """설정값으로 가짜 채팅 모델 생성."""
+    config = get_ai_config()
+    return FakeReviewChatModel(
+        ttft_ms=config.fake_llm_ttft_ms,
+        latency_sigma=config.fake_llm_latency_sigma,
+        output_tokens_per_second=config.fake_llm_output_tokens_per_second,
+        output_tokens=config.fake_llm_output_tokens,
+        error_rate=config.fake_llm_error_rate,
+        error_types=config.fake_llm_error_type_list,
+        seed=config.fake_llm_seed,
+        streaming=config.anthropic_streaming_enabled,
+    )
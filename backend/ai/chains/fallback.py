@@ -0,0 +1,121 @@
+"""과부하 시 모델 폴백 체인.
+
+설정된 모델이 과부하(529)나 타임아웃으로 실패하면 같은 모델을 재시도하지 않고
+다음 순위 모델로 즉시 넘겨 호출합니다. 과부하가 난 모델은 일정 시간 건너뛰며,
+타임아웃은 연속으로 반복될 때만 건너뜁니다.
+"""
+
+import logging
+import time
+from collections import Counter
+from typing import Any
+
+from anthropic import APITimeoutError, OverloadedError
+from langchain_core.language_models import LanguageModelInput
+from langchain_core.messages import BaseMessage
+from langchain_core.runnables import RunnableConfig
+
+from backend.ai.chains.gateway import ChatModel
+
+logger = logging.getLogger(__name__)
+
+# 다음 모델로 넘기는 예외
+FALLBACK_ERRORS = (OverloadedError, APITimeoutError)
+
+
+class ModelFallbackChain:
+    """우선순위 모델 목록을 따라 호출하는 폴백 체인.
+
+    호출 시 model 인자로 1순위 모델을 바꿀 수 있으며(단계별 라우팅), 나머지 폴백
+    모델은 설정 순서를 따릅니다. 응답 메시지의 response_metadata["model_name"]에
+    실제로 응답한 모델을 기록합니다.
+    """
+
+    def __init__(
+        self,
+        model: ChatModel,
+        default_model: str,
+        fallback_models: list[str],
+        cooldown_seconds: float = 30.0,
+        timeout_threshold: int = 2,
+    ):
+        self._model = model
+        self._default_model = default_model
+        self._fallback_models = fallback_models
+        self._cooldown_seconds = cooldown_seconds
+        self._timeout_threshold = timeout_threshold
+
+        self._cooldown_until: dict[str, float] = {}
+        self._consecutive_timeouts: Counter[str] = Counter()
+        self._served: Counter[str] = Counter()
+        self._fallbacks: Counter[str] = Counter()
+
+    def candidates(self, primary: str | None = None) -> list[str]:
+        """이번 호출에서 시도할 모델 순서.
+
+        건너뛰는 중인 모델은 뒤로 보내되 목록에서 빼지는 않습니다 (모두 과부하일 때 대비).
+        """
+        ordered = list(dict.fromkeys([primary or self._default_model, *self._fallback_models]))
+        now = time.monotonic()
+        healthy = [name for name in ordered if self._cooldown_until.get(name, 0.0) <= now]
+        return healthy + [name for name in ordered if name not in healthy]
+
+    async def ainvoke(
+        self, input: LanguageModelInput, config: RunnableConfig | None = None, **kwargs: Any
+    ) -> BaseMessage:
+        """우선순위대로 모델을 호출하고 과부하/타임아웃이면 다음 모델로 넘김."""
+        candidates = self.candidates(kwargs.pop("model", None))
+        for name, next_model in zip(candidates, candidates[1:], strict=False):
+            try:
+                return await self._call(name, input, config, **kwargs)
+            except FALLBACK_ERRORS as e:
+                self._fallbacks[f"{name}->{next_model}"] += 1
+                logger.warning(
+                    f"모델 폴백: {name} -> {next_model}",
+                    extra={
+                        "model": name,
+                        "fallback_model": next_model,
+                        "error_type": type(e).__name__,
+                    },
+                )
+
+        return await self._call(candidates[-1], input, config, **kwargs)
+
+    def snapshot(self) -> dict[str, Any]:
+        """모델별 응답 수, 폴백 횟수, 건너뛰는 중인 모델 반환."""
+        now = time.monotonic()
+        return {
+            "served": dict(self._served),
+            "fallbacks": dict(self._fallbacks),
+            "cooling_down": {
+                name: round((until - now) * 1000)
+                for name, until in self._cooldown_until.items()
+                if until > now
+            },
+        }
+
+    async def _call(
+        self,
+        name: str,
+        messages: LanguageModelInput,
+        config: RunnableConfig | None,
+        **kwargs: Any,
+    ) -> BaseMessage:
+        try:
+            result = await self._model.ainvoke(messages, config, model=name, **kwargs)
+        except FALLBACK_ERRORS as e:
+            self._on_failure(name, e)
+            raise
+
+        self._consecutive_timeouts[name] = 0
+        self._served[name] += 1
+        result.response_metadata.setdefault("model_name", name)
+        return result
+
+    def _on_failure(self, name: str, error: BaseException) -> None:
+        if isinstance(error, APITimeoutError):
+            self._consecutive_timeouts[name] += 1
+            if self._consecutive_timeouts[name] < self._timeout_threshold:
+                return
+            self._consecutive_timeouts[name] = 0
+        self._cooldown_until[name] = time.monotonic() + self._cooldown_seconds
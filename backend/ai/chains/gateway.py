@@ -0,0 +1,204 @@
+"""LLM 호출 정책 계층.
+
+체인(prompt | llm | parser)의 llm 자리에 들어가 실제 모델 호출 전후에
+재시도, 서킷 브레이커, 동시성 제한 같은 프로세스 전역 정책을 적용합니다.
+"""
+
+import asyncio
+import time
+from typing import Any, Protocol
+
+from anthropic import OverloadedError, RateLimitError
+from langchain_core.language_models import LanguageModelInput
+from langchain_core.messages import BaseMessage
+from langchain_core.runnables import Runnable, RunnableConfig, RunnableLambda
+
+from backend.ai.chains.circuit_breaker import CircuitBreaker
+from backend.ai.chains.hedging import HedgingPolicy
+from backend.ai.chains.limiter import AdaptiveConcurrencyLimiter
+from backend.ai.chains.rate_shaper import TokenRateShaper
+from backend.ai.chains.retry import RetryPolicy, remaining_time
+from backend.ai.chains.routing import LLMRoute, ModelRouter
+from backend.ai.chains.token_budget import (
+    OutputTokenBudget,
+    build_continuation_input,
+    is_truncated,
+    output_tokens,
+    stitch_continuation,
+)
+
+# 동시성 한도를 줄여야 하는 응답 (429, 529)
+OVERLOAD_ERRORS = (RateLimitError, OverloadedError)
+
+# 라우트/관찰값이 없을 때 TPM 예약에 쓰는 예상 출력 토큰 수
+DEFAULT_EXPECTED_OUTPUT_TOKENS = 1024
+
+
+class ChatModel(Protocol):
+    """게이트웨이가 호출하는 모델 인터페이스 (Runnable 또는 키 풀/폴백 체인)."""
+
+    async def ainvoke(
+        self, input: LanguageModelInput, config: RunnableConfig | None = None, **kwargs: Any
+    ) -> BaseMessage: ...
+
+
+def stage_key(config: RunnableConfig | None) -> str:
+    """RunnableConfig metadata에서 단계 식별 키(target_type:stage) 추출."""
+    metadata = (config or {}).get("metadata") or {}
+    return f"{metadata.get('target_type', 'unknown')}:{metadata.get('stage', 'unknown')}"
+
+
+class LLMGateway:
+    """모델 호출을 감싸는 정책 계층.
+
+    재시도 정책이 가장 바깥에 있고, 각 시도마다 동시성 슬롯을 새로 획득한 뒤 서킷
+    브레이커 허용 여부를 확인합니다. 브레이커는 슬롯 대기 시간을 호출 지연에 포함하지
+    않습니다. 백오프 대기 중에는 슬롯을 점유하지 않으며, 서킷이 열리면
+    CircuitOpenError가 재시도 없이 즉시 전파됩니다.
+
+    헤징 정책이 주어지면 재시도 루프 전체를 헤징 대상으로 삼습니다. 단계별 지연 분포와
+    모델 라우팅은 RunnableConfig metadata의 target_type / stage 값으로 구분합니다.
+
+    응답이 max_tokens에서 잘리면 max_continuations회까지 이어서 생성해 하나의 메시지로
+    합칩니다. 이어쓰기 호출도 위 정책을 모두 거칩니다. 도구 호출 응답은 assistant
+    prefill로 이어 쓸 수 없으므로 이어쓰기 대신, 출력 예산이 낮춘 max_tokens에서
+    잘렸을 때 라우트의 max_tokens로 한 번 다시 요청합니다.
+
+    TPM 셰이퍼가 있으면 생성 요청마다 입력/예상 출력 토큰을 예약하고, 예산이 부족하면
+    재시도 루프에 들어가기 전에 기다립니다.
+    """
+
+    def __init__(
+        self,
+        model: ChatModel,
+        limiter: AdaptiveConcurrencyLimiter,
+        retry_policy: RetryPolicy,
+        circuit_breaker: CircuitBreaker,
+        hedging: HedgingPolicy | None = None,
+        router: ModelRouter | None = None,
+        output_budget: OutputTokenBudget | None = None,
+        max_continuations: int = 0,
+        rate_shaper: TokenRateShaper | None = None,
+    ):
+        self._model = model
+        self._limiter = limiter
+        self._retry_policy = retry_policy
+        self._circuit_breaker = circuit_breaker
+        self._hedging = hedging
+        self._router = router
+        self._output_budget = output_budget
+        self._max_continuations = max_continuations
+        self._rate_shaper = rate_shaper
+
+    async def ainvoke(
+        self, messages: LanguageModelInput, config: RunnableConfig | None = None, **kwargs: Any
+    ) -> BaseMessage:
+        """재시도 정책에 따라 모델 호출.
+
+        라우터가 있으면 단계에 맞는 모델/생성 파라미터를 적용하고, 출력 토큰 예산이 있으면
+        라우트의 max_tokens를 관찰한 출력 길이에 맞춥니다. kwargs로 직접 준 값이 우선하며
+        kwargs는 모델 호출 인자로 그대로 전달됩니다.
+        """
+        route = self._router.resolve_config(config) if self._router else None
+        # 출력 예산이 max_tokens를 라우트 설정값보다 낮췄는지 (kwargs로 직접 준 경우 제외)
+        budget_lowered = False
+        if route is not None:
+            route_kwargs = route.call_kwargs()
+            if self._output_budget is not None:
+                suggested = self._output_budget.suggest(route.key, route.max_tokens)
+                route_kwargs["max_tokens"] = suggested
+                budget_lowered = suggested < route.max_tokens and "max_tokens" not in kwargs
+            kwargs = {**route_kwargs, **kwargs}
+
+        expected_output = self._expected_output_tokens(route, kwargs)
+        started = time.monotonic()
+        result = await self._generate(messages, config, expected_output, **kwargs)
+        if kwargs.get("tools"):
+            # 도구 호출은 prefill로 이어 쓸 수 없으므로 예산 때문에 잘렸다면 라우트 상한으로 재요청
+            if route is not None and budget_lowered and is_truncated(result):
+                kwargs = {**kwargs, "max_tokens": route.max_tokens}
+                result = await self._generate(messages, config, expected_output, **kwargs)
+            max_continuations = 0
+        else:
+            max_continuations = self._max_continuations
+        continuations = 0
+        while is_truncated(result) and continuations < max_continuations:
+            continuations += 1
+            partial = result.text
+            tail = await self._generate(
+                build_continuation_input(messages, partial), config, expected_output, **kwargs
+            )
+            result = stitch_continuation(partial, result, tail)
+
+        if route is not None and self._router is not None:
+            self._router.record(route, time.monotonic() - started)
+        if route is not None and self._output_budget is not None:
+            tokens = output_tokens(result)
+            if tokens is not None:
+                self._output_budget.record(route.key, tokens)
+        return result
+
+    async def _generate(
+        self,
+        messages: LanguageModelInput,
+        config: RunnableConfig | None,
+        expected_output: int,
+        **kwargs: Any,
+    ) -> BaseMessage:
+        """한 번의 생성 요청: TPM 예약 후 재시도 정책(및 헤징)을 적용해 모델 호출."""
+
+        async def call() -> BaseMessage:
+            if self._rate_shaper is None:
+                return await self._retry_policy.call(
+                    lambda: self._attempt(messages, config, **kwargs)
+                )
+
+            reservation = await self._rate_shaper.reserve(messages, expected_output)
+            try:
+                result = await self._retry_policy.call(
+                    lambda: self._attempt(messages, config, **kwargs)
+                )
+            except asyncio.CancelledError:
+                # 헤징에서 진 요청처럼 이미 보낸 뒤 취소된 호출도 과금되므로 예약분을 그대로 차감
+                raise
+            except BaseException:
+                self._rate_shaper.cancel(reservation)
+                raise
+            self._rate_shaper.reconcile(reservation, result)
+            return result
+
+        if self._hedging is None:
+            return await call()
+        return await self._hedging.run(stage_key(config), call)
+
+    def _expected_output_tokens(self, route: LLMRoute | None, kwargs: dict[str, Any]) -> int:
+        """TPM 예약에 쓸 예상 출력 토큰 수 (관찰 중앙값 → max_tokens → 기본값 순)."""
+        if route is not None and self._output_budget is not None:
+            expected = self._output_budget.expected(route.key)
+            if expected is not None:
+                return expected
+        max_tokens: int = kwargs.get("max_tokens", DEFAULT_EXPECTED_OUTPUT_TOKENS)
+        return max_tokens
+
+    async def _attempt(
+        self, messages: LanguageModelInput, config: RunnableConfig | None, **kwargs: Any
+    ) -> BaseMessage:
+        """단일 시도: 동시성 슬롯을 점유한 채 데드라인 안에서 모델을 호출.
+
+        데드라인 타이머는 서킷 브레이커 바깥에 두어, 요청 데드라인 만료(호출 취소)는
+        공급자 장애로 기록되지 않고 전송 타임아웃(APITimeoutError)만 기록됩니다.
+        """
+        async with self._limiter.slot(), asyncio.timeout(remaining_time()):
+            async with self._circuit_breaker.guard():
+                try:
+                    result = await self._model.ainvoke(messages, config, **kwargs)
+                except OVERLOAD_ERRORS:
+                    self._limiter.record_overload()
+                    raise
+
+        self._limiter.record_success()
+        return result
+
+    def as_runnable(self) -> Runnable[LanguageModelInput, BaseMessage]:
+        """체인에 조합할 수 있는 Runnable로 변환."""
+        return RunnableLambda(self.ainvoke, name="LLMGateway")
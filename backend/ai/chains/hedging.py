@@ -0,0 +1,147 @@
+"""LLM 호출 헤징 (tail latency 완화).
+
+같은 단계(타겟 타입 × 평가/개선)의 최근 지연 분포에서 구한 백분위 임계값까지
+응답이 없으면 동일한 요청을 한 번 더 보내고, 먼저 끝난 쪽을 채택한 뒤 나머지는 취소합니다.
+추가 호출량은 재시도 예산과 같은 토큰 버킷으로 제한합니다.
+"""
+
+import asyncio
+import logging
+import time
+from collections import defaultdict, deque
+from collections.abc import Awaitable, Callable
+from functools import lru_cache
+from typing import Any, TypeVar
+
+from backend.ai.chains.retry import RetryBudget
+from backend.ai.config import get_ai_config
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class LatencyTracker:
+    """키별 최근 표본(지연 시간, 토큰 수 등) 슬라이딩 윈도우."""
+
+    def __init__(self, window_size: int = 200):
+        self._samples: dict[str, deque[float]] = defaultdict(lambda: deque(maxlen=window_size))
+
+    def record(self, key: str, elapsed: float) -> None:
+        """표본 기록."""
+        self._samples[key].append(elapsed)
+
+    def count(self, key: str) -> int:
+        """기록된 표본 수."""
+        return len(self._samples[key])
+
+    def percentile(self, key: str, q: float) -> float | None:
+        """q 백분위(0~1) 값. 표본이 없으면 None."""
+        samples = self._samples.get(key)
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(q * len(ordered)))
+        return ordered[index]
+
+
+class HedgingPolicy:
+    """적응형 백분위 임계값 기반 헤징 정책."""
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        min_samples: int = 20,
+        min_delay: float = 1.0,
+        budget: RetryBudget | None = None,
+        tracker: LatencyTracker | None = None,
+    ):
+        self._percentile = percentile
+        self._min_samples = min_samples
+        self._min_delay = min_delay
+        self._budget = budget or RetryBudget(ratio=0.05, capacity=5.0)
+        self._tracker = tracker or LatencyTracker()
+
+        self._calls_total = 0
+        self._hedged_total = 0
+        self._hedge_wins = 0
+
+    def hedge_delay(self, key: str) -> float | None:
+        """두 번째 요청을 보낼 때까지 기다릴 시간. 표본이 부족하면 None (헤징 안 함)."""
+        if self._tracker.count(key) < self._min_samples:
+            return None
+        threshold = self._tracker.percentile(key, self._percentile)
+        if threshold is None:
+            return None
+        return max(self._min_delay, threshold)
+
+    async def run(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """fn을 실행하고 임계값을 넘기면 한 번 더 실행해 먼저 성공한 결과를 반환."""
+        self._calls_total += 1
+        self._budget.record_request()
+        started = time.monotonic()
+
+        primary = asyncio.ensure_future(fn())
+        tasks: set[asyncio.Future[T]] = {primary}
+        try:
+            delay = self.hedge_delay(key)
+            if delay is not None:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if not done and self._budget.try_withdraw():
+                    self._hedged_total += 1
+                    logger.info(
+                        f"LLM 헤지 요청 발송: key={key}, delay={delay:.2f}s",
+                        extra={"hedge_key": key, "hedge_delay": delay},
+                    )
+                    tasks.add(asyncio.ensure_future(fn()))
+
+            winner = await self._first_success(tasks)
+            if winner is not primary:
+                self._hedge_wins += 1
+            self._tracker.record(key, time.monotonic() - started)
+            return winner.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def snapshot(self) -> dict[str, Any]:
+        """헤지 발송률 및 헤지 승률 반환."""
+        return {
+            "calls_total": self._calls_total,
+            "hedged_total": self._hedged_total,
+            "hedge_wins": self._hedge_wins,
+            "hedge_rate": (
+                round(self._hedged_total / self._calls_total, 4) if self._calls_total else 0.0
+            ),
+            "win_rate": (
+                round(self._hedge_wins / self._hedged_total, 4) if self._hedged_total else 0.0
+            ),
+            "budget_balance": round(self._budget.balance, 2),
+        }
+
+    @staticmethod
+    async def _first_success(tasks: set[asyncio.Future[T]]) -> asyncio.Future[T]:
+        """가장 먼저 성공한 작업 반환. 모두 실패하면 마지막 예외를 던짐."""
+        pending = set(tasks)
+        error: BaseException | None = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task
+                error = task.exception()
+        assert error is not None
+        raise error
+
+
+@lru_cache
+def get_hedging_policy() -> HedgingPolicy:
+    """프로세스 전역 헤징 정책 싱글톤 반환."""
+    config = get_ai_config()
+    return HedgingPolicy(
+        percentile=config.llm_hedging_percentile,
+        min_samples=config.llm_hedging_min_samples,
+        min_delay=config.llm_hedging_min_delay,
+        budget=RetryBudget(ratio=config.llm_hedging_budget_ratio, capacity=5.0),
+    )
@@ -0,0 +1,143 @@
+"""Anthropic API용 공유 HTTP 커넥션 풀.
+
+모든 API 키 클라이언트가 하나의 httpx 커넥션 풀을 공유합니다. 풀 크기와 keepalive는
+LLM 동시성 한도에 맞춰 설정하며(SDK 기본 keepalive는 5초라 트래픽 사이마다 TLS
+연결을 다시 맺게 됨), 요청 훅에서 풀 대기 시간과 새 연결 수를 측정합니다.
+
+풀 한도는 SDK 기본 한도(anthropic.DEFAULT_CONNECTION_LIMITS)와 같은 타입으로 만들어
+SDK가 내부적으로 쓰는 httpx 구현과 맞춥니다.
+"""
+
+import time
+from functools import lru_cache
+from typing import Any
+
+import anthropic
+
+from backend.ai.config import get_ai_config
+
+# 요청이 커넥션을 배정받아 실제 전송을 시작했음을 나타내는 httpcore trace 이벤트
+_DISPATCH_EVENTS = frozenset(
+    {
+        "connection.connect_tcp.started",
+        "http11.send_request_headers.started",
+        "http2.send_request_headers.started",
+    }
+)
+_CONNECT_STARTED = "connection.connect_tcp.started"
+_CONNECT_COMPLETE_EVENTS = frozenset(
+    {"connection.connect_tcp.complete", "connection.start_tls.complete"}
+)
+
+
+class HTTPPoolMonitor:
+    """풀 대기 시간, 연결 수립 시간, 새 연결 수를 기록하는 커넥션 풀 모니터.
+
+    httpx 요청 훅으로 요청마다 httpcore trace 콜백을 걸어 측정하므로 SDK가 쓰는
+    httpx 구현(전송 계층)을 바꾸지 않습니다.
+    """
+
+    def __init__(self) -> None:
+        self._requests_total = 0
+        self._connections_opened = 0
+        self._wait_seconds_total = 0.0
+        self._wait_seconds_max = 0.0
+        self._connect_seconds_total = 0.0
+
+    async def on_request(self, request: Any) -> None:
+        """httpx 요청 훅: 전송 시작까지의 대기 시간을 재는 trace 콜백 등록."""
+        started = time.monotonic()
+        state: dict[str, float] = {}
+        previous_trace = request.extensions.get("trace")
+
+        async def trace(event_name: str, info: dict[str, Any]) -> None:
+            now = time.monotonic()
+            if "dispatched" not in state and event_name in _DISPATCH_EVENTS:
+                state["dispatched"] = now
+                self._record_wait(now - started)
+            if event_name == _CONNECT_STARTED:
+                state["connect_started"] = now
+                self._connections_opened += 1
+            elif event_name in _CONNECT_COMPLETE_EVENTS and "connect_started" in state:
+                # TCP 완료 후 TLS 완료 시점으로 갱신되므로 마지막 값만 누적
+                elapsed = now - state["connect_started"]
+                self._connect_seconds_total += elapsed - state.get("connect_elapsed", 0.0)
+                state["connect_elapsed"] = elapsed
+            if previous_trace is not None:
+                await previous_trace(event_name, info)
+
+        self._requests_total += 1
+        request.extensions = {**request.extensions, "trace": trace}
+
+    def snapshot(self, client: Any | None = None) -> dict[str, Any]:
+        """커넥션 풀 상태와 대기/연결 지표 반환 (client를 주면 현재 연결 수 포함)."""
+        pool = getattr(getattr(client, "_transport", None), "_pool", None)
+        connections = list(getattr(pool, "connections", []))
+        idle = sum(1 for connection in connections if connection.is_idle())
+        return {
+            "connections": len(connections),
+            "in_use": len(connections) - idle,
+            "idle": idle,
+            "waiting": sum(1 for request in getattr(pool, "_requests", []) if request.is_queued()),
+            "requests_total": self._requests_total,
+            "connections_opened_total": self._connections_opened,
+            "connection_reuse_rate": (
+                round(1 - self._connections_opened / self._requests_total, 4)
+                if self._requests_total
+                else 0.0
+            ),
+            "wait_ms_avg": (
+                round(self._wait_seconds_total / self._requests_total * 1000, 2)
+                if self._requests_total
+                else 0.0
+            ),
+            "wait_ms_max": round(self._wait_seconds_max * 1000, 2),
+            "connect_ms_avg": (
+                round(self._connect_seconds_total / self._connections_opened * 1000, 2)
+                if self._connections_opened
+                else 0.0
+            ),
+        }
+
+    def _record_wait(self, elapsed: float) -> None:
+        self._wait_seconds_total += elapsed
+        self._wait_seconds_max = max(self._wait_seconds_max, elapsed)
+
+
+def build_http_client(
+    max_connections: int,
+    max_keepalive_connections: int | None = None,
+    keepalive_expiry: float | None = 5.0,
+    monitor: HTTPPoolMonitor | None = None,
+) -> anthropic.DefaultAsyncHttpxClient:
+    """SDK 기본 설정(TCP keepalive 소켓 옵션 등)에 풀 한도와 모니터 훅을 더한 클라이언트 생성."""
+    limits = type(anthropic.DEFAULT_CONNECTION_LIMITS)(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+    event_hooks = {"request": [monitor.on_request]} if monitor is not None else None
+    return anthropic.DefaultAsyncHttpxClient(limits=limits, event_hooks=event_hooks)
+
+
+@lru_cache
+def get_http_pool_monitor() -> HTTPPoolMonitor:
+    """공유 커넥션 풀 모니터 싱글톤 반환."""
+    return HTTPPoolMonitor()
+
+
+@lru_cache
+def get_http_client() -> anthropic.DefaultAsyncHttpxClient:
+    """모든 Anthropic 클라이언트가 공유하는 httpx 클라이언트 싱글톤 반환."""
+    config = get_ai_config()
+    return build_http_client(
+        max_connections=config.anthropic_http_max_connections,
+        max_keepalive_connections=config.anthropic_http_max_keepalive_connections,
+        keepalive_expiry=config.anthropic_http_keepalive_expiry,
+        monitor=get_http_pool_monitor(),
+    )
+
+
+def get_http_pool_stats() -> dict[str, Any]:
+    """공유 커넥션 풀 지표 반환."""
+    return get_http_pool_monitor().snapshot(get_http_client())
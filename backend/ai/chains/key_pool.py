@@ -0,0 +1,155 @@
+"""Anthropic API 키 풀.
+
+키마다 별도 클라이언트를 두고, 호출마다 사용 가능한 키 중 진행 중 요청이 가장 적은
+키를 고릅니다. 429 또는 인증/권한 오류를 받은 키는 일정 시간 순환에서 제외하고,
+아직 시도하지 않은 정상 키가 있으면 같은 시도 안에서 즉시 넘겨 호출합니다.
+"""
+
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+from anthropic import AuthenticationError, PermissionDeniedError, RateLimitError
+from langchain_core.language_models import LanguageModelInput
+from langchain_core.messages import BaseMessage
+from langchain_core.runnables import Runnable, RunnableConfig
+
+from backend.ai.chains.retry import parse_retry_after
+
+logger = logging.getLogger(__name__)
+
+# 키를 순환에서 제외하는 인증/권한 오류
+AUTH_ERRORS = (AuthenticationError, PermissionDeniedError)
+
+T = TypeVar("T")
+
+
+def mask_api_key(api_key: str) -> str:
+    """로그/지표용 키 식별자 (마지막 4자리만 노출)."""
+    return f"...{api_key[-4:]}"
+
+
+class APIKeySlot:
+    """키 하나의 클라이언트와 사용량/상태."""
+
+    def __init__(self, name: str, client: Runnable[LanguageModelInput, BaseMessage]):
+        self.name = name
+        self.client = client
+        self.in_flight = 0
+        self.cooldown_until = 0.0
+
+        self.requests_total = 0
+        self.errors_total = 0
+        self.rate_limited_total = 0
+        self.auth_errors_total = 0
+
+    def cooldown_remaining(self) -> float:
+        """순환 제외가 풀리기까지 남은 시간(초)."""
+        return max(0.0, self.cooldown_until - time.monotonic())
+
+    def is_available(self) -> bool:
+        """순환에 포함되어 있는지 여부."""
+        return self.cooldown_remaining() <= 0
+
+    def snapshot(self) -> dict[str, Any]:
+        """키별 사용량 지표 반환."""
+        return {
+            "key": self.name,
+            "available": self.is_available(),
+            "in_flight": self.in_flight,
+            "requests_total": self.requests_total,
+            "errors_total": self.errors_total,
+            "rate_limited_total": self.rate_limited_total,
+            "auth_errors_total": self.auth_errors_total,
+            "cooldown_remaining_ms": round(self.cooldown_remaining() * 1000),
+        }
+
+
+class APIKeyPool:
+    """최소 부하 키 선택과 키별 쿨다운을 수행하는 API 키 풀."""
+
+    def __init__(
+        self,
+        slots: list[APIKeySlot],
+        cooldown_seconds: float = 30.0,
+        auth_cooldown_seconds: float = 300.0,
+    ):
+        if not slots:
+            raise ValueError("API 키 풀에는 최소 하나의 키가 필요합니다.")
+        self._slots = slots
+        self._cooldown_seconds = cooldown_seconds
+        self._auth_cooldown_seconds = auth_cooldown_seconds
+
+    def select(self, exclude: set[str] | None = None) -> APIKeySlot | None:
+        """사용 가능한 키 중 진행 중 요청이 가장 적은 키 선택.
+
+        사용 가능한 키가 하나도 없으면 쿨다운이 가장 먼저 끝나는 키를 고릅니다.
+        exclude에 포함된 키는 제외하며, 남는 키가 없으면 None.
+        """
+        candidates = [slot for slot in self._slots if slot.name not in (exclude or set())]
+        if not candidates:
+            return None
+
+        available = [slot for slot in candidates if slot.is_available()]
+        if available:
+            return min(available, key=lambda slot: (slot.in_flight, slot.requests_total))
+        if exclude:
+            # 이미 다른 키로 시도했다면 쿨다운 중인 키로 넘기지 않고 오류를 전파
+            return None
+        return min(candidates, key=lambda slot: slot.cooldown_until)
+
+    async def ainvoke(
+        self, input: LanguageModelInput, config: RunnableConfig | None = None, **kwargs: Any
+    ) -> BaseMessage:
+        """선택한 키로 모델 호출. 429/인증 오류 시 다른 정상 키로 즉시 넘김."""
+        return await self.call(lambda slot: slot.client.ainvoke(input, config, **kwargs))
+
+    async def call(self, operation: Callable[[APIKeySlot], Awaitable[T]]) -> T:
+        """선택한 키로 임의의 API 작업 수행. 429/인증 오류 시 다른 정상 키로 즉시 넘김.
+
+        모델 호출이 아닌 API(예: Message Batches 제출)도 같은 키 선택/쿨다운/사용량
+        집계를 따르게 합니다.
+        """
+        tried: set[str] = set()
+        slot = self.select()
+        while True:
+            assert slot is not None
+            tried.add(slot.name)
+            try:
+                return await self._call(slot, operation)
+            except (RateLimitError, *AUTH_ERRORS) as e:
+                self._cool_down(slot, e)
+                slot = self.select(exclude=tried)
+                if slot is None:
+                    raise
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        """키별 사용량 지표 반환."""
+        return [slot.snapshot() for slot in self._slots]
+
+    @staticmethod
+    async def _call(slot: APIKeySlot, operation: Callable[[APIKeySlot], Awaitable[T]]) -> T:
+        slot.in_flight += 1
+        slot.requests_total += 1
+        try:
+            return await operation(slot)
+        except Exception:
+            slot.errors_total += 1
+            raise
+        finally:
+            slot.in_flight -= 1
+
+    def _cool_down(self, slot: APIKeySlot, error: BaseException) -> None:
+        if isinstance(error, RateLimitError):
+            slot.rate_limited_total += 1
+            duration = parse_retry_after(error) or self._cooldown_seconds
+        else:
+            slot.auth_errors_total += 1
+            duration = self._auth_cooldown_seconds
+
+        slot.cooldown_until = max(slot.cooldown_until, time.monotonic() + duration)
+        logger.warning(
+            f"API 키 순환 제외: key={slot.name}, duration={duration:.1f}s",
+            extra={"api_key": slot.name, "error_type": type(error).__name__},
+        )
@@ -0,0 +1,152 @@
+"""LLM 호출 동시성 제한기 (AIMD)."""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Any
+
+from backend.ai.config import get_ai_config
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD(Additive Increase, Multiplicative Decrease) 방식의 적응형 동시성 제한기.
+
+    호출이 성공하면 허용 동시성을 조금씩(가법적으로) 늘리고, RateLimitError나
+    과부하 응답을 받으면 곱셈적으로 줄입니다. 한도를 넘는 호출은 FIFO 순서로 대기합니다.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        increase_step: float = 1.0,
+        decrease_factor: float = 0.5,
+        decrease_cooldown: float = 1.0,
+    ):
+        self._limit = float(initial_limit)
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._increase_step = increase_step
+        self._decrease_factor = decrease_factor
+        # 하나의 429 폭주에 대해 한도를 여러 번 깎지 않도록 감소 간 최소 간격(초)
+        self._decrease_cooldown = decrease_cooldown
+        self._last_decrease = 0.0
+
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+        # 관측 지표
+        self._acquired_total = 0
+        self._overloads_total = 0
+        self._queue_wait_total = 0.0
+        self._queue_wait_max = 0.0
+
+    @property
+    def limit(self) -> int:
+        """현재 허용 동시성."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """현재 진행 중인 호출 수."""
+        return self._in_flight
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """동시성 슬롯을 점유한 채로 블록을 실행."""
+        await self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    async def acquire(self) -> float:
+        """슬롯을 획득하고 대기 시간(초)을 반환."""
+        start = time.monotonic()
+
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+        else:
+            waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # 슬롯을 받은 직후 취소된 경우 슬롯을 반납
+                    self.release()
+                else:
+                    self._waiters.remove(waiter)
+                raise
+
+        waited = time.monotonic() - start
+        self._acquired_total += 1
+        self._queue_wait_total += waited
+        self._queue_wait_max = max(self._queue_wait_max, waited)
+        return waited
+
+    def release(self) -> None:
+        """슬롯을 반납하고 대기 중인 호출을 깨움."""
+        self._in_flight -= 1
+        self._wake_waiters()
+
+    def record_success(self) -> None:
+        """성공한 호출 반영: 한도를 가법적으로 증가 (한도당 약 +increase_step)."""
+        previous = self.limit
+        self._limit = min(self._max_limit, self._limit + self._increase_step / self._limit)
+        if self.limit > previous:
+            self._wake_waiters()
+
+    def record_overload(self) -> None:
+        """Rate limit/과부하 응답 반영: 한도를 곱셈적으로 감소."""
+        self._overloads_total += 1
+
+        now = time.monotonic()
+        if now - self._last_decrease < self._decrease_cooldown:
+            return
+
+        self._last_decrease = now
+        previous = self.limit
+        self._limit = max(float(self._min_limit), self._limit * self._decrease_factor)
+        logger.warning(
+            f"LLM 동시성 한도 감소: {previous} -> {self.limit}",
+            extra={"previous_limit": previous, "limit": self.limit},
+        )
+
+    def snapshot(self) -> dict[str, Any]:
+        """튜닝용 현재 상태 및 누적 지표 반환."""
+        avg_wait = self._queue_wait_total / self._acquired_total if self._acquired_total else 0.0
+        return {
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "waiting": len(self._waiters),
+            "acquired_total": self._acquired_total,
+            "overloads_total": self._overloads_total,
+            "queue_wait_ms_avg": round(avg_wait * 1000, 2),
+            "queue_wait_ms_max": round(self._queue_wait_max * 1000, 2),
+        }
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
+
+
+@lru_cache
+def get_concurrency_limiter() -> AdaptiveConcurrencyLimiter:
+    """프로세스 전역 동시성 제한기 싱글톤 반환."""
+    config = get_ai_config()
+    return AdaptiveConcurrencyLimiter(
+        initial_limit=config.llm_concurrency_initial,
+        min_limit=config.llm_concurrency_min,
+        max_limit=config.llm_concurrency_max,
+    )
@@ -1,34 +1,246 @@
-from functools import lru_cache
+import asyncio
+import logging
+from functools import cached_property, lru_cache
+from typing import Any
 
-from anthropic import APIConnectionError, APITimeoutError, RateLimitError
+import anthropic
 from langchain_anthropic import ChatAnthropic
+from langchain_core.language_models import BaseChatModel, LanguageModelInput
+from langchain_core.messages import BaseMessage, SystemMessage
+from langchain_core.runnables import Runnable
 
+from backend.ai.chains.batch import (
+    AnthropicBatchClient,
+    BatchClient,
+    LocalBatchClient,
+    MessageBatcher,
+)
+from backend.ai.chains.cassette import CassetteRecorder, CassetteReplayChatModel, get_llm_cassette
+from backend.ai.chains.circuit_breaker import get_circuit_breaker
+from backend.ai.chains.fake_llm import build_fake_chat_model
+from backend.ai.chains.fallback import ModelFallbackChain
+from backend.ai.chains.gateway import ChatModel, LLMGateway
+from backend.ai.chains.hedging import get_hedging_policy
+from backend.ai.chains.http_pool import get_http_client, get_http_pool_stats
+from backend.ai.chains.key_pool import APIKeyPool, APIKeySlot, mask_api_key
+from backend.ai.chains.limiter import get_concurrency_limiter
+from backend.ai.chains.rate_shaper import get_token_rate_shaper
+from backend.ai.chains.retry import get_retry_policy
+from backend.ai.chains.routing import get_model_router
+from backend.ai.chains.telemetry import get_llm_telemetry
+from backend.ai.chains.token_budget import get_output_token_budget
 from backend.ai.config import get_ai_config
 
+logger = logging.getLogger(__name__)
+
+# Anthropic 프롬프트 캐시 브레이크포인트 (기본 TTL 5분)
+PROMPT_CACHE_CONTROL = {"type": "ephemeral"}
+
+
+class PooledChatAnthropic(ChatAnthropic):
+    """프로세스 공유 HTTP 커넥션 풀을 사용하는 ChatAnthropic."""
+
+    @cached_property
+    def _async_client(self) -> anthropic.AsyncClient:
+        return anthropic.AsyncClient(**self._client_params, http_client=get_http_client())
+
+
+@lru_cache
+def get_api_key_pool() -> APIKeyPool:
+    """API 키별 Anthropic 클라이언트로 구성한 키 풀 싱글톤 반환."""
+    config = get_ai_config()
+
+    slots = [
+        APIKeySlot(f"{index}:{mask_api_key(api_key)}", _build_chat_model(api_key))
+        for index, api_key in enumerate(config.anthropic_api_keys)
+    ]
+    return APIKeyPool(
+        slots,
+        cooldown_seconds=config.anthropic_key_cooldown_seconds,
+        auth_cooldown_seconds=config.anthropic_key_auth_cooldown_seconds,
+    )
+
+
+@lru_cache
+def get_fallback_chain() -> ModelFallbackChain:
+    """API 키 풀 위에 구성한 모델 폴백 체인 싱글톤 반환."""
+    config = get_ai_config()
+    return ModelFallbackChain(
+        get_api_key_pool(),
+        default_model=config.anthropic_model,
+        fallback_models=config.anthropic_fallback_model_list,
+        cooldown_seconds=config.llm_fallback_cooldown_seconds,
+        timeout_threshold=config.llm_fallback_timeout_threshold,
+    )
+
 
 @lru_cache
-def get_anthropic_client() -> ChatAnthropic:
-    """Anthropic Claude 클라이언트 싱글톤 반환."""
+def get_anthropic_client() -> Runnable[LanguageModelInput, BaseMessage]:
+    """Anthropic Claude 클라이언트 싱글톤 반환.
+
+    모든 호출은 LLMGateway의 재시도 정책, 서킷 브레이커, 프로세스 전역 동시성
+    제한기를 거치며, 설정에 따라 느린 호출은 헤징됩니다. 모델과 생성 파라미터는
+    (타겟 타입, 단계)별 라우팅 테이블과 출력 토큰 예산을 따르고, max_tokens에서 잘린
+    응답은 이어서 생성합니다. TPM 한도를 설정하면 분당 토큰 예산에 맞춰 호출을
+    페이싱합니다. 실제 호출은 모델 폴백 체인을 거쳐 API 키 풀에서 고른 키의
+    클라이언트로 보냅니다. 카세트 모드에 따라 호출을 녹화하거나 녹화된 응답을
+    재생합니다.
+    """
+    config = get_ai_config()
+
+    gateway = LLMGateway(
+        _build_gateway_model(),
+        get_concurrency_limiter(),
+        get_retry_policy(),
+        get_circuit_breaker(),
+        hedging=get_hedging_policy() if config.llm_hedging_enabled else None,
+        router=get_model_router(),
+        output_budget=get_output_token_budget() if config.llm_output_budget_enabled else None,
+        max_continuations=config.llm_max_continuations,
+        rate_shaper=get_token_rate_shaper() if config.tpm_shaping_enabled else None,
+    )
+    return gateway.as_runnable()
+
+
+def _build_gateway_model() -> ChatModel:
+    """게이트웨이가 호출할 모델 (카세트 모드에 따라 녹화/재생 래핑)."""
+    config = get_ai_config()
+    if config.llm_cassette_mode == "replay":
+        return CassetteReplayChatModel(
+            get_llm_cassette(), time_scale=config.llm_cassette_time_scale
+        )
+    if config.llm_cassette_mode == "record":
+        return CassetteRecorder(get_fallback_chain(), get_llm_cassette())
+    return get_fallback_chain()
+
+
+def _build_chat_model(api_key: str) -> BaseChatModel:
+    """API 키 하나에 대한 채팅 모델 클라이언트 생성.
+
+    llm_provider가 fake면 실제 API 대신 가짜 모델을 사용합니다 (부하 테스트용).
+
+    SDK 자체 재시도(max_retries)는 끄고 재시도를 게이트웨이 한 곳에서만 수행합니다.
+    HTTP 커넥션 풀은 모든 키가 공유합니다. 스트리밍을 켜면 응답은 한 메시지로
+    합쳐 반환되고, 콜백으로 첫 토큰 수신 시각을 관찰할 수 있습니다.
+    """
     config = get_ai_config()
+    if config.llm_provider == "fake":
+        return build_fake_chat_model()
 
-    client = ChatAnthropic(
+    return PooledChatAnthropic(
         model=config.anthropic_model,
-        anthropic_api_key=config.anthropic_api_key,
+        anthropic_api_key=api_key,
+        base_url=config.anthropic_base_url,
         max_tokens=config.anthropic_max_tokens,
         temperature=config.anthropic_temperature,
-        default_request_timeout=90.0,
+        default_request_timeout=config.anthropic_request_timeout,
+        max_retries=0,
+        streaming=config.anthropic_streaming_enabled,
     )
 
-    return client.with_retry(
-        retry_if_exception_type=(
-            APIConnectionError,
-            APITimeoutError,
-            RateLimitError,
-        ),
-        stop_after_attempt=3,
-        wait_exponential_jitter=True,
-        exponential_jitter_params={
-            "initial": 4,
-            "max": 10,
-        },
+
+@lru_cache
+def get_message_batcher() -> MessageBatcher:
+    """Message Batches 실행 모드에서 단계 호출을 모으는 배처 싱글톤 반환."""
+    config = get_ai_config()
+    return MessageBatcher(
+        _build_batch_client(),
+        router=get_model_router(),
+        max_batch_size=config.llm_batch_max_size,
+        flush_seconds=config.llm_batch_flush_seconds,
+        poll_seconds=config.llm_batch_poll_seconds,
+    )
+
+
+def _build_batch_client() -> BatchClient:
+    """배치 클라이언트 생성 (가짜 제공자면 로컬 대역)."""
+    if get_ai_config().llm_provider == "fake":
+        return LocalBatchClient(build_fake_chat_model())
+
+    # 배치도 실시간 경로와 같은 키 풀에서 키를 골라 제출 (키별 한도/쿨다운 공유)
+    return AnthropicBatchClient(get_api_key_pool())
+
+
+async def warm_up_llm_connections() -> int:
+    """앱 시작 시 LLM 클라이언트를 만들고 커넥션을 미리 열어 둠.
+
+    과금되지 않는 모델 목록 API를 동시에 호출해 설정한 수만큼 TLS 연결을 맺어 두고
+    keepalive로 유지합니다. 실패해도 서비스 시작을 막지 않습니다.
+
+    Returns:
+        int: 성공한 워밍업 요청 수
+    """
+    config = get_ai_config()
+    get_anthropic_client()
+    if config.llm_provider != "anthropic":
+        return 0
+
+    client = anthropic.AsyncClient(
+        api_key=config.anthropic_api_key,
+        base_url=config.anthropic_base_url,
+        http_client=get_http_client(),
+        max_retries=0,
+        timeout=config.llm_warmup_timeout,
+    )
+    results = await asyncio.gather(
+        *[client.models.list(limit=1) for _ in range(config.llm_warmup_connections)],
+        return_exceptions=True,
+    )
+    errors = [result for result in results if isinstance(result, BaseException)]
+    if errors:
+        logger.warning(
+            f"LLM 커넥션 워밍업 일부 실패: {len(errors)}/{len(results)}",
+            extra={"error_type": type(errors[0]).__name__},
+        )
+    succeeded = len(results) - len(errors)
+    logger.info(
+        f"LLM 커넥션 워밍업 완료: {succeeded}개",
+        extra={"http_pool": get_http_pool_stats()},
     )
+    return succeeded
+
+
+def build_cached_system_message(system_prompt: str) -> SystemMessage:
+    """정적 시스템 프롬프트에 캐시 브레이크포인트를 표시한 SystemMessage 생성.
+
+    시스템 프롬프트(기본 지침 + 타입별 지침 + 출력 형식 지침)는 요청마다 동일하므로
+    메시지 맨 앞에 두고 끝에 cache_control을 붙여, 이후 호출에서는 캐시된 prefix를
+    재사용하도록 합니다. 가변 내용(사용자 입력)은 반드시 이 메시지 뒤에 와야 합니다.
+    """
+    if not get_ai_config().anthropic_prompt_cache_enabled:
+        return SystemMessage(content=system_prompt)
+
+    return SystemMessage(
+        content=[
+            {
+                "type": "text",
+                "text": system_prompt,
+                "cache_control": PROMPT_CACHE_CONTROL,
+            }
+        ]
+    )
+
+
+def get_llm_runtime_stats() -> dict[str, Any]:
+    """LLM 호출 계층의 런타임 지표 반환 (튜닝/모니터링용)."""
+    return {
+        "api_keys": get_api_key_pool().snapshot(),
+        "cassette": (
+            get_llm_cassette().snapshot() if get_ai_config().llm_cassette_mode != "off" else None
+        ),
+        "circuit_breaker": get_circuit_breaker().snapshot(),
+        "concurrency": get_concurrency_limiter().snapshot(),
+        "fallback": get_fallback_chain().snapshot(),
+        "http_pool": get_http_pool_stats(),
+        "hedging": get_hedging_policy().snapshot(),
+        "output_budget": get_output_token_budget().snapshot(),
+        "output_repairs": get_llm_telemetry().repair_snapshot(),
+        "result_caches": get_llm_telemetry().cache_snapshot(),
+        "rate_shaper": (
+            get_token_rate_shaper().snapshot() if get_ai_config().tpm_shaping_enabled else None
+        ),
+        "retry": get_retry_policy().snapshot(),
+        "review_modes": get_llm_telemetry().review_snapshot(),
+        "routing": get_model_router().snapshot(),
+        "telemetry": get_llm_telemetry().snapshot(),
+    }
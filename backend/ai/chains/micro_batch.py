@@ -0,0 +1,233 @@
+"""같은 타입 블록 평가의 요청 간 마이크로 배치.
+
+프론트엔드는 블록 리뷰 요청을 짧은 간격으로 여러 개 보내는데, 요청마다 같은 시스템
+프롬프트로 작은 LLM 호출을 한 번씩 합니다. 마이크로 배처는 같은 타겟 타입의 블록
+평가를 짧은 창(window_ms) 동안, 최대 max_items개까지 모아 다중 항목 프롬프트 한 번으로
+평가하고, 목록 형태의 결과를 항목별 EvaluationResult로 나눠 각 호출자에게 돌려줍니다.
+
+배치 호출은 어느 호출자의 컨텍스트도 물려받지 않는 새 컨텍스트에서 실행합니다.
+데드라인은 배치에 담긴 호출자 중 가장 넉넉한 것을 따르고(하나라도 데드라인이 없으면
+두지 않음), 단계 기록은 기다리던 호출자 각각의 요청 수집기에 남깁니다.
+
+창 안에 요청이 하나뿐이었거나 다중 항목 응답을 파싱하지 못하면 None을 돌려주며,
+호출자는 기존 단일 평가로 진행합니다.
+"""
+
+import asyncio
+import contextvars
+import logging
+import time
+from typing import Any
+
+from langchain_core.exceptions import OutputParserException
+from langchain_core.language_models import LanguageModelInput
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+from langchain_core.prompts import PromptTemplate
+from langchain_core.runnables import Runnable, RunnableConfig
+
+from backend.ai.chains.callbacks import LLMTelemetryHandler
+from backend.ai.chains.llm import build_cached_system_message
+from backend.ai.chains.retry import current_deadline, request_deadline
+from backend.ai.chains.structured_output import OutputMode, StructuredOutput
+from backend.ai.chains.telemetry import credit_stage, current_request_telemetry
+from backend.ai.output.review_result import EvaluationBatchResult, EvaluationResult
+from backend.ai.strategies.base import PromptStrategy
+from backend.services.review.context import ReviewContext
+from backend.services.review.enums import ReviewTargetType
+from backend.utils.yaml_loader import get_prompt
+
+logger = logging.getLogger(__name__)
+
+# 마이크로 배치 대상 (블록 평가)
+BLOCK_TARGET_TYPES = frozenset(
+    {
+        ReviewTargetType.WORK_EXPERIENCE_BLOCK,
+        ReviewTargetType.PROJECT_BLOCK,
+        ReviewTargetType.EDUCATION_BLOCK,
+    }
+)
+
+# 라우팅/텔레메트리에서 단일 평가와 구분하는 단계 이름
+BATCH_STAGE = "evaluation_batch"
+
+
+class _PendingEvaluation:
+    """배치를 기다리는 평가 요청 하나."""
+
+    def __init__(self, strategy: PromptStrategy, context: ReviewContext):
+        self.strategy = strategy
+        self.context = context
+        # 배치는 새 컨텍스트에서 실행하므로 호출자의 데드라인/요청 수집기를 따로 보관
+        self.deadline = current_deadline()
+        self.telemetry = current_request_telemetry()
+        self.future: asyncio.Future[EvaluationResult | None] = (
+            asyncio.get_running_loop().create_future()
+        )
+
+
+class EvaluationMicroBatcher:
+    """같은 타입 블록 평가를 모아 다중 항목 프롬프트 한 번으로 평가."""
+
+    def __init__(
+        self,
+        llm: Runnable[LanguageModelInput, BaseMessage],
+        window_ms: float = 20.0,
+        max_items: int = 8,
+        output_mode: OutputMode = "tool",
+    ):
+        self._llm = llm
+        self._window = window_ms / 1000
+        self._max_items = max_items
+        self._output = StructuredOutput(EvaluationBatchResult, output_mode)
+        self._system_messages: dict[ReviewTargetType, SystemMessage] = {}
+        self._item_template = get_prompt("base", "evaluation_batch_item_template")
+        self._prompt_template = get_prompt("base", "evaluation_batch_prompt_template")
+        self._pending: dict[ReviewTargetType, list[_PendingEvaluation]] = {}
+        self._timers: dict[ReviewTargetType, asyncio.TimerHandle] = {}
+        self._running: set[asyncio.Task[None]] = set()
+        self._batches = 0
+        self._batched_items = 0
+        self._single_items = 0
+        self._fallback_items = 0
+
+    def accepts(self, context: ReviewContext) -> bool:
+        """마이크로 배치 대상(블록 평가)인지 여부."""
+        return context.block is not None and context.target_type in BLOCK_TARGET_TYPES
+
+    async def evaluate(
+        self, strategy: PromptStrategy, context: ReviewContext
+    ) -> EvaluationResult | None:
+        """다음 배치에 평가를 담고 결과를 기다림 (None이면 단일 평가로 진행)."""
+        target_type = context.target_type
+        request = _PendingEvaluation(strategy, context)
+        pending = self._pending.setdefault(target_type, [])
+        pending.append(request)
+
+        if len(pending) >= self._max_items:
+            self._flush(target_type)
+        elif target_type not in self._timers:
+            self._timers[target_type] = asyncio.get_running_loop().call_later(
+                self._window, self._flush, target_type
+            )
+        return await request.future
+
+    def snapshot(self) -> dict[str, Any]:
+        """배치 수, 배치로 처리한 항목 수, 단일 평가로 넘긴 항목 수 반환."""
+        return {
+            "batches": self._batches,
+            "batched_items": self._batched_items,
+            "avg_batch_size": (
+                round(self._batched_items / self._batches, 2) if self._batches else None
+            ),
+            "single_items": self._single_items,
+            "fallback_items": self._fallback_items,
+        }
+
+    def _flush(self, target_type: ReviewTargetType) -> None:
+        timer = self._timers.pop(target_type, None)
+        if timer is not None:
+            timer.cancel()
+        requests = self._pending.pop(target_type, [])
+        if not requests:
+            return
+        if len(requests) == 1:
+            self._single_items += 1
+            requests[0].future.set_result(None)
+            return
+
+        # 타이머 콜백이나 마지막 호출자의 컨텍스트를 물려받지 않도록 새 컨텍스트에서 실행
+        task = asyncio.create_task(
+            self._run_batch(target_type, requests), context=contextvars.Context()
+        )
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _run_batch(
+        self, target_type: ReviewTargetType, requests: list[_PendingEvaluation]
+    ) -> None:
+        self._batches += 1
+        self._batched_items += len(requests)
+        deadlines = [request.deadline for request in requests]
+        try:
+            if None in deadlines:
+                results = await self._evaluate_batch(target_type, requests)
+            else:
+                latest = max(deadline for deadline in deadlines if deadline is not None)
+                with request_deadline(latest - time.monotonic()):
+                    results = await self._evaluate_batch(target_type, requests)
+        except OutputParserException as e:
+            logger.warning(
+                f"다중 항목 평가 파싱 실패, 단일 평가로 전환: {e}",
+                extra={"target_type": target_type, "items": len(requests)},
+            )
+            results = {}
+        except Exception as e:
+            for request in requests:
+                if not request.future.done():
+                    request.future.set_exception(e)
+            return
+
+        for index, request in enumerate(requests):
+            result = results.get(index)
+            if result is None:
+                self._fallback_items += 1
+            if not request.future.done():
+                request.future.set_result(result)
+
+    async def _evaluate_batch(
+        self, target_type: ReviewTargetType, requests: list[_PendingEvaluation]
+    ) -> dict[int, EvaluationResult]:
+        """다중 항목 프롬프트로 한 번 호출하고 index별 평가 결과 반환."""
+        # 같은 타겟 타입은 같은 전략/시스템 프롬프트를 사용하므로 타입별로 한 번만 구성
+        system_message = self._system_messages.get(target_type)
+        if system_message is None:
+            system_message = build_cached_system_message(
+                requests[0].strategy.build_evaluation_system_prompt(
+                    self._output.format_instructions
+                )
+            )
+            self._system_messages[target_type] = system_message
+        messages = [system_message, HumanMessage(content=self._build_user_prompt(requests))]
+
+        telemetry = LLMTelemetryHandler(BATCH_STAGE, target_type.value)
+        config: RunnableConfig = {
+            "callbacks": [telemetry],
+            "metadata": {"stage": BATCH_STAGE, "target_type": target_type.value},
+        }
+        try:
+            message = await self._llm.ainvoke(messages, config=config, **self._output.call_kwargs)
+            batch: EvaluationBatchResult = await self._output.parser.ainvoke(
+                message, config={**config, "run_name": LLMTelemetryHandler.PARSER_RUN_NAME}
+            )
+        finally:
+            credit_stage(telemetry.finish(), [request.telemetry for request in requests])
+
+        model_name = message.response_metadata.get("model_name")
+        results: dict[int, EvaluationResult] = {}
+        for item in batch.items:
+            if 0 <= item.index < len(requests) and item.index not in results:
+                results[item.index] = EvaluationResult(
+                    target_type=target_type,
+                    summary=item.summary,
+                    strengths=item.strengths,
+                    weaknesses=item.weaknesses,
+                    needs_improvement=item.needs_improvement,
+                    served_models={"evaluation": model_name} if model_name else {},
+                )
+        logger.info(
+            f"다중 항목 평가 완료: {len(results)}/{len(requests)}개",
+            extra={"target_type": target_type},
+        )
+        return results
+
+    def _build_user_prompt(self, requests: list[_PendingEvaluation]) -> str:
+        items = [
+            self._item_template.format(
+                index=index,
+                item=PromptTemplate.from_template(
+                    request.strategy.get_user_prompt_template()
+                ).format(**request.strategy.build_prompt_variables(request.context)),
+            ).strip()
+            for index, request in enumerate(requests)
+        ]
+        return self._prompt_template.format(count=len(requests), items="\n\n".join(items))
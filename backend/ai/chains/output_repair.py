@@ -0,0 +1,239 @@
+"""파싱에 실패한 단계 응답 복구.
+
+단계 응답 파싱이 실패하면 리뷰 전체(2단계)를 다시 호출하는 대신 아래 순서로 복구를
+시도하고, 첫 번째로 스키마 검증을 통과한 결과를 사용합니다.
+
+1. strip_fences: 코드 펜스와 JSON 앞뒤의 설명 문장 제거
+2. tolerant_decode: 제어 문자, 끝 쉼표를 허용하는 관대한 JSON 디코딩
+3. close_truncated: 끊긴 문자열/괄호를 닫아 잘린 JSON 복원 (손실 복원이므로 본문
+   필드 값에서 끊긴 경우에는 사용하지 않음)
+4. coerce_lists: 위 결과에서 max_length를 넘는 목록을 제한 길이로 자름
+5. llm_fixup: 로컬 복구가 모두 실패하면 원본 출력과 오류를 주고 형식만 고치는 작은
+   LLM 호출 한 번
+
+max_tokens에서 잘린 응답(stop_reason == "max_tokens")은 복구하지 않고 실패(truncated)로
+처리합니다. 도구 입력은 SDK가 이미 닫은 JSON으로 넘겨주므로 형식상 복구에 성공해도
+목록과 피드백 일부가 빠진 결과이고, 끊긴 내용은 형식 교정으로도 되살릴 수 없습니다.
+
+복구 결과(단계별 성공/실패)는 (타겟 타입:단계)별로 텔레메트리에 집계됩니다.
+"""
+
+import json
+import logging
+import re
+from typing import Any
+
+from annotated_types import MaxLen
+from langchain_core.exceptions import OutputParserException
+from langchain_core.language_models import LanguageModelInput
+from langchain_core.messages import BaseMessage
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import Runnable, RunnableConfig
+from langchain_core.utils.json import parse_partial_json
+from pydantic import BaseModel, ValidationError
+
+from backend.ai.chains.callbacks import LLMTelemetryHandler
+from backend.ai.chains.llm import build_cached_system_message
+from backend.ai.chains.structured_output import StructuredOutput
+from backend.ai.chains.telemetry import LLMTelemetry, get_llm_telemetry
+from backend.ai.chains.token_budget import is_truncated
+from backend.utils.yaml_loader import get_prompt
+
+logger = logging.getLogger(__name__)
+
+# 라우팅/텔레메트리에서 형식 교정 호출을 구분하는 단계 이름
+REPAIR_STAGE = "repair"
+
+# 형식 교정 프롬프트에 넣는 원본 출력/오류의 최대 길이 (문자)
+_MAX_REPAIR_OUTPUT_CHARS = 8000
+_MAX_REPAIR_ERROR_CHARS = 1000
+
+# 잘린 채로 닫아 쓰면 사용자에게 끊긴 문장이 그대로 전달되는 본문 필드
+CONTENT_FIELDS = frozenset({"improved_content"})
+
+# 입력의 일부가 유실될 수 있는 복구 단계
+LOSSY_STEPS = frozenset({"close_truncated"})
+
+_CODE_FENCE = re.compile(r"```(?:json)?\s*(.*?)(?:```|$)", re.DOTALL)
+_TRAILING_COMMA = re.compile(r",\s*([}\]])")
+
+
+def raw_output(message: BaseMessage, schema: type[BaseModel]) -> str:
+    """복구 대상 원본 출력 (도구 입력, 파싱 못 한 도구 입력, 본문 텍스트 순)."""
+    for call in getattr(message, "tool_calls", []):
+        if call["name"] == schema.__name__:
+            return json.dumps(call["args"], ensure_ascii=False)
+    for call in getattr(message, "invalid_tool_calls", []):
+        if call.get("args"):
+            return str(call["args"])
+    return message.text
+
+
+def strip_wrapping(text: str) -> str:
+    """코드 펜스와 JSON 객체 앞뒤의 설명 문장 제거."""
+    fenced = _CODE_FENCE.search(text)
+    if fenced:
+        text = fenced.group(1)
+    start = text.find("{")
+    if start < 0:
+        return text.strip()
+    end = text.rfind("}")
+    # 닫는 괄호가 없으면 잘린 JSON이므로 끝까지 유지
+    return text[start : end + 1] if end > start else text[start:].strip()
+
+
+def tolerant_loads(text: str) -> Any:
+    """제어 문자와 끝 쉼표를 허용하는 JSON 디코딩."""
+    return json.loads(_TRAILING_COMMA.sub(r"\1", text), strict=False)
+
+
+def close_truncated(text: str) -> Any:
+    """끊긴 문자열/괄호를 닫아 디코딩 (복원할 수 없으면 ValueError)."""
+    data = parse_partial_json(_TRAILING_COMMA.sub(r"\1", text))
+    if data is None:
+        raise ValueError("잘린 JSON을 복원할 수 없습니다.")
+    return data
+
+
+def coerce_lists(data: dict[str, Any], schema: type[BaseModel]) -> dict[str, Any]:
+    """스키마의 max_length를 넘는 목록 필드를 제한 길이로 자름."""
+    coerced = dict(data)
+    for name, field in schema.model_fields.items():
+        value = coerced.get(name)
+        if not isinstance(value, list):
+            continue
+        limits = [item.max_length for item in field.metadata if isinstance(item, MaxLen)]
+        if limits and len(value) > limits[0]:
+            coerced[name] = value[: limits[0]]
+    return coerced
+
+
+_DECODERS = (
+    ("strip_fences", json.loads),
+    ("tolerant_decode", tolerant_loads),
+    ("close_truncated", close_truncated),
+)
+
+
+def repair_locally(schema: type[BaseModel], raw: str) -> tuple[BaseModel, str] | None:
+    """로컬 복구 단계를 순서대로 적용해 (결과, 성공한 단계) 반환. 모두 실패하면 None."""
+    text = strip_wrapping(raw)
+    for step, decode in _DECODERS:
+        try:
+            data = decode(text)
+        except ValueError:
+            continue
+        if not isinstance(data, dict):
+            continue
+        if step in LOSSY_STEPS and data and next(reversed(data)) in CONTENT_FIELDS:
+            # 본문 필드 값 중간에서 끊긴 JSON은 닫아도 내용이 유실되므로 복구하지 않음
+            return None
+        for candidate, label in ((data, step), (coerce_lists(data, schema), "coerce_lists")):
+            try:
+                return schema.model_validate(candidate), label
+            except ValidationError:
+                continue
+    return None
+
+
+class OutputRepairer:
+    """파싱에 실패한 단계 응답을 로컬 복구 → 형식 교정 LLM 호출 순으로 복구.
+
+    llm이 없으면 형식 교정 호출 없이 로컬 복구만 시도합니다.
+    """
+
+    def __init__(
+        self,
+        llm: Runnable[LanguageModelInput, BaseMessage] | None = None,
+        telemetry: LLMTelemetry | None = None,
+    ):
+        self._llm = llm
+        self._telemetry = telemetry
+        self._system_template = get_prompt("base", "output_repair_system_prompt")
+        self._user_template = get_prompt("base", "output_repair_prompt_template")
+        self._pipelines: dict[str, Runnable[dict, BaseMessage]] = {}
+
+    async def repair(
+        self,
+        output: StructuredOutput,
+        message: BaseMessage,
+        error: OutputParserException,
+        target_type: str,
+        stage: str,
+    ) -> BaseModel:
+        """응답 복구. 모두 실패하면(형식 교정 호출 오류 포함) 원래 파싱 예외를 다시 발생."""
+        key = f"{target_type}:{stage}"
+        if is_truncated(message):
+            logger.warning("max_tokens에서 잘린 응답은 복구하지 않음", extra={"key": key})
+            self._record(key, "truncated")
+            raise error
+
+        raw = raw_output(message, output.schema)
+
+        repaired = repair_locally(output.schema, raw)
+        if repaired is not None:
+            result, step = repaired
+            self._record(key, step)
+            return result
+
+        if self._llm is not None:
+            try:
+                result = await self._fix_with_llm(output, raw, error, target_type)
+            except OutputParserException as e:
+                logger.warning(f"형식 교정 호출 결과도 파싱 실패: {e}", extra={"key": key})
+            except Exception as e:
+                # 교정 호출 자체의 실패(API 오류, 서킷 열림, 데드라인 초과)도 복구 실패로 보고
+                # 원래 파싱 예외를 전파
+                logger.warning(
+                    f"형식 교정 호출 실패: {e}",
+                    extra={"key": key, "error_type": type(e).__name__},
+                )
+            else:
+                self._record(key, "llm_fixup")
+                return result
+
+        self._record(key, "failed")
+        raise error
+
+    async def _fix_with_llm(
+        self, output: StructuredOutput, raw: str, error: OutputParserException, target_type: str
+    ) -> BaseModel:
+        """원본 출력과 오류를 주고 형식만 고치는 LLM 호출 한 번."""
+        telemetry = LLMTelemetryHandler(REPAIR_STAGE, target_type, self._telemetry)
+        config: RunnableConfig = {
+            "callbacks": [telemetry],
+            "metadata": {"stage": REPAIR_STAGE, "target_type": target_type},
+        }
+        variables = {
+            "error": str(error)[:_MAX_REPAIR_ERROR_CHARS],
+            "output": raw[:_MAX_REPAIR_OUTPUT_CHARS],
+        }
+        try:
+            message = await self._get_pipeline(output).ainvoke(variables, config=config)
+            result: BaseModel = await output.parser.ainvoke(
+                message, config={**config, "run_name": LLMTelemetryHandler.PARSER_RUN_NAME}
+            )
+            return result
+        finally:
+            telemetry.finish()
+
+    def _get_pipeline(self, output: StructuredOutput) -> Runnable[dict, BaseMessage]:
+        """결과 스키마별 형식 교정 파이프라인 (처음 요청할 때 한 번만 구성)."""
+        # 형식 교정 호출은 llm이 있을 때만 수행
+        assert self._llm is not None
+        name = output.schema.__name__
+        pipeline = self._pipelines.get(name)
+        if pipeline is None:
+            system_prompt = self._system_template.format(
+                format_instructions=output.format_instructions
+            )
+            prompt = ChatPromptTemplate.from_messages(
+                [build_cached_system_message(system_prompt), ("human", self._user_template)]
+            )
+            pipeline = prompt | output.bind(self._llm)
+            self._pipelines[name] = pipeline
+        return pipeline
+
+    def _record(self, key: str, outcome: str) -> None:
+        (self._telemetry or get_llm_telemetry()).record_repair(key, outcome)
+        logger.info(f"단계 응답 복구: {key} → {outcome}", extra={"outcome": outcome})
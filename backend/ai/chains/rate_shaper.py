@@ -0,0 +1,240 @@
+"""입력/출력 분당 토큰(TPM) 기반 요청 페이싱.
+
+Anthropic은 요청 수뿐 아니라 분당 입력 토큰과 출력 토큰도 제한합니다. 큰 요청 몇 개가
+분당 예산을 소진해 작은 요청까지 429를 받지 않도록, 호출 전에 입력 토큰 추정치와 예상
+출력 토큰을 토큰 버킷에서 미리 예약하고 부족하면 기다렸다가 보냅니다. 응답의 실제
+사용량(usage_metadata)으로 예약분을 정산하고 추정 보정 계수를 갱신합니다.
+"""
+
+import asyncio
+import logging
+import math
+import time
+from functools import lru_cache
+from typing import Any
+
+from langchain_core.language_models import LanguageModelInput
+from langchain_core.messages import BaseMessage
+
+from backend.ai.chains.retry import remaining_time
+from backend.ai.chains.token_budget import to_messages
+from backend.ai.config import get_ai_config
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache
+def _get_encoding() -> Any | None:
+    """tiktoken 인코딩 반환. 사용할 수 없으면 None (문자 수 기반 추정으로 대체)."""
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        logger.warning("tiktoken 인코딩을 불러오지 못해 문자 수 기반으로 토큰을 추정합니다.")
+        return None
+
+
+async def preload_token_encoding() -> None:
+    """tiktoken 인코딩을 워커 스레드에서 미리 로드.
+
+    첫 로드는 인코딩 파일을 내려받고 구성하므로, 첫 요청이 이벤트 루프를 막지 않도록
+    앱 시작 시 호출합니다.
+    """
+    await asyncio.to_thread(_get_encoding)
+
+
+def _heuristic_token_count(text: str) -> int:
+    """문자 수 기반 토큰 수 추정 (ASCII 약 4자당 1토큰, 한글 등은 1자당 1토큰)."""
+    ascii_chars = sum(1 for ch in text if ch.isascii())
+    return math.ceil(ascii_chars / 4) + (len(text) - ascii_chars)
+
+
+class TokenEstimator:
+    """프롬프트 입력 토큰 추정기.
+
+    기본 추정값에 실제 사용량과의 비율(EWMA)로 학습한 보정 계수를 곱합니다.
+    """
+
+    def __init__(self, use_tiktoken: bool = True, smoothing: float = 0.1):
+        self._use_tiktoken = use_tiktoken
+        self._smoothing = smoothing
+        self._correction = 1.0
+
+    @property
+    def correction(self) -> float:
+        """현재 보정 계수 (실제 / 기본 추정)."""
+        return self._correction
+
+    def estimate(self, messages: LanguageModelInput) -> int:
+        """보정 계수를 적용한 입력 토큰 추정치."""
+        return math.ceil(self.raw_estimate(messages) * self._correction)
+
+    def raw_estimate(self, messages: LanguageModelInput) -> int:
+        """보정 전 입력 토큰 추정치."""
+        text = "\n".join(message.text for message in to_messages(messages))
+        encoding = _get_encoding() if self._use_tiktoken else None
+        if encoding is None:
+            return _heuristic_token_count(text)
+        return len(encoding.encode(text, disallowed_special=()))
+
+    def observe(self, raw_estimate: int, actual: int) -> None:
+        """실제 입력 토큰 수로 보정 계수 갱신."""
+        if raw_estimate <= 0 or actual <= 0:
+            return
+        ratio = actual / raw_estimate
+        self._correction += self._smoothing * (ratio - self._correction)
+
+
+class TokenBucket:
+    """분당 보충 속도와 최대 적립량을 가진 토큰 버킷.
+
+    예약 시 잔량이 음수(부채)가 될 수 있으며, 부채를 갚는 데 걸리는 시간만큼
+    기다리게 해서 요청을 일정한 속도로 내보냅니다.
+    """
+
+    def __init__(self, tokens_per_minute: float, burst_seconds: float = 10.0):
+        self._rate = tokens_per_minute / 60
+        self._capacity = max(1.0, self._rate * burst_seconds)
+        self._tokens = self._capacity
+        self._updated_at = time.monotonic()
+
+    @property
+    def level(self) -> float:
+        """현재 잔량 (음수면 부채)."""
+        self._refill()
+        return self._tokens
+
+    def reserve(self, amount: float) -> float:
+        """amount만큼 예약하고 보내기 전 기다려야 할 시간(초) 반환."""
+        self._refill()
+        self._tokens -= amount
+        return max(0.0, -self._tokens / self._rate)
+
+    def adjust(self, delta: float) -> None:
+        """예약분 정산 (양수면 반환, 음수면 추가 차감)."""
+        self._refill()
+        self._tokens = min(self._capacity, self._tokens + delta)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._rate)
+        self._updated_at = now
+
+
+class TokenReservation:
+    """한 번의 호출에 대해 예약한 입력/출력 토큰."""
+
+    def __init__(self, raw_input: int, input_tokens: int, output_tokens: int):
+        self.raw_input = raw_input
+        self.input_tokens = input_tokens
+        self.output_tokens = output_tokens
+
+
+class TokenRateShaper:
+    """입력/출력 TPM 토큰 버킷으로 호출을 페이싱하는 셰이퍼.
+
+    한도가 0인 쪽은 페이싱하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        input_tokens_per_minute: int,
+        output_tokens_per_minute: int,
+        burst_seconds: float = 10.0,
+        estimator: TokenEstimator | None = None,
+    ):
+        self._input = (
+            TokenBucket(input_tokens_per_minute, burst_seconds)
+            if input_tokens_per_minute > 0
+            else None
+        )
+        self._output = (
+            TokenBucket(output_tokens_per_minute, burst_seconds)
+            if output_tokens_per_minute > 0
+            else None
+        )
+        self._estimator = estimator or TokenEstimator()
+
+        self._reservations_total = 0
+        self._paced_total = 0
+        self._wait_seconds_total = 0.0
+        self._wait_seconds_max = 0.0
+
+    async def reserve(self, messages: LanguageModelInput, output_tokens: int) -> TokenReservation:
+        """입력 추정치와 예상 출력 토큰을 예약하고 버킷이 허용할 때까지 대기.
+
+        요청 데드라인 안에 보낼 수 없으면 예약을 돌려놓고 TimeoutError를 발생시킵니다.
+        긴 프롬프트의 토큰화가 이벤트 루프를 막지 않도록 추정은 워커 스레드에서 합니다.
+        """
+        raw_input = await asyncio.to_thread(self._estimator.raw_estimate, messages)
+        reservation = TokenReservation(
+            raw_input, math.ceil(raw_input * self._estimator.correction), output_tokens
+        )
+        wait = max(
+            self._input.reserve(reservation.input_tokens) if self._input else 0.0,
+            self._output.reserve(reservation.output_tokens) if self._output else 0.0,
+        )
+        self._reservations_total += 1
+        if wait <= 0:
+            return reservation
+
+        remaining = remaining_time()
+        if remaining is not None and wait > remaining:
+            self.cancel(reservation)
+            raise TimeoutError(f"TPM 예산 대기({wait:.1f}s)가 요청 데드라인을 넘습니다.")
+
+        self._paced_total += 1
+        self._wait_seconds_total += wait
+        self._wait_seconds_max = max(self._wait_seconds_max, wait)
+        try:
+            await asyncio.sleep(wait)
+        except asyncio.CancelledError:
+            self.cancel(reservation)
+            raise
+        return reservation
+
+    def reconcile(self, reservation: TokenReservation, message: BaseMessage) -> None:
+        """실제 사용량으로 예약분을 정산하고 입력 추정 보정 계수를 갱신."""
+        usage = getattr(message, "usage_metadata", None)
+        if not usage:
+            return
+
+        details = usage.get("input_token_details") or {}
+        # 캐시 읽기 토큰은 입력 TPM 한도에 포함되지 않음
+        billed_input = usage["input_tokens"] - details.get("cache_read", 0)
+        if self._input is not None:
+            self._input.adjust(reservation.input_tokens - billed_input)
+        if self._output is not None:
+            self._output.adjust(reservation.output_tokens - usage["output_tokens"])
+        self._estimator.observe(reservation.raw_input, usage["input_tokens"])
+
+    def cancel(self, reservation: TokenReservation) -> None:
+        """보내지 못한(또는 실패한) 호출의 예약분 반환."""
+        if self._input is not None:
+            self._input.adjust(reservation.input_tokens)
+        if self._output is not None:
+            self._output.adjust(reservation.output_tokens)
+
+    def snapshot(self) -> dict[str, Any]:
+        """버킷 잔량과 페이싱 지표 반환."""
+        return {
+            "input_tokens_available": round(self._input.level) if self._input else None,
+            "output_tokens_available": round(self._output.level) if self._output else None,
+            "reservations_total": self._reservations_total,
+            "paced_total": self._paced_total,
+            "wait_ms_total": round(self._wait_seconds_total * 1000),
+            "wait_ms_max": round(self._wait_seconds_max * 1000),
+            "input_estimate_correction": round(self._estimator.correction, 3),
+        }
+
+
+@lru_cache
+def get_token_rate_shaper() -> TokenRateShaper:
+    """프로세스 전역 TPM 셰이퍼 싱글톤 반환."""
+    config = get_ai_config()
+    return TokenRateShaper(
+        input_tokens_per_minute=config.llm_input_tpm_limit,
+        output_tokens_per_minute=config.llm_output_tpm_limit,
+        burst_seconds=config.llm_tpm_burst_seconds,
+    )
@@ -0,0 +1,135 @@
+"""단계/리뷰 결과의 프로세스 내 캐시.
+
+같은 입력으로 다시 요청된 단계/리뷰 결과를 LLM 호출 없이 돌려주기 위한 TTL + LRU
+캐시입니다. 키는 호출자가 프롬프트에 영향을 주는 값(전략, 렌더링 변수, 템플릿 버전,
+모델)을 모아 만든 SHA-256 해시이고, 값은 결과 모델과 그 결과를 만드는 데 걸린 시간입니다.
+적중 시 돌려주는 결과는 복사본이므로 호출자가 메타데이터를 덮어써도 캐시 항목은 바뀌지
+않습니다.
+
+리뷰 결과 캐시처럼 내용 자체를 주소로 쓰는 경우에는 content_key로 문자열을 유니코드 NFC
+정규화한 뒤 해시해, 조합 형태만 다른 같은 내용이 같은 키를 갖게 합니다. 공백은 줄이지
+않습니다. 캐시된 결과에는 원문이 그대로 들어갈 수 있으므로(개선 없이 끝난 리뷰), 공백이
+다른 블록에 다른 블록의 원문을 돌려주지 않기 위해서입니다.
+"""
+
+import hashlib
+import json
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any
+
+from pydantic import BaseModel
+
+
+def template_version(*templates: str) -> str:
+    """프롬프트 템플릿(시스템 프롬프트, 사용자 템플릿 등) 내용의 짧은 해시."""
+    digest = hashlib.sha256()
+    for template in templates:
+        digest.update(template.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()[:16]
+
+
+def cache_key(payload: dict[str, Any]) -> str:
+    """키 구성 요소를 정렬된 JSON으로 직렬화한 SHA-256 해시."""
+    canonical = json.dumps(
+        payload, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def normalize_content(value: Any) -> Any:
+    """문자열을 NFC 정규화 (dict/list는 재귀 적용)."""
+    if isinstance(value, str):
+        return unicodedata.normalize("NFC", value)
+    if isinstance(value, dict):
+        return {key: normalize_content(item) for key, item in value.items()}
+    if isinstance(value, list | tuple):
+        return [normalize_content(item) for item in value]
+    return value
+
+
+def content_key(payload: dict[str, Any]) -> str:
+    """정규화한 키 구성 요소의 SHA-256 해시 (내용 주소 키)."""
+    return cache_key(normalize_content(payload))
+
+
+class _CacheEntry:
+    """캐시 항목 하나 (결과, 생성 소요 시간, 만료 시각, 직렬화 크기)."""
+
+    def __init__(self, value: BaseModel, elapsed: float, expires_at: float):
+        self.value = value
+        self.elapsed = elapsed
+        self.expires_at = expires_at
+        self.size = len(value.model_dump_json().encode())
+
+
+class ResultCache:
+    """항목 수(또는 바이트)와 TTL로 크기를 제한하는 LRU 결과 캐시.
+
+    조회한 항목은 가장 최근 사용으로 옮기고, 항목 수가 max_entries를 넘거나 결과의 JSON
+    직렬화 크기 합계가 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 버립니다.
+    만료된 항목은 조회 시점에 제거합니다.
+    """
+
+    def __init__(
+        self,
+        max_entries: int | None = 1024,
+        ttl_seconds: float = 1800.0,
+        max_bytes: int | None = None,
+    ):
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._ttl = ttl_seconds
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._bytes = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> tuple[Any, float] | None:
+        """키에 해당하는 (결과 복사본, 생성 소요 시간(초)) 반환. 없거나 만료됐으면 None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._remove(key)
+            self._expirations += 1
+            return None
+        self._entries.move_to_end(key)
+        return entry.value.model_copy(deep=True), entry.elapsed
+
+    def put(self, key: str, value: BaseModel, elapsed: float) -> None:
+        """결과와 생성 소요 시간(초) 저장 (용량을 넘으면 가장 오래된 항목부터 제거)."""
+        entry = _CacheEntry(value.model_copy(deep=True), elapsed, time.monotonic() + self._ttl)
+        if self._max_bytes is not None and entry.size > self._max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = entry
+        self._bytes += entry.size
+        while self._over_capacity():
+            self._remove(next(iter(self._entries)))
+            self._evictions += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        """항목 수, 직렬화 크기 합계와 용량/만료로 제거한 항목 수 반환."""
+        return {
+            "entries": len(self._entries),
+            "max_entries": self._max_entries,
+            "bytes": self._bytes,
+            "max_bytes": self._max_bytes,
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+        }
+
+    def _over_capacity(self) -> bool:
+        if self._max_entries is not None and len(self._entries) > self._max_entries:
+            return True
+        return self._max_bytes is not None and self._bytes > self._max_bytes
+
+    def _remove(self, key: str) -> None:
+        self._bytes -= self._entries.pop(key).size
@@ -0,0 +1,231 @@
+"""LLM 호출 재시도 정책.
+
+- 서버가 보낸 retry-after(-ms) 헤더를 우선 따릅니다.
+- 토큰 버킷 기반 재시도 예산으로 전체 호출 대비 재시도 비율을 제한합니다.
+- 요청 데드라인까지 남은 시간이 다음 시도에 부족하면 즉시 포기합니다.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Any, TypeVar
+
+from anthropic import APIConnectionError, InternalServerError, OverloadedError, RateLimitError
+
+from backend.ai.config import get_ai_config
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 재시도 대상 예외 (APITimeoutError는 APIConnectionError의 하위 클래스)
+RETRYABLE_ERRORS = (APIConnectionError, RateLimitError, OverloadedError, InternalServerError)
+
+_request_deadline: ContextVar[float | None] = ContextVar("llm_request_deadline", default=None)
+
+
+@contextmanager
+def request_deadline(seconds: float) -> Iterator[None]:
+    """현재 컨텍스트(요청)의 LLM 호출 데드라인 설정.
+
+    바깥에 더 이른 데드라인이 이미 있으면 그것을 유지합니다.
+    """
+    deadline = time.monotonic() + seconds
+    current = _request_deadline.get()
+    if current is not None:
+        deadline = min(deadline, current)
+
+    token = _request_deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _request_deadline.reset(token)
+
+
+def current_deadline() -> float | None:
+    """현재 요청의 데드라인 시각(time.monotonic 기준). 데드라인이 없으면 None."""
+    return _request_deadline.get()
+
+
+def remaining_time() -> float | None:
+    """현재 요청 데드라인까지 남은 시간(초). 데드라인이 없으면 None."""
+    deadline = _request_deadline.get()
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+def parse_retry_after(error: BaseException) -> float | None:
+    """API 에러 응답의 retry-after-ms / retry-after 헤더를 초 단위로 변환."""
+    response = getattr(error, "response", None)
+    if response is None:
+        return None
+
+    headers = response.headers
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return max(0.0, float(retry_after_ms) / 1000)
+        except ValueError:
+            pass
+
+    retry_after = headers.get("retry-after")
+    if not retry_after:
+        return None
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
+class RetryBudget:
+    """토큰 버킷 기반 재시도 예산.
+
+    최초 호출마다 ratio만큼 토큰이 쌓이고 재시도 1회에 토큰 1개를 소모합니다.
+    장기적으로 재시도 수는 (호출 수 × ratio + capacity)를 넘지 않습니다.
+    """
+
+    def __init__(self, ratio: float = 0.1, capacity: float = 10.0):
+        self._ratio = ratio
+        self._capacity = capacity
+        self._tokens = capacity
+
+    @property
+    def balance(self) -> float:
+        """현재 남은 재시도 토큰."""
+        return self._tokens
+
+    def record_request(self) -> None:
+        """최초 호출 1회 적립."""
+        self._tokens = min(self._capacity, self._tokens + self._ratio)
+
+    def try_withdraw(self) -> bool:
+        """재시도 1회분 토큰 소모. 예산이 부족하면 False."""
+        # ratio 누적 시 부동소수점 오차(0.1 × 10 = 0.999...)를 허용
+        if self._tokens < 1.0 - 1e-9:
+            return False
+        self._tokens = max(0.0, self._tokens - 1.0)
+        return True
+
+
+class RetryPolicy:
+    """retry-after, 재시도 예산, 요청 데드라인을 고려하는 재시도 정책."""
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 8.0,
+        max_retry_after: float = 20.0,
+        min_attempt_time: float = 5.0,
+        budget: RetryBudget | None = None,
+    ):
+        self._max_attempts = max_attempts
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._max_retry_after = max_retry_after
+        # 다음 시도를 하려면 대기 후에도 이만큼의 시간이 남아 있어야 함
+        self._min_attempt_time = min_attempt_time
+        self._budget = budget or RetryBudget()
+
+        self._calls_total = 0
+        self._retries_total = 0
+        self._give_ups: dict[str, int] = {}
+
+    async def call(self, fn: Callable[[], Awaitable[T]]) -> T:
+        """fn을 실행하고 재시도 가능한 오류면 정책에 따라 다시 시도."""
+        self._calls_total += 1
+        self._budget.record_request()
+
+        attempt = 1
+        while True:
+            try:
+                return await fn()
+            except RETRYABLE_ERRORS as e:
+                delay = self._next_delay(e, attempt)
+                reason = self._give_up_reason(attempt, delay)
+                if reason is not None:
+                    self._give_ups[reason] = self._give_ups.get(reason, 0) + 1
+                    logger.warning(
+                        f"LLM 호출 재시도 포기: reason={reason}, attempt={attempt}",
+                        extra={
+                            "reason": reason,
+                            "attempt": attempt,
+                            "error_type": type(e).__name__,
+                        },
+                    )
+                    raise
+
+                # 대기 시간이 None이면 _give_up_reason이 항상 포기 사유를 반환함
+                assert delay is not None
+                self._retries_total += 1
+                logger.warning(
+                    f"LLM 호출 재시도: attempt={attempt}, delay={delay:.2f}s",
+                    extra={"attempt": attempt, "delay": delay, "error_type": type(e).__name__},
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        """재시도 지표 반환."""
+        return {
+            "calls_total": self._calls_total,
+            "retries_total": self._retries_total,
+            "retry_ratio": (
+                round(self._retries_total / self._calls_total, 4) if self._calls_total else 0.0
+            ),
+            "budget_balance": round(self._budget.balance, 2),
+            "give_ups": dict(self._give_ups),
+        }
+
+    def _next_delay(self, error: BaseException, attempt: int) -> float | None:
+        """다음 시도까지 대기 시간. 서버가 너무 긴 대기를 요구하면 None."""
+        retry_after = parse_retry_after(error)
+        if retry_after is not None:
+            if retry_after > self._max_retry_after:
+                return None
+            return retry_after
+
+        # full jitter 지수 백오프
+        return random.uniform(0, min(self._max_delay, self._base_delay * 2 ** (attempt - 1)))
+
+    def _give_up_reason(self, attempt: int, delay: float | None) -> str | None:
+        if attempt >= self._max_attempts:
+            return "max_attempts"
+        if delay is None:
+            return "retry_after_too_long"
+
+        remaining = remaining_time()
+        if remaining is not None and remaining - delay < self._min_attempt_time:
+            return "deadline"
+
+        # 다른 이유로 포기하지 않을 때만 예산을 소모
+        if not self._budget.try_withdraw():
+            return "budget_exhausted"
+        return None
+
+
+@lru_cache
+def get_retry_policy() -> RetryPolicy:
+    """프로세스 전역 재시도 정책 싱글톤 반환."""
+    config = get_ai_config()
+    return RetryPolicy(
+        max_attempts=config.llm_retry_max_attempts,
+        base_delay=config.llm_retry_base_delay,
+        max_delay=config.llm_retry_max_delay,
+        max_retry_after=config.llm_retry_max_retry_after,
+        min_attempt_time=config.llm_retry_min_attempt_seconds,
+        budget=RetryBudget(ratio=config.llm_retry_budget_ratio),
+    )
@@ -1,44 +1,187 @@
 import asyncio
 import logging
+import time
+from typing import Any
 
 from anthropic import AnthropicError
 from langchain_core.exceptions import OutputParserException
-from langchain_core.output_parsers import PydanticOutputParser
+from langchain_core.language_models import LanguageModelInput
+from langchain_core.messages import BaseMessage
 from langchain_core.prompts import ChatPromptTemplate
-
-from backend.ai.chains.llm import get_anthropic_client
-from backend.ai.output.review_result import EvaluationResult, ReviewResult
+from langchain_core.runnables import Runnable, RunnableConfig
+
+from backend.ai.chains.callbacks import LLMTelemetryHandler
+from backend.ai.chains.circuit_breaker import CircuitOpenError
+from backend.ai.chains.llm import build_cached_system_message, get_anthropic_client
+from backend.ai.chains.micro_batch import EvaluationMicroBatcher
+from backend.ai.chains.output_repair import OutputRepairer
+from backend.ai.chains.result_cache import ResultCache, cache_key, content_key, template_version
+from backend.ai.chains.retry import request_deadline
+from backend.ai.chains.routing import get_model_router
+from backend.ai.chains.structured_output import StructuredOutput
+from backend.ai.chains.telemetry import collect_llm_telemetry, get_llm_telemetry
+from backend.ai.config import get_ai_config
+from backend.ai.output.review_result import (
+    EvaluationOutput,
+    EvaluationResult,
+    FusedReviewOutput,
+    ImprovementOutput,
+    ReviewResult,
+)
 from backend.ai.strategies.base import PromptStrategy
 from backend.ai.strategies.factory import PromptStrategyFactory
-from backend.api.rest.exceptions import ReviewServiceError
+from backend.api.rest.exceptions import ReviewServiceError, ReviewServiceUnavailableError
 from backend.services.review.context import ReviewContext
-from backend.services.review.enums import ReviewTargetType
+from backend.services.review.enums import ReviewMode, ReviewTargetType
 
 logger = logging.getLogger(__name__)
 
+# 평가에서 개선이 필요 없다고 판단해 개선 단계를 생략할 때의 안내
+NO_IMPROVEMENT_SUGGESTION = "현재 내용이 이미 충분히 좋아 별도의 개선이 필요하지 않습니다."
+
+
+def _served_models(message: BaseMessage, stage: str) -> dict[str, str]:
+    """응답 메시지에 기록된 실제 응답 모델을 단계별 맵으로 변환."""
+    model_name = message.response_metadata.get("model_name")
+    return {stage: model_name} if model_name else {}
+
 
 class ReviewChain:
     """2단계 리뷰 체인: 평가 → 개선.
 
     1단계: 내용을 평가하여 강점과 약점을 파악합니다.
     2단계: 평가 결과를 바탕으로 구체적인 개선안을 생성합니다.
+
+    단일 호출 모드(타겟 타입별 설정 또는 요청별 지정)에서는 평가/개선 지침을 합친
+    프롬프트 한 번으로 평가와 개선안을 함께 생성합니다. 리뷰 1회의 소요 시간과 토큰은
+    실행 모드별로 집계됩니다.
+
+    평가에서 개선이 필요 없다고 판단하면(needs_improvement=false) 개선 단계를 생략하고
+    원문을 그대로 improved_content에 담아 바로 반환합니다.
+
+    llm을 주입하면 해당 LLM으로 단계를 호출합니다 (예: Message Batches 배처).
+    마이크로 배처가 있으면 블록 평가는 같은 타입 요청과 모아 한 번에 평가합니다.
+    단계 파이프라인(prompt | llm)은 (타겟 타입, 단계)별로 한 번만 구성해 재사용합니다.
+    단계 결과는 설정(llm_structured_output)에 따라 도구 호출 강제(기본) 또는 JSON 텍스트
+    파싱으로 받습니다. 파싱에 실패한 응답은 리뷰 전체를 실패시키기 전에 OutputRepairer로
+    복구를 시도합니다.
+
+    LLM에는 모델이 작성하는 필드만 담은 생성 스키마(EvaluationOutput, ImprovementOutput,
+    FusedReviewOutput)를 요청하고, target_type / block_id와 개선 단계의 평가 필드는 서버에서
+    병합해 최종 결과를 만듭니다.
+
+    평가 결과 캐시가 있으면 (전략, 렌더링된 변수, 템플릿 버전, 모델)이 같은 평가는 캐시된
+    결과를 재사용하므로, 같은 블록을 다시 리뷰하면 개선 단계 호출만 발생합니다.
+
+    리뷰 결과 캐시가 있으면 정규화한 입력(NFC, 연속 공백 축약), 실행 모드, 템플릿 버전,
+    모델이 같은 리뷰는 체인을 실행하지 않고 캐시된 결과를 돌려줍니다. 요청에서 캐시
+    우회(cache_bypass)를 지정하면 새로 생성한 결과로 캐시를 갱신합니다.
     """
 
-    def __init__(self):
-        self._llm = get_anthropic_client()
-        self._evaluation_parser = PydanticOutputParser(pydantic_object=EvaluationResult)
-        self._improvement_parser = PydanticOutputParser(pydantic_object=ReviewResult)
+    def __init__(
+        self,
+        llm: Runnable[LanguageModelInput, BaseMessage] | None = None,
+        micro_batcher: EvaluationMicroBatcher | None = None,
+        evaluation_cache: ResultCache | None = None,
+        result_cache: ResultCache | None = None,
+    ):
+        self._llm = llm or get_anthropic_client()
+        config = get_ai_config()
+        if micro_batcher is None and config.llm_micro_batch_enabled:
+            micro_batcher = EvaluationMicroBatcher(
+                self._llm,
+                window_ms=config.llm_micro_batch_window_ms,
+                max_items=config.llm_micro_batch_max_items,
+                output_mode=config.llm_structured_output,
+            )
+        self._micro_batcher = micro_batcher
+        if evaluation_cache is None and config.review_evaluation_cache_enabled:
+            evaluation_cache = ResultCache(
+                max_entries=config.review_evaluation_cache_max_entries,
+                ttl_seconds=config.review_evaluation_cache_ttl_seconds,
+            )
+        self._evaluation_cache = evaluation_cache
+        if result_cache is None and config.review_result_cache_enabled:
+            result_cache = ResultCache(
+                max_entries=None,
+                ttl_seconds=config.review_result_cache_ttl_seconds,
+                max_bytes=config.review_result_cache_max_bytes,
+            )
+        self._result_cache = result_cache
+        # 출력 형식 지침(JSON 스키마 직렬화)과 도구 정의는 한 번만 계산
+        self._outputs: dict[str, StructuredOutput] = {
+            "evaluation": StructuredOutput(EvaluationOutput, config.llm_structured_output),
+            "improvement": StructuredOutput(ImprovementOutput, config.llm_structured_output),
+            "fused": StructuredOutput(FusedReviewOutput, config.llm_structured_output),
+        }
+        self._repairer = (
+            OutputRepairer(self._llm if config.llm_output_repair_fixup_enabled else None)
+            if config.llm_output_repair_enabled
+            else None
+        )
+        self._fused_target_types = set(config.review_fused_target_type_list)
+        self._early_exit_enabled = config.review_early_exit_enabled
+        self._pipelines: dict[tuple[ReviewTargetType, str], Runnable[dict, BaseMessage]] = {}
+        self._template_versions: dict[tuple[ReviewTargetType, str], str] = {}
 
     async def run(self, context: ReviewContext) -> ReviewResult:
-        """2단계 리뷰 실행: 평가 → 개선."""
+        """리뷰 실행: 평가 → 개선 (단일 호출 모드면 한 번의 호출로 평가 + 개선)."""
         strategy = PromptStrategyFactory.get(context)
+        mode = self._resolve_mode(context)
 
+        cache = self._result_cache
         try:
-            # Step 1: 평가
-            evaluation = await self._evaluate(strategy, context)
+            # 캐시 키 계산(프롬프트 구성)에서 난 오류도 리뷰 오류로 변환
+            key = self._result_cache_key(strategy, context, mode) if cache is not None else None
+            if cache is not None and key is not None and not context.cache_bypass:
+                cached = self._lookup_result(cache, key, context)
+                if cached is not None:
+                    return cached
+
+            # 두 단계 전체가 하나의 데드라인을 공유 (재시도도 이 안에서만 수행)
+            with (
+                request_deadline(get_ai_config().llm_request_deadline_seconds),
+                collect_llm_telemetry() as review_telemetry,
+            ):
+                started = time.monotonic()
+                improvement_skipped = False
+                if mode == ReviewMode.FUSED:
+                    result = await self._review_fused(strategy, context)
+                else:
+                    # Step 1: 평가
+                    evaluation = await self._evaluate(strategy, context)
+
+                    # Step 2: 평가 결과를 바탕으로 개선 (개선이 필요 없으면 생략)
+                    if self._early_exit_enabled and not evaluation.needs_improvement:
+                        improvement_skipped = True
+                        result = self._complete_without_improvement(context, evaluation)
+                    else:
+                        result = await self._improve(strategy, context, evaluation)
+
+            get_llm_telemetry().record_review(
+                context.target_type.value,
+                mode.value,
+                time.monotonic() - started,
+                review_telemetry.stages,
+                improvement_skipped=improvement_skipped,
+            )
+            if cache is not None and key is not None:
+                cache.put(key, result, time.monotonic() - started)
+            return result
 
-            # Step 2: 평가 결과를 바탕으로 개선
-            return await self._improve(strategy, context, evaluation)
+        except CircuitOpenError as e:
+            logger.warning(
+                "LLM 서킷이 열려 있어 리뷰 요청을 즉시 거부",
+                extra={
+                    "target_type": context.target_type,
+                    "resume_id": context.resume_id,
+                    "retry_after_ms": e.retry_after_ms,
+                },
+            )
+            raise ReviewServiceUnavailableError(
+                "AI 서비스가 일시적으로 불안정합니다. 잠시 후 다시 시도해주세요.",
+                retry_after_ms=e.retry_after_ms,
+            ) from e
 
         except AnthropicError as e:
             logger.error(
@@ -66,6 +209,19 @@ class ReviewChain:
             )
             raise ReviewServiceError("AI 응답 형식이 올바르지 않습니다. 다시 시도해주세요.") from e
 
+        except TimeoutError as e:
+            logger.error(
+                "LLM 요청 데드라인 초과",
+                extra={
+                    "target_type": context.target_type,
+                    "resume_id": context.resume_id,
+                },
+                exc_info=True,
+            )
+            raise ReviewServiceError(
+                "AI 응답이 지연되고 있습니다. 잠시 후 다시 시도해주세요."
+            ) from e
+
         except Exception as e:
             logger.error(
                 f"예상치 못한 에러 발생: {e}",
@@ -78,6 +234,81 @@ class ReviewChain:
             )
             raise ReviewServiceError("서비스 처리 중 오류가 발생했습니다.") from e
 
+    def _resolve_mode(self, context: ReviewContext) -> ReviewMode:
+        """요청에 지정한 실행 모드, 없으면 타겟 타입별 설정에 따른 모드."""
+        if context.review_mode is not None:
+            return context.review_mode
+        if context.target_type.value in self._fused_target_types:
+            return ReviewMode.FUSED
+        return ReviewMode.TWO_STAGE
+
+    def _get_pipeline(
+        self, strategy: PromptStrategy, target_type: ReviewTargetType, stage: str
+    ) -> Runnable[dict, BaseMessage]:
+        """(타겟 타입, 단계)별 prompt | llm 파이프라인 반환 (처음 요청할 때 한 번만 구성)."""
+        key = (target_type, stage)
+        pipeline = self._pipelines.get(key)
+        if pipeline is None:
+            pipeline, version = self._build_pipeline(strategy, stage)
+            self._pipelines[key] = pipeline
+            self._template_versions[key] = version
+        return pipeline
+
+    def _build_pipeline(
+        self, strategy: PromptStrategy, stage: str
+    ) -> tuple[Runnable[dict, BaseMessage], str]:
+        """단계 파이프라인과 템플릿 버전 구성.
+
+        정적 시스템 프롬프트를 먼저 두어 프롬프트 캐시에 적중하도록 합니다.
+        """
+        output = self._outputs[stage]
+        format_instructions = output.format_instructions
+        if stage == "evaluation":
+            system_prompt = strategy.build_evaluation_system_prompt(format_instructions)
+            user_template = strategy.get_user_prompt_template()
+        elif stage == "fused":
+            system_prompt = strategy.build_fused_system_prompt(format_instructions)
+            user_template = strategy.get_user_prompt_template()
+        else:
+            system_prompt = strategy.build_improvement_system_prompt(format_instructions)
+            user_template = strategy.get_improvement_prompt_template()
+
+        prompt = ChatPromptTemplate.from_messages(
+            [build_cached_system_message(system_prompt), ("human", user_template)]
+        )
+        return prompt | output.bind(self._llm), template_version(system_prompt, user_template)
+
+    async def _review_fused(self, strategy: PromptStrategy, context: ReviewContext) -> ReviewResult:
+        """단일 호출: 한 번의 프롬프트로 평가와 개선안을 함께 생성."""
+        logger.info(
+            f"단일 호출 리뷰 시작: target_type={context.target_type}",
+            extra={"resume_id": context.resume_id},
+        )
+
+        chain = self._get_pipeline(strategy, context.target_type, "fused")
+        telemetry = LLMTelemetryHandler("fused", context.target_type.value)
+        config: RunnableConfig = {
+            "callbacks": [telemetry],
+            "metadata": {"stage": "fused", "target_type": context.target_type.value},
+        }
+        try:
+            message = await chain.ainvoke(strategy.build_prompt_variables(context), config=config)
+            output: FusedReviewOutput = await self._parse("fused", message, config, context)
+        finally:
+            telemetry.finish()
+
+        logger.info(
+            f"단일 호출 리뷰 완료: target_type={context.target_type}",
+            extra={"resume_id": context.resume_id},
+        )
+
+        return ReviewResult(
+            target_type=context.target_type,
+            **output.model_dump(),
+            block_id=context.block.block_id if context.block else None,
+            served_models=_served_models(message, "fused"),
+        )
+
     async def _evaluate(self, strategy: PromptStrategy, context: ReviewContext) -> EvaluationResult:
         """1단계: 평가만 수행."""
         logger.info(
@@ -85,17 +316,21 @@ class ReviewChain:
             extra={"resume_id": context.resume_id},
         )
 
-        # 프롬프트 생성
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                ("system", strategy.build_evaluation_system_prompt()),
-                ("human", strategy.get_user_prompt_template()),
-            ]
-        ).partial(format_instructions=self._evaluation_parser.get_format_instructions())
-
-        # 체인 실행 (with_retry가 적용된 LLM 사용)
-        chain = prompt | self._llm | self._evaluation_parser
-        result: EvaluationResult = await chain.ainvoke(strategy.build_prompt_variables(context))
+        cache = self._evaluation_cache
+        key = self._evaluation_cache_key(strategy, context) if cache is not None else None
+        result = (
+            self._lookup_evaluation(cache, key, context)
+            if cache is not None and key is not None
+            else None
+        )
+        if result is None:
+            started = time.monotonic()
+            if self._micro_batcher is not None and self._micro_batcher.accepts(context):
+                result = await self._micro_batcher.evaluate(strategy, context)
+            if result is None:
+                result = await self._evaluate_single(strategy, context)
+            if cache is not None and key is not None:
+                cache.put(key, result, time.monotonic() - started)
 
         logger.info(
             f"평가 완료: target_type={context.target_type}",
@@ -109,6 +344,109 @@ class ReviewChain:
 
         return result
 
+    def _result_cache_key(
+        self, strategy: PromptStrategy, context: ReviewContext, mode: ReviewMode
+    ) -> str:
+        """리뷰 결과 캐시 키: 정규화한 렌더링 변수, 실행 모드, 템플릿 버전, 모델의 해시."""
+        target_type = context.target_type
+        stages = ("fused",) if mode == ReviewMode.FUSED else ("evaluation", "improvement")
+        router = get_model_router()
+        versions, models = [], []
+        for stage in stages:
+            # 템플릿 버전은 파이프라인을 구성할 때 계산
+            self._get_pipeline(strategy, target_type, stage)
+            versions.append(self._template_versions[(target_type, stage)])
+            models.append(router.resolve(target_type.value, stage).model)
+        return content_key(
+            {
+                "target_type": target_type.value,
+                "mode": mode.value,
+                "variables": strategy.build_prompt_variables(context),
+                "template_versions": versions,
+                "models": models,
+            }
+        )
+
+    def _lookup_result(
+        self, cache: ResultCache, key: str, context: ReviewContext
+    ) -> ReviewResult | None:
+        """캐시된 리뷰 결과 조회 후 타겟 타입별 적중/실패를 텔레메트리에 기록."""
+        cached = cache.get(key)
+        get_llm_telemetry().record_cache_lookup(
+            "review",
+            context.target_type.value,
+            hit=cached is not None,
+            saved_seconds=cached[1] if cached is not None else 0.0,
+        )
+        if cached is None:
+            return None
+        logger.info(
+            f"리뷰 결과 캐시 적중: target_type={context.target_type}",
+            extra={"resume_id": context.resume_id},
+        )
+        # 같은 내용의 다른 블록일 수 있으므로 메타데이터는 현재 요청 기준으로 설정
+        result: ReviewResult = cached[0]
+        result.target_type = context.target_type
+        result.block_id = context.block.block_id if context.block else None
+        return result
+
+    def _evaluation_cache_key(self, strategy: PromptStrategy, context: ReviewContext) -> str:
+        """평가 결과 캐시 키: 전략, 렌더링된 변수, 템플릿 버전, 모델의 해시."""
+        target_type = context.target_type
+        # 템플릿 버전은 파이프라인을 구성할 때 계산
+        self._get_pipeline(strategy, target_type, "evaluation")
+        return cache_key(
+            {
+                "strategy": type(strategy).__name__,
+                "variables": strategy.build_prompt_variables(context),
+                "template_version": self._template_versions[(target_type, "evaluation")],
+                "model": get_model_router().resolve(target_type.value, "evaluation").model,
+            }
+        )
+
+    def _lookup_evaluation(
+        self, cache: ResultCache, key: str, context: ReviewContext
+    ) -> EvaluationResult | None:
+        """캐시된 평가 결과 조회 후 적중/실패와 아낀 시간을 텔레메트리에 기록."""
+        cached = cache.get(key)
+        get_llm_telemetry().record_cache_lookup(
+            "evaluation",
+            context.target_type.value,
+            hit=cached is not None,
+            saved_seconds=cached[1] if cached is not None else 0.0,
+        )
+        if cached is None:
+            return None
+        logger.info(
+            f"평가 결과 캐시 적중: target_type={context.target_type}",
+            extra={"resume_id": context.resume_id},
+        )
+        result: EvaluationResult = cached[0]
+        return result
+
+    async def _evaluate_single(
+        self, strategy: PromptStrategy, context: ReviewContext
+    ) -> EvaluationResult:
+        """평가 요청 하나를 단독으로 LLM에 보내 평가."""
+        # 체인 실행 (LLMGateway 정책이 적용된 LLM 사용)
+        chain = self._get_pipeline(strategy, context.target_type, "evaluation")
+        telemetry = LLMTelemetryHandler("evaluation", context.target_type.value)
+        config: RunnableConfig = {
+            "callbacks": [telemetry],
+            "metadata": {"stage": "evaluation", "target_type": context.target_type.value},
+        }
+        try:
+            message = await chain.ainvoke(strategy.build_prompt_variables(context), config=config)
+            output: EvaluationOutput = await self._parse("evaluation", message, config, context)
+        finally:
+            telemetry.finish()
+
+        return EvaluationResult(
+            target_type=context.target_type,
+            **output.model_dump(),
+            served_models=_served_models(message, "evaluation"),
+        )
+
     async def _improve(
         self, strategy: PromptStrategy, context: ReviewContext, evaluation: EvaluationResult
     ) -> ReviewResult:
@@ -118,40 +456,91 @@ class ReviewChain:
             extra={"resume_id": context.resume_id},
         )
 
-        # 프롬프트 생성
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                ("system", strategy.build_improvement_system_prompt()),
-                ("human", strategy.get_improvement_prompt_template()),
-            ]
-        ).partial(format_instructions=self._improvement_parser.get_format_instructions())
+        chain = self._get_pipeline(strategy, context.target_type, "improvement")
+        telemetry = LLMTelemetryHandler("improvement", context.target_type.value)
+        config: RunnableConfig = {
+            "callbacks": [telemetry],
+            "metadata": {"stage": "improvement", "target_type": context.target_type.value},
+        }
+        try:
+            message = await chain.ainvoke(
+                strategy.build_improvement_variables(context, evaluation), config=config
+            )
+            output: ImprovementOutput = await self._parse("improvement", message, config, context)
+        finally:
+            telemetry.finish()
 
-        chain = prompt | self._llm | self._improvement_parser
-        result: ReviewResult = await chain.ainvoke(
-            strategy.build_improvement_variables(context, evaluation)
+        logger.info(
+            f"개선 완료: target_type={context.target_type}",
+            extra={"resume_id": context.resume_id},
         )
 
+        # 평가 결과와 개선안을 최종 결과로 병합
+        return ReviewResult(
+            target_type=context.target_type,
+            evaluation_summary=evaluation.summary,
+            strengths=evaluation.strengths,
+            weaknesses=evaluation.weaknesses,
+            improvement_suggestion=output.improvement_suggestion,
+            improved_content=output.improved_content,
+            block_id=context.block.block_id if context.block else None,
+            served_models={
+                **evaluation.served_models,
+                **_served_models(message, "improvement"),
+            },
+        )
+
+    async def _parse(
+        self, stage: str, message: BaseMessage, config: RunnableConfig, context: ReviewContext
+    ) -> Any:
+        """단계 응답 파싱 (실패하면 복구를 시도하고, 복구도 실패하면 원래 예외 발생)."""
+        output = self._outputs[stage]
+        try:
+            return await output.parser.ainvoke(
+                message, config={**config, "run_name": LLMTelemetryHandler.PARSER_RUN_NAME}
+            )
+        except OutputParserException as e:
+            if self._repairer is None:
+                raise
+            logger.warning(
+                f"단계 응답 파싱 실패, 복구 시도: stage={stage}",
+                extra={"target_type": context.target_type, "resume_id": context.resume_id},
+            )
+            return await self._repairer.repair(output, message, e, context.target_type.value, stage)
+
+    def _complete_without_improvement(
+        self, context: ReviewContext, evaluation: EvaluationResult
+    ) -> ReviewResult:
+        """개선 단계 없이 평가 결과와 원문으로 최종 결과 구성."""
         logger.info(
-            f"개선 완료: target_type={context.target_type}",
+            f"개선 불필요로 개선 단계 생략: target_type={context.target_type}",
             extra={"resume_id": context.resume_id},
         )
 
-        # 평가 결과를 최종 결과에 포함
-        result.target_type = context.target_type
-        result.strengths = evaluation.strengths
-        result.weaknesses = evaluation.weaknesses
-        result.evaluation_summary = evaluation.summary
         if context.block:
-            result.block_id = context.block.block_id
-
-        return result
+            original_content = context.block.content
+        elif context.introduction:
+            original_content = context.introduction.content
+        else:
+            original_content = None
+
+        return ReviewResult(
+            target_type=context.target_type,
+            evaluation_summary=evaluation.summary,
+            strengths=evaluation.strengths,
+            weaknesses=evaluation.weaknesses,
+            improvement_suggestion=NO_IMPROVEMENT_SUGGESTION,
+            improved_content=original_content,
+            block_id=context.block.block_id if context.block else None,
+            served_models=dict(evaluation.served_models),
+        )
 
 
 class SectionReviewChain:
     """섹션 리뷰 체인 - 여러 블록을 순차 처리."""
 
-    def __init__(self):
-        self._single_chain = ReviewChain()
+    def __init__(self, single_chain: ReviewChain | None = None):
+        self._single_chain = single_chain or ReviewChain()
 
     async def run(self, context: ReviewContext) -> list[ReviewResult]:
         """섹션 내 모든 블록을 병렬로 리뷰."""
@@ -167,6 +556,8 @@ class SectionReviewChain:
                 target_type=block_target_type,
                 section=context.section,
                 block=block,
+                review_mode=context.review_mode,
+                cache_bypass=context.cache_bypass,
             )
             for block in context.section.blocks
         ]
@@ -0,0 +1,148 @@
+"""(타겟 타입, 단계)별 모델 라우팅.
+
+라우팅 테이블(YAML)에서 타겟 타입과 단계(evaluation/improvement)에 맞는 모델과
+생성 파라미터를 고르고, 라우트별 단계 소요 시간을 집계합니다.
+
+라우트 키 우선순위: "<target_type>.<stage>" > "<target_type>.*" > "*.<stage>" > AIConfig 기본값
+"""
+
+import logging
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import yaml
+from langchain_core.runnables import RunnableConfig
+from pydantic import BaseModel, Field
+
+from backend.ai.chains.hedging import LatencyTracker
+from backend.ai.config import get_ai_config
+from backend.services.review.enums import ReviewTargetType
+
+logger = logging.getLogger(__name__)
+
+WILDCARD = "*"
+
+_TARGET_PATTERNS = {WILDCARD, *(target_type.value for target_type in ReviewTargetType)}
+
+
+def _get_default_routing_path() -> Path:
+    """기본 라우팅 테이블 경로 반환."""
+    return Path(__file__).parent.parent / "routing.yaml"
+
+
+class RouteOverride(BaseModel):
+    """라우팅 테이블 항목 (지정하지 않은 값은 상위 항목/기본값을 따름)."""
+
+    model: str | None = Field(None, description="모델명")
+    max_tokens: int | None = Field(None, description="최대 생성 토큰 수", ge=1, le=8192)
+    temperature: float | None = Field(None, description="응답 생성 온도", ge=0.0, le=1.0)
+
+
+class LLMRoute(BaseModel):
+    """단계 호출에 적용할 모델과 생성 파라미터."""
+
+    key: str = Field(..., description="라우트 키 (target_type:stage)")
+    model: str = Field(..., description="모델명")
+    max_tokens: int = Field(..., description="최대 생성 토큰 수")
+    temperature: float = Field(..., description="응답 생성 온도")
+
+    def call_kwargs(self) -> dict[str, Any]:
+        """모델 호출 인자로 변환."""
+        return {
+            "model": self.model,
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+        }
+
+
+class ModelRouter:
+    """라우팅 테이블 조회 및 라우트별 소요 시간 집계."""
+
+    def __init__(self, default: RouteOverride, routes: dict[str, RouteOverride] | None = None):
+        self._default = default
+        self._routes = routes or {}
+        self._timings = LatencyTracker(window_size=500)
+        self._resolved: dict[str, LLMRoute] = {}
+
+    @classmethod
+    def from_yaml(cls, path: Path, default: RouteOverride) -> "ModelRouter":
+        """YAML 라우팅 테이블로 라우터 생성."""
+        with open(path, encoding="utf-8") as f:
+            data = yaml.safe_load(f) or {}
+
+        routes: dict[str, RouteOverride] = {}
+        for key, value in (data.get("routes") or {}).items():
+            target_type, _, stage = key.partition(".")
+            if not stage or target_type not in _TARGET_PATTERNS:
+                raise ValueError(f"잘못된 라우트 키: {key} ({path})")
+            routes[key] = RouteOverride.model_validate(value or {})
+        return cls(default, routes)
+
+    def resolve(self, target_type: str, stage: str) -> LLMRoute:
+        """타겟 타입과 단계에 맞는 라우트 반환."""
+        key = f"{target_type}:{stage}"
+        route = self._resolved.get(key)
+        if route is not None:
+            return route
+
+        values = self._default.model_dump()
+        # 넓은 범위부터 덮어써서 가장 구체적인 항목이 이기도록 함
+        for pattern in (
+            f"{WILDCARD}.{stage}",
+            f"{target_type}.{WILDCARD}",
+            f"{target_type}.{stage}",
+        ):
+            override = self._routes.get(pattern)
+            if override is not None:
+                values.update(override.model_dump(exclude_none=True))
+
+        route = LLMRoute(key=key, **values)
+        self._resolved[key] = route
+        return route
+
+    def resolve_config(self, config: RunnableConfig | None) -> LLMRoute | None:
+        """RunnableConfig metadata의 target_type / stage로 라우트 조회. 정보가 없으면 None."""
+        metadata = (config or {}).get("metadata") or {}
+        target_type, stage = metadata.get("target_type"), metadata.get("stage")
+        if target_type is None or stage is None:
+            return None
+        return self.resolve(str(target_type), str(stage))
+
+    def record(self, route: LLMRoute, elapsed: float) -> None:
+        """라우트의 단계 소요 시간(초) 기록."""
+        self._timings.record(route.key, elapsed)
+
+    def snapshot(self) -> dict[str, Any]:
+        """라우트별 모델과 소요 시간 통계 반환."""
+        stats: dict[str, Any] = {}
+        for key, route in sorted(self._resolved.items()):
+            stats[key] = {
+                "model": route.model,
+                "max_tokens": route.max_tokens,
+                "temperature": route.temperature,
+                "samples": self._timings.count(key),
+                "p50_ms": _to_ms(self._timings.percentile(key, 0.5)),
+                "p95_ms": _to_ms(self._timings.percentile(key, 0.95)),
+            }
+        return stats
+
+
+def _to_ms(seconds: float | None) -> int | None:
+    return None if seconds is None else round(seconds * 1000)
+
+
+@lru_cache
+def get_model_router() -> ModelRouter:
+    """설정의 라우팅 테이블로 구성한 라우터 싱글톤 반환."""
+    config = get_ai_config()
+    default = RouteOverride(
+        model=config.anthropic_model,
+        max_tokens=config.anthropic_max_tokens,
+        temperature=config.anthropic_temperature,
+    )
+    path = Path(config.llm_routing_file) if config.llm_routing_file else _get_default_routing_path()
+    if not path.exists():
+        logger.warning(f"라우팅 테이블이 없어 기본 모델만 사용합니다: {path}")
+        return ModelRouter(default)
+    return ModelRouter.from_yaml(path, default)
@@ -0,0 +1,111 @@
+"""단계 결과의 구조화 출력 방식.
+
+- tool: 결과 스키마를 도구 정의로 넘기고 tool_choice로 그 도구 호출을 강제합니다.
+  모델은 스키마에 맞는 JSON 객체를 도구 입력으로 돌려주므로 자유 텍스트 파싱이 없고,
+  시스템 프롬프트에는 긴 JSON 스키마 지침 대신 짧은 안내 한 줄만 들어갑니다.
+- json: PydanticOutputParser의 JSON 스키마 지침을 시스템 프롬프트에 넣고 응답
+  텍스트를 파싱합니다 (기존 방식, 비교 측정용).
+
+두 방식 모두 파서는 RunnableConfig의 run_name(LLMTelemetryHandler.PARSER_RUN_NAME)으로
+실행되어 파싱 시간과 실패 수가 단계 텔레메트리에 기록됩니다.
+"""
+
+import inspect
+import json
+from typing import Any, Literal, TypeVar
+
+from langchain_core.exceptions import OutputParserException
+from langchain_core.language_models import LanguageModelInput
+from langchain_core.messages import BaseMessage
+from langchain_core.output_parsers import BaseGenerationOutputParser, PydanticOutputParser
+from langchain_core.outputs import ChatGeneration, Generation
+from langchain_core.runnables import Runnable
+from pydantic import BaseModel, ValidationError
+
+from backend.ai.chains.token_budget import is_truncated
+from backend.utils.yaml_loader import get_prompt
+
+OutputMode = Literal["tool", "json"]
+
+T = TypeVar("T", bound=BaseModel)
+
+
+def build_output_tool(schema: type[BaseModel]) -> dict[str, Any]:
+    """결과 스키마를 Anthropic 도구 정의로 변환 (SkipJsonSchema 필드는 제외됨)."""
+    return {
+        "name": schema.__name__,
+        "description": inspect.getdoc(schema) or schema.__name__,
+        "input_schema": schema.model_json_schema(),
+    }
+
+
+class ToolCallOutputParser(BaseGenerationOutputParser[T]):
+    """강제한 도구 호출의 입력을 결과 스키마로 검증하는 파서."""
+
+    pydantic_object: type[T]
+
+    def parse_result(self, result: list[Generation], *, partial: bool = False) -> T:
+        """응답 메시지의 도구 호출 입력을 Pydantic 모델로 변환."""
+        generation = result[0]
+        if not isinstance(generation, ChatGeneration):
+            raise OutputParserException("도구 호출 결과는 채팅 모델 응답에서만 파싱할 수 있습니다.")
+
+        name = self.pydantic_object.__name__
+        message = generation.message
+        arguments = next(
+            (call["args"] for call in getattr(message, "tool_calls", []) if call["name"] == name),
+            None,
+        )
+        if arguments is None:
+            raise OutputParserException(
+                f"응답에 {name} 도구 호출이 없습니다.", llm_output=message.text
+            )
+        if is_truncated(message):
+            # 잘린 도구 입력은 부분 JSON을 닫아 만든 것이므로 검증을 통과해도 사용하지 않음
+            raise OutputParserException(
+                f"{name} 도구 입력이 max_tokens에서 잘렸습니다.",
+                llm_output=json.dumps(arguments, ensure_ascii=False),
+            )
+        try:
+            return self.pydantic_object.model_validate(arguments)
+        except ValidationError as e:
+            raise OutputParserException(
+                f"{name} 도구 입력이 스키마와 맞지 않습니다: {e}",
+                llm_output=json.dumps(arguments, ensure_ascii=False),
+            ) from e
+
+    @property
+    def _type(self) -> str:
+        return "tool_call_output_parser"
+
+
+class StructuredOutput:
+    """결과 스키마 하나에 대한 형식 지침, 모델 호출 인자, 파서 묶음."""
+
+    def __init__(self, schema: type[BaseModel], mode: OutputMode = "tool"):
+        self.schema = schema
+        self.mode = mode
+        self.parser: Runnable[BaseMessage, Any]
+        if mode == "tool":
+            tool = build_output_tool(schema)
+            self.parser = ToolCallOutputParser(pydantic_object=schema)
+            self.format_instructions = (
+                get_prompt("base", "tool_format_instructions")
+                .format(tool_name=tool["name"])
+                .strip()
+            )
+            self.call_kwargs: dict[str, Any] = {
+                "tools": [tool],
+                "tool_choice": {"type": "tool", "name": tool["name"]},
+            }
+        else:
+            parser: PydanticOutputParser[BaseModel] = PydanticOutputParser(pydantic_object=schema)
+            self.parser = parser
+            self.format_instructions = parser.get_format_instructions()
+            self.call_kwargs = {}
+
+    def bind(
+        self, llm: Runnable[LanguageModelInput, BaseMessage]
+    ) -> Runnable[LanguageModelInput, BaseMessage]:
+        """도구 호출 방식이면 도구 정의와 tool_choice를 모델 호출 인자로 고정."""
+        return llm.bind(**self.call_kwargs) if self.call_kwargs else llm
@@ -0,0 +1,237 @@
+"""LLM 호출 단계별 텔레메트리.
+
+ReviewChain의 단계(평가/개선) 하나가 끝날 때마다 입력/출력/캐시 토큰, 첫 토큰까지의
+시간(TTFT), 생성 시간, 재시도 수, 파싱 시간과 실패 여부, 응답 모델을 한 건의 기록으로
+남깁니다.
+기록은 프로세스 전역 집계기에 쌓이고, 요청 단위 수집기가 열려 있으면 해당 요청의
+로그 레코드에도 첨부됩니다. 리뷰 1회 단위로는 실행 모드(2단계/단일 호출)별 소요
+시간과 토큰 사용량, 개선 단계를 생략한 비율을, 파싱 실패 응답은 복구 결과를, 결과
+캐시는 타겟 타입별 적중/실패 수와 적중으로 아낀 시간을 따로 집계합니다.
+"""
+
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Any
+
+from backend.ai.chains.hedging import LatencyTracker
+
+# 백분위로 집계하는 시간 지표
+_TIMING_FIELDS = ("ttft_ms", "generation_ms", "parse_ms")
+# 합계로 집계하는 카운터 지표
+_COUNTER_FIELDS = (
+    "input_tokens",
+    "output_tokens",
+    "cache_read_tokens",
+    "cache_creation_tokens",
+    "retries",
+    "continuations",
+    "parse_failures",
+)
+
+
+class StageTelemetry:
+    """단계 1회 실행의 측정값."""
+
+    def __init__(self, stage: str, target_type: str):
+        self.stage = stage
+        self.target_type = target_type
+        self.model: str | None = None
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.cache_read_tokens = 0
+        self.cache_creation_tokens = 0
+        self.ttft_ms: float | None = None
+        self.generation_ms: float | None = None
+        self.parse_ms: float | None = None
+        self.retries = 0
+        self.continuations = 0
+        self.parse_failures = 0
+
+    @property
+    def key(self) -> str:
+        """집계 키 (타겟 타입:단계)."""
+        return f"{self.target_type}:{self.stage}"
+
+    def to_dict(self) -> dict[str, Any]:
+        """로그 첨부용 딕셔너리."""
+        return {
+            "stage": self.stage,
+            "target_type": self.target_type,
+            "model": self.model,
+            **{field: getattr(self, field) for field in _COUNTER_FIELDS},
+            **{
+                field: round(value, 2) if (value := getattr(self, field)) is not None else None
+                for field in _TIMING_FIELDS
+            },
+        }
+
+
+class RequestTelemetry:
+    """한 요청에서 실행된 단계 기록 수집기 (상위 수집기가 있으면 함께 기록)."""
+
+    def __init__(self, parent: "RequestTelemetry | None" = None) -> None:
+        self.stages: list[StageTelemetry] = []
+        self.parent = parent
+
+    def add(self, stage: StageTelemetry) -> None:
+        """단계 기록을 이 수집기와 모든 상위 수집기에 추가."""
+        collector: RequestTelemetry | None = self
+        while collector is not None:
+            collector.stages.append(stage)
+            collector = collector.parent
+
+    def to_list(self) -> list[dict[str, Any]]:
+        """로그 첨부용 단계 기록 목록."""
+        return [stage.to_dict() for stage in self.stages]
+
+
+_request_telemetry: ContextVar[RequestTelemetry | None] = ContextVar(
+    "llm_request_telemetry", default=None
+)
+
+
+@contextmanager
+def collect_llm_telemetry() -> Iterator[RequestTelemetry]:
+    """현재 컨텍스트(요청)에서 끝나는 단계 기록을 모으는 수집기 설정.
+
+    asyncio.gather로 만든 하위 태스크도 같은 수집기에 기록합니다. 수집기를 중첩하면
+    안쪽 기록이 바깥 수집기에도 남습니다 (예: 서비스 요청 안의 리뷰 1회).
+    """
+    telemetry = RequestTelemetry(_request_telemetry.get())
+    token = _request_telemetry.set(telemetry)
+    try:
+        yield telemetry
+    finally:
+        _request_telemetry.reset(token)
+
+
+def current_request_telemetry() -> RequestTelemetry | None:
+    """현재 컨텍스트(요청)의 단계 기록 수집기. 열려 있지 않으면 None."""
+    return _request_telemetry.get()
+
+
+def credit_stage(stage: StageTelemetry, collectors: Iterable[RequestTelemetry | None]) -> None:
+    """여러 요청이 함께 쓴 단계 기록을 각 요청 수집기(와 상위 수집기)에 한 번씩 추가."""
+    credited: set[int] = set()
+    for collector in collectors:
+        while collector is not None and id(collector) not in credited:
+            credited.add(id(collector))
+            collector.stages.append(stage)
+            collector = collector.parent
+
+
+class LLMTelemetry:
+    """단계 기록의 프로세스 전역 집계기."""
+
+    def __init__(self, window_size: int = 200):
+        self._timings = LatencyTracker(window_size)
+        self._totals: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self._models: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self._reviews: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self._repairs: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self._caches: dict[str, dict[str, dict[str, float]]] = defaultdict(
+            lambda: defaultdict(lambda: defaultdict(float))
+        )
+
+    def record(self, stage: StageTelemetry) -> None:
+        """단계 기록을 집계하고 요청 수집기가 있으면 함께 남김."""
+        totals = self._totals[stage.key]
+        totals["calls"] += 1
+        for field in _COUNTER_FIELDS:
+            totals[field] += getattr(stage, field)
+        for field in _TIMING_FIELDS:
+            value = getattr(stage, field)
+            if value is not None:
+                self._timings.record(f"{stage.key}:{field}", value)
+        if stage.model:
+            self._models[stage.key][stage.model] += 1
+
+        request = _request_telemetry.get()
+        if request is not None:
+            request.add(stage)
+
+    def record_review(
+        self,
+        target_type: str,
+        mode: str,
+        elapsed: float,
+        stages: list[StageTelemetry],
+        improvement_skipped: bool = False,
+    ) -> None:
+        """리뷰 1회의 실행 모드별 소요 시간(초), 토큰 사용량, 개선 단계 생략 여부 집계."""
+        key = f"{target_type}:{mode}"
+        totals = self._reviews[key]
+        totals["reviews"] += 1
+        totals["improvement_skipped"] += int(improvement_skipped)
+        totals["llm_calls"] += len(stages)
+        totals["input_tokens"] += sum(stage.input_tokens for stage in stages)
+        totals["output_tokens"] += sum(stage.output_tokens for stage in stages)
+        self._timings.record(f"review:{key}", elapsed * 1000)
+
+    def review_snapshot(self) -> dict[str, Any]:
+        """(타겟 타입:실행 모드)별 리뷰 수, 평균 토큰, 개선 생략률, 소요 시간 p50/p95 반환."""
+        result: dict[str, Any] = {}
+        for key, totals in sorted(self._reviews.items()):
+            reviews = totals["reviews"]
+            result[key] = {
+                **totals,
+                "input_tokens_avg": round(totals["input_tokens"] / reviews, 1),
+                "output_tokens_avg": round(totals["output_tokens"] / reviews, 1),
+                "improvement_skip_rate": round(totals["improvement_skipped"] / reviews, 3),
+                "duration_ms_p50": self._timings.percentile(f"review:{key}", 0.5),
+                "duration_ms_p95": self._timings.percentile(f"review:{key}", 0.95),
+            }
+        return result
+
+    def record_repair(self, key: str, outcome: str) -> None:
+        """파싱 실패 응답의 복구 결과(성공한 복구 단계, truncated 또는 failed) 집계."""
+        self._repairs[key][outcome] += 1
+
+    def repair_snapshot(self) -> dict[str, dict[str, int]]:
+        """(타겟 타입:단계)별 복구 결과 수 반환."""
+        return {key: dict(outcomes) for key, outcomes in sorted(self._repairs.items())}
+
+    def record_cache_lookup(
+        self, cache: str, target_type: str, hit: bool, saved_seconds: float = 0.0
+    ) -> None:
+        """결과 캐시 조회 1회 집계 (적중이면 캐시된 결과를 만들 때 걸린 시간만큼 절약)."""
+        totals = self._caches[cache][target_type]
+        totals["hits" if hit else "misses"] += 1
+        totals["saved_ms"] += saved_seconds * 1000
+
+    def cache_snapshot(self) -> dict[str, dict[str, Any]]:
+        """캐시별, 타겟 타입별 적중/실패 수, 적중률, 절약한 시간 반환."""
+        result: dict[str, dict[str, Any]] = {}
+        for cache, per_target in sorted(self._caches.items()):
+            result[cache] = {}
+            for target_type, totals in sorted(per_target.items()):
+                hits, misses = int(totals["hits"]), int(totals["misses"])
+                result[cache][target_type] = {
+                    "hits": hits,
+                    "misses": misses,
+                    "hit_rate": round(hits / (hits + misses), 3),
+                    "saved_ms": round(totals["saved_ms"], 1),
+                }
+        return result
+
+    def snapshot(self) -> dict[str, Any]:
+        """(타겟 타입:단계)별 누적 토큰/재시도, 파싱 실패율과 시간 지표 p50/p95 반환."""
+        result: dict[str, Any] = {}
+        for key, totals in sorted(self._totals.items()):
+            entry: dict[str, Any] = dict(totals)
+            entry["parse_failure_rate"] = round(totals["parse_failures"] / totals["calls"], 4)
+            for field in _TIMING_FIELDS:
+                entry[f"{field}_p50"] = self._timings.percentile(f"{key}:{field}", 0.5)
+                entry[f"{field}_p95"] = self._timings.percentile(f"{key}:{field}", 0.95)
+            entry["models"] = dict(self._models[key])
+            result[key] = entry
+        return result
+
+
+@lru_cache
+def get_llm_telemetry() -> LLMTelemetry:
+    """프로세스 전역 텔레메트리 집계기 싱글톤 반환."""
+    return LLMTelemetry()
@@ -0,0 +1,124 @@
+"""출력 토큰 예산과 max_tokens 잘림 이어쓰기.
+
+- 라우트(타겟 타입 × 단계)별로 실제 출력 토큰 수를 관찰해 max_tokens를 정합니다.
+- 응답이 max_tokens에서 잘리면(stop_reason == "max_tokens") 받은 내용을 assistant
+  prefill로 넘겨 이어서 생성하고, 결과를 하나의 메시지로 이어 붙입니다.
+"""
+
+import math
+from functools import lru_cache
+from typing import Any
+
+from langchain_core.language_models import LanguageModelInput
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, convert_to_messages
+from langchain_core.messages.ai import add_usage
+from langchain_core.prompt_values import PromptValue
+
+from backend.ai.chains.hedging import LatencyTracker
+from backend.ai.config import get_ai_config
+
+MAX_TOKENS_STOP_REASON = "max_tokens"
+
+
+class OutputTokenBudget:
+    """관찰한 출력 길이 분포로 라우트별 max_tokens를 정하는 예산 관리자."""
+
+    def __init__(
+        self,
+        percentile: float = 0.99,
+        headroom: float = 1.5,
+        min_tokens: int = 512,
+        min_samples: int = 20,
+    ):
+        self._percentile = percentile
+        self._headroom = headroom
+        self._min_tokens = min_tokens
+        self._min_samples = min_samples
+        self._samples = LatencyTracker()
+        self._ceilings: dict[str, int] = {}
+
+    def suggest(self, key: str, ceiling: int) -> int:
+        """라우트의 max_tokens 제안. 표본이 부족하면 ceiling(라우트 설정값)을 그대로 사용."""
+        self._ceilings[key] = ceiling
+        if self._samples.count(key) < self._min_samples:
+            return ceiling
+        observed = self._samples.percentile(key, self._percentile) or 0
+        budget = math.ceil(observed * self._headroom)
+        return min(ceiling, max(self._min_tokens, budget))
+
+    def expected(self, key: str) -> int | None:
+        """라우트의 예상(중앙값) 출력 토큰 수. 표본이 부족하면 None."""
+        if self._samples.count(key) < self._min_samples:
+            return None
+        observed = self._samples.percentile(key, 0.5)
+        return math.ceil(observed) if observed is not None else None
+
+    def record(self, key: str, output_tokens: int) -> None:
+        """이어쓰기를 포함한 최종 출력 토큰 수 기록."""
+        self._samples.record(key, output_tokens)
+
+    def snapshot(self) -> dict[str, Any]:
+        """라우트별 관찰 출력 길이와 현재 예산 반환."""
+        return {
+            key: {
+                "samples": self._samples.count(key),
+                "p50_tokens": self._samples.percentile(key, 0.5),
+                "p99_tokens": self._samples.percentile(key, 0.99),
+                "max_tokens": self.suggest(key, ceiling),
+            }
+            for key, ceiling in sorted(self._ceilings.items())
+        }
+
+
+def to_messages(messages: LanguageModelInput) -> list[BaseMessage]:
+    """모델 입력(PromptValue, 문자열, 메시지 목록)을 메시지 리스트로 변환."""
+    if isinstance(messages, PromptValue):
+        return messages.to_messages()
+    if isinstance(messages, str):
+        return [HumanMessage(content=messages)]
+    return convert_to_messages(messages)
+
+
+def is_truncated(message: BaseMessage) -> bool:
+    """max_tokens에서 잘린 응답인지 여부."""
+    return message.response_metadata.get("stop_reason") == MAX_TOKENS_STOP_REASON
+
+
+def build_continuation_input(messages: LanguageModelInput, partial: str) -> list[BaseMessage]:
+    """지금까지 받은 출력을 assistant prefill로 붙인 이어쓰기 입력 생성.
+
+    API가 공백으로 끝나는 prefill을 거부하므로 끝 공백은 제거합니다.
+    """
+    return [*to_messages(messages), AIMessage(content=partial.rstrip())]
+
+
+def stitch_continuation(partial: str, head: BaseMessage, tail: BaseMessage) -> AIMessage:
+    """prefill 이전 출력과 이어쓴 출력을 하나의 메시지로 합침.
+
+    종료 사유 등 메타데이터는 마지막 응답을, 토큰 사용량은 합계를 따릅니다.
+    """
+    usage = add_usage(getattr(head, "usage_metadata", None), getattr(tail, "usage_metadata", None))
+    continuations = head.response_metadata.get("continuations", 0) + 1
+    return AIMessage(
+        content=partial.rstrip() + tail.text,
+        response_metadata={**tail.response_metadata, "continuations": continuations},
+        usage_metadata=usage,
+    )
+
+
+def output_tokens(message: BaseMessage) -> int | None:
+    """응답의 출력 토큰 수. 사용량 정보가 없으면 None."""
+    usage = getattr(message, "usage_metadata", None)
+    return usage["output_tokens"] if usage else None
+
+
+@lru_cache
+def get_output_token_budget() -> OutputTokenBudget:
+    """프로세스 전역 출력 토큰 예산 싱글톤 반환."""
+    config = get_ai_config()
+    return OutputTokenBudget(
+        percentile=config.llm_output_budget_percentile,
+        headroom=config.llm_output_budget_headroom,
+        min_tokens=config.llm_output_budget_min_tokens,
+        min_samples=config.llm_output_budget_min_samples,
+    )
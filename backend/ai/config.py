@@ -1,7 +1,8 @@
 from functools import lru_cache
 from pathlib import Path
+from typing import Literal, Self
 
-from pydantic import Field
+from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -22,15 +23,76 @@ class AIConfig(BaseSettings):
         extra="ignore",
     )
 
+    # LLM 제공자 (fake는 부하 테스트/오프라인 벤치마크용)
+    llm_provider: Literal["anthropic", "fake"] = Field(
+        default="anthropic",
+        description="LLM 제공자 (anthropic: 실제 API, fake: 스키마에 맞는 가짜 응답)",
+    )
+
+    # 구조화 출력 방식
+    llm_structured_output: Literal["tool", "json"] = Field(
+        default="tool",
+        description=(
+            "단계 결과를 받는 방식 (tool: 도구 호출 강제, "
+            "json: 프롬프트에 JSON 스키마 지침을 넣고 텍스트 파싱)"
+        ),
+    )
+    # 파싱 실패 응답 복구
+    llm_output_repair_enabled: bool = Field(
+        default=True,
+        description="파싱에 실패한 단계 응답을 로컬에서 복구할지 여부 (코드 펜스/끊긴 JSON 등)",
+    )
+    llm_output_repair_fixup_enabled: bool = Field(
+        default=True,
+        description="로컬 복구가 실패하면 형식 교정 LLM 호출을 한 번 시도할지 여부",
+    )
+
+    # LLM 호출 녹화/재생 (성능 회귀 테스트, 파싱 실패 재현용)
+    llm_cassette_mode: Literal["off", "record", "replay"] = Field(
+        default="off",
+        description="LLM 호출 카세트 모드 (record: 실제 호출 녹화, replay: 녹화 응답 재생)",
+    )
+    llm_cassette_path: str = Field(
+        default="cassettes/llm_cassette.jsonl.gz",
+        description="카세트 파일 경로 (gzip JSONL)",
+    )
+    llm_cassette_time_scale: float = Field(
+        default=1.0,
+        description="재생 시 녹화된 소요 시간에 곱할 배율 (0이면 대기 없음)",
+        ge=0,
+    )
+
     # Anthropic API 설정
     anthropic_api_key: str = Field(
         ...,
         description="Anthropic API 키",
     )
+    anthropic_extra_api_keys: str = Field(
+        default="",
+        description="키 풀에 추가할 Anthropic API 키 (쉼표로 구분)",
+    )
+    anthropic_key_cooldown_seconds: float = Field(
+        default=30.0,
+        description="429 응답을 받은 키를 풀에서 제외하는 기본 시간 (초, retry-after 우선)",
+        gt=0,
+    )
+    anthropic_key_auth_cooldown_seconds: float = Field(
+        default=300.0,
+        description="인증/권한 오류가 발생한 키를 풀에서 제외하는 시간 (초)",
+        gt=0,
+    )
+    anthropic_base_url: str | None = Field(
+        default=None,
+        description="Anthropic API base URL (모의 서버/프록시 사용 시, 비워두면 기본 API)",
+    )
     anthropic_model: str = Field(
         default="claude-haiku-4-5-20251001",
         description="사용할 Anthropic 모델명",
     )
+    anthropic_fallback_models: str = Field(
+        default="",
+        description="과부하/타임아웃 시 순서대로 넘겨 호출할 폴백 모델명 (쉼표로 구분)",
+    )
     anthropic_max_tokens: int = Field(
         default=4096,
         description="최대 생성 토큰 수",
@@ -49,6 +111,403 @@ class AIConfig(BaseSettings):
         ge=0.0,
         le=1.0,
     )
+    anthropic_request_timeout: float = Field(
+        default=60.0,
+        description="단일 API 호출 타임아웃 (초)",
+        gt=0,
+    )
+    anthropic_http_max_connections: int = Field(
+        default=64,
+        description="Anthropic API HTTP 커넥션 풀 최대 연결 수 (LLM 최대 동시성에 맞춤)",
+        ge=1,
+    )
+    anthropic_http_max_keepalive_connections: int = Field(
+        default=32,
+        description="유휴 상태로 유지할 최대 keepalive 연결 수",
+        ge=0,
+    )
+    anthropic_http_keepalive_expiry: float = Field(
+        default=60.0,
+        description="유휴 keepalive 연결 유지 시간 (초)",
+        gt=0,
+    )
+    llm_warmup_enabled: bool = Field(
+        default=True,
+        description="앱 시작 시 LLM 클라이언트 생성 및 커넥션 워밍업 여부",
+    )
+    llm_warmup_connections: int = Field(
+        default=4,
+        description="앱 시작 시 미리 열어 둘 커넥션 수",
+        ge=1,
+    )
+    llm_warmup_timeout: float = Field(
+        default=5.0,
+        description="커넥션 워밍업 요청 타임아웃 (초)",
+        gt=0,
+    )
+    anthropic_streaming_enabled: bool = Field(
+        default=True,
+        description="스트리밍 응답 사용 여부 (첫 토큰까지의 시간(TTFT) 측정에 필요)",
+    )
+    anthropic_prompt_cache_enabled: bool = Field(
+        default=True,
+        description="정적 시스템 프롬프트에 프롬프트 캐시 브레이크포인트 적용 여부",
+    )
+
+    # LLM 호출 동시성 제한 (AIMD)
+    llm_concurrency_initial: int = Field(
+        default=8,
+        description="초기 허용 동시 LLM 호출 수",
+        ge=1,
+    )
+    llm_concurrency_min: int = Field(
+        default=1,
+        description="최소 허용 동시 LLM 호출 수",
+        ge=1,
+    )
+    llm_concurrency_max: int = Field(
+        default=64,
+        description="최대 허용 동시 LLM 호출 수",
+        ge=1,
+    )
+
+    # LLM 호출 재시도 정책
+    llm_retry_max_attempts: int = Field(
+        default=3,
+        description="최대 시도 횟수 (최초 호출 포함)",
+        ge=1,
+    )
+    llm_retry_base_delay: float = Field(
+        default=0.5,
+        description="지수 백오프 기본 대기 시간 (초)",
+        ge=0.0,
+    )
+    llm_retry_max_delay: float = Field(
+        default=8.0,
+        description="지수 백오프 최대 대기 시간 (초)",
+        ge=0.0,
+    )
+    llm_retry_max_retry_after: float = Field(
+        default=20.0,
+        description="이보다 긴 retry-after를 요구하면 재시도하지 않음 (초)",
+        ge=0.0,
+    )
+    llm_retry_budget_ratio: float = Field(
+        default=0.1,
+        description="전체 호출 대비 허용 재시도 비율 (토큰 버킷 적립률)",
+        ge=0.0,
+        le=1.0,
+    )
+    llm_retry_min_attempt_seconds: float = Field(
+        default=5.0,
+        description="재시도 후 데드라인까지 최소한 남아 있어야 하는 시간 (초)",
+        ge=0.0,
+    )
+    llm_request_deadline_seconds: float = Field(
+        default=180.0,
+        description=(
+            "리뷰 요청 하나가 LLM 호출에 쓸 수 있는 전체 시간 (초). 단일 호출 타임아웃 ×"
+            " 단계 수보다 길어야 타임아웃 재시도/폴백이 동작함"
+        ),
+        gt=0,
+    )
+
+    # LLM 서킷 브레이커
+    llm_circuit_window_size: int = Field(
+        default=20,
+        description="오류율/지연 판단에 사용하는 최근 호출 수",
+        ge=1,
+    )
+    llm_circuit_min_calls: int = Field(
+        default=10,
+        description="서킷을 열기 위해 필요한 최소 호출 수",
+        ge=1,
+    )
+    llm_circuit_failure_rate: float = Field(
+        default=0.5,
+        description="서킷을 여는 오류율 임계값",
+        gt=0.0,
+        le=1.0,
+    )
+    llm_circuit_slow_call_seconds: float = Field(
+        default=30.0,
+        description="느린 호출로 간주하는 지연 시간 (초)",
+        gt=0,
+    )
+    llm_circuit_slow_call_rate: float = Field(
+        default=0.8,
+        description="서킷을 여는 느린 호출 비율 임계값",
+        gt=0.0,
+        le=1.0,
+    )
+    llm_circuit_open_seconds: float = Field(
+        default=30.0,
+        description="서킷이 열린 뒤 탐색 호출을 허용하기까지의 시간 (초)",
+        gt=0,
+    )
+    llm_circuit_half_open_calls: int = Field(
+        default=2,
+        description="HALF_OPEN 상태에서 허용하는 탐색 호출 수",
+        ge=1,
+    )
+
+    # 모델 라우팅
+    llm_routing_file: str = Field(
+        default="",
+        description="(타겟 타입, 단계)별 모델 라우팅 테이블 YAML 경로 (비워두면 기본 테이블)",
+    )
+
+    # 출력 토큰 예산 / 이어쓰기
+    llm_output_budget_enabled: bool = Field(
+        default=True,
+        description="관찰한 출력 길이로 라우트별 max_tokens를 조정할지 여부",
+    )
+    llm_output_budget_percentile: float = Field(
+        default=0.99,
+        description="출력 토큰 예산 산정에 사용하는 관찰 출력 길이 백분위",
+        gt=0.0,
+        lt=1.0,
+    )
+    llm_output_budget_headroom: float = Field(
+        default=1.5,
+        description="관찰 출력 길이에 곱하는 여유 배수",
+        ge=1.0,
+    )
+    llm_output_budget_min_tokens: int = Field(
+        default=512,
+        description="출력 토큰 예산의 하한",
+        ge=1,
+    )
+    llm_output_budget_min_samples: int = Field(
+        default=20,
+        description="예산 조정을 시작하기 위해 필요한 라우트별 최소 표본 수",
+        ge=1,
+    )
+    llm_max_continuations: int = Field(
+        default=2,
+        description="max_tokens에서 잘린 응답을 이어서 생성하는 최대 횟수",
+        ge=0,
+    )
+
+    # 분당 토큰(TPM) 페이싱 (0이면 비활성화)
+    llm_input_tpm_limit: int = Field(
+        default=0,
+        description="클라이언트 측 분당 입력 토큰 한도 (캐시 읽기 제외, 0이면 페이싱 안 함)",
+        ge=0,
+    )
+    llm_output_tpm_limit: int = Field(
+        default=0,
+        description="클라이언트 측 분당 출력 토큰 한도 (0이면 페이싱 안 함)",
+        ge=0,
+    )
+    llm_tpm_burst_seconds: float = Field(
+        default=10.0,
+        description="TPM 버킷에 적립할 수 있는 최대 시간 (초)",
+        gt=0,
+    )
+
+    # 모델 폴백
+    llm_fallback_cooldown_seconds: float = Field(
+        default=30.0,
+        description="과부하가 난 모델을 1순위에서 제외하는 시간 (초)",
+        gt=0,
+    )
+    llm_fallback_timeout_threshold: int = Field(
+        default=2,
+        description="모델을 1순위에서 제외하기까지 허용하는 연속 타임아웃 횟수",
+        ge=1,
+    )
+
+    # LLM 헤징 (tail latency 완화)
+    llm_hedging_enabled: bool = Field(
+        default=False,
+        description="느린 호출에 대해 동일 요청을 한 번 더 보내는 헤징 사용 여부",
+    )
+    llm_hedging_percentile: float = Field(
+        default=0.95,
+        description="헤지 요청 발송 임계값으로 쓰는 단계별 지연 백분위",
+        gt=0.0,
+        lt=1.0,
+    )
+    llm_hedging_min_samples: int = Field(
+        default=20,
+        description="헤징을 시작하기 위해 필요한 단계별 최소 지연 표본 수",
+        ge=1,
+    )
+    llm_hedging_min_delay: float = Field(
+        default=1.0,
+        description="헤지 요청 발송 전 최소 대기 시간 (초)",
+        ge=0,
+    )
+    llm_hedging_budget_ratio: float = Field(
+        default=0.05,
+        description="최초 호출 대비 허용하는 헤지 요청 비율",
+        ge=0.0,
+        le=1.0,
+    )
+    # 리뷰 실행 모드
+    review_fused_target_types: str = Field(
+        default="",
+        description=(
+            "평가와 개선을 한 번의 호출로 처리할 타겟 타입 (쉼표로 구분, "
+            "요청 헤더 X-Review-Mode가 우선)"
+        ),
+    )
+    review_early_exit_enabled: bool = Field(
+        default=True,
+        description="평가에서 개선이 필요 없다고 판단하면 개선 단계를 생략할지 여부",
+    )
+    # 평가 단계 결과 캐시 (같은 블록의 개선안만 다시 받을 때 평가 호출 생략)
+    review_evaluation_cache_enabled: bool = Field(
+        default=True,
+        description="같은 입력의 평가 결과를 캐시해 재리뷰 시 평가 호출을 생략할지 여부",
+    )
+    review_evaluation_cache_ttl_seconds: float = Field(
+        default=1800.0,
+        description="평가 결과 캐시 항목의 유효 시간 (초)",
+        gt=0,
+    )
+    review_evaluation_cache_max_entries: int = Field(
+        default=2048,
+        description="평가 결과 캐시에 보관하는 최대 항목 수 (초과 시 LRU 제거)",
+        ge=1,
+    )
+    # 리뷰 결과 캐시 (같은 내용의 반복 요청은 LLM 호출 없이 응답)
+    review_result_cache_enabled: bool = Field(
+        default=True,
+        description="같은 내용의 리뷰 결과를 캐시해 반복 요청에 재사용할지 여부",
+    )
+    review_result_cache_ttl_seconds: float = Field(
+        default=600.0,
+        description="리뷰 결과 캐시 항목의 유효 시간 (초)",
+        gt=0,
+    )
+    review_result_cache_max_bytes: int = Field(
+        default=32 * 1024 * 1024,
+        description="리뷰 결과 캐시의 최대 크기 (결과 JSON 바이트 합계, 초과 시 LRU 제거)",
+        ge=1024,
+    )
+    # 블록 평가 마이크로 배치
+    llm_micro_batch_enabled: bool = Field(
+        default=False,
+        description="같은 타입 블록 평가를 짧은 창 동안 모아 한 번에 평가할지 여부",
+    )
+    llm_micro_batch_window_ms: float = Field(
+        default=20.0,
+        description="첫 평가 요청 이후 같은 타입 요청을 모으는 시간 (ms)",
+        ge=0,
+    )
+    llm_micro_batch_max_items: int = Field(
+        default=8,
+        description="다중 항목 프롬프트 하나에 담는 최대 블록 수",
+        ge=2,
+        le=32,
+    )
+    # Message Batches 실행 모드 (지연에 둔감한 대량 리뷰)
+    llm_batch_max_size: int = Field(
+        default=1000,
+        description="배치 하나에 담는 최대 요청 수",
+        ge=1,
+        le=100_000,
+    )
+    llm_batch_flush_seconds: float = Field(
+        default=5.0,
+        description="첫 요청 이후 배치를 제출하기까지 요청을 모으는 시간 (초)",
+        ge=0,
+    )
+    llm_batch_poll_seconds: float = Field(
+        default=30.0,
+        description="배치 완료 여부를 확인하는 간격 (초)",
+        gt=0,
+    )
+    # 가짜 LLM 제공자 (llm_provider=fake)
+    fake_llm_ttft_ms: float = Field(
+        default=600.0,
+        description="가짜 LLM 첫 토큰까지의 지연 중앙값 (ms, 로그정규 분포)",
+        ge=0,
+    )
+    fake_llm_latency_sigma: float = Field(
+        default=0.4,
+        description="가짜 LLM 지연 로그정규 분포의 sigma (클수록 꼬리가 김)",
+        ge=0,
+    )
+    fake_llm_output_tokens_per_second: float = Field(
+        default=80.0,
+        description="가짜 LLM 출력 토큰 생성 속도 (토큰/초)",
+        gt=0,
+    )
+    fake_llm_output_tokens: int = Field(
+        default=300,
+        description="가짜 LLM 응답의 출력 토큰 수 중앙값",
+        ge=1,
+    )
+    fake_llm_error_rate: float = Field(
+        default=0.0,
+        description="가짜 LLM 호출이 오류로 끝날 확률",
+        ge=0.0,
+        le=1.0,
+    )
+    fake_llm_error_types: str = Field(
+        default="rate_limit,overloaded,timeout",
+        description="주입할 오류 종류 (rate_limit, overloaded, timeout, server_error; 쉼표로 구분)",
+    )
+    fake_llm_seed: int | None = Field(
+        default=None,
+        description="가짜 LLM 난수 시드 (재현 가능한 벤치마크용)",
+    )
+
+    @model_validator(mode="after")
+    def validate_concurrency_bounds(self) -> Self:
+        """동시성 한도가 최소 <= 초기 <= 최대 순서인지 검증."""
+        if not self.llm_concurrency_min <= self.llm_concurrency_initial <= self.llm_concurrency_max:
+            raise ValueError(
+                "LLM 동시성 한도는 llm_concurrency_min <= llm_concurrency_initial"
+                " <= llm_concurrency_max 이어야 합니다"
+            )
+        return self
+
+    @model_validator(mode="after")
+    def validate_review_fused_target_types(self) -> Self:
+        """단일 호출 모드 타겟 타입이 모두 ReviewTargetType 값인지 검증."""
+        # 지연 로딩으로 순환 참조 방지
+        from backend.services.review.enums import ReviewTargetType
+
+        allowed = [target_type.value for target_type in ReviewTargetType]
+        unknown = [item for item in self.review_fused_target_type_list if item not in allowed]
+        if unknown:
+            raise ValueError(
+                f"review_fused_target_types에 알 수 없는 타겟 타입이 있습니다: "
+                f"{', '.join(unknown)} (허용: {', '.join(allowed)})"
+            )
+        return self
+
+    @property
+    def anthropic_api_keys(self) -> list[str]:
+        """키 풀에 사용할 API 키 리스트 반환 (중복 제거, 기본 키가 맨 앞)."""
+        keys = [self.anthropic_api_key]
+        keys.extend(key.strip() for key in self.anthropic_extra_api_keys.split(","))
+        return list(dict.fromkeys(key for key in keys if key))
+
+    @property
+    def tpm_shaping_enabled(self) -> bool:
+        """TPM 페이싱 사용 여부 (입력/출력 한도 중 하나라도 설정된 경우)."""
+        return self.llm_input_tpm_limit > 0 or self.llm_output_tpm_limit > 0
+
+    @property
+    def anthropic_fallback_model_list(self) -> list[str]:
+        """폴백 모델 리스트 반환 (기본 모델 제외)."""
+        models = (model.strip() for model in self.anthropic_fallback_models.split(","))
+        return [model for model in dict.fromkeys(models) if model and model != self.anthropic_model]
+
+    @property
+    def review_fused_target_type_list(self) -> list[str]:
+        """단일 호출 모드를 기본으로 쓰는 타겟 타입 리스트 반환."""
+        return [item.strip() for item in self.review_fused_target_types.split(",") if item.strip()]
+
+    @property
+    def fake_llm_error_type_list(self) -> list[str]:
+        """가짜 LLM이 주입할 오류 종류 리스트 반환."""
+        return [kind.strip() for kind in self.fake_llm_error_types.split(",") if kind.strip()]
 
 
 @lru_cache
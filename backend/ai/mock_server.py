@@ -0,0 +1,385 @@
+"""Anthropic Messages API 호환 모의 서버 (장애 주입용).
+
+ChatAnthropic의 base_url(ANTHROPIC_BASE_URL)을 이 서버로 지정하면 실제 API 없이
+llm.py의 재시도/타임아웃/폴백 경로와 review_chain.py의 파서 경로를 부하 상황에서
+그대로 실행해 볼 수 있습니다. 일반 응답과 스트리밍(SSE) 응답을 모두 지원하며,
+tool_choice로 도구 호출을 강제한 요청에는 같은 본문을 도구 입력(tool_use)으로 돌려줍니다.
+
+장애는 두 가지 방식으로 주입합니다.
+- 확률: 동작 설정의 fault_rates에 장애 종류별 확률 지정
+- 스크립트: POST /_mock/script로 다음 요청들에 순서대로 적용할 장애 목록 등록
+
+실행:
+    python -m backend.ai.mock_server --port 8089
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import uuid
+from enum import StrEnum
+from typing import Any
+
+from aiohttp import web
+from langchain_core.utils.json import parse_partial_json
+from pydantic import BaseModel, Field
+
+from backend.ai.chains.fake_llm import (
+    build_fake_payload,
+    forced_tool_name,
+    infer_stage,
+    render_fake_payload,
+)
+from backend.ai.chains.rate_shaper import TokenEstimator
+
+
+class MockFault(StrEnum):
+    """주입할 장애 종류."""
+
+    NONE = "none"
+    RATE_LIMIT = "rate_limit"  # 429 + retry-after
+    OVERLOADED = "overloaded"  # 529
+    TIMEOUT = "timeout"  # hang_seconds 동안 응답 지연
+    TRUNCATED_JSON = "truncated_json"  # 정상 종료지만 JSON이 앞부분에서 끊김 (필수 필드 누락)
+    MAX_TOKENS = "max_tokens"  # 출력 절반에서 stop_reason=max_tokens
+
+
+class MockBehavior(BaseModel):
+    """모의 서버 응답 동작 설정."""
+
+    ttft_ms: float = Field(default=300.0, description="첫 토큰까지의 지연 중앙값 (ms)", ge=0)
+    latency_sigma: float = Field(default=0.3, description="지연 로그정규 분포 sigma", ge=0)
+    tokens_per_second: float = Field(default=150.0, description="출력 토큰 생성 속도", gt=0)
+    output_tokens: int = Field(default=300, description="응답 출력 토큰 수", ge=1)
+    hang_seconds: float = Field(default=120.0, description="타임아웃 장애 시 응답 지연 (초)")
+    retry_after_seconds: float = Field(default=1.0, description="429 응답의 retry-after (초)")
+    fault_rates: dict[MockFault, float] = Field(
+        default_factory=dict, description="장애 종류별 주입 확률"
+    )
+
+
+_ERROR_TYPES = {
+    MockFault.RATE_LIMIT: (429, "rate_limit_error"),
+    MockFault.OVERLOADED: (529, "overloaded_error"),
+}
+
+
+class MockAnthropicServer:
+    """Anthropic Messages API 모의 서버."""
+
+    def __init__(self, behavior: MockBehavior | None = None, seed: int | None = None):
+        self.behavior = behavior or MockBehavior()
+        self._rng = random.Random(seed)
+        self._estimator = TokenEstimator(use_tiktoken=False)
+        self._script: list[MockFault] = []
+        self._counts: dict[str, int] = {}
+        self._runner: web.AppRunner | None = None
+
+    def script(self, faults: list[MockFault]) -> None:
+        """다음 요청들에 순서대로 적용할 장애 등록."""
+        self._script.extend(faults)
+
+    def build_app(self) -> web.Application:
+        """aiohttp 애플리케이션 생성."""
+        app = web.Application()
+        app.router.add_post("/v1/messages", self._messages)
+        app.router.add_get("/v1/models", self._models)
+        app.router.add_post("/_mock/script", self._set_script)
+        app.router.add_post("/_mock/behavior", self._set_behavior)
+        app.router.add_get("/_mock/stats", self._stats)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """서버를 시작하고 base URL 반환 (port=0이면 빈 포트 사용)."""
+        self._runner = web.AppRunner(self.build_app())
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound_host, bound_port = self._runner.addresses[0][:2]
+        return f"http://{bound_host}:{bound_port}"
+
+    async def stop(self) -> None:
+        """서버 종료."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _messages(self, request: web.Request) -> web.StreamResponse:
+        body = await request.json()
+        fault = self._next_fault()
+        self._counts[fault.value] = self._counts.get(fault.value, 0) + 1
+
+        if fault in _ERROR_TYPES:
+            await asyncio.sleep(self._sample(self.behavior.ttft_ms) / 1000 * 0.1)
+            return self._error(fault)
+        if fault == MockFault.TIMEOUT:
+            await asyncio.sleep(self.behavior.hang_seconds)
+
+        text, stop_reason = self._completion(body, fault)
+        tool_name = forced_tool_name(body)
+        if tool_name and stop_reason == "end_turn":
+            stop_reason = "tool_use"
+        input_tokens = self._estimator.raw_estimate(_prompt_text(body))
+        output_tokens = self._estimator.raw_estimate(text)
+        ttft = self._sample(self.behavior.ttft_ms) / 1000
+        generation = output_tokens / self.behavior.tokens_per_second
+
+        if body.get("stream"):
+            return await self._stream(
+                request,
+                body,
+                text,
+                stop_reason,
+                input_tokens,
+                output_tokens,
+                ttft,
+                generation,
+                tool_name,
+            )
+
+        await asyncio.sleep(ttft + generation)
+        return web.json_response(
+            {
+                "id": f"msg_mock_{uuid.uuid4().hex[:16]}",
+                "type": "message",
+                "role": "assistant",
+                "model": body.get("model", "mock-model"),
+                "content": [_content_block(text, tool_name)],
+                "stop_reason": stop_reason,
+                "stop_sequence": None,
+                "usage": _usage(input_tokens, output_tokens),
+            }
+        )
+
+    async def _stream(
+        self,
+        request: web.Request,
+        body: dict[str, Any],
+        text: str,
+        stop_reason: str,
+        input_tokens: int,
+        output_tokens: int,
+        ttft: float,
+        generation: float,
+        tool_name: str | None = None,
+    ) -> web.StreamResponse:
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+
+        async def send(event: str, data: dict[str, Any]) -> None:
+            payload = json.dumps({"type": event, **data}, ensure_ascii=False)
+            await response.write(f"event: {event}\ndata: {payload}\n\n".encode())
+
+        await asyncio.sleep(ttft)
+        await send(
+            "message_start",
+            {
+                "message": {
+                    "id": f"msg_mock_{uuid.uuid4().hex[:16]}",
+                    "type": "message",
+                    "role": "assistant",
+                    "model": body.get("model", "mock-model"),
+                    "content": [],
+                    "stop_reason": None,
+                    "stop_sequence": None,
+                    "usage": _usage(input_tokens, 1),
+                }
+            },
+        )
+        await send(
+            "content_block_start", {"index": 0, "content_block": _content_block("", tool_name)}
+        )
+
+        chunks = [text[start : start + 24] for start in range(0, len(text), 24)] or [""]
+        for index, chunk in enumerate(chunks):
+            if index:
+                await asyncio.sleep(generation / len(chunks))
+            delta = (
+                {"type": "input_json_delta", "partial_json": chunk}
+                if tool_name
+                else {"type": "text_delta", "text": chunk}
+            )
+            await send("content_block_delta", {"index": 0, "delta": delta})
+
+        await send("content_block_stop", {"index": 0})
+        await send(
+            "message_delta",
+            {
+                "delta": {"stop_reason": stop_reason, "stop_sequence": None},
+                "usage": _usage(input_tokens, output_tokens),
+            },
+        )
+        await send("message_stop", {})
+        await response.write_eof()
+        return response
+
+    async def _models(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {
+                "data": [
+                    {
+                        "type": "model",
+                        "id": "mock-model",
+                        "display_name": "Mock Model",
+                        "created_at": "2025-01-01T00:00:00Z",
+                    }
+                ],
+                "has_more": False,
+                "first_id": "mock-model",
+                "last_id": "mock-model",
+            }
+        )
+
+    async def _set_script(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        self.script([MockFault(fault) for fault in body.get("faults", [])])
+        return web.json_response({"queued": len(self._script)})
+
+    async def _set_behavior(self, request: web.Request) -> web.Response:
+        self.behavior = MockBehavior.model_validate(
+            {**self.behavior.model_dump(), **(await request.json())}
+        )
+        return web.json_response(self.behavior.model_dump(mode="json"))
+
+    async def _stats(self, request: web.Request) -> web.Response:
+        return web.json_response({"requests": self._counts, "queued": len(self._script)})
+
+    def _next_fault(self) -> MockFault:
+        """스크립트가 있으면 스크립트 순서로, 없으면 확률에 따라 장애 선택."""
+        if self._script:
+            return self._script.pop(0)
+        roll = self._rng.random()
+        for fault, rate in self.behavior.fault_rates.items():
+            if roll < rate:
+                return fault
+            roll -= rate
+        return MockFault.NONE
+
+    def _completion(self, body: dict[str, Any], fault: MockFault) -> tuple[str, str]:
+        """응답 텍스트와 stop_reason 생성.
+
+        응답 본문은 단계별로 결정적이므로, 마지막 메시지가 assistant prefill이면
+        그 뒤에 이어지는 부분만 돌려줘 max_tokens 이어쓰기를 재현합니다.
+        """
+        prompt = _prompt_text(body)
+        full = render_fake_payload(
+            build_fake_payload(infer_stage(prompt, body.get("tools"))),
+            self.behavior.output_tokens,
+        )
+        messages = body.get("messages", [])
+        prefill = ""
+        if messages and messages[-1].get("role") == "assistant":
+            prefill = _content_text(messages[-1].get("content", ""))
+        # prefill은 끝 공백이 제거된 채 오므로 이어지는 공백은 응답에 포함됨
+        text = full[len(prefill) :] if prefill and full.startswith(prefill) else full
+
+        if fault == MockFault.TRUNCATED_JSON:
+            # 파서가 끊긴 문자열/괄호는 보정하므로 필수 필드가 빠지도록 앞부분만 보냄
+            return text[: len(text) // 10], "end_turn"
+        if fault == MockFault.MAX_TOKENS:
+            return text[: len(text) // 2], "max_tokens"
+
+        max_tokens = body.get("max_tokens")
+        if max_tokens and self._estimator.raw_estimate(text) > max_tokens:
+            return _truncate_to_tokens(text, max_tokens, self._estimator), "max_tokens"
+        return text, "end_turn"
+
+    def _error(self, fault: MockFault) -> web.Response:
+        status, error_type = _ERROR_TYPES[fault]
+        headers = {}
+        if fault == MockFault.RATE_LIMIT:
+            headers["retry-after"] = str(self.behavior.retry_after_seconds)
+        return web.json_response(
+            {"type": "error", "error": {"type": error_type, "message": f"mock {error_type}"}},
+            status=status,
+            headers=headers,
+        )
+
+    def _sample(self, median: float) -> float:
+        if median <= 0:
+            return 0.0
+        return median * self._rng.lognormvariate(0.0, self.behavior.latency_sigma)
+
+
+def _content_block(text: str, tool_name: str | None) -> dict[str, Any]:
+    """응답 content 블록 (도구 호출이면 본문 JSON을 도구 입력으로, 끊긴 JSON은 보정)."""
+    if not tool_name:
+        return {"type": "text", "text": text}
+    return {
+        "type": "tool_use",
+        "id": f"toolu_mock_{uuid.uuid4().hex[:16]}",
+        "name": tool_name,
+        "input": (parse_partial_json(text) if text else None) or {},
+    }
+
+
+def _content_text(content: Any) -> str:
+    """메시지 content(문자열 또는 블록 목록)의 텍스트."""
+    if isinstance(content, str):
+        return content
+    return "".join(block.get("text", "") for block in content if isinstance(block, dict))
+
+
+def _prompt_text(body: dict[str, Any]) -> str:
+    """요청의 system과 messages 텍스트를 이어 붙인 문자열."""
+    parts = [_content_text(body.get("system") or "")]
+    parts.extend(_content_text(message.get("content", "")) for message in body.get("messages", []))
+    return "\n".join(parts)
+
+
+def _truncate_to_tokens(text: str, max_tokens: int, estimator: TokenEstimator) -> str:
+    """추정 토큰 수가 max_tokens 이하가 되도록 앞부분만 남김."""
+    low, high = 0, len(text)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if estimator.raw_estimate(text[:middle]) <= max_tokens:
+            low = middle
+        else:
+            high = middle - 1
+    return text[:low]
+
+
+def _usage(input_tokens: int, output_tokens: int) -> dict[str, int]:
+    return {
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens,
+        "cache_creation_input_tokens": 0,
+        "cache_read_input_tokens": 0,
+    }
+
+
+def main() -> None:
+    """CLI 진입점."""
+    parser = argparse.ArgumentParser(description="Anthropic Messages API 모의 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--ttft-ms", type=float, default=300.0)
+    parser.add_argument("--tokens-per-second", type=float, default=150.0)
+    parser.add_argument(
+        "--fault",
+        action="append",
+        default=[],
+        metavar="KIND=RATE",
+        help="장애 주입 확률 (예: --fault rate_limit=0.05 --fault overloaded=0.01)",
+    )
+    args = parser.parse_args()
+
+    fault_rates = {
+        MockFault(kind): float(rate) for kind, rate in (item.split("=", 1) for item in args.fault)
+    }
+    server = MockAnthropicServer(
+        MockBehavior(
+            ttft_ms=args.ttft_ms,
+            tokens_per_second=args.tokens_per_second,
+            fault_rates=fault_rates,
+        ),
+        seed=args.seed,
+    )
+    print(f"Mock Anthropic server: http://{args.host}:{args.port}")
+    web.run_app(server.build_app(), host=args.host, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    main()
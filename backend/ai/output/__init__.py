@@ -1,7 +1,21 @@
 from backend.ai.output.review_result import (
+    EvaluationBatchItem,
+    EvaluationBatchResult,
+    EvaluationOutput,
     EvaluationResult,
+    FusedReviewOutput,
+    ImprovementOutput,
     ReviewResult,
     SectionReviewResult,
 )
 
-__all__ = ["EvaluationResult", "ReviewResult", "SectionReviewResult"]
+__all__ = [
+    "EvaluationBatchItem",
+    "EvaluationBatchResult",
+    "EvaluationOutput",
+    "EvaluationResult",
+    "FusedReviewOutput",
+    "ImprovementOutput",
+    "ReviewResult",
+    "SectionReviewResult",
+]
@@ -1,10 +1,39 @@
 from uuid import UUID
 
 from pydantic import BaseModel, Field
+from pydantic.json_schema import SkipJsonSchema
 
 from backend.services.review.enums import ReviewTargetType
 
 
+class EvaluationOutput(BaseModel):
+    """1단계 평가 생성 결과 (LLM이 작성하는 필드만 포함)."""
+
+    summary: str = Field(..., description="전반적인 평가 요약")
+    strengths: list[str] = Field(..., max_length=3, description="잘된 점 목록")
+    weaknesses: list[str] = Field(..., max_length=3, description="개선 필요점 목록")
+    needs_improvement: bool = Field(
+        True, description="개선안이 필요한지 여부 (이미 충분히 좋은 내용이면 false)"
+    )
+
+
+class ImprovementOutput(BaseModel):
+    """2단계 개선 생성 결과 (평가 결과와 메타데이터는 서버에서 병합)."""
+
+    improvement_suggestion: str = Field(..., description="개선 제안 요약")
+    improved_content: str | None = Field(None, description="개선된 문장/내용 (블록/아이템 리뷰 시)")
+
+
+class FusedReviewOutput(BaseModel):
+    """단일 호출 생성 결과 (평가 + 개선안, 메타데이터는 서버에서 병합)."""
+
+    evaluation_summary: str = Field(..., description="전반적인 평가 요약")
+    strengths: list[str] = Field(..., max_length=3, description="잘된 점 목록")
+    weaknesses: list[str] = Field(..., max_length=3, description="개선 필요점 목록")
+    improvement_suggestion: str = Field(..., description="개선 제안 요약")
+    improved_content: str | None = Field(None, description="개선된 문장/내용 (블록/아이템 리뷰 시)")
+
+
 class EvaluationResult(BaseModel):
     """1단계 평가 결과 (개선안 제외)."""
 
@@ -12,7 +41,26 @@ class EvaluationResult(BaseModel):
     summary: str = Field(..., description="전반적인 평가 요약")
     strengths: list[str] = Field(..., max_length=3, description="잘된 점 목록")
     weaknesses: list[str] = Field(..., max_length=3, description="개선 필요점 목록")
+    needs_improvement: bool = Field(
+        True, description="개선안이 필요한지 여부 (이미 충분히 좋은 내용이면 false)"
+    )
     block_id: UUID | None = Field(None, description="리뷰한 블록 ID")
+    # 서버에서 채우는 값 (LLM 출력 형식 지침에서 제외)
+    served_models: SkipJsonSchema[dict[str, str]] = Field(
+        default_factory=dict, description="단계별 응답 모델"
+    )
+
+
+class EvaluationBatchItem(EvaluationOutput):
+    """다중 항목 평가 결과의 항목 하나."""
+
+    index: int = Field(..., description="평가한 항목의 index")
+
+
+class EvaluationBatchResult(BaseModel):
+    """다중 항목 평가 결과 (같은 타입 블록 평가 마이크로 배치)."""
+
+    items: list[EvaluationBatchItem] = Field(..., description="항목별 평가 결과")
 
 
 class ReviewResult(BaseModel):
@@ -28,6 +76,10 @@ class ReviewResult(BaseModel):
     improvement_suggestion: str = Field(..., description="개선 제안 요약")
     improved_content: str | None = Field(None, description="개선된 문장/내용 (블록/아이템 리뷰 시)")
     block_id: UUID | None = Field(None, description="리뷰한 블록 ID")
+    # 서버에서 채우는 값 (LLM 출력 형식 지침에서 제외)
+    served_models: SkipJsonSchema[dict[str, str]] = Field(
+        default_factory=dict, description="단계별 응답 모델"
+    )
 
 
 class SectionReviewResult(BaseModel):
@@ -0,0 +1,181 @@
+"""단계 파이프라인 준비 비용 마이크로벤치마크.
+
+요청마다 출력 형식 지침(JSON 스키마 직렬화)과 ChatPromptTemplate을 새로 만들던 방식과
+ReviewChain이 (타겟 타입, 단계)별로 캐시한 파이프라인을 재사용하는 방식의 요청당 CPU
+시간을 비교합니다. LLM 자리에는 즉시 빈 응답을 돌려주는 Runnable을 두어 프롬프트
+준비와 렌더링 비용만 측정합니다.
+
+구조화 출력 방식(json: 시스템 프롬프트의 JSON 스키마 지침, tool: 짧은 지침 + 도구
+정의)별 단계 입력 크기(추정 토큰)도 함께 비교합니다. 도구 정의도 입력 토큰으로
+과금되므로 tool 방식은 시스템 프롬프트와 도구 정의를 합산합니다. API가 도구 사용 시
+덧붙이는 고정 시스템 프롬프트는 포함하지 않으므로 실제 차이는 응답 usage로 확인하세요.
+
+실행:
+    python -m backend.ai.prompt_benchmark --iterations 2000
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from collections.abc import Callable
+from uuid import uuid4
+
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.output_parsers import PydanticOutputParser
+from langchain_core.prompt_values import PromptValue
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import Runnable, RunnableLambda
+from pydantic import BaseModel
+
+from backend.ai.chains.llm import build_cached_system_message
+from backend.ai.chains.rate_shaper import TokenEstimator
+from backend.ai.chains.review_chain import ReviewChain
+from backend.ai.chains.structured_output import StructuredOutput
+from backend.ai.output.review_result import (
+    EvaluationOutput,
+    EvaluationResult,
+    ImprovementOutput,
+    ReviewResult,
+)
+from backend.ai.strategies.base import PromptStrategy
+from backend.ai.strategies.factory import PromptStrategyFactory
+from backend.services.review.context import BlockData, ReviewContext
+from backend.services.review.enums import ReviewTargetType
+
+STAGES = ("evaluation", "improvement")
+
+PipelineGetter = Callable[[PromptStrategy, ReviewContext, str], Runnable[dict, BaseMessage]]
+
+
+async def _echo(prompt: PromptValue, **kwargs: object) -> AIMessage:
+    return AIMessage(content="")
+
+
+def build_rebuilding_getter(llm: Runnable) -> PipelineGetter:
+    """캐시 이전 방식: 호출마다 형식 지침을 직렬화하고 파이프라인을 새로 구성."""
+    parsers: dict[str, PydanticOutputParser[BaseModel]] = {
+        "evaluation": PydanticOutputParser(pydantic_object=EvaluationResult),
+        "improvement": PydanticOutputParser(pydantic_object=ReviewResult),
+    }
+
+    def get(strategy: PromptStrategy, context: ReviewContext, stage: str) -> Runnable:
+        format_instructions = parsers[stage].get_format_instructions()
+        if stage == "evaluation":
+            system_prompt = strategy.build_evaluation_system_prompt(format_instructions)
+            user_template = strategy.get_user_prompt_template()
+        else:
+            system_prompt = strategy.build_improvement_system_prompt(format_instructions)
+            user_template = strategy.get_improvement_prompt_template()
+        prompt = ChatPromptTemplate.from_messages(
+            [build_cached_system_message(system_prompt), ("human", user_template)]
+        )
+        return prompt | llm
+
+    return get
+
+
+def build_cached_getter(llm: Runnable) -> PipelineGetter:
+    """ReviewChain의 (타겟 타입, 단계)별 캐시 파이프라인 사용."""
+    chain = ReviewChain(llm=llm)
+
+    def get(strategy: PromptStrategy, context: ReviewContext, stage: str) -> Runnable:
+        return chain._get_pipeline(strategy, context.target_type, stage)
+
+    return get
+
+
+async def measure(get_pipeline: PipelineGetter, context: ReviewContext, iterations: int) -> float:
+    """평가+개선 단계 프롬프트 준비/렌더링의 요청당 CPU 시간 (µs)."""
+    evaluation = EvaluationResult(
+        target_type=context.target_type, summary="요약", strengths=["강점"], weaknesses=["약점"]
+    )
+    started = time.process_time()
+    for _ in range(iterations):
+        strategy = PromptStrategyFactory.get(context)
+        for stage in STAGES:
+            variables = (
+                strategy.build_prompt_variables(context)
+                if stage == "evaluation"
+                else strategy.build_improvement_variables(context, evaluation)
+            )
+            await get_pipeline(strategy, context, stage).ainvoke(variables)
+    return (time.process_time() - started) / iterations * 1_000_000
+
+
+def measure_prompt_sizes(context: ReviewContext) -> dict[str, dict[str, int]]:
+    """구조화 출력 방식별 단계 시스템 프롬프트 + 도구 정의의 추정 입력 토큰 수."""
+    estimator = TokenEstimator(use_tiktoken=False)
+    strategy = PromptStrategyFactory.get(context)
+    schemas: dict[str, type[BaseModel]] = {
+        "evaluation": EvaluationOutput,
+        "improvement": ImprovementOutput,
+    }
+    sizes: dict[str, dict[str, int]] = {}
+    for stage, schema in schemas.items():
+        sizes[stage] = {}
+        for mode in ("json", "tool"):
+            output = StructuredOutput(schema, mode)
+            if stage == "evaluation":
+                system_prompt = strategy.build_evaluation_system_prompt(output.format_instructions)
+            else:
+                system_prompt = strategy.build_improvement_system_prompt(output.format_instructions)
+            tools = json.dumps(output.call_kwargs.get("tools", []), ensure_ascii=False)
+            sizes[stage][mode] = estimator.raw_estimate(system_prompt) + (
+                estimator.raw_estimate(tools) if output.call_kwargs else 0
+            )
+    return sizes
+
+
+def build_context() -> ReviewContext:
+    """측정용 프로젝트 블록 리뷰 컨텍스트."""
+    return ReviewContext(
+        resume_id=uuid4(),
+        target_type=ReviewTargetType.PROJECT_BLOCK,
+        block=BlockData(
+            block_id=uuid4(),
+            sub_title="결제 시스템",
+            period="2023.01 - 2024.06",
+            tech_stack=["Python", "FastAPI", "PostgreSQL"],
+            content="결제 API를 설계하고 정산 배치를 구축했습니다.",
+        ),
+    )
+
+
+async def run(iterations: int) -> dict[str, float]:
+    """두 방식을 번갈아 측정하지 않고 각각 예열 후 측정."""
+    llm = RunnableLambda(_echo)
+    context = build_context()
+    results: dict[str, float] = {}
+    for label, getter in (
+        ("rebuilt", build_rebuilding_getter(llm)),
+        ("cached", build_cached_getter(llm)),
+    ):
+        await measure(getter, context, max(1, iterations // 10))
+        results[label] = await measure(getter, context, iterations)
+    return results
+
+
+def main() -> None:
+    """CLI 진입점."""
+    parser = argparse.ArgumentParser(description="단계 파이프라인 준비 비용 마이크로벤치마크")
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.iterations))
+    saved = results["rebuilt"] - results["cached"]
+    print(f"rebuilt: {results['rebuilt']:.1f} µs/request")
+    print(f"cached:  {results['cached']:.1f} µs/request")
+    print(f"saved:   {saved:.1f} µs/request ({saved / results['rebuilt']:.0%})")
+
+    print("\nprompt size (estimated input tokens, system prompt + tool definition):")
+    for stage, sizes in measure_prompt_sizes(build_context()).items():
+        delta = sizes["tool"] - sizes["json"]
+        print(
+            f"{stage:<12} json: {sizes['json']:>5}  tool: {sizes['tool']:>5}  "
+            f"delta: {delta:+d} ({delta / sizes['json']:+.0%})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -13,7 +13,7 @@ if TYPE_CHECKING:
 class PromptStrategy(ABC):
     """프롬프트 생성 전략 인터페이스.
 
-    서브클래스는 다음 두 메서드만 구현하면 됩니다:
+    BasePromptStrategy를 상속하면 다음 두 메서드만 구현하면 됩니다:
     - get_template_name(): 사용할 YAML 템플릿 이름
     - build_prompt_variables(): 프롬프트 변수 딕셔너리 생성
     """
@@ -28,6 +28,42 @@ class PromptStrategy(ABC):
         """프롬프트 변수 딕셔너리 생성."""
         ...
 
+    @abstractmethod
+    def build_evaluation_system_prompt(
+        self, format_instructions: str = "{format_instructions}"
+    ) -> str:
+        """1단계: 평가 전용 시스템 프롬프트 생성."""
+        ...
+
+    @abstractmethod
+    def build_improvement_system_prompt(
+        self, format_instructions: str = "{format_instructions}"
+    ) -> str:
+        """2단계: 개선 전용 시스템 프롬프트 생성."""
+        ...
+
+    @abstractmethod
+    def build_fused_system_prompt(self, format_instructions: str = "{format_instructions}") -> str:
+        """단일 호출(평가 + 개선) 시스템 프롬프트 생성."""
+        ...
+
+    @abstractmethod
+    def get_user_prompt_template(self) -> str:
+        """변수가 포함된 사용자 프롬프트 템플릿 반환."""
+        ...
+
+    @abstractmethod
+    def get_improvement_prompt_template(self) -> str:
+        """2단계: 개선 요청 프롬프트 템플릿 반환."""
+        ...
+
+    @abstractmethod
+    def build_improvement_variables(
+        self, context: ReviewContext, evaluation: EvaluationResult
+    ) -> dict:
+        """2단계: 평가 결과를 포함한 변수 딕셔너리 생성."""
+        ...
+
 
 class BasePromptStrategy(PromptStrategy):
     """공통 프롬프트 전략 구현 (YAML 기반 템플릿 메서드 패턴).
@@ -40,6 +76,7 @@ class BasePromptStrategy(PromptStrategy):
         # 기본 시스템 프롬프트 로드
         self._evaluation_system_prompt = get_prompt("base", "evaluation_system_prompt")
         self._improvement_system_prompt = get_prompt("base", "improvement_system_prompt")
+        self._fused_system_prompt = get_prompt("base", "fused_system_prompt")
         # 타입별 템플릿 (지연 로드)
         self._template: dict | None = None
 
@@ -57,18 +94,42 @@ class BasePromptStrategy(PromptStrategy):
 
     # ===== 시스템 프롬프트 (템플릿 메서드) =====
 
-    def build_evaluation_system_prompt(self) -> str:
-        """1단계: 평가 전용 시스템 프롬프트 생성."""
+    def build_evaluation_system_prompt(
+        self, format_instructions: str = "{format_instructions}"
+    ) -> str:
+        """1단계: 평가 전용 시스템 프롬프트 생성.
+
+        format_instructions를 넘기면 완성된 정적 문자열을, 생략하면
+        {format_instructions} 플레이스홀더가 남은 템플릿을 반환합니다.
+        """
         return self._evaluation_system_prompt.format(
             specific_instructions=self._get_specific_instructions("evaluation_instructions"),
-            format_instructions="{format_instructions}",
+            format_instructions=format_instructions,
         )
 
-    def build_improvement_system_prompt(self) -> str:
+    def build_improvement_system_prompt(
+        self, format_instructions: str = "{format_instructions}"
+    ) -> str:
         """2단계: 개선 전용 시스템 프롬프트 생성."""
         return self._improvement_system_prompt.format(
             specific_instructions=self._get_specific_instructions("improvement_instructions"),
-            format_instructions="{format_instructions}",
+            format_instructions=format_instructions,
+        )
+
+    def build_fused_system_prompt(self, format_instructions: str = "{format_instructions}") -> str:
+        """단일 호출(평가 + 개선) 시스템 프롬프트 생성.
+
+        타입별 평가 지침과 개선 지침을 함께 사용하며, 두 지침이 같으면 한 번만 넣습니다.
+        """
+        instructions = [
+            self._get_specific_instructions("evaluation_instructions"),
+            self._get_specific_instructions("improvement_instructions"),
+        ]
+        return self._fused_system_prompt.format(
+            specific_instructions="\n\n".join(
+                dict.fromkeys(item.strip() for item in instructions if item.strip())
+            ),
+            format_instructions=format_instructions,
         )
 
     # ===== 사용자 프롬프트 템플릿 (YAML에서 로드) =====
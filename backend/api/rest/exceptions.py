@@ -1,6 +1,7 @@
 """API 예외 정의 및 핸들러."""
 
 import logging
+import math
 from typing import Any
 
 from fastapi import Request, status
@@ -27,6 +28,14 @@ class ReviewServiceError(Exception):
         super().__init__(self.message)
 
 
+class ReviewServiceUnavailableError(ReviewServiceError):
+    """AI 서비스 일시 불가 (LLM 서킷 브레이커 열림)."""
+
+    def __init__(self, message: str, retry_after_ms: int, context: dict[str, Any] | None = None):
+        self.retry_after_ms = retry_after_ms
+        super().__init__(message, context)
+
+
 async def review_validation_error_handler(
     request: Request,
     exc: ReviewValidationError,
@@ -59,6 +68,28 @@ async def review_service_error_handler(
     )
 
 
+async def review_service_unavailable_error_handler(
+    request: Request,
+    exc: Exception,
+) -> JSONResponse:
+    """AI 서비스 일시 불가 핸들러 (503 + Retry-After)."""
+    if not isinstance(exc, ReviewServiceUnavailableError):
+        return await generic_exception_handler(request, exc)
+    logger.warning(
+        f"리뷰 서비스 일시 불가: {exc.message}",
+        extra={"context": exc.context, "retry_after_ms": exc.retry_after_ms},
+    )
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": exc.message, "retry_after_ms": exc.retry_after_ms},
+        headers={
+            # 표준 Retry-After는 초 단위이므로 올림 처리하고, 밀리초 값은 별도 헤더로 제공
+            "Retry-After": str(math.ceil(exc.retry_after_ms / 1000)),
+            "Retry-After-Ms": str(exc.retry_after_ms),
+        },
+    )
+
+
 async def value_error_handler(
     request: Request,
     exc: ValueError,
@@ -1,4 +1,7 @@
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -6,9 +9,11 @@ from fastapi.middleware.cors import CORSMiddleware
 from backend.api.rest.config import get_api_config
 from backend.api.rest.exceptions import (
     ReviewServiceError,
+    ReviewServiceUnavailableError,
     ReviewValidationError,
     generic_exception_handler,
     review_service_error_handler,
+    review_service_unavailable_error_handler,
     review_validation_error_handler,
     value_error_handler,
 )
@@ -16,10 +21,31 @@ from backend.api.rest.logging_config import setup_logging
 from backend.api.rest.middleware import LoggingMiddleware, RateLimitMiddleware
 from backend.api.rest.v1.routes.reviews import router as api_v1_reviews_router
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """앱 시작 시 토큰 인코딩 로드, LLM 클라이언트 생성 및 커넥션 워밍업."""
+    # 지연 로딩으로 순환 참조 방지
+    from backend.ai.chains.llm import warm_up_llm_connections
+    from backend.ai.chains.rate_shaper import preload_token_encoding
+    from backend.ai.config import get_ai_config
+
+    config = get_ai_config()
+    if config.tpm_shaping_enabled:
+        await preload_token_encoding()
+    if config.llm_warmup_enabled:
+        try:
+            await warm_up_llm_connections()
+        except Exception as e:
+            logger.warning(f"LLM 커넥션 워밍업 실패: {e}", extra={"error_type": type(e).__name__})
+    yield
+
+
 app = FastAPI(
     title="Resustack AI Service",
     description="AI-powered resume review and JD matching service",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 api_config = get_api_config()
@@ -49,6 +75,7 @@ app.add_middleware(
 # Exception handlers
 app.add_exception_handler(ReviewValidationError, review_validation_error_handler)
 app.add_exception_handler(ReviewServiceError, review_service_error_handler)
+app.add_exception_handler(ReviewServiceUnavailableError, review_service_unavailable_error_handler)
 app.add_exception_handler(ValueError, value_error_handler)
 app.add_exception_handler(Exception, generic_exception_handler)
 
@@ -64,5 +91,21 @@ async def root() -> dict[str, str]:
 @app.get("/health")
 async def health() -> dict[str, str]:
     """Health check endpoint."""
+    # 지연 로딩으로 순환 참조 방지
+    from backend.ai.chains.circuit_breaker import CircuitState, get_circuit_breaker
+
     logger.info("API Health Check")
-    return {"status": "healthy"}
+    circuit_state = get_circuit_breaker().state
+    return {
+        "status": "healthy" if circuit_state == CircuitState.CLOSED else "degraded",
+        "llm_circuit": circuit_state.value,
+    }
+
+
+@app.get("/health/llm")
+async def llm_health() -> dict[str, Any]:
+    """LLM 호출 계층 상태 및 런타임 지표."""
+    # 지연 로딩으로 순환 참조 방지
+    from backend.ai.chains.llm import get_llm_runtime_stats
+
+    return get_llm_runtime_stats()
@@ -1,7 +1,8 @@
 import logging
+from typing import Annotated, Literal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Header, status
 
 from backend.api.rest.v1.schemas.resumes import (
     ResumeBlockReviewRequest,
@@ -12,11 +13,30 @@ from backend.api.rest.v1.schemas.resumes import (
 from backend.api.rest.v1.schemas.reviews import ReviewResponse, SectionReviewResponse
 from backend.domain.resume.enums import SectionType
 from backend.services import ReviewService, get_review_service
+from backend.services.review.enums import ReviewMode
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/{resume_id}/reviews", tags=["AI Reviews"])
 
+# 요청별 리뷰 실행 모드 (미지정 시 타겟 타입별 설정을 따름)
+ReviewModeHeader = Annotated[
+    ReviewMode | None,
+    Header(
+        alias="X-Review-Mode",
+        description="리뷰 실행 모드 (two_stage: 평가 → 개선 2회 호출, fused: 단일 호출)",
+    ),
+]
+
+# 리뷰 결과 캐시 우회 (같은 입력이어도 새로 생성하고 캐시를 갱신)
+ReviewCacheHeader = Annotated[
+    Literal["bypass"] | None,
+    Header(
+        alias="X-Review-Cache",
+        description="bypass: 캐시된 리뷰 결과를 쓰지 않고 새로 생성 (평가 결과 캐시는 유지)",
+    ),
+]
+
 
 @router.post(
     "/introduction",
@@ -29,6 +49,8 @@ async def review_introduction(
     resume_id: UUID,
     request: ResumeReviewRequest,
     service: ReviewService = Depends(get_review_service),
+    review_mode: ReviewModeHeader = None,
+    review_cache: ReviewCacheHeader = None,
 ) -> ReviewResponse:
     """소개글 리뷰.
 
@@ -39,7 +61,9 @@ async def review_introduction(
         extra={"resume_id": str(resume_id), "position": request.profile.position},
     )
 
-    response = await service.review_introduction(resume_id, request)
+    response = await service.review_introduction(
+        resume_id, request, review_mode=review_mode, cache_bypass=review_cache == "bypass"
+    )
 
     logger.info("Introduction review request completed", extra={"resume_id": str(resume_id)})
 
@@ -57,6 +81,8 @@ async def review_skills(
     resume_id: UUID,
     request: ResumeSkillReviewRequest,
     service: ReviewService = Depends(get_review_service),
+    review_mode: ReviewModeHeader = None,
+    review_cache: ReviewCacheHeader = None,
 ) -> ReviewResponse:
     """스킬 리뷰.
 
@@ -64,7 +90,9 @@ async def review_skills(
     """
     logger.info("Skill review request received", extra={"resume_id": str(resume_id)})
 
-    response = await service.review_skill(resume_id, request)
+    response = await service.review_skill(
+        resume_id, request, review_mode=review_mode, cache_bypass=review_cache == "bypass"
+    )
 
     logger.info("Skill review request completed", extra={"resume_id": str(resume_id)})
 
@@ -82,6 +110,8 @@ async def review_resume_summary(
     resume_id: UUID,
     request: ResumeReviewRequest,
     service: ReviewService = Depends(get_review_service),
+    review_mode: ReviewModeHeader = None,
+    review_cache: ReviewCacheHeader = None,
 ) -> ReviewResponse:
     """전체 이력서 요약 리뷰.
 
@@ -92,7 +122,9 @@ async def review_resume_summary(
         extra={"resume_id": str(resume_id), "section_count": len(request.sections)},
     )
 
-    response = await service.review_summary(resume_id, request)
+    response = await service.review_summary(
+        resume_id, request, review_mode=review_mode, cache_bypass=review_cache == "bypass"
+    )
 
     logger.info("Full resume review request completed", extra={"resume_id": str(resume_id)})
 
@@ -111,6 +143,8 @@ async def review_block(
     section_type: SectionType,
     request: ResumeBlockReviewRequest,
     service: ReviewService = Depends(get_review_service),
+    review_mode: ReviewModeHeader = None,
+    review_cache: ReviewCacheHeader = None,
 ) -> ReviewResponse:
     """블록 리뷰.
 
@@ -128,7 +162,13 @@ async def review_block(
     )
 
     response = await service.review_block(
-        resume_id, section_type, request.section_id, request.id, request
+        resume_id,
+        section_type,
+        request.section_id,
+        request.id,
+        request,
+        review_mode=review_mode,
+        cache_bypass=review_cache == "bypass",
     )
 
     logger.info(
@@ -151,6 +191,8 @@ async def review_section(
     section_type: SectionType,
     request: ResumeSectionReviewRequest,
     service: ReviewService = Depends(get_review_service),
+    review_mode: ReviewModeHeader = None,
+    review_cache: ReviewCacheHeader = None,
 ) -> SectionReviewResponse:
     """섹션 리뷰.
 
@@ -170,7 +212,13 @@ async def review_section(
         },
     )
 
-    response = await service.review_section(resume_id, section_type, request)
+    response = await service.review_section(
+        resume_id,
+        section_type,
+        request,
+        review_mode=review_mode,
+        cache_bypass=review_cache == "bypass",
+    )
 
     logger.info(
         "Section review request completed",
@@ -15,6 +15,9 @@ class ReviewResponse(CamelModel):
     improvement_suggestion: str = Field(..., description="개선 제안 요약")
     improved_content: str | None = Field(None, description="개선된 문장/내용 (블록/아이템 리뷰 시)")
     block_id: UUID | None = Field(None, description="리뷰한 블록 ID (블록 리뷰 시)")
+    served_models: dict[str, str] = Field(
+        default_factory=dict, description="단계별 응답 모델 (evaluation/improvement)"
+    )
 
 
 class BlockReviewResponse(CamelModel):
@@ -26,6 +29,9 @@ class BlockReviewResponse(CamelModel):
     weaknesses: list[str] = Field(default_factory=list, description="개선 필요점 목록")
     improvement_suggestion: str = Field(..., description="개선 제안")
     improved_content: str | None = Field(None, description="개선된 내용")
+    served_models: dict[str, str] = Field(
+        default_factory=dict, description="단계별 응답 모델 (evaluation/improvement)"
+    )
 
 
 class SectionReviewResponse(CamelModel):
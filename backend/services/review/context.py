@@ -5,7 +5,7 @@ from uuid import UUID
 from pydantic import BaseModel, Field
 
 from backend.domain.resume.enums import SectionType
-from backend.services.review.enums import ReviewTargetType
+from backend.services.review.enums import ReviewMode, ReviewTargetType
 
 
 class BlockData(BaseModel):
@@ -68,3 +68,8 @@ class ReviewContext(BaseModel):
 
     # 전체 리뷰용 (모든 데이터 포함)
     full_resume_text: str | None = Field(None, description="전체 이력서 텍스트 (요약)")
+
+    # 요청별 실행 모드 (None이면 타겟 타입별 설정을 따름)
+    review_mode: ReviewMode | None = Field(None, description="리뷰 실행 모드")
+    # 리뷰 결과 캐시를 건너뛰고 새로 생성할지 여부 (요청 헤더 X-Review-Cache: bypass)
+    cache_bypass: bool = Field(False, description="리뷰 결과 캐시 우회 여부")
@@ -53,3 +53,12 @@ class ReviewTargetType(StrEnum):
             ResumeItemType.SKILL: cls.SKILL,
         }
         return mapping[item_type]
+
+
+class ReviewMode(StrEnum):
+    """리뷰 실행 모드."""
+
+    # 평가 → 개선 2회 호출
+    TWO_STAGE = "two_stage"
+    # 평가 + 개선을 한 번의 호출로 생성
+    FUSED = "fused"
@@ -43,6 +43,7 @@ class ReviewResponseMapper:
             improvement_suggestion=result.improvement_suggestion,
             improved_content=result.improved_content,
             block_id=result.block_id,
+            served_models=result.served_models,
         )
 
     @staticmethod
@@ -69,6 +70,7 @@ class ReviewResponseMapper:
                 weaknesses=br.weaknesses,
                 improvement_suggestion=br.improvement_suggestion,
                 improved_content=br.improved_content,
+                served_models=br.served_models,
             )
             for br in result.block_results
         ]
@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import logging
 import time
-from typing import TYPE_CHECKING
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any, TypeVar
 from uuid import UUID
 
+from backend.ai.chains.telemetry import collect_llm_telemetry
 from backend.ai.output.review_result import ReviewResult, SectionReviewResult
 from backend.api.rest.v1.schemas.resumes import (
     ResumeBlockReviewRequest,
@@ -15,7 +17,8 @@ from backend.api.rest.v1.schemas.resumes import (
 from backend.api.rest.v1.schemas.reviews import ReviewResponse, SectionReviewResponse
 from backend.domain.resume.enums import SectionType
 from backend.services.review.assembler import ReviewContextAssembler
-from backend.services.review.enums import ReviewTargetType
+from backend.services.review.context import ReviewContext
+from backend.services.review.enums import ReviewMode, ReviewTargetType
 from backend.services.review.mapper import ReviewResponseMapper
 
 if TYPE_CHECKING:
@@ -23,6 +26,8 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class ReviewService:
     """리뷰 서비스."""
@@ -43,10 +48,10 @@ class ReviewService:
         self,
         resume_id: UUID,
         request: ResumeReviewRequest,
+        review_mode: ReviewMode | None = None,
+        cache_bypass: bool = False,
     ) -> ReviewResponse:
         """전체 이력서 요약 리뷰."""
-        start_time = time.time()
-
         logger.info(
             "Starting full resume review",
             extra={
@@ -56,45 +61,24 @@ class ReviewService:
             },
         )
 
-        try:
-            context = self._assembler.assemble_full(resume_id, request)
-            result = await self._chain.run(context)
-            response = self._mapper.to_review_response(resume_id, result)
-
-            duration_ms = (time.time() - start_time) * 1000
-            logger.info(
-                "Full resume review completed",
-                extra={
-                    "resume_id": str(resume_id),
-                    "operation": "review_summary",
-                    "duration_ms": duration_ms,
-                },
-            )
-
-            return response
-
-        except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
-            logger.error(
-                f"Full resume review failed: {e}",
-                extra={
-                    "resume_id": str(resume_id),
-                    "operation": "review_summary",
-                    "duration_ms": duration_ms,
-                    "error_type": type(e).__name__,
-                },
-                exc_info=True,
-            )
-            raise
+        return await self._run_review(
+            "review_summary",
+            "Full resume review",
+            {"resume_id": str(resume_id)},
+            lambda: self._assembler.assemble_full(resume_id, request),
+            lambda context: self._review_single(resume_id, context),
+            review_mode,
+            cache_bypass,
+        )
 
     async def review_introduction(
         self,
         resume_id: UUID,
         request: ResumeReviewRequest,
+        review_mode: ReviewMode | None = None,
+        cache_bypass: bool = False,
     ) -> ReviewResponse:
         """소개글 리뷰."""
-        start_time = time.time()
-
         logger.info(
             "Starting introduction review",
             extra={
@@ -104,45 +88,24 @@ class ReviewService:
             },
         )
 
-        try:
-            context = self._assembler.assemble_introduction(resume_id, request)
-            result = await self._chain.run(context)
-            response = self._mapper.to_review_response(resume_id, result)
-
-            duration_ms = (time.time() - start_time) * 1000
-            logger.info(
-                "Introduction review completed",
-                extra={
-                    "resume_id": str(resume_id),
-                    "operation": "review_introduction",
-                    "duration_ms": duration_ms,
-                },
-            )
-
-            return response
-
-        except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
-            logger.error(
-                f"Introduction review failed: {e}",
-                extra={
-                    "resume_id": str(resume_id),
-                    "operation": "review_introduction",
-                    "duration_ms": duration_ms,
-                    "error_type": type(e).__name__,
-                },
-                exc_info=True,
-            )
-            raise
+        return await self._run_review(
+            "review_introduction",
+            "Introduction review",
+            {"resume_id": str(resume_id)},
+            lambda: self._assembler.assemble_introduction(resume_id, request),
+            lambda context: self._review_single(resume_id, context),
+            review_mode,
+            cache_bypass,
+        )
 
     async def review_skill(
         self,
         resume_id: UUID,
         request: ResumeSkillReviewRequest,
+        review_mode: ReviewMode | None = None,
+        cache_bypass: bool = False,
     ) -> ReviewResponse:
         """스킬 리뷰."""
-        start_time = time.time()
-
         # Count total skills for logging
         skill_count = sum(
             [
@@ -166,45 +129,25 @@ class ReviewService:
             },
         )
 
-        try:
-            context = self._assembler.assemble_skill(resume_id, request)
-            result = await self._chain.run(context)
-            response = self._mapper.to_review_response(resume_id, result)
-
-            duration_ms = (time.time() - start_time) * 1000
-            logger.info(
-                "Skill review completed",
-                extra={
-                    "resume_id": str(resume_id),
-                    "operation": "review_skill",
-                    "duration_ms": duration_ms,
-                },
-            )
-
-            return response
-
-        except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
-            logger.error(
-                f"Skill review failed: {e}",
-                extra={
-                    "resume_id": str(resume_id),
-                    "operation": "review_skill",
-                    "duration_ms": duration_ms,
-                    "error_type": type(e).__name__,
-                },
-                exc_info=True,
-            )
-            raise
+        return await self._run_review(
+            "review_skill",
+            "Skill review",
+            {"resume_id": str(resume_id)},
+            lambda: self._assembler.assemble_skill(resume_id, request),
+            lambda context: self._review_single(resume_id, context),
+            review_mode,
+            cache_bypass,
+        )
 
     async def review_section(
         self,
         resume_id: UUID,
         section_type: SectionType,
         request: ResumeSectionReviewRequest,
+        review_mode: ReviewMode | None = None,
+        cache_bypass: bool = False,
     ) -> SectionReviewResponse:
         """섹션 리뷰 (경력/프로젝트/교육)."""
-        start_time = time.time()
         block_count = len(request.blocks)
 
         logger.info(
@@ -218,8 +161,7 @@ class ReviewService:
             },
         )
 
-        try:
-            context = self._assembler.assemble_section(resume_id, section_type, request)
+        async def review(context: ReviewContext) -> SectionReviewResponse:
             block_results = await self._section_chain.run(context)
             overall_evaluation = self._summarize_block_results(block_results)
 
@@ -229,37 +171,21 @@ class ReviewService:
                 overall_evaluation=overall_evaluation,
                 block_results=block_results,
             )
-            response = self._mapper.to_section_review_response(resume_id, section_result)
-
-            duration_ms = (time.time() - start_time) * 1000
-            logger.info(
-                "Section review completed",
-                extra={
-                    "resume_id": str(resume_id),
-                    "operation": "review_section",
-                    "section_type": section_type.value,
-                    "block_count": block_count,
-                    "duration_ms": duration_ms,
-                },
-            )
+            return self._mapper.to_section_review_response(resume_id, section_result)
 
-            return response
-
-        except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
-            logger.error(
-                f"Section review failed: {e}",
-                extra={
-                    "resume_id": str(resume_id),
-                    "operation": "review_section",
-                    "section_type": section_type.value,
-                    "block_count": block_count,
-                    "duration_ms": duration_ms,
-                    "error_type": type(e).__name__,
-                },
-                exc_info=True,
-            )
-            raise
+        return await self._run_review(
+            "review_section",
+            "Section review",
+            {
+                "resume_id": str(resume_id),
+                "section_type": section_type.value,
+                "block_count": block_count,
+            },
+            lambda: self._assembler.assemble_section(resume_id, section_type, request),
+            review,
+            review_mode,
+            cache_bypass,
+        )
 
     async def review_block(
         self,
@@ -268,10 +194,10 @@ class ReviewService:
         section_id: UUID,
         block_id: UUID,
         request: ResumeBlockReviewRequest,
+        review_mode: ReviewMode | None = None,
+        cache_bypass: bool = False,
     ) -> ReviewResponse:
         """단일 블록 리뷰."""
-        start_time = time.time()
-
         logger.info(
             "Starting block review",
             extra={
@@ -283,42 +209,77 @@ class ReviewService:
             },
         )
 
-        try:
-            context = self._assembler.assemble_block(
+        return await self._run_review(
+            "review_block",
+            "Block review",
+            {
+                "resume_id": str(resume_id),
+                "section_type": section_type.value,
+                "block_id": str(block_id),
+            },
+            lambda: self._assembler.assemble_block(
                 resume_id, section_type, section_id, block_id, request
-            )
-            result = await self._chain.run(context)
-            response = self._mapper.to_review_response(resume_id, result)
-
-            duration_ms = (time.time() - start_time) * 1000
-            logger.info(
-                "Block review completed",
-                extra={
-                    "resume_id": str(resume_id),
-                    "operation": "review_block",
-                    "section_type": section_type.value,
-                    "block_id": str(block_id),
-                    "duration_ms": duration_ms,
-                },
-            )
+            ),
+            lambda context: self._review_single(resume_id, context),
+            review_mode,
+            cache_bypass,
+        )
 
-            return response
-
-        except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
-            logger.error(
-                f"Block review failed: {e}",
-                extra={
-                    "resume_id": str(resume_id),
-                    "operation": "review_block",
-                    "section_type": section_type.value,
-                    "block_id": str(block_id),
-                    "duration_ms": duration_ms,
-                    "error_type": type(e).__name__,
-                },
-                exc_info=True,
-            )
-            raise
+    async def _run_review(
+        self,
+        operation: str,
+        label: str,
+        log_extra: dict[str, Any],
+        assemble: Callable[[], ReviewContext],
+        review: Callable[[ReviewContext], Awaitable[T]],
+        review_mode: ReviewMode | None,
+        cache_bypass: bool,
+    ) -> T:
+        """컨텍스트 조립부터 응답 생성까지 실행하고 LLM 단계 지표와 함께 완료/실패 로깅.
+
+        요청별 실행 옵션(review_mode, cache_bypass)은 조립한 컨텍스트에 여기서 한 번에
+        적용합니다.
+        """
+        start_time = time.time()
+
+        with collect_llm_telemetry() as telemetry:
+            try:
+                context = assemble()
+                context.review_mode = review_mode
+                context.cache_bypass = cache_bypass
+                response = await review(context)
+
+            except Exception as e:
+                duration_ms = (time.time() - start_time) * 1000
+                logger.error(
+                    f"{label} failed: {e}",
+                    extra={
+                        **log_extra,
+                        "operation": operation,
+                        "duration_ms": duration_ms,
+                        "llm_stages": telemetry.to_list(),
+                        "error_type": type(e).__name__,
+                    },
+                    exc_info=True,
+                )
+                raise
+
+        duration_ms = (time.time() - start_time) * 1000
+        logger.info(
+            f"{label} completed",
+            extra={
+                **log_extra,
+                "operation": operation,
+                "duration_ms": duration_ms,
+                "llm_stages": telemetry.to_list(),
+            },
+        )
+        return response
+
+    async def _review_single(self, resume_id: UUID, context: ReviewContext) -> ReviewResponse:
+        """단일 대상 리뷰 체인 실행 후 응답으로 변환."""
+        result = await self._chain.run(context)
+        return self._mapper.to_review_response(resume_id, result)
 
     def _summarize_block_results(self, results: list[ReviewResult]) -> str:
         """블록별 결과를 종합하여 섹션 전체 평가 요약 생성."""
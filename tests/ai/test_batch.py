@@ -0,0 +1,281 @@
+"""Message Batches 실행 모드 테스트."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import httpx
+import pytest
+from anthropic import RateLimitError
+from anthropic.types import Message, TextBlock, ToolUseBlock, Usage
+from backend.ai.chains.batch import (
+    AnthropicBatchClient,
+    BatchRequest,
+    BatchRequestError,
+    LocalBatchClient,
+    MessageBatcher,
+)
+from backend.ai.chains.fake_llm import FakeReviewChatModel
+from backend.ai.chains.key_pool import APIKeyPool, APIKeySlot
+from backend.ai.chains.review_chain import ReviewChain
+from backend.ai.chains.routing import ModelRouter, RouteOverride
+from backend.services.review.context import BlockData, ReviewContext
+from backend.services.review.enums import ReviewTargetType
+from langchain_anthropic import ChatAnthropic
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
+
+class EchoModel:
+    """요청 내용을 그대로 돌려주고, "실패"가 포함되면 예외를 내는 가짜 모델."""
+
+    async def ainvoke(self, messages, config=None, **kwargs):
+        text = messages[-1].content
+        if "실패" in text:
+            raise ValueError("모델 오류")
+        return AIMessage(content=text, response_metadata={"model_name": kwargs.get("model")})
+
+
+def make_batcher(client, **kwargs) -> MessageBatcher:
+    """짧은 수집 시간과 폴링 간격을 쓰는 배처 생성."""
+    params = {"flush_seconds": 0.01, "poll_seconds": 0.001}
+    return MessageBatcher(client, **{**params, **kwargs})
+
+
+def make_context() -> ReviewContext:
+    """프로젝트 블록 리뷰 컨텍스트 생성."""
+    return ReviewContext(
+        resume_id=uuid4(),
+        target_type=ReviewTargetType.PROJECT_BLOCK,
+        block=BlockData(
+            block_id=uuid4(), sub_title="결제 시스템", period="2024", content="결제 API 개발"
+        ),
+    )
+
+
+class TestMessageBatcher:
+    """배처 수집/제출/분배 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_batch(self) -> None:
+        """수집 시간 안에 들어온 호출은 한 배치로 제출되고 각자 자기 결과를 받는다."""
+        client = LocalBatchClient(EchoModel())
+        batcher = make_batcher(client)
+
+        results = await asyncio.gather(
+            *[batcher.ainvoke([HumanMessage(content=f"요청 {i}")]) for i in range(3)]
+        )
+
+        assert [result.content for result in results] == ["요청 0", "요청 1", "요청 2"]
+        assert len(client.submitted) == 1
+        assert len(client.submitted[0]) == 3
+        assert batcher.snapshot()["batches"] == 1
+
+    @pytest.mark.asyncio
+    async def test_max_batch_size_flushes_immediately(self) -> None:
+        """최대 크기가 차면 수집 시간을 기다리지 않고 제출한다."""
+        client = LocalBatchClient(EchoModel())
+        batcher = make_batcher(client, max_batch_size=2, flush_seconds=60.0)
+
+        await asyncio.gather(
+            *[batcher.ainvoke([HumanMessage(content=f"요청 {i}")]) for i in range(4)]
+        )
+
+        assert [len(ids) for ids in client.submitted] == [2, 2]
+
+    @pytest.mark.asyncio
+    async def test_item_failure_only_fails_its_caller(self) -> None:
+        """배치 안의 개별 실패는 해당 호출자에게만 전달된다."""
+        batcher = make_batcher(LocalBatchClient(EchoModel()))
+
+        ok, failed = await asyncio.gather(
+            batcher.ainvoke([HumanMessage(content="성공")]),
+            batcher.ainvoke([HumanMessage(content="실패")]),
+            return_exceptions=True,
+        )
+
+        assert ok.content == "성공"
+        assert isinstance(failed, ValueError)
+        assert batcher.snapshot()["failed_requests"] == 1
+
+    @pytest.mark.asyncio
+    async def test_submit_failure_fails_all_callers(self) -> None:
+        """배치 제출이 실패하면 담긴 모든 호출이 같은 예외로 끝난다."""
+        client = LocalBatchClient(EchoModel())
+        client.submit = AsyncMock(side_effect=ConnectionError("제출 실패"))
+        batcher = make_batcher(client)
+
+        results = await asyncio.gather(
+            *[batcher.ainvoke([HumanMessage(content=f"요청 {i}")]) for i in range(2)],
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, ConnectionError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_params_follow_routing_table(self) -> None:
+        """모델과 생성 파라미터는 config metadata로 라우팅 테이블에서 고른다."""
+        router = ModelRouter(
+            RouteOverride(model="claude-default", max_tokens=1024, temperature=0.7),
+            {"*.evaluation": RouteOverride(model="claude-small")},
+        )
+        batcher = make_batcher(LocalBatchClient(EchoModel()), router=router)
+
+        message = await batcher.ainvoke(
+            [HumanMessage(content="요청")],
+            config={"metadata": {"target_type": "project_block", "stage": "evaluation"}},
+        )
+
+        assert message.response_metadata["model_name"] == "claude-small"
+
+
+class TestBatchReviewChain:
+    """배치 모드 ReviewChain 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_reviews_batch_evaluation_then_improvement(self) -> None:
+        """동시에 실행한 리뷰는 평가 배치 하나, 개선 배치 하나로 처리된다."""
+        model = FakeReviewChatModel(ttft_ms=0.0, output_tokens_per_second=1_000_000.0, seed=3)
+        client = LocalBatchClient(model)
+        chain = ReviewChain(llm=make_batcher(client).as_runnable())
+
+        results = await asyncio.gather(*[chain.run(make_context()) for _ in range(3)])
+
+        assert all(result.improved_content and result.strengths for result in results)
+        assert [len(ids) for ids in client.submitted] == [3, 3]
+
+
+class TestAnthropicBatchClient:
+    """Anthropic 배치 API 변환 테스트."""
+
+    @staticmethod
+    def make_slot(name: str, create: AsyncMock | None = None) -> tuple[APIKeySlot, SimpleNamespace]:
+        """SDK 배치 리소스를 가짜로 바꾼 ChatAnthropic 키 슬롯 생성."""
+        batches = SimpleNamespace(
+            create=create or AsyncMock(return_value=SimpleNamespace(id=f"msgbatch_{name}")),
+            retrieve=AsyncMock(return_value=SimpleNamespace(processing_status="ended")),
+            results=AsyncMock(),
+        )
+        model = ChatAnthropic(model="claude-default", anthropic_api_key=f"test-api-key-{name}")
+        # cached_property를 인스턴스 값으로 덮어 SDK 클라이언트를 교체
+        object.__setattr__(
+            model, "_async_client", SimpleNamespace(messages=SimpleNamespace(batches=batches))
+        )
+        return APIKeySlot(name, model), batches
+
+    def make_client(self) -> tuple[AnthropicBatchClient, SimpleNamespace]:
+        """키 하나짜리 풀로 만든 배치 클라이언트 생성."""
+        slot, batches = self.make_slot("1")
+        return AnthropicBatchClient(APIKeyPool([slot])), batches
+
+    @staticmethod
+    async def submit_one(client: AnthropicBatchClient) -> str:
+        """결과 조회 전에 요청 하나를 제출."""
+        return await client.submit([BatchRequest("ok", [HumanMessage(content="소개글")], {})])
+
+    @pytest.mark.asyncio
+    async def test_submit_builds_message_params(self) -> None:
+        """시스템 프롬프트(캐시 표시 포함)와 생성 파라미터가 요청 본문에 담긴다."""
+        client, batches = self.make_client()
+        system = SystemMessage(
+            content=[{"type": "text", "text": "지침", "cache_control": {"type": "ephemeral"}}]
+        )
+        request = BatchRequest(
+            "req-1",
+            [system, HumanMessage(content="소개글")],
+            {"model": "claude-small", "max_tokens": 512, "temperature": 0.2},
+        )
+
+        batch_id = await client.submit([request])
+
+        params = batches.create.await_args.kwargs["requests"][0]["params"]
+        assert batch_id == "msgbatch_1"
+        assert params["model"] == "claude-small"
+        assert params["max_tokens"] == 512
+        assert params["temperature"] == 0.2
+        assert params["system"][0]["cache_control"] == {"type": "ephemeral"}
+        assert params["messages"] == [{"role": "user", "content": "소개글"}]
+
+    @pytest.mark.asyncio
+    async def test_results_convert_to_messages(self) -> None:
+        """성공 결과는 AIMessage로, 만료 결과는 BatchRequestError로 변환된다."""
+        client, batches = self.make_client()
+        message = Message(
+            id="msg_1",
+            type="message",
+            role="assistant",
+            model="claude-small",
+            content=[TextBlock(type="text", text='{"summary": "좋습니다"}')],
+            stop_reason="end_turn",
+            usage=Usage(input_tokens=100, output_tokens=20, cache_read_input_tokens=900),
+        )
+
+        async def entries():
+            yield SimpleNamespace(
+                custom_id="ok", result=SimpleNamespace(type="succeeded", message=message)
+            )
+            yield SimpleNamespace(custom_id="late", result=SimpleNamespace(type="expired"))
+
+        batches.results.return_value = entries()
+        batch_id = await self.submit_one(client)
+
+        assert await client.is_done(batch_id)
+        results = await client.results(batch_id)
+
+        assert results["ok"].content == '{"summary": "좋습니다"}'
+        assert results["ok"].response_metadata["model_name"] == "claude-small"
+        assert results["ok"].usage_metadata["input_tokens"] == 1000
+        assert isinstance(results["late"], BatchRequestError)
+
+    @pytest.mark.asyncio
+    async def test_tool_use_results_become_tool_calls(self) -> None:
+        """도구 호출로 받은 결과는 실시간 응답처럼 tool_calls로 변환된다."""
+        client, batches = self.make_client()
+        message = Message(
+            id="msg_1",
+            type="message",
+            role="assistant",
+            model="claude-small",
+            content=[
+                ToolUseBlock(
+                    type="tool_use",
+                    id="toolu_1",
+                    name="EvaluationResult",
+                    input={"summary": "좋음"},
+                )
+            ],
+            stop_reason="tool_use",
+            usage=Usage(input_tokens=100, output_tokens=20),
+        )
+
+        async def entries():
+            yield SimpleNamespace(
+                custom_id="ok", result=SimpleNamespace(type="succeeded", message=message)
+            )
+
+        batches.results.return_value = entries()
+        batch_id = await self.submit_one(client)
+
+        results = await client.results(batch_id)
+
+        assert results["ok"].tool_calls[0]["name"] == "EvaluationResult"
+        assert results["ok"].tool_calls[0]["args"] == {"summary": "좋음"}
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_key_hands_batch_to_next_key(self) -> None:
+        """제출이 429를 받으면 다른 키로 넘기고, 조회/결과는 제출한 키로 수행한다."""
+        request = httpx.Request("POST", "https://api.anthropic.com/v1/messages/batches")
+        rate_limited = RateLimitError(
+            "error", response=httpx.Response(429, request=request), body=None
+        )
+        limited_slot, limited = self.make_slot("a", AsyncMock(side_effect=rate_limited))
+        healthy_slot, healthy = self.make_slot("b")
+        client = AnthropicBatchClient(APIKeyPool([limited_slot, healthy_slot]))
+
+        batch_id = await self.submit_one(client)
+        assert await client.is_done(batch_id)
+
+        assert batch_id == "msgbatch_b"
+        assert not limited_slot.is_available()
+        healthy.retrieve.assert_awaited_once_with("msgbatch_b")
+        limited.retrieve.assert_not_awaited()
@@ -0,0 +1,100 @@
+"""오프라인 일괄 재리뷰 작업 테스트."""
+
+import json
+import sys
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from backend.ai import batch_review
+from backend.ai.batch_review import run_jobs
+from backend.ai.chains.batch import LocalBatchClient, MessageBatcher
+from backend.ai.chains.fake_llm import FakeReviewChatModel
+from backend.ai.chains.review_chain import ReviewChain, SectionReviewChain
+from backend.services.review import ReviewService
+from backend.services.review.assembler import get_review_context_assembler
+from backend.services.review.mapper import get_review_response_mapper
+
+
+def make_service() -> tuple[ReviewService, LocalBatchClient]:
+    """가짜 모델 로컬 배치로 구성한 배치 리뷰 서비스 생성."""
+    model = FakeReviewChatModel(ttft_ms=0.0, output_tokens_per_second=1_000_000.0, seed=5)
+    client = LocalBatchClient(model)
+    batcher = MessageBatcher(client, flush_seconds=0.01, poll_seconds=0.001)
+    chain = ReviewChain(llm=batcher.as_runnable())
+    service = ReviewService(
+        assembler=get_review_context_assembler(),
+        chain=chain,
+        section_chain=SectionReviewChain(chain),
+        mapper=get_review_response_mapper(),
+    )
+    return service, client
+
+
+def block_job(section_type: str | None = "project") -> str:
+    """프로젝트 블록 재리뷰 작업 한 줄 생성."""
+    return json.dumps(
+        {
+            "resumeId": str(uuid4()),
+            "target": "block",
+            "sectionType": section_type,
+            "request": {
+                "id": str(uuid4()),
+                "sectionId": str(uuid4()),
+                "subTitle": "AI 챗봇 개발",
+                "period": "2023.01 - 2023.06",
+                "content": "FastAPI 기반 챗봇 백엔드 구축",
+                "isVisible": True,
+                "techStack": ["Python", "FastAPI"],
+            },
+        },
+        ensure_ascii=False,
+    )
+
+
+class TestRunJobs:
+    """JSONL 작업 실행 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_jobs_share_stage_batches(self) -> None:
+        """동시에 실행한 작업은 평가 배치 하나, 개선 배치 하나로 처리된다."""
+        service, client = make_service()
+
+        results = await run_jobs(service, [block_job(), block_job()])
+
+        assert [result["line"] for result in results] == [1, 2]
+        assert all(result["response"]["improvedContent"] for result in results)
+        assert [len(ids) for ids in client.submitted] == [2, 2]
+
+    @pytest.mark.asyncio
+    async def test_invalid_jobs_are_reported_without_stopping_others(self) -> None:
+        """잘못된 작업은 error로 남기고 나머지 작업은 계속 실행한다."""
+        service, _ = make_service()
+
+        results = await run_jobs(service, ["{}", block_job(section_type=None), "", block_job()])
+
+        assert "잘못된 작업" in results[0]["error"]
+        assert "sectionType" in results[1]["error"]
+        assert results[2]["line"] == 4
+        assert "response" in results[2]
+
+
+class TestMain:
+    """CLI 진입점 테스트."""
+
+    def test_writes_results_jsonl(self, tmp_path) -> None:
+        """작업 파일을 읽어 작업 순서대로 결과 파일을 쓴다."""
+        jobs = tmp_path / "jobs.jsonl"
+        output = tmp_path / "results.jsonl"
+        jobs.write_text(block_job() + "\n", encoding="utf-8")
+        argv = ["batch_review", str(jobs), str(output)]
+
+        with (
+            patch.object(sys, "argv", argv),
+            patch.object(batch_review, "build_batch_review_service", lambda: make_service()[0]),
+        ):
+            batch_review.main()
+
+        lines = output.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0])["target"] == "block"
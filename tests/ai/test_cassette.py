@@ -0,0 +1,161 @@
+"""LLM 호출 녹화/재생 카세트 테스트."""
+
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from backend.ai.chains.cassette import (
+    CassetteMissError,
+    CassetteRecorder,
+    CassetteReplayChatModel,
+    LLMCassette,
+    cassette_key,
+)
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolCall
+
+MESSAGES = [
+    SystemMessage(content="시스템 프롬프트"),
+    HumanMessage(content="소개글을 평가해 주세요"),
+]
+
+
+class ScriptedModel:
+    """호출 횟수를 세고 고정 응답을 반환하는 가짜 모델."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def ainvoke(self, messages, config=None, **kwargs):
+        self.calls += 1
+        return AIMessage(
+            content='{"summary": "좋습니다"}',
+            response_metadata={"model_name": kwargs.get("model"), "stop_reason": "end_turn"},
+            usage_metadata={"input_tokens": 120, "output_tokens": 30, "total_tokens": 150},
+        )
+
+
+class TestCassetteKey:
+    """카세트 키 테스트."""
+
+    def test_key_ignores_max_tokens(self) -> None:
+        """출력 토큰 예산이 바꾸는 max_tokens는 키에 포함하지 않는다."""
+        first = cassette_key(MESSAGES, {"model": "claude-a", "max_tokens": 1024})
+        second = cassette_key(MESSAGES, {"model": "claude-a", "max_tokens": 512})
+
+        assert first == second
+
+    def test_key_changes_with_messages_and_model(self) -> None:
+        """메시지나 모델이 다르면 키가 달라진다."""
+        base = cassette_key(MESSAGES, {"model": "claude-a"})
+
+        assert base != cassette_key(MESSAGES, {"model": "claude-b"})
+        assert base != cassette_key(MESSAGES[:1], {"model": "claude-a"})
+
+    def test_key_changes_with_forced_tool(self) -> None:
+        """도구 호출을 강제한 요청은 같은 메시지라도 다른 키를 쓴다."""
+        tool_choice = {"type": "tool", "name": "EvaluationResult"}
+
+        assert cassette_key(MESSAGES, {"model": "claude-a"}) != cassette_key(
+            MESSAGES, {"model": "claude-a", "tool_choice": tool_choice}
+        )
+
+
+class TestRecordAndReplay:
+    """녹화 후 재생 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_replay_returns_recorded_response(self, tmp_path: Path) -> None:
+        """녹화한 응답을 새 프로세스(카세트 재로드)에서 그대로 재생한다."""
+        path = tmp_path / "llm.jsonl.gz"
+        model = ScriptedModel()
+        recorder = CassetteRecorder(model, LLMCassette(path))
+
+        recorded = await recorder.ainvoke(MESSAGES, model="claude-a", max_tokens=1024)
+        await recorder.ainvoke(MESSAGES, model="claude-a", max_tokens=1024)
+
+        cassette = LLMCassette(path)
+        replay = CassetteReplayChatModel(cassette, time_scale=0.0)
+        replayed = await replay.ainvoke(MESSAGES, model="claude-a", max_tokens=512)
+
+        assert len(cassette) == 1
+        assert replayed.content == recorded.content
+        assert replayed.response_metadata["model_name"] == "claude-a"
+        assert replayed.usage_metadata["output_tokens"] == 30
+        assert cassette.snapshot()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_replay_restores_tool_calls(self, tmp_path: Path) -> None:
+        """녹화한 도구 호출 응답은 재생 시에도 도구 호출로 복원된다."""
+        cassette = LLMCassette(tmp_path / "llm.jsonl.gz")
+        params = {"model": "claude-a", "tool_choice": {"type": "tool", "name": "EvaluationResult"}}
+        cassette.record(
+            cassette_key(MESSAGES, params),
+            MESSAGES,
+            params,
+            AIMessage(
+                content="",
+                tool_calls=[
+                    ToolCall(name="EvaluationResult", args={"summary": "좋습니다"}, id="toolu_1")
+                ],
+            ),
+            elapsed=0.0,
+        )
+        replay = CassetteReplayChatModel(LLMCassette(tmp_path / "llm.jsonl.gz"), time_scale=0.0)
+
+        replayed = await replay.ainvoke(MESSAGES, **params)
+
+        assert replayed.tool_calls[0]["args"] == {"summary": "좋습니다"}
+
+    @pytest.mark.asyncio
+    async def test_replay_scales_recorded_timing(self, tmp_path: Path) -> None:
+        """재생 시 녹화된 소요 시간에 배율을 곱해 기다린다."""
+        path = tmp_path / "llm.jsonl.gz"
+        cassette = LLMCassette(path)
+        cassette.record(
+            cassette_key(MESSAGES, {"model": "claude-a"}),
+            MESSAGES,
+            {"model": "claude-a"},
+            AIMessage(content="{}"),
+            elapsed=2.0,
+        )
+        replay = CassetteReplayChatModel(cassette, time_scale=0.5)
+
+        with patch("backend.ai.chains.cassette.asyncio.sleep", AsyncMock()) as sleep:
+            await replay.ainvoke(MESSAGES, model="claude-a")
+
+        sleep.assert_awaited_once_with(pytest.approx(1.0))
+
+    @pytest.mark.asyncio
+    async def test_replay_miss_raises(self, tmp_path: Path) -> None:
+        """녹화되지 않은 요청은 실제 호출 없이 실패한다."""
+        cassette = LLMCassette(tmp_path / "empty.jsonl.gz")
+        replay = CassetteReplayChatModel(cassette, time_scale=0.0)
+
+        with pytest.raises(CassetteMissError):
+            await replay.ainvoke(MESSAGES, model="claude-a")
+
+        assert cassette.snapshot()["misses"] == 1
+
+    def test_sync_replay_returns_recorded_response(self, tmp_path: Path) -> None:
+        """동기 호출(invoke)로도 녹화된 응답을 재생한다."""
+        cassette = LLMCassette(tmp_path / "llm.jsonl.gz")
+        cassette.record(
+            cassette_key(MESSAGES, {"model": "claude-a"}),
+            MESSAGES,
+            {"model": "claude-a"},
+            AIMessage(content="{}"),
+            elapsed=0.0,
+        )
+        replay = CassetteReplayChatModel(cassette, time_scale=0.0)
+
+        assert replay.invoke(MESSAGES, model="claude-a").content == "{}"
+
+    @pytest.mark.asyncio
+    async def test_recorder_writes_file_off_the_event_loop(self, tmp_path: Path) -> None:
+        """녹화기는 gzip 파일 쓰기를 스레드로 넘긴다."""
+        recorder = CassetteRecorder(ScriptedModel(), LLMCassette(tmp_path / "llm.jsonl.gz"))
+
+        with patch("backend.ai.chains.cassette.asyncio.to_thread", AsyncMock()) as to_thread:
+            await recorder.ainvoke(MESSAGES, model="claude-a")
+
+        to_thread.assert_awaited_once()
@@ -0,0 +1,108 @@
+"""CircuitBreaker 테스트."""
+
+from itertools import count
+from unittest.mock import patch
+
+import pytest
+from backend.ai.chains.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+
+
+class ProviderError(Exception):
+    """공급자 장애를 흉내내는 예외."""
+
+
+def make_breaker(**kwargs) -> CircuitBreaker:
+    """테스트용 작은 윈도우의 브레이커 생성."""
+    params = {
+        "failure_exceptions": (ProviderError,),
+        "window_size": 4,
+        "min_calls": 4,
+        "failure_rate_threshold": 0.5,
+        "open_duration": 10.0,
+        "half_open_calls": 1,
+    }
+    params.update(kwargs)
+    return CircuitBreaker(**params)
+
+
+async def succeed(breaker: CircuitBreaker) -> None:
+    async with breaker.guard():
+        pass
+
+
+async def fail(breaker: CircuitBreaker, error: Exception | None = None) -> None:
+    with pytest.raises(type(error or ProviderError())):
+        async with breaker.guard():
+            raise error or ProviderError()
+
+
+class TestCircuitBreaker:
+    """상태 전이 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_opens_when_failure_rate_exceeded(self) -> None:
+        """최근 호출 오류율이 임계값을 넘으면 열린다."""
+        breaker = make_breaker()
+
+        await succeed(breaker)
+        await succeed(breaker)
+        await fail(breaker)
+        assert breaker.state == CircuitState.CLOSED
+
+        await fail(breaker)
+        assert breaker.state == CircuitState.OPEN
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_rejects_immediately(self) -> None:
+        """열린 상태에서는 호출 블록을 실행하지 않고 즉시 거부한다."""
+        breaker = make_breaker(min_calls=1, window_size=1)
+        await fail(breaker)
+
+        with pytest.raises(CircuitOpenError) as exc_info:
+            async with breaker.guard():
+                pytest.fail("열린 서킷에서 호출이 실행됨")
+
+        assert 0 < exc_info.value.retry_after_ms <= 10_000
+        assert breaker.snapshot()["rejected_total"] == 1
+
+    @pytest.mark.asyncio
+    async def test_slow_calls_open_circuit(self) -> None:
+        """느린 호출 비율이 임계값을 넘어도 열린다."""
+        breaker = make_breaker(min_calls=2, slow_call_seconds=1.0, slow_call_rate_threshold=1.0)
+
+        with patch("backend.ai.chains.circuit_breaker.time.monotonic", side_effect=count(0, 5)):
+            await succeed(breaker)
+            await succeed(breaker)
+
+            assert breaker.state == CircuitState.OPEN
+
+    @pytest.mark.asyncio
+    async def test_client_errors_are_not_counted(self) -> None:
+        """공급자 장애가 아닌 예외는 오류율에 반영하지 않는다."""
+        breaker = make_breaker(min_calls=1, window_size=1)
+
+        await fail(breaker, ValueError("bad request"))
+
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.snapshot()["window_calls"] == 0
+
+    @pytest.mark.asyncio
+    async def test_half_open_probe_success_closes(self) -> None:
+        """열린 시간이 지나면 탐색 호출을 허용하고, 성공하면 닫힌다."""
+        breaker = make_breaker(min_calls=1, window_size=1, open_duration=0.0)
+        await fail(breaker)
+
+        assert breaker.state == CircuitState.HALF_OPEN
+        await succeed(breaker)
+
+        assert breaker.state == CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_half_open_probe_failure_reopens(self) -> None:
+        """탐색 호출이 실패하면 다시 열린다."""
+        breaker = make_breaker(min_calls=1, window_size=1, open_duration=0.0)
+        await fail(breaker)
+
+        await fail(breaker)
+
+        assert breaker._state == CircuitState.OPEN
@@ -0,0 +1,158 @@
+"""가짜 LLM 제공자 테스트."""
+
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from anthropic import OverloadedError
+from backend.ai.chains.fake_llm import FAKE_MODEL_NAME, FakeReviewChatModel, build_fake_error
+from backend.ai.chains.llm import _build_chat_model
+from backend.ai.chains.review_chain import ReviewChain
+from backend.ai.chains.structured_output import StructuredOutput
+from backend.ai.chains.telemetry import collect_llm_telemetry
+from backend.ai.config import AIConfig
+from backend.ai.output.review_result import ImprovementOutput
+from backend.api.rest.exceptions import ReviewServiceUnavailableError
+from backend.services.review.context import BlockData, ReviewContext
+from backend.services.review.enums import ReviewTargetType
+
+
+def make_fake(**kwargs) -> FakeReviewChatModel:
+    """지연 없는 가짜 모델 생성."""
+    params = {"ttft_ms": 0.0, "output_tokens_per_second": 1_000_000.0, "seed": 7}
+    return FakeReviewChatModel(**{**params, **kwargs})
+
+
+def make_chain(model: FakeReviewChatModel) -> ReviewChain:
+    """가짜 모델이 주입된 ReviewChain 생성."""
+    with patch("backend.ai.chains.review_chain.get_anthropic_client", return_value=model):
+        return ReviewChain()
+
+
+@pytest.fixture
+def block_context() -> ReviewContext:
+    """프로젝트 블록 리뷰 컨텍스트."""
+    return ReviewContext(
+        resume_id=uuid4(),
+        target_type=ReviewTargetType.PROJECT_BLOCK,
+        block=BlockData(
+            block_id=uuid4(), sub_title="결제 시스템", period="2024", content="결제 API 개발"
+        ),
+    )
+
+
+class TestFakeReviewChatModel:
+    """가짜 채팅 모델 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_review_chain_parses_fake_responses(self, block_context: ReviewContext) -> None:
+        """평가/개선 단계 응답이 모두 스키마에 맞게 파싱된다."""
+        chain = make_chain(make_fake())
+
+        result = await chain.run(block_context)
+
+        assert result.target_type == ReviewTargetType.PROJECT_BLOCK
+        assert result.improved_content
+        assert result.strengths
+        assert result.served_models == {
+            "evaluation": FAKE_MODEL_NAME,
+            "improvement": FAKE_MODEL_NAME,
+        }
+
+    @pytest.mark.asyncio
+    async def test_output_length_follows_configured_tokens(self) -> None:
+        """출력 토큰 수는 설정한 중앙값 근처이고 max_tokens를 넘지 않는다."""
+        model = make_fake(output_tokens=400, latency_sigma=0.0)
+
+        long_message = await model.ainvoke("리뷰해 주세요")
+        capped_message = await model.ainvoke("리뷰해 주세요", max_tokens=100)
+
+        assert 300 <= long_message.usage_metadata["output_tokens"] <= 450
+        assert capped_message.usage_metadata["output_tokens"] <= 100
+
+    @pytest.mark.asyncio
+    async def test_streaming_reports_first_token(self, block_context: ReviewContext) -> None:
+        """스트리밍 모드에서는 텔레메트리에 첫 토큰까지의 시간이 기록된다."""
+        chain = make_chain(make_fake(streaming=True, ttft_ms=5.0))
+
+        with collect_llm_telemetry() as telemetry:
+            await chain.run(block_context)
+
+        stages = telemetry.to_list()
+        assert all(stage["ttft_ms"] is not None for stage in stages)
+        assert all(stage["output_tokens"] > 0 for stage in stages)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("streaming", [False, True])
+    async def test_returns_forced_tool_call(self, streaming: bool) -> None:
+        """도구 호출을 강제하면 일반/스트리밍 모두 단계 스키마에 맞는 도구 입력을 돌려준다."""
+        output = StructuredOutput(ImprovementOutput, "tool")
+        model = make_fake(streaming=streaming)
+
+        message = await model.ainvoke("리뷰해 주세요", **output.call_kwargs)
+        result = await output.parser.ainvoke(message)
+
+        assert result.improvement_suggestion
+        assert message.response_metadata["stop_reason"] == "tool_use"
+
+    @pytest.mark.parametrize("streaming", [False, True])
+    def test_sync_invoke_returns_forced_tool_call(self, streaming: bool) -> None:
+        """동기 호출도 일반/스트리밍 모두 단계 스키마에 맞는 도구 입력을 돌려준다."""
+        output = StructuredOutput(ImprovementOutput, "tool")
+
+        message = make_fake(streaming=streaming).invoke("리뷰해 주세요", **output.call_kwargs)
+        result = output.parser.invoke(message)
+
+        assert result.improvement_suggestion
+        assert message.usage_metadata["output_tokens"] > 0
+
+    def test_sync_invoke_injects_errors(self) -> None:
+        """동기 호출에도 설정한 오류가 주입된다."""
+        model = make_fake(error_rate=1.0, error_types=["overloaded"])
+
+        with pytest.raises(OverloadedError):
+            model.invoke("리뷰해 주세요")
+
+    @pytest.mark.asyncio
+    async def test_injects_configured_errors(self) -> None:
+        """오류 확률이 1이면 설정한 종류의 SDK 예외가 발생한다."""
+        model = make_fake(error_rate=1.0, error_types=["overloaded"])
+
+        with pytest.raises(OverloadedError):
+            await model.ainvoke("리뷰해 주세요")
+
+    @pytest.mark.asyncio
+    async def test_injected_errors_follow_real_error_handling(
+        self, block_context: ReviewContext
+    ) -> None:
+        """주입한 과부하 오류는 실제 API 오류와 같은 경로로 처리된다."""
+        chain = make_chain(make_fake(error_rate=1.0, error_types=["overloaded"]))
+
+        with pytest.raises(Exception) as exc_info:
+            await chain.run(block_context)
+
+        assert not isinstance(exc_info.value, ReviewServiceUnavailableError)
+        assert isinstance(exc_info.value.__cause__, OverloadedError)
+
+    def test_rate_limit_error_carries_retry_after(self) -> None:
+        """429 오류에는 retry-after 헤더가 포함된다."""
+        error = build_fake_error("rate_limit")
+
+        assert error.response.headers["retry-after"] == "1"
+
+
+class TestProviderSelection:
+    """제공자 선택 테스트."""
+
+    def test_fake_provider_builds_fake_model(self) -> None:
+        """llm_provider=fake면 키별 클라이언트로 가짜 모델을 만든다."""
+        config = AIConfig(anthropic_api_key="test-api-key", llm_provider="fake", fake_llm_seed=1)
+
+        with (
+            patch("backend.ai.chains.fake_llm.get_ai_config", return_value=config),
+            patch("backend.ai.chains.llm.get_ai_config", return_value=config),
+        ):
+            model = _build_chat_model("test-api-key")
+
+        assert isinstance(model, FakeReviewChatModel)
+        assert model.seed == 1
@@ -0,0 +1,126 @@
+"""ModelFallbackChain 테스트."""
+
+import httpx
+import pytest
+from anthropic import APITimeoutError, BadRequestError, OverloadedError
+from backend.ai.chains.fallback import ModelFallbackChain
+from backend.ai.config import AIConfig
+from langchain_core.messages import AIMessage
+
+
+def make_overloaded_error() -> OverloadedError:
+    """테스트용 529 에러 생성."""
+    request = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+    return OverloadedError("overloaded", response=httpx.Response(529, request=request), body=None)
+
+
+def make_timeout_error() -> APITimeoutError:
+    """테스트용 타임아웃 에러 생성."""
+    return APITimeoutError(request=httpx.Request("POST", "https://api.anthropic.com/v1/messages"))
+
+
+class ScriptedModel:
+    """모델명별로 지정한 에러를 던지고 그 외에는 성공하는 가짜 모델."""
+
+    def __init__(self, errors: dict[str, list[Exception]] | None = None):
+        self._errors = {name: list(errs) for name, errs in (errors or {}).items()}
+        self.calls: list[str] = []
+
+    async def ainvoke(self, messages, config=None, **kwargs) -> AIMessage:
+        model = kwargs["model"]
+        self.calls.append(model)
+        if self._errors.get(model):
+            raise self._errors[model].pop(0)
+        return AIMessage(content="ok")
+
+
+class TestModelFallbackChain:
+    """ModelFallbackChain 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_overloaded_model_falls_back_immediately(self) -> None:
+        """529를 받으면 같은 모델을 재시도하지 않고 다음 모델로 넘긴다."""
+        model = ScriptedModel({"primary": [make_overloaded_error()]})
+        chain = ModelFallbackChain(model, "primary", ["secondary"])
+
+        result = await chain.ainvoke("hi")
+
+        assert model.calls == ["primary", "secondary"]
+        assert result.response_metadata["model_name"] == "secondary"
+        snapshot = chain.snapshot()
+        assert snapshot["fallbacks"] == {"primary->secondary": 1}
+        assert snapshot["served"] == {"secondary": 1}
+
+    @pytest.mark.asyncio
+    async def test_overloaded_model_is_skipped_during_cooldown(self) -> None:
+        """과부하가 난 모델은 쿨다운 동안 뒤로 밀린다."""
+        model = ScriptedModel({"primary": [make_overloaded_error()]})
+        chain = ModelFallbackChain(model, "primary", ["secondary"], cooldown_seconds=60)
+
+        await chain.ainvoke("hi")
+        await chain.ainvoke("hi")
+
+        assert model.calls == ["primary", "secondary", "secondary"]
+        assert chain.candidates() == ["secondary", "primary"]
+        assert "primary" in chain.snapshot()["cooling_down"]
+
+    @pytest.mark.asyncio
+    async def test_single_timeout_switches_without_cooldown(self) -> None:
+        """타임아웃 한 번은 이번 호출만 넘기고, 연속으로 반복될 때 쿨다운한다."""
+        model = ScriptedModel({"primary": [make_timeout_error(), make_timeout_error()]})
+        chain = ModelFallbackChain(model, "primary", ["secondary"], timeout_threshold=2)
+
+        await chain.ainvoke("hi")
+        assert chain.candidates() == ["primary", "secondary"]
+
+        await chain.ainvoke("hi")
+        assert chain.candidates() == ["secondary", "primary"]
+
+    @pytest.mark.asyncio
+    async def test_routed_model_comes_first(self) -> None:
+        """호출 시 지정한 모델이 1순위가 된다."""
+        model = ScriptedModel()
+        chain = ModelFallbackChain(model, "primary", ["secondary"])
+
+        result = await chain.ainvoke("hi", model="secondary")
+
+        assert model.calls == ["secondary"]
+        assert result.response_metadata["model_name"] == "secondary"
+
+    @pytest.mark.asyncio
+    async def test_raises_when_all_models_overloaded(self) -> None:
+        """모든 모델이 과부하면 마지막 에러를 전파한다."""
+        model = ScriptedModel(
+            {"primary": [make_overloaded_error()], "secondary": [make_overloaded_error()]}
+        )
+        chain = ModelFallbackChain(model, "primary", ["secondary"])
+
+        with pytest.raises(OverloadedError):
+            await chain.ainvoke("hi")
+
+    @pytest.mark.asyncio
+    async def test_other_errors_do_not_fall_back(self) -> None:
+        """요청 자체의 오류는 폴백하지 않고 그대로 전파한다."""
+        request = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+        error = BadRequestError("bad", response=httpx.Response(400, request=request), body=None)
+        model = ScriptedModel({"primary": [error]})
+        chain = ModelFallbackChain(model, "primary", ["secondary"])
+
+        with pytest.raises(BadRequestError):
+            await chain.ainvoke("hi")
+
+        assert model.calls == ["primary"]
+
+
+class TestFallbackModelsConfig:
+    """폴백 모델 설정 테스트."""
+
+    def test_fallback_model_list_excludes_default(self) -> None:
+        """폴백 목록에서 기본 모델과 중복은 제거된다."""
+        config = AIConfig(
+            anthropic_api_key="key",
+            anthropic_model="primary",
+            anthropic_fallback_models="secondary, primary, tertiary, secondary",
+        )
+
+        assert config.anthropic_fallback_model_list == ["secondary", "tertiary"]
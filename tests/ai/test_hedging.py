@@ -0,0 +1,232 @@
+"""HedgingPolicy 테스트."""
+
+import asyncio
+
+import pytest
+from backend.ai.chains.circuit_breaker import CircuitBreaker
+from backend.ai.chains.gateway import LLMGateway, stage_key
+from backend.ai.chains.hedging import HedgingPolicy, LatencyTracker
+from backend.ai.chains.limiter import AdaptiveConcurrencyLimiter
+from backend.ai.chains.rate_shaper import TokenEstimator, TokenRateShaper
+from backend.ai.chains.retry import RetryBudget, RetryPolicy
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+
+
+def make_policy(samples: int = 20, latency: float = 0.01, **kwargs) -> HedgingPolicy:
+    """지연 표본이 미리 채워진 헤징 정책 생성."""
+    tracker = LatencyTracker()
+    for _ in range(samples):
+        tracker.record("key", latency)
+    kwargs.setdefault("min_delay", 0.0)
+    kwargs.setdefault("budget", RetryBudget(ratio=1.0, capacity=10.0))
+    return HedgingPolicy(min_samples=20, tracker=tracker, **kwargs)
+
+
+class SlowThenFast:
+    """첫 호출은 오래 걸리고 이후 호출은 즉시 끝나는 호출."""
+
+    def __init__(self, first_delay: float = 1.0):
+        self._first_delay = first_delay
+        self.calls = 0
+        self.cancelled = 0
+
+    async def __call__(self) -> str:
+        self.calls += 1
+        call_no = self.calls
+        try:
+            if call_no == 1:
+                await asyncio.sleep(self._first_delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return f"call-{call_no}"
+
+
+class TestLatencyTracker:
+    """LatencyTracker 테스트."""
+
+    def test_percentile(self) -> None:
+        """백분위 지연 시간을 계산한다."""
+        tracker = LatencyTracker()
+        for i in range(1, 101):
+            tracker.record("key", i / 100)
+
+        assert tracker.percentile("key", 0.95) == pytest.approx(0.96)
+        assert tracker.percentile("other", 0.95) is None
+
+    def test_window_size_bounds_samples(self) -> None:
+        """윈도우 크기를 넘는 오래된 표본은 버려진다."""
+        tracker = LatencyTracker(window_size=3)
+        for value in (10.0, 1.0, 1.0, 1.0):
+            tracker.record("key", value)
+
+        assert tracker.count("key") == 3
+        assert tracker.percentile("key", 0.99) == 1.0
+
+
+class TestHedgingPolicy:
+    """HedgingPolicy 테스트."""
+
+    def test_no_hedge_before_min_samples(self) -> None:
+        """표본이 부족하면 헤징하지 않는다."""
+        policy = make_policy(samples=5)
+
+        assert policy.hedge_delay("key") is None
+
+    def test_hedge_delay_respects_min_delay(self) -> None:
+        """임계값은 최소 대기 시간보다 짧아지지 않는다."""
+        policy = make_policy(latency=0.01, min_delay=0.5)
+
+        assert policy.hedge_delay("key") == 0.5
+
+    @pytest.mark.asyncio
+    async def test_fast_call_is_not_hedged(self) -> None:
+        """임계값 안에 끝나는 호출은 헤지 요청을 보내지 않는다."""
+        policy = make_policy(latency=1.0)
+        call = SlowThenFast(first_delay=0.0)
+
+        result = await policy.run("key", call)
+
+        assert result == "call-1"
+        assert call.calls == 1
+        assert policy.snapshot()["hedged_total"] == 0
+
+    @pytest.mark.asyncio
+    async def test_slow_call_is_hedged_and_loser_cancelled(self) -> None:
+        """임계값을 넘으면 헤지 요청을 보내고 먼저 끝난 결과를 채택한 뒤 나머지는 취소한다."""
+        policy = make_policy(latency=0.01)
+        call = SlowThenFast(first_delay=1.0)
+
+        result = await policy.run("key", call)
+        await asyncio.sleep(0)
+
+        assert result == "call-2"
+        assert call.cancelled == 1
+        snapshot = policy.snapshot()
+        assert snapshot["hedged_total"] == 1
+        assert snapshot["hedge_wins"] == 1
+        assert snapshot["hedge_rate"] == 1.0
+        assert snapshot["win_rate"] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_budget_limits_hedges(self) -> None:
+        """헤지 예산이 없으면 느린 호출도 원래 요청만 기다린다."""
+        policy = make_policy(latency=0.01, budget=RetryBudget(ratio=0.0, capacity=0.0))
+        call = SlowThenFast(first_delay=0.05)
+
+        result = await policy.run("key", call)
+
+        assert result == "call-1"
+        assert call.calls == 1
+        assert policy.snapshot()["hedged_total"] == 0
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_other_when_one_fails(self) -> None:
+        """한쪽이 실패하면 다른 쪽 결과를 기다린다."""
+        policy = make_policy(latency=0.01)
+        calls = 0
+
+        async def flaky() -> str:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                await asyncio.sleep(0.05)
+                return "primary"
+            raise RuntimeError("hedge failed")
+
+        result = await policy.run("key", flaky)
+
+        assert result == "primary"
+        assert policy.snapshot()["hedge_wins"] == 0
+
+    @pytest.mark.asyncio
+    async def test_raises_when_all_fail(self) -> None:
+        """모든 요청이 실패하면 예외를 전파한다."""
+        policy = make_policy(latency=0.01)
+
+        async def fail() -> str:
+            await asyncio.sleep(0.02)
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await policy.run("key", fail)
+
+
+class TestGatewayHedging:
+    """LLMGateway 헤징 연동 테스트."""
+
+    def test_stage_key_from_metadata(self) -> None:
+        """RunnableConfig metadata에서 단계 키를 만든다."""
+        config = {"metadata": {"stage": "evaluation", "target_type": "skill"}}
+
+        assert stage_key(config) == "skill:evaluation"
+        assert stage_key(None) == "unknown:unknown"
+
+    @pytest.mark.asyncio
+    async def test_gateway_records_latency_per_stage(self) -> None:
+        """게이트웨이 호출 지연이 단계별로 기록된다."""
+        tracker = LatencyTracker()
+        policy = HedgingPolicy(tracker=tracker)
+
+        async def ok(_):
+            return AIMessage(content="ok")
+
+        gateway = LLMGateway(
+            RunnableLambda(ok),
+            AdaptiveConcurrencyLimiter(),
+            RetryPolicy(),
+            CircuitBreaker(()),
+            hedging=policy,
+        )
+        await gateway.as_runnable().ainvoke(
+            "hi", config={"metadata": {"stage": "improvement", "target_type": "skill"}}
+        )
+
+        assert tracker.count("skill:improvement") == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_loser_keeps_tpm_reservation(self) -> None:
+        """취소된 헤지 패자의 TPM 예약분은 돌려주지 않고 사용량으로 차감한다."""
+        tracker = LatencyTracker()
+        for _ in range(20):
+            tracker.record("unknown:unknown", 0.01)
+        policy = HedgingPolicy(
+            min_samples=20,
+            min_delay=0.0,
+            budget=RetryBudget(ratio=1.0, capacity=10.0),
+            tracker=tracker,
+        )
+        shaper = TokenRateShaper(
+            6000, 6000, burst_seconds=1.0, estimator=TokenEstimator(use_tiktoken=False)
+        )
+
+        class SlowThenFastModel:
+            calls = 0
+
+            async def ainvoke(self, messages, config=None, **kwargs):
+                self.calls += 1
+                if self.calls == 1:
+                    await asyncio.sleep(1.0)
+                return AIMessage(
+                    content="ok",
+                    usage_metadata={"input_tokens": 10, "output_tokens": 50, "total_tokens": 60},
+                )
+
+        model = SlowThenFastModel()
+        gateway = LLMGateway(
+            model,
+            AdaptiveConcurrencyLimiter(),
+            RetryPolicy(),
+            CircuitBreaker(()),
+            hedging=policy,
+            rate_shaper=shaper,
+        )
+        await gateway.ainvoke("a" * 40, max_tokens=50)
+        # 취소된 패자 작업이 정리될 때까지 이벤트 루프를 돌림
+        await asyncio.sleep(0.01)
+
+        assert model.calls == 2
+        assert policy.snapshot()["hedge_wins"] == 1
+        # 버킷 용량 100에서 승자(정산 후 50)와 패자(예약 50)의 출력 토큰이 모두 빠짐
+        assert shaper.snapshot()["output_tokens_available"] == pytest.approx(0, abs=2)
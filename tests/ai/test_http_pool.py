@@ -0,0 +1,177 @@
+"""공유 HTTP 커넥션 풀 및 워밍업 테스트."""
+
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from functools import cached_property
+from inspect import getattr_static
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+from anthropic import APIConnectionError
+from backend.ai.chains.http_pool import HTTPPoolMonitor, build_http_client, get_http_client
+from backend.ai.chains.llm import PooledChatAnthropic, _build_chat_model, warm_up_llm_connections
+from langchain_anthropic import ChatAnthropic
+
+# 최소한의 Messages API 응답 본문
+MESSAGE_BODY = json.dumps(
+    {
+        "id": "msg_test",
+        "type": "message",
+        "role": "assistant",
+        "model": "claude-test",
+        "content": [{"type": "text", "text": "ok"}],
+        "stop_reason": "end_turn",
+        "stop_sequence": None,
+        "usage": {"input_tokens": 1, "output_tokens": 1},
+    }
+).encode()
+
+
+async def _handle_keepalive(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """연결을 닫지 않고 요청마다 빈 200 응답을 보내는 HTTP/1.1 핸들러."""
+    try:
+        while await reader.readuntil(b"\r\n\r\n"):
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def _handle_messages(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """요청 본문을 읽고 고정된 Messages API 응답을 보내는 HTTP/1.1 핸들러."""
+    try:
+        while headers := await reader.readuntil(b"\r\n\r\n"):
+            for line in headers.decode().split("\r\n"):
+                if line.lower().startswith("content-length:"):
+                    await reader.readexactly(int(line.split(":", 1)[1]))
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                + f"Content-Length: {len(MESSAGE_BODY)}\r\n\r\n".encode()
+                + MESSAGE_BODY
+            )
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+@pytest.fixture
+async def server_url() -> AsyncIterator[str]:
+    """keepalive를 지원하는 로컬 HTTP 서버 주소."""
+    server = await asyncio.start_server(_handle_keepalive, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}"
+    server.close()
+
+
+@pytest.fixture
+async def messages_url() -> AsyncIterator[str]:
+    """Messages API 응답을 흉내 내는 로컬 HTTP 서버 주소."""
+    server = await asyncio.start_server(_handle_messages, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}"
+    server.close()
+
+
+class TestInstrumentedAsyncTransport:
+    """커넥션 풀 지표 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_sequential_requests_reuse_connection(self, server_url: str) -> None:
+        """순차 요청은 keepalive 연결 하나를 재사용한다."""
+        monitor = HTTPPoolMonitor()
+
+        async with build_http_client(4, monitor=monitor) as client:
+            for _ in range(3):
+                response = await client.get(server_url)
+                assert response.text == "ok"
+
+            snapshot = monitor.snapshot(client)
+
+        assert snapshot["requests_total"] == 3
+        assert snapshot["connections_opened_total"] == 1
+        assert snapshot["connection_reuse_rate"] == pytest.approx(2 / 3, abs=1e-3)
+        assert snapshot["connections"] == 1
+        assert snapshot["idle"] == 1
+        assert snapshot["in_use"] == 0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_open_connections_up_to_limit(self, server_url: str) -> None:
+        """동시 요청은 풀 한도까지만 연결을 열고 나머지는 대기 후 재사용한다."""
+        monitor = HTTPPoolMonitor()
+
+        async with build_http_client(2, monitor=monitor) as client:
+            await asyncio.gather(*[client.get(server_url) for _ in range(6)])
+            snapshot = monitor.snapshot(client)
+
+        assert snapshot["requests_total"] == 6
+        assert snapshot["connections_opened_total"] <= 2
+        assert snapshot["waiting"] == 0
+
+
+class TestPooledChatAnthropic:
+    """공유 커넥션 풀 연동 테스트."""
+
+    def test_clients_share_http_client(self) -> None:
+        """키별 클라이언트가 같은 httpx 클라이언트(커넥션 풀)를 사용한다."""
+        first = _build_chat_model("key-a")
+        second = _build_chat_model("key-b")
+
+        assert first._async_client._client is get_http_client()
+        assert second._async_client._client is get_http_client()
+        assert first._async_client.api_key == "key-a"
+
+    def test_upstream_still_builds_async_client_lazily(self) -> None:
+        """설치된 langchain-anthropic이 _async_client를 cached_property로 만든다.
+
+        PooledChatAnthropic은 이 비공개 속성을 덮어쓰므로, 업그레이드로 구현이 바뀌면
+        이 테스트가 먼저 실패해야 합니다.
+        """
+        assert isinstance(getattr_static(ChatAnthropic, "_async_client"), cached_property)
+
+    @pytest.mark.asyncio
+    async def test_requests_go_through_shared_client(self, messages_url: str) -> None:
+        """모델 호출이 실제로 공유 httpx 클라이언트를 거쳐 전송된다."""
+        monitor = HTTPPoolMonitor()
+
+        async with build_http_client(2, monitor=monitor) as client:
+            with patch("backend.ai.chains.llm.get_http_client", return_value=client):
+                model = PooledChatAnthropic(
+                    model="claude-test",
+                    anthropic_api_key="key-a",
+                    base_url=messages_url,
+                    max_retries=0,
+                    streaming=False,
+                )
+                result = await model.ainvoke("hi")
+
+        assert result.content == "ok"
+        assert monitor.snapshot()["requests_total"] == 1
+
+
+class TestWarmUp:
+    """커넥션 워밍업 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_warm_up_opens_configured_connections(self) -> None:
+        """설정한 수만큼 워밍업 요청을 보낸다."""
+        with patch("anthropic.resources.models.AsyncModels.list", AsyncMock()) as models_list:
+            succeeded = await warm_up_llm_connections()
+
+        assert succeeded == 4
+        assert models_list.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_warm_up_failure_is_not_fatal(self) -> None:
+        """워밍업 요청이 실패해도 예외 없이 성공 수만 반환한다."""
+        error = APIConnectionError(request=httpx.Request("GET", "https://api.anthropic.com"))
+
+        with patch("anthropic.resources.models.AsyncModels.list", AsyncMock(side_effect=error)):
+            succeeded = await warm_up_llm_connections()
+
+        assert succeeded == 0
@@ -0,0 +1,128 @@
+"""APIKeyPool 테스트."""
+
+import httpx
+import pytest
+from anthropic import AuthenticationError, BadRequestError, RateLimitError
+from backend.ai.chains.key_pool import APIKeyPool, APIKeySlot
+from backend.ai.config import AIConfig
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+
+
+def make_error(
+    error_cls: type = RateLimitError, status: int = 429, headers: dict | None = None
+) -> Exception:
+    """테스트용 API 에러 생성."""
+    request = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+    response = httpx.Response(status, request=request, headers=headers or {})
+    return error_cls("error", response=response, body=None)
+
+
+def make_slot(name: str, error: Exception | None = None) -> APIKeySlot:
+    """호출 시 지정한 에러를 던지거나 키 이름을 응답하는 슬롯 생성."""
+
+    async def call(_):
+        if error is not None:
+            raise error
+        return AIMessage(content=name)
+
+    return APIKeySlot(name, RunnableLambda(call))
+
+
+class TestAPIKeyPool:
+    """APIKeyPool 테스트."""
+
+    def test_requires_at_least_one_key(self) -> None:
+        """빈 키 풀은 만들 수 없다."""
+        with pytest.raises(ValueError):
+            APIKeyPool([])
+
+    def test_select_least_loaded(self) -> None:
+        """진행 중 요청이 가장 적은 키를 고른다."""
+        busy, idle = make_slot("busy"), make_slot("idle")
+        busy.in_flight = 3
+        pool = APIKeyPool([busy, idle])
+
+        assert pool.select() is idle
+
+    def test_select_balances_by_usage(self) -> None:
+        """부하가 같으면 누적 사용량이 적은 키를 고른다."""
+        first, second = make_slot("first"), make_slot("second")
+        first.requests_total = 10
+        pool = APIKeyPool([first, second])
+
+        assert pool.select() is second
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_key_fails_over_and_cools_down(self) -> None:
+        """429를 받은 키는 retry-after 동안 제외되고 다른 키로 즉시 넘어간다."""
+        limited = make_slot("limited", make_error(headers={"retry-after": "10"}))
+        healthy = make_slot("healthy")
+        healthy.requests_total = 1  # limited 키가 먼저 선택되도록
+        pool = APIKeyPool([limited, healthy])
+
+        result = await pool.ainvoke("hi")
+
+        assert result.content == "healthy"
+        assert not limited.is_available()
+        assert 9000 <= limited.snapshot()["cooldown_remaining_ms"] <= 10000
+        assert limited.snapshot()["rate_limited_total"] == 1
+        assert pool.select() is healthy
+
+    @pytest.mark.asyncio
+    async def test_auth_error_uses_auth_cooldown(self) -> None:
+        """인증 오류를 받은 키는 인증 쿨다운 동안 제외된다."""
+        revoked = make_slot("revoked", make_error(AuthenticationError, 401))
+        healthy = make_slot("healthy")
+        healthy.requests_total = 1
+        pool = APIKeyPool([revoked, healthy], auth_cooldown_seconds=300)
+
+        result = await pool.ainvoke("hi")
+
+        assert result.content == "healthy"
+        assert revoked.cooldown_remaining() > 290
+        assert revoked.snapshot()["auth_errors_total"] == 1
+
+    @pytest.mark.asyncio
+    async def test_raises_when_all_keys_rate_limited(self) -> None:
+        """모든 키가 429면 마지막 에러를 전파한다."""
+        pool = APIKeyPool(
+            [make_slot("a", make_error()), make_slot("b", make_error())], cooldown_seconds=5
+        )
+
+        with pytest.raises(RateLimitError):
+            await pool.ainvoke("hi")
+
+        assert all(not entry["available"] for entry in pool.snapshot())
+
+    @pytest.mark.asyncio
+    async def test_other_errors_do_not_cool_down(self) -> None:
+        """요청 자체의 오류는 키를 제외하지 않고 그대로 전파한다."""
+        slot = make_slot("key", make_error(BadRequestError, 400))
+        pool = APIKeyPool([slot])
+
+        with pytest.raises(BadRequestError):
+            await pool.ainvoke("hi")
+
+        assert slot.is_available()
+        assert slot.in_flight == 0
+        assert slot.snapshot()["errors_total"] == 1
+
+    def test_select_cooling_key_when_none_available(self) -> None:
+        """모든 키가 제외되어 있으면 가장 먼저 복귀하는 키를 고른다."""
+        first, second = make_slot("first"), make_slot("second")
+        first.cooldown_until = 1e12
+        second.cooldown_until = 1e11
+        pool = APIKeyPool([first, second])
+
+        assert pool.select() is second
+
+
+class TestAPIKeysConfig:
+    """키 풀 설정 테스트."""
+
+    def test_extra_keys_are_appended_and_deduplicated(self) -> None:
+        """추가 키는 기본 키 뒤에 중복 없이 붙는다."""
+        config = AIConfig(anthropic_api_key="main", anthropic_extra_api_keys="a, main, b,")
+
+        assert config.anthropic_api_keys == ["main", "a", "b"]
@@ -0,0 +1,222 @@
+"""AdaptiveConcurrencyLimiter / LLMGateway 테스트."""
+
+import asyncio
+
+import httpx
+import pytest
+from anthropic import RateLimitError
+from backend.ai.chains.circuit_breaker import (
+    CIRCUIT_FAILURE_ERRORS,
+    CircuitBreaker,
+    CircuitState,
+)
+from backend.ai.chains.gateway import LLMGateway
+from backend.ai.chains.limiter import AdaptiveConcurrencyLimiter
+from backend.ai.chains.retry import RetryPolicy, request_deadline
+from backend.ai.config import AIConfig
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+from pydantic import ValidationError
+
+
+def make_rate_limit_error() -> RateLimitError:
+    """테스트용 429 에러 생성."""
+    request = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+    return RateLimitError("rate limited", response=httpx.Response(429, request=request), body=None)
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """AIMD 한도 조정 테스트."""
+
+    def test_success_increases_limit_additively(self) -> None:
+        """한도만큼의 성공이 누적될 때마다 한도가 약 1씩 증가한다."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=10)
+
+        for _ in range(5):
+            limiter.record_success()
+
+        assert limiter.limit == 5
+
+    def test_overload_decreases_limit_multiplicatively(self) -> None:
+        """과부하 시 한도가 절반으로 줄어든다."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8, decrease_cooldown=0.0)
+
+        limiter.record_overload()
+        limiter.record_overload()
+
+        assert limiter.limit == 2
+
+    def test_overload_respects_min_limit_and_cooldown(self) -> None:
+        """쿨다운 내 연속 과부하는 한 번만 반영되고 최소 한도 아래로 내려가지 않는다."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, min_limit=2, decrease_cooldown=60)
+
+        limiter.record_overload()
+        limiter.record_overload()
+
+        assert limiter.limit == 2
+        assert limiter.snapshot()["overloads_total"] == 2
+
+    def test_limit_capped_at_max(self) -> None:
+        """한도는 최대값을 넘지 않는다."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=3, max_limit=3)
+
+        for _ in range(10):
+            limiter.record_success()
+
+        assert limiter.limit == 3
+
+    @pytest.mark.asyncio
+    async def test_calls_over_limit_wait_in_queue(self) -> None:
+        """한도를 넘는 호출은 슬롯이 반납될 때까지 대기한다."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+        await limiter.acquire()
+
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        assert limiter.snapshot()["waiting"] == 1
+
+        limiter.release()
+        await waiter
+
+        assert limiter.in_flight == 1
+        assert limiter.snapshot()["acquired_total"] == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_queue(self) -> None:
+        """대기 중 취소된 호출은 큐에서 제거된다."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+        await limiter.acquire()
+
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        limiter.release()
+        assert limiter.in_flight == 0
+        assert limiter.snapshot()["waiting"] == 0
+
+
+class TestConcurrencyConfig:
+    """동시성 한도 설정 검증 테스트."""
+
+    def test_initial_limit_must_be_within_bounds(self) -> None:
+        """초기 한도가 최소/최대 범위를 벗어나면 설정 생성이 실패한다."""
+        with pytest.raises(ValidationError):
+            AIConfig(anthropic_api_key="test-api-key", llm_concurrency_initial=128)
+
+        with pytest.raises(ValidationError):
+            AIConfig(
+                anthropic_api_key="test-api-key",
+                llm_concurrency_min=4,
+                llm_concurrency_initial=2,
+            )
+
+    def test_ordered_bounds_are_accepted(self) -> None:
+        """최소 <= 초기 <= 최대이면 그대로 받아들인다."""
+        config = AIConfig(
+            anthropic_api_key="test-api-key",
+            llm_concurrency_min=2,
+            llm_concurrency_initial=2,
+            llm_concurrency_max=4,
+        )
+
+        assert config.llm_concurrency_initial == 2
+
+
+class TestLLMGateway:
+    """LLMGateway 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_error_shrinks_limit(self) -> None:
+        """RateLimitError는 한도를 줄이고 그대로 전파된다."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8)
+
+        async def fail(_):
+            raise make_rate_limit_error()
+
+        gateway = LLMGateway(
+            RunnableLambda(fail), limiter, RetryPolicy(max_attempts=1), CircuitBreaker(())
+        )
+
+        with pytest.raises(RateLimitError):
+            await gateway.as_runnable().ainvoke("hi")
+
+        assert limiter.limit == 4
+        assert limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_success_releases_slot(self) -> None:
+        """성공한 호출은 슬롯을 반납하고 결과를 그대로 반환한다."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2)
+
+        async def ok(_):
+            return AIMessage(content="ok")
+
+        gateway = LLMGateway(RunnableLambda(ok), limiter, RetryPolicy(), CircuitBreaker(()))
+        result = await gateway.as_runnable().ainvoke("hi")
+
+        assert result.content == "ok"
+        assert limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_saturated_limiter_does_not_open_breaker(self) -> None:
+        """슬롯 대기가 길어져도 호출 자체가 빠르면 서킷이 열리지 않는다."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+        # 호출 자체(0.05초)는 느린 호출 기준(0.2초)보다 훨씬 빠르지만, 한도 1에서 8개를
+        # 동시에 보내면 절반 이상이 기준보다 오래 슬롯을 기다림
+        breaker = CircuitBreaker(
+            CIRCUIT_FAILURE_ERRORS,
+            window_size=8,
+            min_calls=2,
+            slow_call_seconds=0.2,
+            slow_call_rate_threshold=0.5,
+        )
+
+        async def ok(_):
+            await asyncio.sleep(0.05)
+            return AIMessage(content="ok")
+
+        gateway = LLMGateway(RunnableLambda(ok), limiter, RetryPolicy(), breaker)
+        await asyncio.gather(*[gateway.as_runnable().ainvoke("hi") for _ in range(8)])
+
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.snapshot()["slow_call_rate"] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_errors_do_not_open_breaker(self) -> None:
+        """429는 동시성 한도만 줄이고 서킷 브레이커 실패로 기록하지 않는다."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8)
+        breaker = CircuitBreaker(CIRCUIT_FAILURE_ERRORS, window_size=2, min_calls=2)
+
+        async def fail(_):
+            raise make_rate_limit_error()
+
+        gateway = LLMGateway(RunnableLambda(fail), limiter, RetryPolicy(max_attempts=1), breaker)
+        for _ in range(3):
+            with pytest.raises(RateLimitError):
+                await gateway.as_runnable().ainvoke("hi")
+
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.snapshot()["window_calls"] == 0
+
+    @pytest.mark.asyncio
+    async def test_deadline_expiry_does_not_open_breaker(self) -> None:
+        """요청 데드라인 만료는 공급자 장애가 아니므로 서킷 실패로 기록하지 않는다."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8)
+        breaker = CircuitBreaker(CIRCUIT_FAILURE_ERRORS, window_size=2, min_calls=2)
+
+        async def slow(_):
+            await asyncio.sleep(1)
+            return AIMessage(content="ok")
+
+        gateway = LLMGateway(RunnableLambda(slow), limiter, RetryPolicy(max_attempts=1), breaker)
+        for _ in range(3):
+            with request_deadline(0.01), pytest.raises(TimeoutError):
+                await gateway.as_runnable().ainvoke("hi")
+
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.snapshot()["failure_rate"] == 0.0
+        assert limiter.in_flight == 0
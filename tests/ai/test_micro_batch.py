@@ -0,0 +1,206 @@
+"""블록 평가 마이크로 배치 테스트."""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+from backend.ai.chains.fake_llm import FakeReviewChatModel
+from backend.ai.chains.micro_batch import BATCH_STAGE, EvaluationMicroBatcher
+from backend.ai.chains.retry import remaining_time, request_deadline
+from backend.ai.chains.review_chain import ReviewChain
+from backend.ai.chains.telemetry import collect_llm_telemetry
+from backend.ai.strategies.factory import PromptStrategyFactory
+from backend.services.review.context import BlockData, ReviewContext
+from backend.services.review.enums import ReviewTargetType
+from langchain_core.messages import AIMessage, ToolCall
+
+
+class ScriptedBatchLLM:
+    """프롬프트의 항목 수만큼 index별 평가를 도구 호출로 돌려주는 가짜 LLM."""
+
+    def __init__(self, response: str | None = None) -> None:
+        self.prompts: list[str] = []
+        self._response = response
+
+    async def ainvoke(self, messages, config=None, **kwargs):
+        prompt = messages[-1].content
+        self.prompts.append(prompt)
+        if self._response is not None:
+            return AIMessage(content=self._response)
+        items = [
+            {"index": index, "summary": f"평가 {index}", "strengths": [], "weaknesses": []}
+            for index in range(prompt.count("<item index="))
+        ]
+        return AIMessage(
+            content="",
+            tool_calls=[
+                ToolCall(name=kwargs["tool_choice"]["name"], args={"items": items}, id="toolu_test")
+            ],
+            response_metadata={"model_name": "claude-batch"},
+        )
+
+
+class FailingLLM:
+    """항상 연결 오류를 내는 가짜 LLM."""
+
+    async def ainvoke(self, messages, config=None, **kwargs):
+        raise ConnectionError("연결 실패")
+
+
+def make_context(
+    content: str, target_type: ReviewTargetType = ReviewTargetType.PROJECT_BLOCK
+) -> ReviewContext:
+    """블록 리뷰 컨텍스트 생성."""
+    return ReviewContext(
+        resume_id=uuid4(),
+        target_type=target_type,
+        block=BlockData(block_id=uuid4(), sub_title="결제 시스템", period="2024", content=content),
+    )
+
+
+async def evaluate_all(batcher: EvaluationMicroBatcher, contexts: list[ReviewContext]):
+    """여러 평가를 동시에 요청."""
+    return await asyncio.gather(
+        *[batcher.evaluate(PromptStrategyFactory.get(ctx), ctx) for ctx in contexts]
+    )
+
+
+class TestEvaluationMicroBatcher:
+    """마이크로 배처 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_same_type_evaluations_share_one_call(self) -> None:
+        """창 안에 들어온 같은 타입 평가는 한 번의 호출로 처리되고 각자 자기 결과를 받는다."""
+        llm = ScriptedBatchLLM()
+        batcher = EvaluationMicroBatcher(llm, window_ms=5.0)
+
+        results = await evaluate_all(batcher, [make_context(f"내용 {i}") for i in range(3)])
+
+        assert len(llm.prompts) == 1
+        assert all(f"내용 {i}" in llm.prompts[0] for i in range(3))
+        assert [result.summary for result in results] == ["평가 0", "평가 1", "평가 2"]
+        assert results[0].served_models == {"evaluation": "claude-batch"}
+        assert batcher.snapshot()["avg_batch_size"] == 3
+
+    @pytest.mark.asyncio
+    async def test_max_items_splits_batches(self) -> None:
+        """최대 항목 수를 넘으면 여러 배치로 나뉜다."""
+        llm = ScriptedBatchLLM()
+        batcher = EvaluationMicroBatcher(llm, window_ms=5.0, max_items=2)
+
+        await evaluate_all(batcher, [make_context(f"내용 {i}") for i in range(4)])
+
+        assert len(llm.prompts) == 2
+
+    @pytest.mark.asyncio
+    async def test_different_types_are_not_mixed(self) -> None:
+        """타겟 타입이 다르면 같은 창에 들어와도 따로 처리된다."""
+        llm = ScriptedBatchLLM()
+        batcher = EvaluationMicroBatcher(llm, window_ms=5.0)
+
+        results = await evaluate_all(
+            batcher,
+            [
+                make_context("프로젝트 1"),
+                make_context("프로젝트 2"),
+                make_context("경력", ReviewTargetType.WORK_EXPERIENCE_BLOCK),
+            ],
+        )
+
+        assert len(llm.prompts) == 1
+        assert results[2] is None
+        assert batcher.snapshot()["single_items"] == 1
+
+    @pytest.mark.asyncio
+    async def test_parse_failure_falls_back_to_single(self) -> None:
+        """다중 항목 응답을 파싱하지 못하면 모든 호출자가 단일 평가로 넘어간다."""
+        batcher = EvaluationMicroBatcher(ScriptedBatchLLM("형식이 틀린 응답"), window_ms=5.0)
+
+        results = await evaluate_all(batcher, [make_context(f"내용 {i}") for i in range(2)])
+
+        assert results == [None, None]
+        assert batcher.snapshot()["fallback_items"] == 2
+
+    @pytest.mark.asyncio
+    async def test_llm_error_propagates_to_callers(self) -> None:
+        """LLM 호출 오류는 배치에 담긴 모든 호출자에게 전달된다."""
+        batcher = EvaluationMicroBatcher(FailingLLM(), window_ms=5.0)
+
+        with pytest.raises(ConnectionError):
+            await evaluate_all(batcher, [make_context(f"내용 {i}") for i in range(2)])
+
+    @pytest.mark.asyncio
+    async def test_batch_runs_in_fresh_context_with_latest_deadline(self) -> None:
+        """배치는 가장 넉넉한 데드라인으로 실행되고 단계 기록은 호출자마다 남는다."""
+        llm = ScriptedBatchLLM()
+        remaining: list[float | None] = []
+        original = llm.ainvoke
+
+        async def ainvoke(messages, config=None, **kwargs):
+            remaining.append(remaining_time())
+            return await original(messages, config, **kwargs)
+
+        llm.ainvoke = ainvoke
+        batcher = EvaluationMicroBatcher(llm, window_ms=5.0)
+
+        async def evaluate(deadline: float, content: str):
+            context = make_context(content)
+            with request_deadline(deadline), collect_llm_telemetry() as telemetry:
+                result = await batcher.evaluate(PromptStrategyFactory.get(context), context)
+            return result, telemetry
+
+        (short_result, short), (long_result, long) = await asyncio.gather(
+            evaluate(0.001, "짧은 데드라인"), evaluate(30.0, "긴 데드라인")
+        )
+
+        assert len(llm.prompts) == 1
+        assert remaining[0] is not None and remaining[0] > 10
+        assert short_result.summary == "평가 0"
+        assert long_result.summary == "평가 1"
+        assert [stage.stage for stage in short.stages] == [BATCH_STAGE]
+        assert [stage.stage for stage in long.stages] == [BATCH_STAGE]
+
+    @pytest.mark.asyncio
+    async def test_batch_without_caller_deadline_has_no_deadline(self) -> None:
+        """데드라인이 없는 호출자가 있으면 배치에도 데드라인을 두지 않는다."""
+        llm = ScriptedBatchLLM()
+        remaining: list[float | None] = []
+        original = llm.ainvoke
+
+        async def ainvoke(messages, config=None, **kwargs):
+            remaining.append(remaining_time())
+            return await original(messages, config, **kwargs)
+
+        llm.ainvoke = ainvoke
+        batcher = EvaluationMicroBatcher(llm, window_ms=5.0)
+
+        async def evaluate_with_deadline():
+            context = make_context("데드라인 있음")
+            with request_deadline(0.001):
+                return await batcher.evaluate(PromptStrategyFactory.get(context), context)
+
+        context = make_context("데드라인 없음")
+        await asyncio.gather(
+            evaluate_with_deadline(),
+            batcher.evaluate(PromptStrategyFactory.get(context), context),
+        )
+
+        assert remaining == [None]
+
+
+class TestReviewChainMicroBatch:
+    """마이크로 배치를 사용하는 ReviewChain 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_block_reviews_complete_with_micro_batch(self) -> None:
+        """동시에 들어온 블록 리뷰는 평가를 한 번에 하고 개선은 각자 진행한다."""
+        model = FakeReviewChatModel(ttft_ms=0.0, output_tokens_per_second=1_000_000.0, seed=5)
+        batcher = EvaluationMicroBatcher(model, window_ms=5.0)
+        chain = ReviewChain(llm=model, micro_batcher=batcher)
+        contexts = [make_context(f"내용 {i}") for i in range(3)]
+
+        results = await asyncio.gather(*[chain.run(ctx) for ctx in contexts])
+
+        assert [result.block_id for result in results] == [ctx.block.block_id for ctx in contexts]
+        assert all(result.strengths and result.improved_content for result in results)
+        assert batcher.snapshot()["batches"] == 1
@@ -0,0 +1,140 @@
+"""Anthropic 모의 서버 테스트 (실제 ChatAnthropic 클라이언트로 호출)."""
+
+from collections.abc import AsyncIterator
+
+import pytest
+from anthropic import APITimeoutError, OverloadedError, RateLimitError
+from backend.ai.chains.circuit_breaker import CircuitBreaker
+from backend.ai.chains.gateway import LLMGateway
+from backend.ai.chains.limiter import AdaptiveConcurrencyLimiter
+from backend.ai.chains.retry import RetryPolicy, parse_retry_after
+from backend.ai.chains.structured_output import StructuredOutput
+from backend.ai.mock_server import MockAnthropicServer, MockBehavior, MockFault
+from backend.ai.output.review_result import EvaluationOutput
+from langchain_anthropic import ChatAnthropic
+from langchain_core.exceptions import OutputParserException
+from langchain_core.messages import HumanMessage
+from langchain_core.output_parsers import PydanticOutputParser
+
+PROMPT = [HumanMessage(content="소개글을 평가해 주세요")]
+
+
+@pytest.fixture
+async def server() -> AsyncIterator[MockAnthropicServer]:
+    """지연이 거의 없는 모의 서버."""
+    mock = MockAnthropicServer(
+        MockBehavior(ttft_ms=1.0, tokens_per_second=100_000.0, hang_seconds=2.0), seed=1
+    )
+    mock.base_url = await mock.start()
+    yield mock
+    await mock.stop()
+
+
+def make_model(server: MockAnthropicServer, **kwargs) -> ChatAnthropic:
+    """모의 서버를 가리키는 ChatAnthropic 생성 (SDK 재시도 비활성화)."""
+    return ChatAnthropic(
+        model="claude-mock",
+        anthropic_api_key="test-api-key",
+        base_url=server.base_url,
+        max_retries=0,
+        **kwargs,
+    )
+
+
+class TestMockAnthropicServer:
+    """모의 서버 응답 테스트."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("streaming", [False, True])
+    async def test_returns_parseable_evaluation(
+        self, server: MockAnthropicServer, streaming: bool
+    ) -> None:
+        """일반/스트리밍 응답 모두 평가 스키마로 파싱되고 사용량이 포함된다."""
+        model = make_model(server, streaming=streaming)
+
+        message = await model.ainvoke(PROMPT)
+        result = PydanticOutputParser(pydantic_object=EvaluationOutput).parse(message.text)
+
+        assert result.summary
+        assert message.response_metadata["stop_reason"] == "end_turn"
+        assert message.response_metadata["model_name"] == "claude-mock"
+        assert message.usage_metadata["output_tokens"] > 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("streaming", [False, True])
+    async def test_returns_forced_tool_call(
+        self, server: MockAnthropicServer, streaming: bool
+    ) -> None:
+        """도구 호출을 강제하면 일반/스트리밍 모두 평가 스키마의 도구 입력이 돌아온다."""
+        output = StructuredOutput(EvaluationOutput, "tool")
+        model = make_model(server, streaming=streaming)
+
+        message = await model.ainvoke(PROMPT, **output.call_kwargs)
+        result = await output.parser.ainvoke(message)
+
+        assert result.summary
+        assert message.response_metadata["stop_reason"] == "tool_use"
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_carries_retry_after(self, server: MockAnthropicServer) -> None:
+        """스크립트한 429 응답은 retry-after 헤더와 함께 RateLimitError가 된다."""
+        server.script([MockFault.RATE_LIMIT])
+
+        with pytest.raises(RateLimitError) as exc_info:
+            await make_model(server).ainvoke(PROMPT)
+
+        assert parse_retry_after(exc_info.value) == 1.0
+
+    @pytest.mark.asyncio
+    async def test_overloaded_then_retry_succeeds(self, server: MockAnthropicServer) -> None:
+        """529 뒤의 재시도는 게이트웨이 재시도 정책으로 성공한다."""
+        server.script([MockFault.OVERLOADED])
+        gateway = LLMGateway(
+            make_model(server),
+            AdaptiveConcurrencyLimiter(),
+            RetryPolicy(base_delay=0.01, min_attempt_time=0.0),
+            CircuitBreaker((OverloadedError,)),
+        )
+
+        message = await gateway.ainvoke(PROMPT)
+
+        assert message.response_metadata["stop_reason"] == "end_turn"
+
+    @pytest.mark.asyncio
+    async def test_timeout(self, server: MockAnthropicServer) -> None:
+        """응답이 클라이언트 타임아웃보다 늦으면 APITimeoutError가 난다."""
+        server.script([MockFault.TIMEOUT])
+
+        with pytest.raises(APITimeoutError):
+            await make_model(server, default_request_timeout=0.2).ainvoke(PROMPT)
+
+    @pytest.mark.asyncio
+    async def test_truncated_json_fails_parsing(self, server: MockAnthropicServer) -> None:
+        """중간에 끊긴 JSON은 파서에서 실패한다."""
+        server.script([MockFault.TRUNCATED_JSON])
+
+        message = await make_model(server).ainvoke(PROMPT)
+
+        with pytest.raises(OutputParserException):
+            PydanticOutputParser(pydantic_object=EvaluationOutput).parse(message.text)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("streaming", [False, True])
+    async def test_max_tokens_stop_is_continued_by_gateway(
+        self, server: MockAnthropicServer, streaming: bool
+    ) -> None:
+        """max_tokens에서 잘린 응답을 게이트웨이가 이어 받아 완전한 JSON이 된다."""
+        server.script([MockFault.MAX_TOKENS])
+        gateway = LLMGateway(
+            make_model(server, streaming=streaming),
+            AdaptiveConcurrencyLimiter(),
+            RetryPolicy(),
+            CircuitBreaker(()),
+            max_continuations=2,
+        )
+
+        message = await gateway.ainvoke(PROMPT)
+
+        result = PydanticOutputParser(pydantic_object=EvaluationOutput).parse(message.text)
+        assert result.summary
+        assert message.response_metadata["continuations"] == 1
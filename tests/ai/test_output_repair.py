@@ -0,0 +1,202 @@
+"""파싱 실패 응답 복구 테스트."""
+
+import json
+
+import pytest
+from backend.ai.chains.output_repair import OutputRepairer, repair_locally
+from backend.ai.chains.structured_output import StructuredOutput
+from backend.ai.chains.telemetry import LLMTelemetry
+from backend.ai.output.review_result import EvaluationOutput, ImprovementOutput
+from langchain_core.exceptions import OutputParserException
+from langchain_core.messages import AIMessage, ToolCall
+from langchain_core.prompt_values import PromptValue
+from langchain_core.runnables import RunnableLambda
+
+EVALUATION = {
+    "summary": "핵심 역량이 드러나는 소개글입니다",
+    "strengths": ["기술 스택 명시"],
+    "weaknesses": ["정량적 성과 부족"],
+}
+EVALUATION_TEXT = json.dumps(EVALUATION, ensure_ascii=False)
+IMPROVEMENT_TEXT = json.dumps(
+    {
+        "improvement_suggestion": "성과를 수치로 보여주세요",
+        "improved_content": "결제 API 응답 시간을 40% 단축했습니다",
+    },
+    ensure_ascii=False,
+)
+
+
+class FixupLLM:
+    """형식 교정 호출에 미리 정한 도구 입력을 돌려주는 가짜 LLM."""
+
+    def __init__(self, args: dict) -> None:
+        self.prompts: list[str] = []
+        self._args = args
+
+    async def _ainvoke(self, prompt: PromptValue, **kwargs) -> AIMessage:
+        self.prompts.append(prompt.to_messages()[-1].content)
+        return AIMessage(
+            content="",
+            tool_calls=[ToolCall(name=kwargs["tool_choice"]["name"], args=self._args, id="t")],
+        )
+
+    def as_runnable(self) -> RunnableLambda:
+        return RunnableLambda(self._ainvoke)
+
+
+class TestRepairLocally:
+    """로컬 복구 단계 테스트."""
+
+    @pytest.mark.parametrize(
+        ("raw", "step"),
+        [
+            (f"평가 결과입니다.\n```json\n{EVALUATION_TEXT}\n```\n참고하세요.", "strip_fences"),
+            (EVALUATION_TEXT[:-1] + ",}", "tolerant_decode"),
+            (EVALUATION_TEXT[: EVALUATION_TEXT.index("정량")], "close_truncated"),
+        ],
+    )
+    def test_recovers_malformed_text(self, raw: str, step: str) -> None:
+        """코드 펜스, 끝 쉼표, 잘린 JSON을 순서대로 복구한다."""
+        result, applied = repair_locally(EvaluationOutput, raw)
+
+        assert applied == step
+        assert result.summary == EVALUATION["summary"]
+
+    def test_coerces_over_long_lists(self) -> None:
+        """max_length를 넘는 목록은 제한 길이로 자른다."""
+        raw = json.dumps({**EVALUATION, "strengths": ["a", "b", "c", "d", "e"]})
+
+        result, applied = repair_locally(EvaluationOutput, raw)
+
+        assert applied == "coerce_lists"
+        assert result.strengths == ["a", "b", "c"]
+
+    def test_gives_up_on_missing_fields(self) -> None:
+        """필수 필드가 없으면 로컬에서는 복구하지 않는다."""
+        assert repair_locally(EvaluationOutput, '{"summary": "요약"}') is None
+
+    def test_does_not_close_json_truncated_in_content_field(self) -> None:
+        """본문 필드 값 중간에서 잘린 JSON은 닫아서 복원하지 않는다."""
+        raw = IMPROVEMENT_TEXT[: IMPROVEMENT_TEXT.index("40%")]
+
+        assert repair_locally(ImprovementOutput, raw) is None
+
+
+class TestOutputRepairer:
+    """복구기 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_uses_fixup_call_when_local_repair_fails(self) -> None:
+        """로컬 복구가 실패하면 형식 교정 호출 한 번으로 복구하고 결과를 집계한다."""
+        telemetry = LLMTelemetry()
+        llm = FixupLLM(EVALUATION)
+        repairer = OutputRepairer(llm.as_runnable(), telemetry)
+        message = AIMessage(content="요약: 좋습니다")
+
+        result = await repairer.repair(
+            StructuredOutput(EvaluationOutput),
+            message,
+            OutputParserException("도구 호출 없음"),
+            "introduction",
+            "evaluation",
+        )
+
+        assert result.summary == EVALUATION["summary"]
+        assert "요약: 좋습니다" in llm.prompts[0]
+        assert telemetry.repair_snapshot() == {"introduction:evaluation": {"llm_fixup": 1}}
+
+    @pytest.mark.asyncio
+    async def test_fixup_call_failure_raises_original_error(self) -> None:
+        """형식 교정 호출이 API 오류로 실패해도 원래 파싱 예외를 다시 발생하고 실패로 집계한다."""
+        telemetry = LLMTelemetry()
+
+        async def failing(prompt: PromptValue, **kwargs) -> AIMessage:
+            raise TimeoutError("데드라인 초과")
+
+        repairer = OutputRepairer(RunnableLambda(failing), telemetry)
+        error = OutputParserException("도구 호출 없음")
+
+        with pytest.raises(OutputParserException) as exc_info:
+            await repairer.repair(
+                StructuredOutput(EvaluationOutput),
+                AIMessage(content="요약: 좋습니다"),
+                error,
+                "introduction",
+                "evaluation",
+            )
+
+        assert exc_info.value is error
+        assert telemetry.repair_snapshot() == {"introduction:evaluation": {"failed": 1}}
+
+    @pytest.mark.asyncio
+    async def test_raises_original_error_without_fixup(self) -> None:
+        """형식 교정 호출이 꺼져 있으면 로컬 복구 실패 시 원래 예외를 다시 발생한다."""
+        telemetry = LLMTelemetry()
+        repairer = OutputRepairer(telemetry=telemetry)
+        error = OutputParserException("도구 호출 없음")
+
+        with pytest.raises(OutputParserException) as exc_info:
+            await repairer.repair(
+                StructuredOutput(EvaluationOutput),
+                AIMessage(content="텍스트"),
+                error,
+                "introduction",
+                "evaluation",
+            )
+
+        assert exc_info.value is error
+        assert telemetry.repair_snapshot() == {"introduction:evaluation": {"failed": 1}}
+
+    @pytest.mark.asyncio
+    async def test_truncated_content_is_not_repaired(self) -> None:
+        """본문 필드에서 잘린 응답은 형식 교정 호출 없이 원래 예외를 다시 발생한다."""
+        telemetry = LLMTelemetry()
+        llm = FixupLLM({"improvement_suggestion": "제안", "improved_content": "지어낸 문장"})
+        repairer = OutputRepairer(llm.as_runnable(), telemetry)
+        message = AIMessage(
+            content="",
+            tool_calls=[
+                ToolCall(
+                    name="ImprovementOutput",
+                    args={"improvement_suggestion": "제안", "improved_content": "결제 API 응답"},
+                    id="t",
+                )
+            ],
+            response_metadata={"stop_reason": "max_tokens"},
+        )
+        error = OutputParserException("도구 입력이 잘렸습니다")
+
+        with pytest.raises(OutputParserException) as exc_info:
+            await repairer.repair(
+                StructuredOutput(ImprovementOutput), message, error, "project_block", "improvement"
+            )
+
+        assert exc_info.value is error
+        assert llm.prompts == []
+        assert telemetry.repair_snapshot() == {"project_block:improvement": {"truncated": 1}}
+
+    @pytest.mark.asyncio
+    async def test_closed_truncated_tool_input_is_not_repaired(self) -> None:
+        """SDK가 닫아 준 잘린 도구 입력은 형식상 유효해도 복구하지 않는다."""
+        telemetry = LLMTelemetry()
+        llm = FixupLLM(EVALUATION)
+        repairer = OutputRepairer(llm.as_runnable(), telemetry)
+        # 약점 목록 중간에서 잘렸지만 SDK가 닫아 준 JSON이라 그대로는 스키마를 통과함
+        message = AIMessage(
+            content="",
+            tool_calls=[
+                ToolCall(name="EvaluationOutput", args={**EVALUATION, "weaknesses": []}, id="t")
+            ],
+            response_metadata={"stop_reason": "max_tokens"},
+        )
+        error = OutputParserException("도구 입력이 잘렸습니다")
+
+        with pytest.raises(OutputParserException) as exc_info:
+            await repairer.repair(
+                StructuredOutput(EvaluationOutput), message, error, "introduction", "evaluation"
+            )
+
+        assert exc_info.value is error
+        assert llm.prompts == []
+        assert telemetry.repair_snapshot() == {"introduction:evaluation": {"truncated": 1}}
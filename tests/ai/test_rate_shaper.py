@@ -0,0 +1,187 @@
+"""TokenRateShaper 테스트."""
+
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from backend.ai.chains.circuit_breaker import CircuitBreaker
+from backend.ai.chains.gateway import LLMGateway
+from backend.ai.chains.limiter import AdaptiveConcurrencyLimiter
+from backend.ai.chains.rate_shaper import (
+    TokenBucket,
+    TokenEstimator,
+    TokenRateShaper,
+    _get_encoding,
+    preload_token_encoding,
+)
+from backend.ai.chains.retry import RetryPolicy, request_deadline
+from langchain_core.messages import AIMessage, HumanMessage
+
+
+def make_usage_message(input_tokens: int, output_tokens: int, cache_read: int = 0) -> AIMessage:
+    """사용량이 포함된 응답 메시지 생성."""
+    return AIMessage(
+        content="ok",
+        usage_metadata={
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+            "input_token_details": {"cache_read": cache_read},
+        },
+    )
+
+
+def make_shaper(input_tpm: int = 6000, output_tpm: int = 6000) -> TokenRateShaper:
+    """문자 수 기반 추정기를 쓰는 셰이퍼 생성 (버킷 용량 = 1초분)."""
+    return TokenRateShaper(
+        input_tpm, output_tpm, burst_seconds=1.0, estimator=TokenEstimator(use_tiktoken=False)
+    )
+
+
+class TestTokenEstimator:
+    """입력 토큰 추정 테스트."""
+
+    def test_heuristic_estimate(self) -> None:
+        """ASCII는 약 4자당 1토큰, 한글은 1자당 1토큰으로 추정한다."""
+        estimator = TokenEstimator(use_tiktoken=False)
+
+        assert estimator.raw_estimate([HumanMessage(content="abcdefgh")]) == 2
+        assert estimator.raw_estimate("안녕하세요") == 5
+
+    def test_observe_moves_correction_toward_actual(self) -> None:
+        """실제 사용량을 관찰할수록 보정 계수가 실제 비율에 가까워진다."""
+        estimator = TokenEstimator(use_tiktoken=False, smoothing=0.5)
+
+        estimator.observe(100, 200)
+        estimator.observe(100, 200)
+
+        assert estimator.correction == pytest.approx(1.75)
+        assert estimator.estimate("abcdefgh") == 4
+
+    @pytest.mark.asyncio
+    async def test_preload_loads_encoding_off_event_loop(self) -> None:
+        """인코딩 미리 로드는 워커 스레드에서 한 번만 수행되고 이후 호출은 캐시를 쓴다."""
+        threads: list[int] = []
+
+        def get_encoding(name: str) -> MagicMock:
+            threads.append(threading.get_ident())
+            return MagicMock()
+
+        _get_encoding.cache_clear()
+        try:
+            with patch("tiktoken.get_encoding", side_effect=get_encoding):
+                await preload_token_encoding()
+                _get_encoding()
+        finally:
+            _get_encoding.cache_clear()
+
+        assert len(threads) == 1
+        assert threads[0] != threading.get_ident()
+
+
+class TestTokenBucket:
+    """토큰 버킷 테스트."""
+
+    def test_reserve_within_capacity_has_no_wait(self) -> None:
+        """잔량 안의 예약은 기다리지 않는다."""
+        bucket = TokenBucket(tokens_per_minute=6000, burst_seconds=1.0)
+
+        assert bucket.reserve(100) == 0.0
+
+    def test_reserve_over_capacity_waits_for_refill(self) -> None:
+        """잔량을 넘는 예약은 부채를 갚는 시간만큼 기다린다."""
+        bucket = TokenBucket(tokens_per_minute=6000, burst_seconds=1.0)
+
+        wait = bucket.reserve(300)
+
+        assert wait == pytest.approx(2.0, abs=0.01)
+
+
+class TestTokenRateShaper:
+    """TPM 셰이퍼 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_large_request_paces_following_requests(self) -> None:
+        """큰 요청이 예산을 소진하면 뒤따르는 요청은 보충될 때까지 기다린다."""
+        shaper = make_shaper()
+
+        with patch("backend.ai.chains.rate_shaper.asyncio.sleep", AsyncMock()) as sleep:
+            await shaper.reserve("a" * 400, output_tokens=50)
+            await shaper.reserve("short", output_tokens=50)
+
+        sleep.assert_awaited_once()
+        assert sleep.await_args.args[0] > 0
+        assert shaper.snapshot()["paced_total"] == 1
+
+    @pytest.mark.asyncio
+    async def test_estimate_runs_off_event_loop(self) -> None:
+        """입력 토큰 추정은 이벤트 루프가 아닌 워커 스레드에서 수행된다."""
+        threads: list[int] = []
+
+        class RecordingEstimator(TokenEstimator):
+            def raw_estimate(self, messages):
+                threads.append(threading.get_ident())
+                return super().raw_estimate(messages)
+
+        shaper = TokenRateShaper(6000, 6000, estimator=RecordingEstimator(use_tiktoken=False))
+        reservation = await shaper.reserve("abcdefgh", output_tokens=50)
+
+        assert reservation.raw_input == 2
+        assert threads[0] != threading.get_ident()
+
+    @pytest.mark.asyncio
+    async def test_reconcile_returns_unused_reservation(self) -> None:
+        """실제 사용량이 예약보다 적으면 차이를 돌려받는다 (캐시 읽기 토큰 제외)."""
+        shaper = make_shaper()
+        reservation = await shaper.reserve("a" * 200, output_tokens=80)
+
+        shaper.reconcile(reservation, make_usage_message(90, 30, cache_read=50))
+
+        snapshot = shaper.snapshot()
+        assert snapshot["input_tokens_available"] == pytest.approx(100 - 40, abs=2)
+        assert snapshot["output_tokens_available"] == pytest.approx(100 - 30, abs=2)
+
+    @pytest.mark.asyncio
+    async def test_rejects_wait_beyond_deadline(self) -> None:
+        """요청 데드라인 안에 보낼 수 없으면 예약을 돌려놓고 TimeoutError를 낸다."""
+        shaper = make_shaper()
+
+        with request_deadline(0.5), pytest.raises(TimeoutError):
+            await shaper.reserve("a" * 2000, output_tokens=10)
+
+        assert shaper.snapshot()["input_tokens_available"] == pytest.approx(100, abs=2)
+
+    def test_zero_limit_disables_dimension(self) -> None:
+        """한도가 0인 쪽은 페이싱하지 않는다."""
+        shaper = make_shaper(input_tpm=6000, output_tpm=0)
+
+        assert shaper.snapshot()["output_tokens_available"] is None
+
+
+class TestGatewayRateShaping:
+    """LLMGateway TPM 페이싱 연동 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_failed_call_returns_reservation(self) -> None:
+        """실패한 호출의 예약분은 돌려받는다."""
+        shaper = make_shaper()
+
+        class FailingModel:
+            async def ainvoke(self, messages, config=None, **kwargs):
+                raise ValueError("bad request")
+
+        gateway = LLMGateway(
+            FailingModel(),
+            AdaptiveConcurrencyLimiter(),
+            RetryPolicy(),
+            CircuitBreaker(()),
+            rate_shaper=shaper,
+        )
+
+        with pytest.raises(ValueError):
+            await gateway.ainvoke("a" * 200, max_tokens=50)
+
+        snapshot = shaper.snapshot()
+        assert snapshot["reservations_total"] == 1
+        assert snapshot["input_tokens_available"] == pytest.approx(100, abs=2)
+        assert snapshot["output_tokens_available"] == pytest.approx(100, abs=2)
@@ -0,0 +1,90 @@
+"""결과 캐시 테스트."""
+
+import unicodedata
+from unittest.mock import patch
+
+from backend.ai.chains.result_cache import (
+    ResultCache,
+    cache_key,
+    content_key,
+    template_version,
+)
+from backend.ai.output.review_result import EvaluationOutput
+
+RESULT = EvaluationOutput(summary="요약", strengths=["강점"], weaknesses=["약점"])
+
+
+class TestResultCache:
+    """TTL + LRU 결과 캐시 테스트."""
+
+    def test_returns_copy_with_elapsed(self) -> None:
+        """적중 시 결과 복사본과 생성 소요 시간을 돌려준다."""
+        cache = ResultCache()
+        cache.put("key", RESULT, 1.5)
+
+        value, elapsed = cache.get("key")
+        value.strengths.append("수정")
+
+        assert elapsed == 1.5
+        assert cache.get("key")[0].strengths == ["강점"]
+
+    def test_expired_entries_are_dropped(self) -> None:
+        """TTL이 지난 항목은 조회 시 제거된다."""
+        cache = ResultCache(ttl_seconds=10)
+        with patch("backend.ai.chains.result_cache.time.monotonic", side_effect=[0.0, 11.0]):
+            cache.put("key", RESULT, 1.0)
+            assert cache.get("key") is None
+
+        assert len(cache) == 0
+        assert cache.snapshot()["expirations"] == 1
+
+    def test_evicts_least_recently_used(self) -> None:
+        """용량을 넘으면 가장 오래 사용하지 않은 항목부터 제거한다."""
+        cache = ResultCache(max_entries=2)
+        cache.put("a", RESULT, 1.0)
+        cache.put("b", RESULT, 1.0)
+        cache.get("a")
+        cache.put("c", RESULT, 1.0)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.snapshot()["evictions"] == 1
+
+    def test_evicts_by_total_bytes(self) -> None:
+        """직렬화 크기 합계가 max_bytes를 넘으면 오래된 항목부터 제거한다."""
+        size = len(RESULT.model_dump_json().encode())
+        cache = ResultCache(max_entries=None, max_bytes=size * 2)
+        for key in ["a", "b", "c"]:
+            cache.put(key, RESULT, 1.0)
+
+        assert cache.get("a") is None
+        assert cache.snapshot()["bytes"] == size * 2
+
+    def test_skips_entry_larger_than_capacity(self) -> None:
+        """혼자서 max_bytes를 넘는 결과는 저장하지 않는다."""
+        cache = ResultCache(max_entries=None, max_bytes=10)
+        cache.put("key", RESULT, 1.0)
+
+        assert len(cache) == 0
+
+
+class TestCacheKey:
+    """캐시 키 테스트."""
+
+    def test_key_ignores_dict_order(self) -> None:
+        """구성 요소의 순서와 무관하게 같은 키를 만든다."""
+        assert cache_key({"a": 1, "b": "값"}) == cache_key({"b": "값", "a": 1})
+
+    def test_template_version_changes_with_template(self) -> None:
+        """템플릿 내용이 바뀌면 버전도 바뀐다."""
+        assert template_version("시스템", "사용자") != template_version("시스템", "사용자 수정")
+        assert template_version("ab", "c") != template_version("a", "bc")
+
+    def test_content_key_normalizes_text(self) -> None:
+        """NFC 정규화 후 같은 내용이면 같은 키를 만들고, 공백이 다르면 다른 키를 만든다."""
+        composed = {"content": "성과 개선", "items": ["가 나"]}
+        decomposed = {"content": unicodedata.normalize("NFD", "성과 개선"), "items": ["가 나"]}
+
+        assert content_key(composed) == content_key(decomposed)
+        assert content_key(composed) != content_key({**composed, "content": "성과  개선"})
+        assert content_key(composed) != content_key({**composed, "content": "성과개선"})
@@ -0,0 +1,195 @@
+"""RetryPolicy / RetryBudget 테스트."""
+
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+from anthropic import APITimeoutError, BadRequestError, RateLimitError
+from backend.ai.chains.retry import (
+    RetryBudget,
+    RetryPolicy,
+    get_retry_policy,
+    parse_retry_after,
+    remaining_time,
+    request_deadline,
+)
+from backend.ai.config import AIConfig
+
+
+def make_error(
+    error_cls: type = RateLimitError, status: int = 429, headers: dict | None = None
+) -> Exception:
+    """테스트용 API 에러 생성."""
+    request = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+    response = httpx.Response(status, request=request, headers=headers or {})
+    return error_cls("error", response=response, body=None)
+
+
+class FlakyCall:
+    """지정한 예외들을 차례로 던진 뒤 성공하는 호출."""
+
+    def __init__(self, errors: list[Exception]):
+        self._errors = list(errors)
+        self.calls = 0
+
+    async def __call__(self) -> str:
+        self.calls += 1
+        if self._errors:
+            raise self._errors.pop(0)
+        return "ok"
+
+
+class TestParseRetryAfter:
+    """retry-after 헤더 파싱 테스트."""
+
+    def test_retry_after_ms_takes_precedence(self) -> None:
+        """retry-after-ms가 있으면 우선 사용한다."""
+        error = make_error(headers={"retry-after-ms": "1500", "retry-after": "10"})
+
+        assert parse_retry_after(error) == 1.5
+
+    def test_retry_after_seconds(self) -> None:
+        """초 단위 retry-after."""
+        assert parse_retry_after(make_error(headers={"retry-after": "3"})) == 3.0
+
+    def test_retry_after_http_date(self) -> None:
+        """HTTP 날짜 형식 retry-after."""
+        retry_at = datetime.now(UTC) + timedelta(seconds=30)
+        error = make_error(headers={"retry-after": format_datetime(retry_at, usegmt=True)})
+
+        assert 25 <= parse_retry_after(error) <= 30
+
+    def test_missing_header(self) -> None:
+        """헤더가 없으면 None."""
+        assert parse_retry_after(make_error()) is None
+
+
+class TestRetryBudget:
+    """재시도 예산 테스트."""
+
+    def test_budget_refills_by_ratio(self) -> None:
+        """호출 10회마다 재시도 1회분이 적립된다."""
+        budget = RetryBudget(ratio=0.1, capacity=1.0)
+        assert budget.try_withdraw()
+        assert not budget.try_withdraw()
+
+        for _ in range(10):
+            budget.record_request()
+
+        assert budget.try_withdraw()
+
+
+class TestRetryPolicy:
+    """재시도 정책 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_honors_retry_after(self) -> None:
+        """서버가 지정한 retry-after만큼 대기 후 재시도한다."""
+        policy = RetryPolicy(max_attempts=3)
+        call = FlakyCall([make_error(headers={"retry-after": "2"})])
+
+        with patch("backend.ai.chains.retry.asyncio.sleep", new=AsyncMock()) as sleep:
+            assert await policy.call(call) == "ok"
+
+        sleep.assert_awaited_once_with(2.0)
+        assert call.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self) -> None:
+        """최대 시도 횟수를 넘으면 마지막 에러를 그대로 던진다."""
+        policy = RetryPolicy(max_attempts=2, base_delay=0)
+        call = FlakyCall([make_error(), make_error(), make_error()])
+
+        with pytest.raises(RateLimitError):
+            await policy.call(call)
+
+        assert call.calls == 2
+        assert policy.snapshot()["give_ups"] == {"max_attempts": 1}
+
+    @pytest.mark.asyncio
+    async def test_does_not_retry_non_retryable_errors(self) -> None:
+        """400 같은 클라이언트 오류는 재시도하지 않는다."""
+        policy = RetryPolicy(max_attempts=3)
+        call = FlakyCall([make_error(BadRequestError, 400)])
+
+        with pytest.raises(BadRequestError):
+            await policy.call(call)
+
+        assert call.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_gives_up_when_retry_after_too_long(self) -> None:
+        """retry-after가 허용 범위를 넘으면 기다리지 않고 포기한다."""
+        policy = RetryPolicy(max_attempts=3, max_retry_after=5)
+        call = FlakyCall([make_error(headers={"retry-after": "60"})])
+
+        with pytest.raises(RateLimitError):
+            await policy.call(call)
+
+        assert policy.snapshot()["give_ups"] == {"retry_after_too_long": 1}
+
+    @pytest.mark.asyncio
+    async def test_gives_up_when_deadline_too_close(self) -> None:
+        """남은 데드라인이 다음 시도에 부족하면 즉시 포기한다."""
+        policy = RetryPolicy(max_attempts=3, min_attempt_time=5.0)
+        call = FlakyCall([make_error(headers={"retry-after": "1"})])
+
+        with request_deadline(3.0), pytest.raises(RateLimitError):
+            await policy.call(call)
+
+        assert call.calls == 1
+        assert policy.snapshot()["give_ups"] == {"deadline": 1}
+
+    @pytest.mark.asyncio
+    async def test_gives_up_when_budget_exhausted(self) -> None:
+        """재시도 예산이 바닥나면 재시도하지 않는다."""
+        policy = RetryPolicy(max_attempts=3, budget=RetryBudget(ratio=0.0, capacity=0.0))
+        call = FlakyCall([make_error()])
+
+        with pytest.raises(RateLimitError):
+            await policy.call(call)
+
+        assert policy.snapshot()["give_ups"] == {"budget_exhausted": 1}
+
+    @pytest.mark.asyncio
+    async def test_timeout_is_retried_under_default_deadline(self) -> None:
+        """기본 설정에서는 단일 호출 타임아웃이 지나도 데드라인 안에서 재시도한다."""
+        config = AIConfig(anthropic_api_key="test-api-key")
+        with patch("backend.ai.chains.retry.get_ai_config", return_value=config):
+            policy = get_retry_policy.__wrapped__()
+        clock = [1000.0]
+        calls = 0
+
+        async def call() -> str:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                # SDK 타임아웃까지 기다린 뒤 실패한 호출을 흉내 냄
+                clock[0] += config.anthropic_request_timeout
+                raise APITimeoutError(httpx.Request("POST", "https://api.anthropic.com"))
+            return "ok"
+
+        with (
+            patch("backend.ai.chains.retry.time.monotonic", side_effect=lambda: clock[0]),
+            patch("backend.ai.chains.retry.asyncio.sleep", new=AsyncMock()),
+            request_deadline(config.llm_request_deadline_seconds),
+        ):
+            assert await policy.call(call) == "ok"
+
+        assert calls == 2
+        assert policy.snapshot()["give_ups"] == {}
+
+
+class TestRequestDeadline:
+    """요청 데드라인 컨텍스트 테스트."""
+
+    def test_nested_deadline_keeps_earlier_one(self) -> None:
+        """안쪽 데드라인이 더 길어도 바깥의 이른 데드라인을 유지한다."""
+        assert remaining_time() is None
+
+        with request_deadline(1.0), request_deadline(100.0):
+            assert remaining_time() <= 1.0
+
+        assert remaining_time() is None
@@ -0,0 +1,612 @@
+"""ReviewChain 테스트."""
+
+import json
+import logging
+import unicodedata
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from backend.ai.chains.callbacks import PromptCacheUsageHandler
+from backend.ai.chains.llm import PROMPT_CACHE_CONTROL
+from backend.ai.chains.review_chain import ReviewChain
+from backend.ai.chains.routing import ModelRouter, RouteOverride
+from backend.ai.chains.telemetry import LLMTelemetry
+from backend.ai.config import AIConfig
+from backend.ai.prompts.block import BlockPromptStrategy
+from backend.api.rest.exceptions import ReviewServiceError
+from backend.domain.resume.enums import SectionType
+from backend.services.review.context import BlockData, IntroductionData, ReviewContext
+from backend.services.review.enums import ReviewMode, ReviewTargetType
+from backend.utils.yaml_loader import load_prompt_template
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage, ToolCall
+from langchain_core.output_parsers import PydanticOutputParser
+from langchain_core.outputs import ChatGeneration, LLMResult
+from langchain_core.prompt_values import PromptValue
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import RunnableLambda
+from pydantic import ValidationError
+
+EVALUATION_JSON = {
+    "summary": "핵심 역량이 드러나는 소개글입니다",
+    "strengths": ["기술 스택 명시"],
+    "weaknesses": ["정량적 성과 부족"],
+}
+
+IMPROVEMENT_JSON = {
+    "improvement_suggestion": "성과 수치를 추가하세요",
+    "improved_content": "개선된 소개글",
+}
+
+
+class RecordingLLM:
+    """렌더링된 메시지와 호출 인자를 기록하고 미리 정한 응답을 순서대로 반환하는 가짜 LLM.
+
+    도구 호출을 강제한 호출에는 응답을 도구 입력으로, 아니면 JSON 텍스트로 돌려줍니다.
+    """
+
+    def __init__(self, responses: list[dict], model_names: list[str] | None = None):
+        self._responses = list(responses)
+        self._model_names = list(model_names or [])
+        self.calls: list[list[BaseMessage]] = []
+        self.call_kwargs: list[dict] = []
+
+    async def _ainvoke(self, prompt: PromptValue, **kwargs) -> AIMessage:
+        self.calls.append(prompt.to_messages())
+        self.call_kwargs.append(kwargs)
+        response_metadata = {"model_name": self._model_names.pop(0)} if self._model_names else {}
+        payload = self._responses.pop(0)
+        tool_choice = kwargs.get("tool_choice")
+        if tool_choice:
+            return AIMessage(
+                content="",
+                tool_calls=[ToolCall(name=tool_choice["name"], args=payload, id="toolu_test")],
+                response_metadata=response_metadata,
+            )
+        return AIMessage(
+            content=json.dumps(payload, ensure_ascii=False),
+            response_metadata=response_metadata,
+        )
+
+    def as_runnable(self) -> RunnableLambda:
+        return RunnableLambda(self._ainvoke)
+
+
+@pytest.fixture
+def introduction_context() -> ReviewContext:
+    """소개글 리뷰 컨텍스트."""
+    return ReviewContext(
+        resume_id=uuid4(),
+        target_type=ReviewTargetType.INTRODUCTION,
+        introduction=IntroductionData(
+            name="홍길동", position="백엔드 개발자", content="FastAPI 백엔드 개발자입니다."
+        ),
+    )
+
+
+def make_chain(llm: RecordingLLM) -> ReviewChain:
+    """가짜 LLM이 주입된 ReviewChain 생성."""
+    with patch(
+        "backend.ai.chains.review_chain.get_anthropic_client", return_value=llm.as_runnable()
+    ):
+        return ReviewChain()
+
+
+class TestReviewChainPromptCaching:
+    """프롬프트 캐시 브레이크포인트 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_static_system_prompt_comes_first_with_cache_control(
+        self, introduction_context: ReviewContext
+    ) -> None:
+        """정적 시스템 프롬프트가 먼저 오고 캐시 브레이크포인트가 붙는다."""
+        llm = RecordingLLM([EVALUATION_JSON, IMPROVEMENT_JSON])
+        chain = make_chain(llm)
+
+        await chain.run(introduction_context)
+
+        assert len(llm.calls) == 2
+        for messages in llm.calls:
+            system, human = messages
+            assert isinstance(system, SystemMessage)
+            assert isinstance(human, HumanMessage)
+            block = system.content[-1]
+            assert block["cache_control"] == PROMPT_CACHE_CONTROL
+            # 출력 형식 지침이 정적 prefix에 포함되고 사용자 입력은 포함되지 않음
+            assert "{format_instructions}" not in block["text"]
+            assert "도구를 호출해" in block["text"]
+            assert "FastAPI 백엔드 개발자입니다." not in block["text"]
+            assert "FastAPI 백엔드 개발자입니다." in human.content
+
+    @pytest.mark.asyncio
+    async def test_system_prompt_is_identical_across_requests(self) -> None:
+        """다른 입력이라도 같은 타입이면 시스템 프롬프트(캐시 prefix)가 동일하다."""
+        llm = RecordingLLM([EVALUATION_JSON, IMPROVEMENT_JSON] * 2)
+        chain = make_chain(llm)
+
+        for content in ["첫 번째 블록 내용", "두 번째 블록 내용"]:
+            context = ReviewContext(
+                resume_id=uuid4(),
+                target_type=ReviewTargetType.PROJECT_BLOCK,
+                block=BlockData(
+                    block_id=uuid4(), sub_title="프로젝트", period="2024", content=content
+                ),
+            )
+            await chain.run(context)
+
+        first_evaluation_system = llm.calls[0][0].content
+        second_evaluation_system = llm.calls[2][0].content
+        assert first_evaluation_system == second_evaluation_system
+
+    @pytest.mark.asyncio
+    async def test_evaluation_merged_into_result(self, introduction_context: ReviewContext) -> None:
+        """개선 결과에 평가 단계의 강점/약점/요약이 반영된다."""
+        llm = RecordingLLM([EVALUATION_JSON, IMPROVEMENT_JSON])
+        chain = make_chain(llm)
+
+        result = await chain.run(introduction_context)
+
+        assert result.evaluation_summary == EVALUATION_JSON["summary"]
+        assert result.strengths == EVALUATION_JSON["strengths"]
+        assert result.weaknesses == EVALUATION_JSON["weaknesses"]
+        assert result.improved_content == "개선된 소개글"
+
+
+class TestPipelineCache:
+    """단계 파이프라인 캐시 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_pipeline_built_once_per_target_type_and_stage(self) -> None:
+        """같은 타입 요청이 반복돼도 단계 파이프라인과 형식 지침은 한 번만 만든다."""
+        llm = RecordingLLM([EVALUATION_JSON, IMPROVEMENT_JSON] * 3)
+        chain = make_chain(llm)
+
+        with (
+            patch(
+                "backend.ai.chains.review_chain.ChatPromptTemplate.from_messages",
+                wraps=ChatPromptTemplate.from_messages,
+            ) as from_messages,
+            patch.object(
+                PydanticOutputParser, "get_format_instructions", autospec=True
+            ) as format_instructions,
+        ):
+            for content in ["첫 번째", "두 번째", "세 번째"]:
+                context = ReviewContext(
+                    resume_id=uuid4(),
+                    target_type=ReviewTargetType.PROJECT_BLOCK,
+                    block=BlockData(
+                        block_id=uuid4(), sub_title="프로젝트", period="2024", content=content
+                    ),
+                )
+                await chain.run(context)
+
+        assert from_messages.call_count == 2
+        format_instructions.assert_not_called()
+        # 캐시된 파이프라인이어도 요청별 입력은 매번 새로 렌더링됨
+        assert "세 번째" in llm.calls[4][1].content
+
+
+FUSED_JSON = {
+    **IMPROVEMENT_JSON,
+    "evaluation_summary": "단일 호출 요약",
+    "strengths": ["강점"],
+    "weaknesses": ["약점"],
+}
+
+
+class TestFusedMode:
+    """단일 호출(평가 + 개선) 모드 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_fused_mode_uses_one_call(self) -> None:
+        """요청에서 단일 호출 모드를 지정하면 한 번의 호출로 결과를 만든다."""
+        llm = RecordingLLM([FUSED_JSON], model_names=["claude-a"])
+        chain = make_chain(llm)
+        context = ReviewContext(
+            resume_id=uuid4(),
+            target_type=ReviewTargetType.PROJECT_BLOCK,
+            block=BlockData(block_id=uuid4(), sub_title="프로젝트", period="2024", content="내용"),
+            review_mode=ReviewMode.FUSED,
+        )
+
+        result = await chain.run(context)
+
+        assert len(llm.calls) == 1
+        assert result.evaluation_summary == "단일 호출 요약"
+        assert result.strengths == ["강점"]
+        assert result.block_id == context.block.block_id
+        assert result.served_models == {"fused": "claude-a"}
+
+    def test_fused_system_prompt_reuses_yaml_instructions(self) -> None:
+        """단일 호출 시스템 프롬프트에는 타입별 평가 지침과 개선 지침이 모두 들어간다."""
+        strategy = BlockPromptStrategy(SectionType.PROJECT)
+        section = load_prompt_template("section")["project"]
+
+        prompt = strategy.build_fused_system_prompt("형식 지침")
+
+        assert section["specific_instructions"].strip() in prompt
+        assert section["improvement_instructions"].strip() in prompt
+        assert prompt.rstrip().endswith("형식 지침")
+
+    def test_unknown_fused_target_type_is_rejected(self) -> None:
+        """ReviewTargetType에 없는 값을 단일 호출 타겟 타입으로 설정하면 설정 생성이 실패한다."""
+        with pytest.raises(ValidationError, match="intro"):
+            AIConfig(
+                anthropic_api_key="test-api-key", review_fused_target_types="introduction,intro"
+            )
+
+    @pytest.mark.asyncio
+    async def test_mode_follows_target_type_config_unless_requested(
+        self, introduction_context: ReviewContext
+    ) -> None:
+        """설정한 타겟 타입은 단일 호출이 기본이고, 요청에서 지정한 모드가 우선한다."""
+        config = AIConfig(
+            anthropic_api_key="test-api-key", review_fused_target_types="introduction"
+        )
+        llm = RecordingLLM([FUSED_JSON, EVALUATION_JSON, IMPROVEMENT_JSON])
+        with patch("backend.ai.chains.review_chain.get_ai_config", return_value=config):
+            chain = make_chain(llm)
+            await chain.run(introduction_context)
+            assert len(llm.calls) == 1
+
+            await chain.run(
+                introduction_context.model_copy(update={"review_mode": ReviewMode.TWO_STAGE})
+            )
+            assert len(llm.calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_review_metrics_are_recorded_per_mode(
+        self, introduction_context: ReviewContext
+    ) -> None:
+        """리뷰 1회의 소요 시간과 호출 수가 실행 모드별로 집계된다."""
+        telemetry = LLMTelemetry()
+        llm = RecordingLLM([EVALUATION_JSON, IMPROVEMENT_JSON, FUSED_JSON])
+        chain = make_chain(llm)
+
+        with patch("backend.ai.chains.review_chain.get_llm_telemetry", return_value=telemetry):
+            await chain.run(introduction_context)
+            await chain.run(
+                introduction_context.model_copy(update={"review_mode": ReviewMode.FUSED})
+            )
+
+        snapshot = telemetry.review_snapshot()
+        assert snapshot["introduction:two_stage"]["reviews"] == 1
+        assert snapshot["introduction:fused"]["reviews"] == 1
+        assert snapshot["introduction:fused"]["duration_ms_p50"] is not None
+
+
+STRONG_EVALUATION_JSON = {**EVALUATION_JSON, "weaknesses": [], "needs_improvement": False}
+
+
+class TestEarlyExit:
+    """개선 불필요 시 개선 단계 생략 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_skips_improvement_when_not_needed(
+        self, introduction_context: ReviewContext
+    ) -> None:
+        """평가에서 개선이 필요 없다고 하면 개선 호출 없이 원문을 그대로 돌려준다."""
+        llm = RecordingLLM([STRONG_EVALUATION_JSON], model_names=["claude-a"])
+        chain = make_chain(llm)
+
+        result = await chain.run(introduction_context)
+
+        assert len(llm.calls) == 1
+        assert result.improved_content == introduction_context.introduction.content
+        assert result.evaluation_summary == EVALUATION_JSON["summary"]
+        assert result.weaknesses == []
+        assert result.served_models == {"evaluation": "claude-a"}
+
+    @pytest.mark.asyncio
+    async def test_missing_signal_keeps_improvement(
+        self, introduction_context: ReviewContext
+    ) -> None:
+        """평가 응답에 신호가 없으면 기존처럼 개선 단계를 진행한다."""
+        llm = RecordingLLM([EVALUATION_JSON, IMPROVEMENT_JSON])
+        chain = make_chain(llm)
+
+        result = await chain.run(introduction_context)
+
+        assert len(llm.calls) == 2
+        assert result.improved_content == "개선된 소개글"
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_config(self, introduction_context: ReviewContext) -> None:
+        """설정으로 끄면 개선이 필요 없다는 평가여도 개선 단계를 진행한다."""
+        config = AIConfig(anthropic_api_key="test-api-key", review_early_exit_enabled=False)
+        llm = RecordingLLM([STRONG_EVALUATION_JSON, IMPROVEMENT_JSON])
+        with patch("backend.ai.chains.review_chain.get_ai_config", return_value=config):
+            chain = make_chain(llm)
+            await chain.run(introduction_context)
+
+        assert len(llm.calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_skip_rate_is_recorded(self, introduction_context: ReviewContext) -> None:
+        """개선 단계를 생략한 비율이 실행 모드별 리뷰 지표에 집계된다."""
+        telemetry = LLMTelemetry()
+        llm = RecordingLLM([STRONG_EVALUATION_JSON, EVALUATION_JSON, IMPROVEMENT_JSON])
+        chain = make_chain(llm)
+
+        # 두 번째 리뷰는 내용이 달라 평가 결과 캐시에 적중하지 않음
+        revised = introduction_context.model_copy(deep=True)
+        revised.introduction.content = "FastAPI 백엔드 개발 3년차입니다."
+
+        with patch("backend.ai.chains.review_chain.get_llm_telemetry", return_value=telemetry):
+            await chain.run(introduction_context)
+            await chain.run(revised)
+
+        snapshot = telemetry.review_snapshot()["introduction:two_stage"]
+        assert snapshot["improvement_skipped"] == 1
+        assert snapshot["improvement_skip_rate"] == 0.5
+
+
+class TestEvaluationCache:
+    """평가 결과 캐시 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_re_review_only_calls_improvement(
+        self, introduction_context: ReviewContext
+    ) -> None:
+        """같은 입력의 개선안을 새로 받으면 평가는 캐시에서 가져오고 개선 단계만 호출한다."""
+        telemetry = LLMTelemetry()
+        llm = RecordingLLM([EVALUATION_JSON, IMPROVEMENT_JSON, IMPROVEMENT_JSON])
+        chain = make_chain(llm)
+        fresh = introduction_context.model_copy(update={"cache_bypass": True})
+
+        with patch("backend.ai.chains.review_chain.get_llm_telemetry", return_value=telemetry):
+            first = await chain.run(introduction_context)
+            second = await chain.run(fresh)
+
+        assert [kwargs["tool_choice"]["name"] for kwargs in llm.call_kwargs] == [
+            "EvaluationOutput",
+            "ImprovementOutput",
+            "ImprovementOutput",
+        ]
+        assert second.strengths == first.strengths
+        entry = telemetry.cache_snapshot()["evaluation"]["introduction"]
+        assert entry["hits"] == 1
+        assert entry["misses"] == 1
+        assert entry["hit_rate"] == 0.5
+        assert entry["saved_ms"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_model_change_misses_cache(self, introduction_context: ReviewContext) -> None:
+        """평가 단계 모델이 바뀌면 같은 입력이라도 다시 평가한다."""
+        llm = RecordingLLM([EVALUATION_JSON, IMPROVEMENT_JSON] * 2)
+        chain = make_chain(llm)
+        router = ModelRouter(RouteOverride(model="claude-a", max_tokens=1024, temperature=0.0))
+
+        with patch("backend.ai.chains.review_chain.get_model_router", return_value=router):
+            await chain.run(introduction_context)
+        router = ModelRouter(RouteOverride(model="claude-b", max_tokens=1024, temperature=0.0))
+        with patch("backend.ai.chains.review_chain.get_model_router", return_value=router):
+            await chain.run(introduction_context)
+
+        assert len(llm.calls) == 4
+
+
+class TestReviewResultCache:
+    """리뷰 결과 캐시 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_identical_content_is_served_from_cache(self) -> None:
+        """정규화 후 같은 내용의 블록 리뷰는 LLM 호출 없이 캐시된 결과를 돌려준다."""
+        telemetry = LLMTelemetry()
+        llm = RecordingLLM([EVALUATION_JSON, IMPROVEMENT_JSON])
+        chain = make_chain(llm)
+        # 같은 내용이지만 유니코드 정규화 형태(NFD)가 다른 블록
+        contexts = [
+            ReviewContext(
+                resume_id=uuid4(),
+                target_type=ReviewTargetType.PROJECT_BLOCK,
+                block=BlockData(block_id=uuid4(), sub_title="결제", period="2024", content=content),
+            )
+            for content in ["결제 API 개발", unicodedata.normalize("NFD", "결제 API 개발")]
+        ]
+
+        with patch("backend.ai.chains.review_chain.get_llm_telemetry", return_value=telemetry):
+            first = await chain.run(contexts[0])
+            second = await chain.run(contexts[1])
+
+        assert len(llm.calls) == 2
+        assert second.improved_content == first.improved_content
+        assert second.block_id == contexts[1].block.block_id
+        entry = telemetry.cache_snapshot()["review"]["project_block"]
+        assert (entry["hits"], entry["misses"]) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_whitespace_difference_does_not_share_original_content(self) -> None:
+        """공백만 다른 블록은 캐시를 공유하지 않아, 개선 없이 끝난 리뷰가 자기 원문을 돌려준다."""
+        llm = RecordingLLM([STRONG_EVALUATION_JSON, STRONG_EVALUATION_JSON])
+        chain = make_chain(llm)
+        contexts = [
+            ReviewContext(
+                resume_id=uuid4(),
+                target_type=ReviewTargetType.PROJECT_BLOCK,
+                block=BlockData(block_id=uuid4(), sub_title="결제", period="2024", content=content),
+            )
+            for content in ["결제 API 개발", "결제  API\n개발"]
+        ]
+
+        results = [await chain.run(context) for context in contexts]
+
+        assert len(llm.calls) == 2
+        assert [result.improved_content for result in results] == [
+            "결제 API 개발",
+            "결제  API\n개발",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_bypass_regenerates_and_refreshes_cache(
+        self, introduction_context: ReviewContext
+    ) -> None:
+        """캐시 우회 요청은 새로 생성하고, 이후 요청은 갱신된 결과를 받는다."""
+        refreshed = {**IMPROVEMENT_JSON, "improved_content": "다시 생성한 소개글"}
+        llm = RecordingLLM([EVALUATION_JSON, IMPROVEMENT_JSON, refreshed])
+        chain = make_chain(llm)
+
+        await chain.run(introduction_context)
+        bypassed = await chain.run(introduction_context.model_copy(update={"cache_bypass": True}))
+        cached = await chain.run(introduction_context)
+
+        assert len(llm.calls) == 3
+        assert bypassed.improved_content == "다시 생성한 소개글"
+        assert cached.improved_content == "다시 생성한 소개글"
+
+    @pytest.mark.asyncio
+    async def test_mode_is_part_of_key(self, introduction_context: ReviewContext) -> None:
+        """실행 모드가 다르면 같은 내용이라도 캐시를 공유하지 않는다."""
+        llm = RecordingLLM([EVALUATION_JSON, IMPROVEMENT_JSON, FUSED_JSON])
+        chain = make_chain(llm)
+
+        await chain.run(introduction_context)
+        result = await chain.run(
+            introduction_context.model_copy(update={"review_mode": ReviewMode.FUSED})
+        )
+
+        assert len(llm.calls) == 3
+        assert result.evaluation_summary == "단일 호출 요약"
+
+    @pytest.mark.asyncio
+    async def test_key_error_becomes_review_error(
+        self, introduction_context: ReviewContext
+    ) -> None:
+        """캐시 키 계산 중 난 오류도 리뷰 서비스 오류로 변환된다."""
+        chain = make_chain(RecordingLLM([EVALUATION_JSON, IMPROVEMENT_JSON]))
+
+        with (
+            patch.object(chain, "_result_cache_key", side_effect=KeyError("template")),
+            pytest.raises(ReviewServiceError),
+        ):
+            await chain.run(introduction_context)
+
+
+class TestStructuredOutputModes:
+    """구조화 출력 방식 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_tool_mode_forces_result_tools(self, introduction_context: ReviewContext) -> None:
+        """기본(도구 호출) 방식은 단계마다 결과 스키마 도구 호출을 강제한다."""
+        llm = RecordingLLM([EVALUATION_JSON, IMPROVEMENT_JSON])
+        chain = make_chain(llm)
+
+        await chain.run(introduction_context)
+
+        assert [kwargs["tool_choice"]["name"] for kwargs in llm.call_kwargs] == [
+            "EvaluationOutput",
+            "ImprovementOutput",
+        ]
+        for messages in llm.calls:
+            assert '"properties"' not in messages[0].content[-1]["text"]
+
+    @pytest.mark.asyncio
+    async def test_json_mode_parses_text(self, introduction_context: ReviewContext) -> None:
+        """JSON 방식은 스키마 지침을 프롬프트에 넣고 응답 텍스트를 파싱한다."""
+        config = AIConfig(anthropic_api_key="test-api-key", llm_structured_output="json")
+        llm = RecordingLLM([EVALUATION_JSON, IMPROVEMENT_JSON])
+        with patch("backend.ai.chains.review_chain.get_ai_config", return_value=config):
+            chain = make_chain(llm)
+            result = await chain.run(introduction_context)
+
+        assert llm.call_kwargs == [{}, {}]
+        assert '"properties"' in llm.calls[0][0].content[-1]["text"]
+        assert result.improved_content == "개선된 소개글"
+
+    @pytest.mark.asyncio
+    async def test_server_filled_fields_are_not_generated(
+        self, introduction_context: ReviewContext
+    ) -> None:
+        """생성 스키마에는 서버에서 채우는 필드가 없고, 최종 결과에는 병합된다."""
+        llm = RecordingLLM([EVALUATION_JSON, IMPROVEMENT_JSON])
+        chain = make_chain(llm)
+
+        result = await chain.run(introduction_context)
+
+        evaluation_tool, improvement_tool = (kwargs["tools"][0] for kwargs in llm.call_kwargs)
+        assert {"target_type", "block_id"}.isdisjoint(evaluation_tool["input_schema"]["properties"])
+        assert set(improvement_tool["input_schema"]["properties"]) == {
+            "improvement_suggestion",
+            "improved_content",
+        }
+        assert result.target_type == ReviewTargetType.INTRODUCTION
+        assert result.evaluation_summary == EVALUATION_JSON["summary"]
+        assert result.strengths == EVALUATION_JSON["strengths"]
+        assert result.improvement_suggestion == IMPROVEMENT_JSON["improvement_suggestion"]
+
+
+class TestOutputRepair:
+    """단계 응답 복구 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_over_long_lists_are_repaired_without_extra_call(
+        self, introduction_context: ReviewContext
+    ) -> None:
+        """목록 길이 제한을 넘는 평가는 추가 호출 없이 잘라서 리뷰를 이어간다."""
+        evaluation = {**EVALUATION_JSON, "strengths": ["a", "b", "c", "d"]}
+        llm = RecordingLLM([evaluation, IMPROVEMENT_JSON])
+        chain = make_chain(llm)
+
+        result = await chain.run(introduction_context)
+
+        assert len(llm.calls) == 2
+        assert result.strengths == ["a", "b", "c"]
+
+
+class TestServedModels:
+    """응답 모델 기록 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_records_model_per_stage(self, introduction_context: ReviewContext) -> None:
+        """각 단계에서 실제로 응답한 모델이 결과에 기록된다."""
+        llm = RecordingLLM(
+            [EVALUATION_JSON, IMPROVEMENT_JSON], model_names=["primary-model", "fallback-model"]
+        )
+        chain = make_chain(llm)
+
+        result = await chain.run(introduction_context)
+
+        assert result.served_models == {
+            "evaluation": "primary-model",
+            "improvement": "fallback-model",
+        }
+
+    @pytest.mark.asyncio
+    async def test_served_models_excluded_from_format_instructions(
+        self, introduction_context: ReviewContext
+    ) -> None:
+        """서버에서 채우는 응답 모델 필드는 출력 형식 지침에 포함되지 않는다."""
+        llm = RecordingLLM([EVALUATION_JSON, IMPROVEMENT_JSON])
+        chain = make_chain(llm)
+
+        result = await chain.run(introduction_context)
+
+        assert result.served_models == {}
+        for messages in llm.calls:
+            assert "served_models" not in messages[0].content[-1]["text"]
+
+
+class TestPromptCacheUsageHandler:
+    """캐시 토큰 사용량 콜백 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_logs_cache_read_and_creation_tokens(self, caplog) -> None:
+        """usage_metadata의 캐시 읽기/쓰기 토큰 수를 기록한다."""
+        message = AIMessage(
+            content="{}",
+            usage_metadata={
+                "input_tokens": 1200,
+                "output_tokens": 80,
+                "total_tokens": 1280,
+                "input_token_details": {"cache_read": 1000, "cache_creation": 0},
+            },
+        )
+        handler = PromptCacheUsageHandler("evaluation", ReviewTargetType.INTRODUCTION)
+
+        with caplog.at_level(logging.INFO, logger="backend.ai.chains.callbacks"):
+            await handler.on_llm_end(LLMResult(generations=[[ChatGeneration(message=message)]]))
+
+        record = caplog.records[-1]
+        assert record.cache_read_tokens == 1000
+        assert record.cache_creation_tokens == 0
+        assert record.input_tokens == 1200
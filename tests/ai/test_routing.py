@@ -0,0 +1,139 @@
+"""ModelRouter 테스트."""
+
+from pathlib import Path
+
+import pytest
+from backend.ai.chains.circuit_breaker import CircuitBreaker
+from backend.ai.chains.gateway import LLMGateway
+from backend.ai.chains.limiter import AdaptiveConcurrencyLimiter
+from backend.ai.chains.retry import RetryPolicy
+from backend.ai.chains.routing import ModelRouter, RouteOverride, _get_default_routing_path
+from langchain_core.messages import AIMessage
+
+DEFAULT = RouteOverride(model="default-model", max_tokens=4096, temperature=0.7)
+
+
+def write_table(tmp_path: Path, content: str) -> Path:
+    """임시 라우팅 테이블 파일 생성."""
+    path = tmp_path / "routing.yaml"
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+class KwargsRecordingModel:
+    """호출 인자를 기록하는 가짜 모델."""
+
+    def __init__(self):
+        self.kwargs: list[dict] = []
+
+    async def ainvoke(self, messages, config=None, **kwargs) -> AIMessage:
+        self.kwargs.append(kwargs)
+        return AIMessage(content="ok")
+
+
+class TestModelRouter:
+    """라우팅 테이블 조회 테스트."""
+
+    def test_defaults_without_routes(self) -> None:
+        """라우트가 없으면 기본 설정을 사용한다."""
+        route = ModelRouter(DEFAULT).resolve("skill", "evaluation")
+
+        assert route.key == "skill:evaluation"
+        assert route.call_kwargs() == {
+            "model": "default-model",
+            "max_tokens": 4096,
+            "temperature": 0.7,
+        }
+
+    def test_most_specific_route_wins(self, tmp_path: Path) -> None:
+        """구체적인 라우트가 와일드카드 라우트를 덮어쓴다."""
+        path = write_table(
+            tmp_path,
+            """
+routes:
+  "*.evaluation":
+    max_tokens: 1024
+    temperature: 0.2
+  "resume_full.*":
+    model: strong-model
+  "resume_full.evaluation":
+    temperature: 0.5
+""",
+        )
+        router = ModelRouter.from_yaml(path, DEFAULT)
+
+        full_eval = router.resolve("resume_full", "evaluation")
+        assert (full_eval.model, full_eval.max_tokens, full_eval.temperature) == (
+            "strong-model",
+            1024,
+            0.5,
+        )
+
+        skill_eval = router.resolve("skill", "evaluation")
+        assert (skill_eval.model, skill_eval.max_tokens) == ("default-model", 1024)
+
+        full_improve = router.resolve("resume_full", "improvement")
+        assert (full_improve.model, full_improve.max_tokens) == ("strong-model", 4096)
+
+    def test_invalid_route_key_rejected(self, tmp_path: Path) -> None:
+        """알 수 없는 타겟 타입 키는 로드 시 거부된다."""
+        path = write_table(tmp_path, 'routes:\n  "unknown.evaluation":\n    max_tokens: 10\n')
+
+        with pytest.raises(ValueError):
+            ModelRouter.from_yaml(path, DEFAULT)
+
+    def test_default_table_loads(self) -> None:
+        """기본 라우팅 테이블이 유효하다."""
+        router = ModelRouter.from_yaml(_get_default_routing_path(), DEFAULT)
+
+        assert router.resolve("introduction", "evaluation").max_tokens == 1024
+        assert router.resolve("introduction", "improvement").max_tokens == 4096
+
+    def test_snapshot_reports_timings_per_route(self) -> None:
+        """라우트별 소요 시간이 집계된다."""
+        router = ModelRouter(DEFAULT)
+        route = router.resolve("skill", "improvement")
+        for elapsed in (0.1, 0.2, 0.3):
+            router.record(route, elapsed)
+
+        stats = router.snapshot()["skill:improvement"]
+        assert stats["model"] == "default-model"
+        assert stats["samples"] == 3
+        assert stats["p50_ms"] == 200
+
+
+class TestGatewayRouting:
+    """LLMGateway 라우팅 연동 테스트."""
+
+    def make_gateway(self, model: KwargsRecordingModel, router: ModelRouter) -> LLMGateway:
+        return LLMGateway(
+            model,
+            AdaptiveConcurrencyLimiter(),
+            RetryPolicy(),
+            CircuitBreaker(()),
+            router=router,
+        )
+
+    @pytest.mark.asyncio
+    async def test_applies_route_from_metadata(self) -> None:
+        """metadata의 타겟 타입/단계에 맞는 모델과 파라미터로 호출한다."""
+        model = KwargsRecordingModel()
+        router = ModelRouter(DEFAULT, {"skill.*": RouteOverride(model="cheap-model")})
+        gateway = self.make_gateway(model, router)
+
+        await gateway.as_runnable().ainvoke(
+            "hi", config={"metadata": {"target_type": "skill", "stage": "evaluation"}}
+        )
+
+        assert model.kwargs[0]["model"] == "cheap-model"
+        assert router.snapshot()["skill:evaluation"]["samples"] == 1
+
+    @pytest.mark.asyncio
+    async def test_no_route_without_metadata(self) -> None:
+        """단계 정보가 없으면 라우팅하지 않는다."""
+        model = KwargsRecordingModel()
+        gateway = self.make_gateway(model, ModelRouter(DEFAULT))
+
+        await gateway.as_runnable().ainvoke("hi")
+
+        assert model.kwargs == [{}]
@@ -0,0 +1,82 @@
+"""구조화 출력(도구 호출 / JSON 텍스트) 테스트."""
+
+import pytest
+from backend.ai.chains.structured_output import StructuredOutput, ToolCallOutputParser
+from backend.ai.output.review_result import EvaluationOutput
+from langchain_core.exceptions import OutputParserException
+from langchain_core.messages import AIMessage, ToolCall
+
+EVALUATION_INPUT = {
+    "summary": "핵심 역량이 드러나는 소개글입니다",
+    "strengths": ["기술 스택 명시"],
+    "weaknesses": ["정량적 성과 부족"],
+}
+
+
+def tool_message(name: str, args: dict) -> AIMessage:
+    """도구 호출 하나를 담은 응답 메시지."""
+    return AIMessage(content="", tool_calls=[ToolCall(name=name, args=args, id="toolu_test")])
+
+
+class TestStructuredOutput:
+    """방식별 형식 지침/호출 인자 테스트."""
+
+    def test_tool_mode_moves_schema_to_tool_definition(self) -> None:
+        """도구 호출 방식은 스키마를 도구 정의로 넘기고 형식 지침은 짧은 안내만 남긴다."""
+        output = StructuredOutput(EvaluationOutput, "tool")
+
+        tool = output.call_kwargs["tools"][0]
+        assert output.call_kwargs["tool_choice"] == {"type": "tool", "name": "EvaluationOutput"}
+        assert "EvaluationOutput" in output.format_instructions
+        assert "properties" not in output.format_instructions
+        assert "summary" in tool["input_schema"]["properties"]
+        assert "served_models" not in tool["input_schema"]["properties"]
+
+    def test_json_mode_keeps_schema_instructions(self) -> None:
+        """JSON 방식은 기존처럼 스키마 지침을 프롬프트에 넣고 호출 인자를 더하지 않는다."""
+        output = StructuredOutput(EvaluationOutput, "json")
+
+        assert output.call_kwargs == {}
+        assert "properties" in output.format_instructions
+
+
+class TestToolCallOutputParser:
+    """도구 호출 파서 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_parses_tool_input(self) -> None:
+        """도구 입력이 결과 스키마로 변환된다."""
+        parser = ToolCallOutputParser(pydantic_object=EvaluationOutput)
+
+        result = await parser.ainvoke(tool_message("EvaluationOutput", EVALUATION_INPUT))
+
+        assert result.summary == EVALUATION_INPUT["summary"]
+        assert result.strengths == ["기술 스택 명시"]
+
+    @pytest.mark.asyncio
+    async def test_missing_tool_call_raises(self) -> None:
+        """도구 호출 없이 텍스트만 오면 파싱 실패로 처리한다."""
+        parser = ToolCallOutputParser(pydantic_object=EvaluationOutput)
+
+        with pytest.raises(OutputParserException):
+            await parser.ainvoke(AIMessage(content='{"summary": "텍스트 응답"}'))
+
+    @pytest.mark.asyncio
+    async def test_invalid_tool_input_raises(self) -> None:
+        """스키마에 맞지 않는 도구 입력은 입력 JSON과 함께 파싱 실패로 처리한다."""
+        parser = ToolCallOutputParser(pydantic_object=EvaluationOutput)
+
+        with pytest.raises(OutputParserException) as exc_info:
+            await parser.ainvoke(tool_message("EvaluationOutput", {"summary": "요약"}))
+
+        assert "요약" in exc_info.value.llm_output
+
+    @pytest.mark.asyncio
+    async def test_truncated_tool_input_raises(self) -> None:
+        """max_tokens에서 잘린 도구 입력은 스키마에 맞아도 파싱 실패로 처리한다."""
+        parser = ToolCallOutputParser(pydantic_object=EvaluationOutput)
+        message = tool_message("EvaluationOutput", EVALUATION_INPUT)
+        message.response_metadata = {"stop_reason": "max_tokens"}
+
+        with pytest.raises(OutputParserException, match="잘렸습니다"):
+            await parser.ainvoke(message)
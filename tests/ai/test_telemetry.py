@@ -0,0 +1,231 @@
+"""LLM 텔레메트리 테스트."""
+
+import asyncio
+import json
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from backend.ai.chains.callbacks import LLMTelemetryHandler
+from backend.ai.chains.review_chain import ReviewChain
+from backend.ai.chains.telemetry import LLMTelemetry, StageTelemetry, collect_llm_telemetry
+from backend.ai.output.review_result import EvaluationOutput
+from backend.api.rest.exceptions import ReviewServiceError
+from backend.services.review.context import IntroductionData, ReviewContext
+from backend.services.review.enums import ReviewTargetType
+from langchain_core.language_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, ToolCall
+from langchain_core.output_parsers import PydanticOutputParser
+from langchain_core.outputs import ChatGeneration, LLMResult
+
+EVALUATION_JSON = {
+    "summary": "핵심 역량이 드러나는 소개글입니다",
+    "strengths": ["기술 스택 명시"],
+    "weaknesses": ["정량적 성과 부족"],
+}
+
+IMPROVEMENT_JSON = {
+    "improvement_suggestion": "성과 수치를 추가하세요",
+    "improved_content": "개선된 소개글",
+}
+
+
+def make_result(output_tokens: int, cache_read: int = 0) -> LLMResult:
+    """사용량과 응답 모델이 포함된 LLMResult 생성."""
+    message = AIMessage(
+        content="{}",
+        response_metadata={"model_name": "claude-test"},
+        usage_metadata={
+            "input_tokens": 100,
+            "output_tokens": output_tokens,
+            "total_tokens": 100 + output_tokens,
+            "input_token_details": {"cache_read": cache_read},
+        },
+    )
+    return LLMResult(generations=[[ChatGeneration(message=message)]])
+
+
+class TestLLMTelemetryHandler:
+    """단계 텔레메트리 콜백 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_records_ttft_and_generation_time(self) -> None:
+        """첫 토큰까지의 시간과 전체 생성 시간을 기록한다."""
+        handler = LLMTelemetryHandler("evaluation", "introduction", LLMTelemetry())
+        run_id = uuid4()
+
+        with patch(
+            "backend.ai.chains.callbacks.time.monotonic", side_effect=[10.0, 10.2, 10.5, 11.0]
+        ):
+            await handler.on_chat_model_start({}, [[]], run_id=run_id)
+            await handler.on_llm_new_token("{", run_id=run_id)
+            await handler.on_llm_new_token('"', run_id=run_id)
+            await handler.on_llm_end(make_result(40, cache_read=80), run_id=run_id)
+
+        record = handler.record
+        assert record.ttft_ms == pytest.approx(200)
+        assert record.generation_ms == pytest.approx(1000)
+        assert record.output_tokens == 40
+        assert record.cache_read_tokens == 80
+        assert record.model == "claude-test"
+
+    @pytest.mark.asyncio
+    async def test_failed_attempts_count_as_retries(self) -> None:
+        """실패한 시도는 재시도로 세고, 헤징으로 취소된 호출은 세지 않는다."""
+        handler = LLMTelemetryHandler("evaluation", "introduction", LLMTelemetry())
+
+        await handler.on_llm_error(TimeoutError(), run_id=uuid4())
+        await handler.on_llm_error(asyncio.CancelledError(), run_id=uuid4())
+        await handler.on_llm_end(make_result(10), run_id=uuid4())
+
+        assert handler.record.retries == 1
+
+    @pytest.mark.asyncio
+    async def test_continuations_sum_usage(self) -> None:
+        """이어쓰기 호출의 토큰은 합산하고 이어쓰기 횟수를 기록한다."""
+        handler = LLMTelemetryHandler("improvement", "introduction", LLMTelemetry())
+
+        await handler.on_llm_end(make_result(30), run_id=uuid4())
+        await handler.on_llm_end(make_result(20), run_id=uuid4())
+
+        assert handler.record.output_tokens == 50
+        assert handler.record.input_tokens == 200
+        assert handler.record.continuations == 1
+
+    @pytest.mark.asyncio
+    async def test_records_parse_time_for_parser_run(self) -> None:
+        """prompt | llm | parser 체인에서 파싱 시간과 모델 정보를 기록한다."""
+        telemetry = LLMTelemetry()
+        handler = LLMTelemetryHandler("evaluation", "introduction", telemetry)
+        model = GenericFakeChatModel(
+            messages=iter(
+                [
+                    AIMessage(
+                        content=json.dumps(EVALUATION_JSON, ensure_ascii=False),
+                        response_metadata={"model_name": "claude-test"},
+                    )
+                ]
+            )
+        )
+        parser = PydanticOutputParser(pydantic_object=EvaluationOutput)
+        config = {"callbacks": [handler]}
+
+        message = await model.ainvoke("평가해 주세요", config=config)
+        await parser.ainvoke(
+            message, config={**config, "run_name": LLMTelemetryHandler.PARSER_RUN_NAME}
+        )
+        handler.finish()
+
+        assert handler.record.parse_ms is not None
+        snapshot = telemetry.snapshot()["introduction:evaluation"]
+        assert snapshot["calls"] == 1
+        assert snapshot["parse_ms_p50"] is not None
+        assert snapshot["models"] == {"claude-test": 1}
+
+
+class TestLLMTelemetry:
+    """집계기 및 요청 수집기 테스트."""
+
+    def test_snapshot_aggregates_per_stage(self) -> None:
+        """(타겟 타입:단계)별로 토큰은 합산하고 시간은 백분위로 집계한다."""
+        telemetry = LLMTelemetry()
+        for output_tokens, ttft in [(10, 100.0), (30, 300.0)]:
+            record = StageTelemetry("evaluation", "introduction")
+            record.output_tokens = output_tokens
+            record.ttft_ms = ttft
+            telemetry.record(record)
+
+        snapshot = telemetry.snapshot()["introduction:evaluation"]
+        assert snapshot["calls"] == 2
+        assert snapshot["output_tokens"] == 40
+        assert snapshot["ttft_ms_p95"] == 300.0
+        assert snapshot["generation_ms_p50"] is None
+
+    def test_records_outside_collector_are_not_attached(self) -> None:
+        """요청 수집기가 닫힌 뒤의 기록은 요청에 첨부되지 않는다."""
+        telemetry = LLMTelemetry()
+
+        with collect_llm_telemetry() as request:
+            telemetry.record(StageTelemetry("evaluation", "introduction"))
+        telemetry.record(StageTelemetry("improvement", "introduction"))
+
+        assert [stage["stage"] for stage in request.to_list()] == ["evaluation"]
+
+    def test_nested_collectors_share_records(self) -> None:
+        """중첩된 수집기의 기록은 바깥 수집기에도 남는다."""
+        telemetry = LLMTelemetry()
+
+        with collect_llm_telemetry() as request:
+            with collect_llm_telemetry() as review:
+                telemetry.record(StageTelemetry("fused", "introduction"))
+            telemetry.record(StageTelemetry("evaluation", "skill"))
+
+        assert [stage["stage"] for stage in review.to_list()] == ["fused"]
+        assert [stage["stage"] for stage in request.to_list()] == ["fused", "evaluation"]
+
+    @pytest.mark.asyncio
+    async def test_review_chain_attaches_both_stages_to_request(self) -> None:
+        """ReviewChain 실행 시 평가/개선 단계 기록이 요청 수집기에 남는다."""
+        model = GenericFakeChatModel(
+            messages=iter(
+                [
+                    AIMessage(
+                        content="", tool_calls=[ToolCall(name=name, args=payload, id="toolu_test")]
+                    )
+                    for name, payload in (
+                        ("EvaluationOutput", EVALUATION_JSON),
+                        ("ImprovementOutput", IMPROVEMENT_JSON),
+                    )
+                ]
+            )
+        )
+        with patch("backend.ai.chains.review_chain.get_anthropic_client", return_value=model):
+            chain = ReviewChain()
+        context = ReviewContext(
+            resume_id=uuid4(),
+            target_type=ReviewTargetType.INTRODUCTION,
+            introduction=IntroductionData(
+                name="홍길동", position="백엔드 개발자", content="FastAPI 백엔드 개발자입니다."
+            ),
+        )
+
+        with collect_llm_telemetry() as request:
+            await chain.run(context)
+
+        stages = request.to_list()
+        assert [stage["stage"] for stage in stages] == ["evaluation", "improvement"]
+        assert all(stage["target_type"] == "introduction" for stage in stages)
+        assert all(stage["parse_ms"] is not None for stage in stages)
+        assert all(stage["generation_ms"] is not None for stage in stages)
+
+    @pytest.mark.asyncio
+    async def test_parse_failure_is_counted(self) -> None:
+        """도구 호출 없이 텍스트만 돌아오면 단계 파싱 실패로 집계된다."""
+        telemetry = LLMTelemetry()
+        # 평가 응답과 형식 교정 호출 응답 모두 도구 호출 없이 텍스트만 돌아옴
+        model = GenericFakeChatModel(
+            messages=iter(
+                [AIMessage(content="형식이 틀린 응답"), AIMessage(content="여전히 텍스트")]
+            )
+        )
+        with patch("backend.ai.chains.review_chain.get_anthropic_client", return_value=model):
+            chain = ReviewChain()
+        context = ReviewContext(
+            resume_id=uuid4(),
+            target_type=ReviewTargetType.INTRODUCTION,
+            introduction=IntroductionData(
+                name="홍길동", position="백엔드 개발자", content="FastAPI 백엔드 개발자입니다."
+            ),
+        )
+
+        with (
+            patch("backend.ai.chains.callbacks.get_llm_telemetry", return_value=telemetry),
+            patch("backend.ai.chains.output_repair.get_llm_telemetry", return_value=telemetry),
+            pytest.raises(ReviewServiceError),
+        ):
+            await chain.run(context)
+
+        entry = telemetry.snapshot()["introduction:evaluation"]
+        assert entry["parse_failures"] == 1
+        assert entry["parse_failure_rate"] == 1.0
+        assert telemetry.repair_snapshot() == {"introduction:evaluation": {"failed": 1}}
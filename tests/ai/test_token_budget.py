@@ -0,0 +1,196 @@
+"""OutputTokenBudget / max_tokens 이어쓰기 테스트."""
+
+import json
+
+import pytest
+from backend.ai.chains.circuit_breaker import CircuitBreaker
+from backend.ai.chains.gateway import LLMGateway
+from backend.ai.chains.limiter import AdaptiveConcurrencyLimiter
+from backend.ai.chains.retry import RetryPolicy
+from backend.ai.chains.routing import ModelRouter, RouteOverride
+from backend.ai.chains.token_budget import (
+    OutputTokenBudget,
+    build_continuation_input,
+    is_truncated,
+)
+from backend.ai.output.review_result import EvaluationResult
+from langchain_core.messages import AIMessage, HumanMessage, ToolCall
+from langchain_core.output_parsers import PydanticOutputParser
+
+STAGE_CONFIG = {"metadata": {"target_type": "introduction", "stage": "evaluation"}}
+
+
+def make_message(text: str, stop_reason: str, output_tokens: int) -> AIMessage:
+    """stop_reason과 사용량이 포함된 응답 메시지 생성."""
+    return AIMessage(
+        content=text,
+        response_metadata={"stop_reason": stop_reason, "model_name": "test-model"},
+        usage_metadata={
+            "input_tokens": 100,
+            "output_tokens": output_tokens,
+            "total_tokens": 100 + output_tokens,
+        },
+    )
+
+
+class ScriptedModel:
+    """미리 정한 응답을 순서대로 반환하고 입력/인자를 기록하는 가짜 모델."""
+
+    def __init__(self, responses: list[AIMessage]):
+        self._responses = list(responses)
+        self.inputs: list = []
+        self.kwargs: list[dict] = []
+
+    async def ainvoke(self, messages, config=None, **kwargs) -> AIMessage:
+        self.inputs.append(messages)
+        self.kwargs.append(kwargs)
+        return self._responses.pop(0)
+
+
+def make_gateway(
+    model: ScriptedModel,
+    budget: OutputTokenBudget | None = None,
+    max_continuations: int = 2,
+) -> LLMGateway:
+    """라우터와 출력 예산이 연결된 게이트웨이 생성."""
+    return LLMGateway(
+        model,
+        AdaptiveConcurrencyLimiter(),
+        RetryPolicy(),
+        CircuitBreaker(()),
+        router=ModelRouter(RouteOverride(model="m", max_tokens=4096, temperature=0.7)),
+        output_budget=budget,
+        max_continuations=max_continuations,
+    )
+
+
+class TestOutputTokenBudget:
+    """출력 토큰 예산 테스트."""
+
+    def test_uses_ceiling_before_min_samples(self) -> None:
+        """표본이 부족하면 라우트 설정값을 그대로 쓴다."""
+        budget = OutputTokenBudget(min_samples=5)
+        budget.record("key", 100)
+
+        assert budget.suggest("key", 4096) == 4096
+
+    def test_sized_from_observed_lengths(self) -> None:
+        """관찰한 출력 길이 백분위에 여유 배수를 곱한 값으로 정한다."""
+        budget = OutputTokenBudget(percentile=0.99, headroom=1.5, min_tokens=64, min_samples=3)
+        for tokens in (300, 400, 600):
+            budget.record("key", tokens)
+
+        assert budget.suggest("key", 4096) == 900
+        assert budget.suggest("key", 800) == 800
+        assert budget.snapshot()["key"]["samples"] == 3
+
+    def test_respects_min_tokens(self) -> None:
+        """예산은 하한보다 작아지지 않는다."""
+        budget = OutputTokenBudget(min_tokens=512, min_samples=1)
+        budget.record("key", 10)
+
+        assert budget.suggest("key", 4096) == 512
+
+
+class TestContinuation:
+    """max_tokens 잘림 이어쓰기 테스트."""
+
+    def test_continuation_input_appends_prefill(self) -> None:
+        """받은 출력을 끝 공백을 제거한 assistant prefill로 붙인다."""
+        messages = build_continuation_input([HumanMessage(content="hi")], '{"summary": "a ')
+
+        assert isinstance(messages[-1], AIMessage)
+        assert messages[-1].content == '{"summary": "a'
+
+    @pytest.mark.asyncio
+    async def test_truncated_output_is_continued_and_stitched(self) -> None:
+        """잘린 JSON을 이어서 생성해 파싱 가능한 하나의 응답으로 합친다."""
+        full = json.dumps(
+            {
+                "target_type": "introduction",
+                "summary": "요약",
+                "strengths": ["강점"],
+                "weaknesses": ["약점"],
+            },
+            ensure_ascii=False,
+        )
+        head, tail = full[:30], full[30:]
+        model = ScriptedModel(
+            [make_message(head, "max_tokens", 30), make_message(tail, "end_turn", 20)]
+        )
+        gateway = make_gateway(model)
+
+        result = await gateway.ainvoke([HumanMessage(content="hi")], STAGE_CONFIG)
+
+        assert result.text == full
+        assert not is_truncated(result)
+        assert result.usage_metadata["output_tokens"] == 50
+        assert result.response_metadata["continuations"] == 1
+        assert result.response_metadata["model_name"] == "test-model"
+        assert model.inputs[1][-1].content == head.rstrip()
+        parsed = PydanticOutputParser(pydantic_object=EvaluationResult).parse(result.text)
+        assert parsed.summary == "요약"
+
+    @pytest.mark.asyncio
+    async def test_stops_after_max_continuations(self) -> None:
+        """이어쓰기 횟수 상한을 넘으면 잘린 응답을 그대로 반환한다."""
+        model = ScriptedModel(
+            [make_message("a", "max_tokens", 1), make_message("b", "max_tokens", 1)]
+        )
+        gateway = make_gateway(model, max_continuations=1)
+
+        result = await gateway.ainvoke("hi", STAGE_CONFIG)
+
+        assert result.text == "ab"
+        assert is_truncated(result)
+        assert len(model.inputs) == 2
+
+    @pytest.mark.asyncio
+    async def test_budget_applied_and_recorded(self) -> None:
+        """라우트 max_tokens에 출력 예산이 적용되고 이어쓰기 포함 출력 길이가 기록된다."""
+        budget = OutputTokenBudget(headroom=1.0, min_tokens=1, min_samples=1)
+        budget.record("introduction:evaluation", 200)
+        model = ScriptedModel(
+            [make_message("a", "max_tokens", 200), make_message("b", "end_turn", 100)]
+        )
+        gateway = make_gateway(model, budget=budget)
+
+        await gateway.ainvoke("hi", STAGE_CONFIG)
+
+        assert model.kwargs[0]["max_tokens"] == 200
+        assert budget.snapshot()["introduction:evaluation"]["p99_tokens"] == 300
+
+    @pytest.mark.asyncio
+    async def test_truncated_tool_output_retried_with_route_max_tokens(self) -> None:
+        """예산이 낮춘 max_tokens에서 잘린 도구 호출은 라우트 max_tokens로 다시 요청한다."""
+        budget = OutputTokenBudget(headroom=1.0, min_tokens=1, min_samples=1)
+        budget.record("introduction:evaluation", 200)
+        truncated = make_message("", "max_tokens", 200)
+        truncated.tool_calls = [
+            ToolCall(name="EvaluationResult", args={"summary": "요"}, id="toolu_1")
+        ]
+        complete = make_message("", "tool_use", 300)
+        complete.tool_calls = [
+            ToolCall(name="EvaluationResult", args={"summary": "요약"}, id="toolu_2")
+        ]
+        model = ScriptedModel([truncated, complete])
+        gateway = make_gateway(model, budget=budget)
+        tools = {"tools": [{"name": "EvaluationResult"}], "tool_choice": {"type": "tool"}}
+
+        result = await gateway.ainvoke("hi", STAGE_CONFIG, **tools)
+
+        assert [kwargs["max_tokens"] for kwargs in model.kwargs] == [200, 4096]
+        assert model.inputs == ["hi", "hi"]
+        assert result.tool_calls[0]["args"] == {"summary": "요약"}
+        assert not is_truncated(result)
+
+    @pytest.mark.asyncio
+    async def test_truncated_tool_output_at_route_max_tokens_is_returned(self) -> None:
+        """라우트 max_tokens에서 잘린 도구 호출은 재요청/이어쓰기 없이 그대로 반환한다."""
+        model = ScriptedModel([make_message("", "max_tokens", 4096)])
+        gateway = make_gateway(model, budget=OutputTokenBudget())
+
+        result = await gateway.ainvoke("hi", STAGE_CONFIG, tools=[{"name": "EvaluationResult"}])
+
+        assert is_truncated(result)
+        assert len(model.inputs) == 1
@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
+from backend.api.rest.exceptions import ReviewServiceUnavailableError
 from backend.api.rest.main import app
 from backend.api.rest.v1.schemas.reviews import (
     BlockReviewResponse,
@@ -12,6 +13,7 @@ from backend.api.rest.v1.schemas.reviews import (
     SectionReviewResponse,
 )
 from backend.services import ReviewService, get_review_service
+from backend.services.review.enums import ReviewMode
 from fastapi.testclient import TestClient
 
 
@@ -279,6 +281,70 @@ class TestReviewBlockEndpoint:
         assert data["targetType"] == "project_block"
         assert len(data["strengths"]) == 2
 
+    @pytest.mark.asyncio
+    async def test_review_mode_header_is_passed_to_service(
+        self, client_with_mock_service: TestClient, mock_review_service: MagicMock
+    ) -> None:
+        """X-Review-Mode 헤더로 지정한 실행 모드가 서비스에 전달된다."""
+        resume_id = uuid4()
+        block_id = uuid4()
+        mock_review_service.review_block = AsyncMock(
+            return_value=ReviewResponse(
+                resume_id=resume_id,
+                target_type="project_block",
+                evaluation_summary="요약",
+                strengths=[],
+                weaknesses=[],
+                improvement_suggestion="제안",
+                block_id=block_id,
+            )
+        )
+
+        response = client_with_mock_service.post(
+            f"/api/v1/resumes/{resume_id}/reviews/project/block",
+            headers={"X-Review-Mode": "fused"},
+            json={
+                "sectionId": str(uuid4()),
+                "id": str(block_id),
+                "subTitle": "AI 챗봇 개발",
+                "period": "2023.01 - 2023.06",
+                "content": "FastAPI 기반 챗봇 백엔드 구축",
+                "isVisible": True,
+            },
+        )
+
+        assert response.status_code == 200
+        call = mock_review_service.review_block.await_args
+        assert call.kwargs["review_mode"] == ReviewMode.FUSED
+        assert call.kwargs["cache_bypass"] is False
+
+    @pytest.mark.asyncio
+    async def test_review_cache_header_is_passed_to_service(
+        self, client_with_mock_service: TestClient, mock_review_service: MagicMock
+    ) -> None:
+        """X-Review-Cache: bypass 헤더는 캐시 우회로 서비스에 전달된다."""
+        resume_id = uuid4()
+        mock_review_service.review_introduction = AsyncMock(
+            return_value=ReviewResponse(
+                resume_id=resume_id,
+                target_type="introduction",
+                evaluation_summary="요약",
+                strengths=[],
+                weaknesses=[],
+                improvement_suggestion="제안",
+            )
+        )
+
+        response = client_with_mock_service.post(
+            f"/api/v1/resumes/{resume_id}/reviews/introduction",
+            headers={"X-Review-Cache": "bypass"},
+            json=create_full_resume_json(),
+        )
+
+        assert response.status_code == 200
+        call = mock_review_service.review_introduction.await_args
+        assert call.kwargs["cache_bypass"] is True
+
 
 class TestReviewSummaryEndpoint:
     """전체 이력서 요약 리뷰 엔드포인트 테스트."""
@@ -309,3 +375,27 @@ class TestReviewSummaryEndpoint:
         data = response.json()
         assert data["targetType"] == "resume_full"
         assert len(data["strengths"]) == 3
+
+
+class TestReviewServiceUnavailable:
+    """LLM 서킷이 열렸을 때의 응답 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_circuit_open_returns_503_with_retry_after(
+        self, client_with_mock_service: TestClient, mock_review_service: MagicMock
+    ) -> None:
+        """서킷이 열리면 503과 Retry-After(초/밀리초)를 즉시 반환."""
+        resume_id = uuid4()
+        mock_review_service.review_skill = AsyncMock(
+            side_effect=ReviewServiceUnavailableError("일시 불가", retry_after_ms=1500)
+        )
+
+        response = client_with_mock_service.post(
+            f"/api/v1/resumes/{resume_id}/reviews/skills",
+            json={"skills": {"language": ["Python"]}},
+        )
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "2"
+        assert response.headers["Retry-After-Ms"] == "1500"
+        assert response.json()["retry_after_ms"] == 1500
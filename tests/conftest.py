@@ -1,5 +1,6 @@
 """Pytest configuration and fixtures."""
 
+import os
 from datetime import datetime
 from uuid import uuid4
 
@@ -9,6 +10,9 @@ from backend.domain.resume.enums import SectionType
 from backend.domain.resume.models import Block, Profile, Resume, Section, Skills
 from fastapi.testclient import TestClient
 
+# AIConfig는 API 키가 필수이므로 테스트용 더미 키를 설정 (실제 호출은 항상 모킹)
+os.environ.setdefault("ANTHROPIC_API_KEY", "test-api-key")
+
 
 @pytest.fixture
 def client() -> TestClient:
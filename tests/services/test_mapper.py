@@ -60,6 +60,22 @@ class TestToReviewResponse:
         assert response.block_id == block_id
         assert response.target_type == "project_block"
 
+    def test_conversion_with_served_models(self, mapper: ReviewResponseMapper) -> None:
+        """단계별 응답 모델이 그대로 전달된다."""
+        result = ReviewResult(
+            target_type=ReviewTargetType.SKILL,
+            evaluation_summary="평가",
+            strengths=[],
+            weaknesses=[],
+            improvement_suggestion="제안",
+            served_models={"evaluation": "model-a", "improvement": "model-b"},
+        )
+
+        response = mapper.to_review_response(uuid4(), result)
+
+        assert response.served_models == {"evaluation": "model-a", "improvement": "model-b"}
+        assert response.model_dump(by_alias=True)["servedModels"]["improvement"] == "model-b"
+
     def test_conversion_without_improved_content(self, mapper: ReviewResponseMapper) -> None:
         """개선된 내용이 없는 경우 테스트."""
         resume_id = uuid4()
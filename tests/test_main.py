@@ -18,3 +18,21 @@ def test_health(client: TestClient) -> None:
     assert response.status_code == 200
     data = response.json()
     assert data["status"] == "healthy"
+    assert data["llm_circuit"] == "closed"
+
+
+def test_llm_health(client: TestClient) -> None:
+    """Test LLM runtime stats endpoint."""
+    response = client.get("/health/llm")
+    assert response.status_code == 200
+    data = response.json()
+    assert "limit" in data["concurrency"]
+    assert "queue_wait_ms_avg" in data["concurrency"]
+    assert data["circuit_breaker"]["state"] == "closed"
+    assert data["api_keys"][0]["available"] is True
+    assert data["fallback"]["fallbacks"] == {}
+    assert isinstance(data["routing"], dict)
+    assert data["rate_shaper"] is None
+    assert data["cassette"] is None
+    assert "connection_reuse_rate" in data["http_pool"]
+    assert isinstance(data["telemetry"], dict)